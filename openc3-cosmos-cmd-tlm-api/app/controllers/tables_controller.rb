@@ -99,7 +99,10 @@ class TablesController < ApplicationController
     scope, binary, definition = sanitize_params([:scope, :binary, :definition], require_params: false, allow_forward_slash: true)
     return unless scope
     begin
-      render json: Table.load(scope, binary, definition)
+      # Optional paging of the table rows for large tables
+      row_offset = [params[:row_offset].to_i, 0].max
+      row_count = params[:row_count] ? [params[:row_count].to_i, 0].max : nil
+      render json: Table.load(scope, binary, definition, row_offset: row_offset, row_count: row_count)
     rescue Table::NotFound => e
       log_error(e)
       render json: { status: 'error', message: e.message }, status: :not_found
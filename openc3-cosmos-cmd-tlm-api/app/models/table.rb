@@ -97,13 +97,13 @@ class Table < OpenC3::TargetFile
     return report
   end
 
-  def self.load(scope, binary_filename, definition_filename)
+  def self.load(scope, binary_filename, definition_filename, row_offset: 0, row_count: nil)
     binary = body(scope, binary_filename)
     raise NotFound, "Binary file '#{binary_filename}' not found" unless binary
     begin
       root_definition, definition_filename, temp_dir = get_definitions(scope, definition_filename, binary_filename)
       raise NotFound, "Definition file '#{definition_filename}' not found" unless root_definition
-      json = OpenC3::TableManagerCore.build_json_hash(binary, root_definition)
+      json = OpenC3::TableManagerCore.build_json_hash(binary, root_definition, row_offset: row_offset, row_count: row_count)
       json['definition'] = definition_filename
     ensure
       # Cleanup temp_dir
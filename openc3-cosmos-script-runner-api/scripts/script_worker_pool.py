@@ -0,0 +1,271 @@
+# Copyright 2026 OpenC3, Inc.
+# All Rights Reserved.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See LICENSE.md for more details.
+#
+# This file may also be used under the terms of a commercial license
+# if purchased from OpenC3, Inc.
+
+# Pool of pre-forked Python script workers. This process starts one pool per
+# scope. Each pool sets OPENC3_SCOPE, imports the openc3 script stack once and
+# then forks workers which connect to Redis and wait on the scope's Unix socket.
+# The scope must be set before the import because the script APIs bind it as
+# the default of their scope arguments, which reloading the environment can't
+# change. RunningScript.spawn (running_script.rb) sends a request with the
+# script id, scope, working directory and environment to the socket of the
+# script's scope and one idle worker applies the environment and replies with
+# its pid. spawn then claims the worker which runs the script exactly like
+# run_script.py. Each worker runs a single script and exits so every script
+# starts from the same clean state. Another worker is forked to replace it.
+# Scripts in scopes without a pool are spawned as individual processes.
+
+import contextlib
+import importlib
+import json
+import os
+import select
+import signal
+import socket
+import sys
+import time
+
+
+# {scope} is replaced by the scope of the pool
+SOCKET_PATH = os.environ.get("OPENC3_SCRIPT_WORKER_POOL_SOCKET", "/tmp/script_worker_pool_{scope}.sock")
+POOL_SIZE = int(os.environ.get("OPENC3_SCRIPT_WORKER_POOL_SIZE", 2))
+# Comma separated scopes which get a pool
+POOL_SCOPES = os.environ.get("OPENC3_SCRIPT_WORKER_POOL_SCOPES", os.environ.get("OPENC3_SCOPE", "DEFAULT"))
+# Seconds a worker waits for RunningScript.spawn to claim it after replying
+CLAIM_TIMEOUT = 30
+# Environment variables which must match for a warm Redis / bucket connection to be reused
+CONNECTION_ENV_KEYS = [
+    "OPENC3_REDIS_HOSTNAME",
+    "OPENC3_REDIS_PORT",
+    "OPENC3_REDIS_USERNAME",
+    "OPENC3_REDIS_PASSWORD",
+    "OPENC3_REDIS_EPHEMERAL_HOSTNAME",
+    "OPENC3_REDIS_EPHEMERAL_PORT",
+    "OPENC3_BUCKET_URL",
+    "OPENC3_BUCKET_USERNAME",
+    "OPENC3_BUCKET_PASSWORD",
+]
+
+
+# Scripts use the Script Runner credentials (see RunningScript.spawn)
+def use_script_runner_credentials():
+    for key in ["REDIS_USERNAME", "REDIS_PASSWORD", "BUCKET_USERNAME", "BUCKET_PASSWORD"]:
+        value = os.environ.get(f"OPENC3_SR_{key}")
+        if value is None:
+            os.environ.pop(f"OPENC3_{key}", None)
+        else:
+            os.environ[f"OPENC3_{key}"] = value
+
+
+# Apply the environment sent by RunningScript.spawn. None values are removed.
+def apply_environment(environment):
+    for key, value in environment.items():
+        if value is None:
+            os.environ.pop(key, None)
+        else:
+            os.environ[key] = str(value)
+    refresh_environment()
+
+
+# openc3.environment reads the environment when it is imported and most modules
+# copy its values with 'from openc3.environment import *'. Reload it and rebind
+# every copied value which changed.
+def refresh_environment():
+    import openc3.environment as environment
+
+    names = [name for name in dir(environment) if name.isupper()]
+    old_values = {name: getattr(environment, name) for name in names}
+    importlib.reload(environment)
+    changed = {name: getattr(environment, name) for name in names if getattr(environment, name) != old_values[name]}
+    if not changed:
+        return
+    for name, module in list(sys.modules.items()):
+        if module is None or not (name == "openc3" or name.startswith("openc3.")):
+            continue
+        for key, value in changed.items():
+            if key in module.__dict__ and module.__dict__[key] == old_values[key]:
+                module.__dict__[key] = value
+
+
+def warm_connections():
+    from openc3.utilities.bucket import Bucket
+    from openc3.utilities.store import EphemeralStore, Store
+
+    Bucket.get_client()
+    Store.instance().ping()
+    EphemeralStore.instance().ping()
+
+
+def drop_connections():
+    from openc3.utilities.store import EphemeralStore, Store
+
+    Store.my_instances.clear()
+    EphemeralStore.my_instances.clear()
+
+
+# Read the request from RunningScript.spawn and reply with this worker's pid.
+# The script only runs once spawn claims the worker. If spawn stopped waiting it
+# closes the connection and spawns a process instead so the request is ignored.
+def accept_request(connection, connection_env, scope):
+    with connection.makefile("rb") as reader:
+        request = json.loads(reader.readline())
+        if request["args"][1] != scope:
+            raise ValueError(f"Worker for scope {scope} can't run a script in scope {request['args'][1]}")
+        apply_environment(request["environment"])
+        if connection_env != {key: os.environ.get(key) for key in CONNECTION_ENV_KEYS}:
+            drop_connections()
+        os.chdir(request["cwd"])
+        with contextlib.suppress(BrokenPipeError):
+            connection.sendall(json.dumps({"pid": os.getpid()}).encode() + b"\n")
+        connection.settimeout(CLAIM_TIMEOUT)
+        if reader.readline() != b"start\n":
+            return None
+    return request
+
+
+def import_script_stack():
+    import run_script
+
+    return run_script
+
+
+def worker(listener, taken_writer, scope, run_script):
+    with contextlib.suppress(Exception):
+        # Scripts can still connect on demand if this fails
+        warm_connections()
+    connection_env = {key: os.environ.get(key) for key in CONNECTION_ENV_KEYS}
+
+    connection, _ = listener.accept()
+    start_time = time.time()
+    listener.close()
+    # Tell the pool to replace this worker
+    os.write(taken_writer, f"{os.getpid()}\n".encode())
+    os.close(taken_writer)
+    try:
+        request = accept_request(connection, connection_env, scope)
+    except Exception as error:
+        with contextlib.suppress(OSError):
+            connection.sendall(json.dumps({"error": repr(error)}).encode() + b"\n")
+        os._exit(1)
+    finally:
+        connection.close()
+    if request is None:
+        os._exit(0)
+
+    script_id = request["args"][0]
+    try:
+        run_script.run_script(script_id, scope, start_time=start_time, working_dir=request["cwd"])
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(0)
+
+
+def fork_worker(listener, taken_writer, scope, run_script):
+    pid = os.fork()
+    if pid == 0:
+        signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        try:
+            worker(listener, taken_writer, scope, run_script)
+        finally:
+            os._exit(1)
+    return pid
+
+
+# Run the pool of workers for one scope. This must run in a process which has
+# not imported the script stack yet (see fork_pool).
+def run_pool(scope):
+    os.environ["OPENC3_SCOPE"] = scope
+    # Import the script stack once so it is shared by every forked worker
+    run_script = import_script_stack()
+
+    socket_path = SOCKET_PATH.format(scope=scope)
+    with contextlib.suppress(FileNotFoundError):
+        os.remove(socket_path)
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(socket_path)
+    os.chmod(socket_path, 0o600)
+    listener.listen(POOL_SIZE * 4)
+    taken_reader, taken_writer = os.pipe()
+    idle_workers = set()
+
+    def shutdown(_signum, _frame):
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(socket_path)
+        for pid in idle_workers:
+            with contextlib.suppress(ProcessLookupError):
+                os.kill(pid, signal.SIGTERM)
+        sys.exit(0)
+
+    signal.signal(signal.SIGTERM, shutdown)
+
+    while True:
+        # Refill the pool
+        while len(idle_workers) < POOL_SIZE:
+            idle_workers.add(fork_worker(listener, taken_writer, scope, run_script))
+
+        readable, _, _ = select.select([taken_reader], [], [], 1.0)
+        if readable:
+            for pid in os.read(taken_reader, 4096).decode().split():
+                idle_workers.discard(int(pid))
+
+        # Reap workers which have finished their scripts (or died while idle)
+        with contextlib.suppress(ChildProcessError):
+            while True:
+                pid, _ = os.waitpid(-1, os.WNOHANG)
+                if pid == 0:
+                    break
+                idle_workers.discard(pid)
+
+
+def fork_pool(scope):
+    pid = os.fork()
+    if pid == 0:
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        try:
+            run_pool(scope)
+        finally:
+            os._exit(1)
+    return pid
+
+
+def main():
+    if POOL_SIZE <= 0:
+        # Pool disabled so scripts are spawned as individual processes
+        while True:
+            signal.pause()
+
+    use_script_runner_credentials()
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    scopes = [scope.strip() for scope in POOL_SCOPES.split(",") if scope.strip()]
+    pools = {}
+
+    def shutdown(_signum, _frame):
+        for pid in pools:
+            with contextlib.suppress(ProcessLookupError):
+                os.kill(pid, signal.SIGTERM)
+        sys.exit(0)
+
+    signal.signal(signal.SIGTERM, shutdown)
+
+    while True:
+        # Start (or restart) the pool of every scope
+        for scope in scopes:
+            if scope not in pools.values():
+                pools[fork_pool(scope)] = scope
+        pid, _ = os.wait()
+        if pools.pop(pid, None) is not None:
+            # Don't spin if a pool can't start
+            time.sleep(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -10,6 +10,7 @@
 
 require "rails_helper"
 require "tempfile"
+require "tmpdir"
 
 RSpec.describe RunningScript, type: :model do
   let(:script_status) {
@@ -275,6 +276,92 @@ RSpec.describe RunningScript, type: :model do
     end
   end
 
+  describe "self.start_in_worker_pool" do
+    let(:process) { double("process", environment: { 'OPENC3_SCOPE' => 'DEFAULT' }) }
+
+    before(:each) do
+      @dir = Dir.mktmpdir
+      @socket_path = File.join(@dir, "pool.sock")
+      allow(ENV).to receive(:fetch).and_call_original
+      allow(ENV).to receive(:fetch).with('OPENC3_SCRIPT_WORKER_POOL_SOCKET', anything).and_return(@socket_path)
+    end
+
+    after(:each) do
+      FileUtils.rm_rf(@dir)
+    end
+
+    # Acts as a pool worker which replies with its pid and returns what spawn sends next
+    def start_worker(server)
+      Thread.new do
+        connection = server.accept
+        request = JSON.parse(connection.gets)
+        connection.write(JSON.generate({ pid: 1234 }) + "\n")
+        [request, connection.gets]
+      ensure
+        connection&.close
+      end
+    end
+
+    it "returns false if the pool is not running" do
+      expect(RunningScript.start_in_worker_pool(process, 1, "DEFAULT", "/tmp")).to be false
+    end
+
+    it "claims the worker which accepts the script" do
+      server = UNIXServer.new(@socket_path)
+      worker = start_worker(server)
+
+      expect(RunningScript.start_in_worker_pool(process, 1, "DEFAULT", "/tmp")).to be true
+      request, claim = worker.value
+      expect(request['args']).to eq(["1", "DEFAULT"])
+      expect(request['cwd']).to eq("/tmp")
+      expect(request['environment']).to eq({ 'OPENC3_SCOPE' => 'DEFAULT' })
+      expect(claim).to eq("start\n")
+      server.close
+    end
+
+    it "uses the pool of the script's scope" do
+      allow(ENV).to receive(:fetch).with('OPENC3_SCRIPT_WORKER_POOL_SOCKET', anything).and_return(File.join(@dir, "pool_{scope}.sock"))
+      server = UNIXServer.new(File.join(@dir, "pool_OTHER.sock"))
+      worker = start_worker(server)
+
+      # There is no pool for the DEFAULT scope
+      expect(RunningScript.start_in_worker_pool(process, 1, "DEFAULT", "/tmp")).to be false
+      expect(RunningScript.start_in_worker_pool(process, 1, "OTHER", "/tmp")).to be true
+      request, _ = worker.value
+      expect(request['args']).to eq(["1", "OTHER"])
+      server.close
+    end
+
+    it "does not claim a worker which answers too late" do
+      server = UNIXServer.new(@socket_path)
+      worker = start_worker(server)
+      allow_any_instance_of(UNIXSocket).to receive(:wait_readable).and_return(nil)
+
+      expect(RunningScript.start_in_worker_pool(process, 1, "DEFAULT", "/tmp")).to be false
+      # The worker sees the connection close instead of a claim so it ignores the request
+      _, claim = worker.value
+      expect(claim).to be_nil
+      server.close
+    end
+
+    it "spawns a process if the pool does not accept the script" do
+      process_double = double("process")
+      allow(process_double).to receive(:io).and_return(double("io", inherit!: nil))
+      allow(process_double).to receive(:cwd=)
+      allow(process_double).to receive(:environment).and_return({})
+      allow(process_double).to receive(:detach=)
+      allow(ChildProcess).to receive(:build).and_return(process_double)
+
+      allow(RunningScript).to receive(:start_in_worker_pool).and_return(true)
+      expect(process_double).not_to receive(:start)
+      RunningScript.spawn("DEFAULT", "script.py")
+
+      allow(RunningScript).to receive(:start_in_worker_pool).and_return(false)
+      expect(process_double).to receive(:start)
+      RunningScript.spawn("DEFAULT", "script.py")
+    end
+  end
+
   describe "#run with suite_runner" do
     before do
       # Avoid hitting the bucket when RunningScript#initialize fetches the body
@@ -0,0 +1,188 @@
+# Copyright 2026 OpenC3, Inc.
+# All Rights Reserved.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See LICENSE.md for more details.
+#
+# This file may also be used under the terms of a commercial license
+# if purchased from OpenC3, Inc.
+
+import importlib.util
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import textwrap
+import time
+
+import pytest
+
+import openc3.environment
+import openc3.utilities.bucket
+
+
+spec = importlib.util.spec_from_file_location(
+    "script_worker_pool", os.path.join(os.path.dirname(__file__), "../../scripts/script_worker_pool.py")
+)
+script_worker_pool = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(script_worker_pool)
+
+
+@pytest.fixture
+def clean_environment(monkeypatch):
+    monkeypatch.setenv("OPENC3_CLOUD", "local")
+    yield monkeypatch
+    monkeypatch.undo()
+    script_worker_pool.refresh_environment()
+
+
+def test_apply_environment_sets_and_removes_variables(clean_environment):
+    clean_environment.setenv("WORKER_POOL_REMOVED", "1")
+    script_worker_pool.apply_environment({"WORKER_POOL_ADDED": "value", "WORKER_POOL_REMOVED": None})
+    assert os.environ["WORKER_POOL_ADDED"] == "value"
+    assert "WORKER_POOL_REMOVED" not in os.environ
+    os.environ.pop("WORKER_POOL_ADDED")
+
+
+def test_apply_environment_rebinds_imported_values(clean_environment):
+    script_worker_pool.refresh_environment()
+    assert openc3.utilities.bucket.OPENC3_CLOUD == "local"
+    script_worker_pool.apply_environment({"OPENC3_CLOUD": "aws"})
+    assert openc3.environment.OPENC3_CLOUD == "aws"
+    assert openc3.utilities.bucket.OPENC3_CLOUD == "aws"
+
+
+def test_use_script_runner_credentials(clean_environment):
+    clean_environment.delenv("OPENC3_REDIS_USERNAME", raising=False)
+    clean_environment.setenv("OPENC3_SR_REDIS_USERNAME", "scriptrunner")
+    clean_environment.delenv("OPENC3_SR_REDIS_PASSWORD", raising=False)
+    clean_environment.setenv("OPENC3_REDIS_PASSWORD", "secret")
+    script_worker_pool.use_script_runner_credentials()
+    assert os.environ["OPENC3_REDIS_USERNAME"] == "scriptrunner"
+    assert "OPENC3_REDIS_PASSWORD" not in os.environ
+
+
+def send_request(connection):
+    request = {"args": ["1", "DEFAULT"], "cwd": os.getcwd(), "environment": {}}
+    connection.sendall(json.dumps(request).encode() + b"\n")
+    return request
+
+
+def test_accept_request_runs_the_script_once_claimed(clean_environment):
+    spawn, worker = socket.socketpair()
+    with spawn, worker:
+        request = send_request(spawn)
+        spawn.sendall(b"start\n")
+        assert script_worker_pool.accept_request(worker, {}, "DEFAULT") == request
+        assert json.loads(spawn.makefile("rb").readline()) == {"pid": os.getpid()}
+
+
+def test_accept_request_ignores_a_request_which_is_not_claimed(clean_environment):
+    spawn, worker = socket.socketpair()
+    with worker:
+        send_request(spawn)
+        # spawn stopped waiting and closed the connection to spawn a process instead
+        spawn.close()
+        assert script_worker_pool.accept_request(worker, {}, "DEFAULT") is None
+
+
+def test_accept_request_rejects_another_scope(clean_environment):
+    spawn, worker = socket.socketpair()
+    with spawn, worker:
+        send_request(spawn)
+        with pytest.raises(ValueError, match="Worker for scope OTHER can't run a script in scope DEFAULT"):
+            script_worker_pool.accept_request(worker, {}, "OTHER")
+
+
+# Runs the pool in a new interpreter (the script stack must not be imported yet)
+# with a script stack which reports the scope defaults of the script APIs
+POOL_DRIVER = textwrap.dedent(
+    """
+    import importlib.util, json, os, sys
+
+    spec = importlib.util.spec_from_file_location("script_worker_pool", sys.argv[1])
+    script_worker_pool = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(script_worker_pool)
+
+    def import_script_stack():
+        import openc3.script
+        import openc3.script.commands
+
+        class RunScript:
+            @staticmethod
+            def run_script(script_id, scope, start_time=None, working_dir=None):
+                result = {
+                    "scope": scope,
+                    "environment": os.environ["OPENC3_SCOPE"],
+                    "list_timelines": openc3.script.list_timelines.__defaults__[0],
+                    "cmd": openc3.script.commands._cmd.__kwdefaults__["scope"],
+                }
+                with open(os.path.join(working_dir, f"{script_id}.json"), "w") as file:
+                    json.dump(result, file)
+
+        return RunScript
+
+    script_worker_pool.import_script_stack = import_script_stack
+    script_worker_pool.main()
+    """
+)
+
+
+def run_pooled_script(socket_path, script_id, scope, cwd):
+    for _ in range(300):
+        if os.path.exists(socket_path):
+            break
+        time.sleep(0.1)
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.connect(socket_path)
+        request = {"args": [script_id, scope], "cwd": cwd, "environment": {"OPENC3_SCOPE": scope}}
+        connection.sendall(json.dumps(request).encode() + b"\n")
+        response = json.loads(connection.makefile("rb").readline())
+        if "pid" in response:
+            connection.sendall(b"start\n")
+        return response
+
+
+def test_pooled_scripts_use_the_scope_of_their_pool(tmp_path):
+    env = dict(os.environ)
+    env.update(
+        {
+            "OPENC3_SCOPE": "DEFAULT",
+            "OPENC3_SCRIPT_WORKER_POOL_SCOPES": "DEFAULT,OTHER",
+            "OPENC3_SCRIPT_WORKER_POOL_SIZE": "1",
+            "OPENC3_SCRIPT_WORKER_POOL_SOCKET": str(tmp_path / "pool_{scope}.sock"),
+            # Nothing listens here so warming the connections fails quickly
+            "OPENC3_REDIS_HOSTNAME": "127.0.0.1",
+            "OPENC3_REDIS_PORT": "1",
+            "OPENC3_REDIS_EPHEMERAL_HOSTNAME": "127.0.0.1",
+            "OPENC3_REDIS_EPHEMERAL_PORT": "1",
+        }
+    )
+    pool = subprocess.Popen(
+        [sys.executable, "-c", POOL_DRIVER, script_worker_pool.__file__], env=env, start_new_session=True
+    )
+    try:
+        for script_id, scope in (("1", "OTHER"), ("2", "DEFAULT")):
+            response = run_pooled_script(str(tmp_path / f"pool_{scope}.sock"), script_id, scope, str(tmp_path))
+            assert "pid" in response
+            result_path = tmp_path / f"{script_id}.json"
+            for _ in range(100):
+                if result_path.exists():
+                    break
+                time.sleep(0.1)
+            assert json.loads(result_path.read_text()) == {
+                "scope": scope,
+                "environment": scope,
+                "list_timelines": scope,
+                "cmd": scope,
+            }
+        # A pool only runs scripts in its own scope
+        response = run_pooled_script(str(tmp_path / "pool_OTHER.sock"), "3", "DEFAULT", str(tmp_path))
+        assert "can't run a script in scope DEFAULT" in response["error"]
+    finally:
+        os.killpg(pool.pid, signal.SIGTERM)
+        pool.wait(10)
@@ -41,6 +41,7 @@ module OpenC3
                        'cmd_raw_no_range_check',
                        'cmd_raw_no_hazardous_check',
                        'cmd_raw_no_checks',
+                       'cmd_many',
                        'build_cmd',
                        'build_command', # DEPRECATED
                        'enable_cmd',
@@ -106,6 +107,52 @@ module OpenC3
       _cmd_implementation('cmd_raw_no_checks', *args, range_check: false, hazardous_check: false, raw: true, **kwargs)
     end
 
+    # Send many commands with one call. Each command is given in either calling style of cmd
+    # or as a Hash with the command and its own keyword arguments such as the ack timeout:
+    #   cmd_many(["INST ABORT", ["INST", "COLLECT", {"TYPE" => "NORMAL"}]])
+    #   cmd_many([{"command" => "INST ABORT", "timeout" => 1}, "INST CLEAR"], timeout: 10)
+    #
+    # Every command is built and authorized the same way as cmd before any are sent. They are
+    # then pipelined so scripts pay about one round trip rather than one per command (see
+    # CommandTopic.send_commands). A possibly hazardous or restricted command is only sent after
+    # every earlier ack and nothing after it is sent until its own ack, so its HazardousError or
+    # CriticalCmdError is raised before anything later is sent. This holds whatever hazardous_check
+    # is because the interface may hold these commands for approval when critical commanding is on.
+    #
+    # @param commands [Array<String|Array|Hash>] Commands to send
+    # @param raw [Boolean] Whether to send the commands without conversions like cmd_raw
+    # @param range_check [Boolean] Whether to check the parameters against their ranges like cmd_no_range_check
+    # @param hazardous_check [Boolean] Whether to reject hazardous commands like cmd_no_hazardous_check
+    # @return [Array<Hash>] The commands which were sent
+    def cmd_many(commands, raw: false, range_check: true, hazardous_check: true, scope: $openc3_scope, **kwargs)
+      method_name = raw ? 'cmd_raw' : 'cmd'
+      if !range_check
+        method_name += hazardous_check ? '_no_range_check' : '_no_checks'
+      elsif !hazardous_check
+        method_name += '_no_hazardous_check'
+      end
+      to_send = []
+      timeouts = []
+      isolate = []
+      commands.each do |args|
+        cmd_kwargs = kwargs.dup
+        if args.is_a?(Hash)
+          cmd_kwargs = kwargs.merge(args.transform_keys(&:to_sym))
+          args = cmd_kwargs.delete(:command)
+        end
+        queue = cmd_kwargs.delete(:queue)
+        command, packet = _build_cmd_hash(method_name, *Array(args), range_check: range_check, hazardous_check: hazardous_check, raw: raw, scope: scope, **cmd_kwargs)
+        timeout = cmd_kwargs[:timeout].nil? ? nil : Float(cmd_kwargs[:timeout])
+        next if _queue_cmd(command, queue, validate: cmd_kwargs.fetch(:validate, true), timeout: timeout, scope: scope)
+
+        to_send << command
+        timeouts << timeout
+        isolate << _cmd_needs_isolation(packet)
+      end
+      CommandTopic.send_commands(to_send, timeout: timeouts, scope: scope, isolate: isolate)
+      return to_send
+    end
+
     # Build a command binary
     #
     # @since 5.8.0
@@ -449,8 +496,21 @@ module OpenC3
     end
 
     # NOTE: When adding new keywords to this method, make sure to update script/commands.rb
-    def _cmd_implementation(method_name, *args, range_check:, hazardous_check:, raw:, timeout: nil, log_message: nil, manual: false, validate: true, queue: nil,
-                            queue_username: nil, scope: $openc3_scope, token: $openc3_token, **kwargs)
+    def _cmd_implementation(method_name, *args, range_check:, hazardous_check:, raw:, timeout: nil, validate: true, queue: nil,
+                            scope: $openc3_scope, **kwargs)
+      command, _ = _build_cmd_hash(method_name, *args, range_check: range_check, hazardous_check: hazardous_check, raw: raw,
+                                   timeout: timeout, validate: validate, scope: scope, **kwargs)
+      unless _queue_cmd(command, queue, validate: validate, timeout: timeout, scope: scope)
+        CommandTopic.send_command(command, timeout: timeout, scope: scope)
+      end
+      return command
+    end
+
+    # Authorize and build the command hash written to the CMD topic
+    #
+    # @return [Array<Hash>] The command hash and the packet hash
+    def _build_cmd_hash(method_name, *args, range_check:, hazardous_check:, raw:, timeout: nil, log_message: nil, manual: false, validate: true,
+                        queue_username: nil, scope: $openc3_scope, token: $openc3_token, **kwargs)
       extract_string_kwargs_to_args(args, kwargs)
       unless [nil, true, false].include?(log_message)
         raise "Invalid log_message parameter: #{log_message}. Must be true or false."
@@ -539,25 +599,41 @@ module OpenC3
       # user or process that actually executed the command). Command History shows
       # 'username' as "Executed By" and queue_username as "Queued By".
       command['queue_username'] = queue_username if queue_username
+      return command, packet
+    end
+
+    # Whether the packet hash is restricted, hazardous or has any hazardous states. These
+    # commands can be rejected or held for approval by the interface so cmd_many doesn't
+    # pipeline them. The default value of a parameter can be hazardous so the given
+    # parameters aren't considered.
+    def _cmd_needs_isolation(packet)
+      return true if packet['restricted'] or packet['hazardous']
+      packet['items'].any? do |item|
+        (item['states'] || {}).values.any? { |state| state.key?('hazardous') }
+      end
+    end
+
+    # Queue the command if requested
+    #
+    # @return [Boolean] Whether the command was queued
+    def _queue_cmd(command, queue, validate:, timeout:, scope:)
       # Users have to explicitly opt into a default queue by setting the OPENC3_DEFAULT_QUEUE
       # At which point ALL commands will go to that queue unless they specifically opt out with queue: false
       if ENV['OPENC3_DEFAULT_QUEUE'] && queue.nil?
         queue = ENV['OPENC3_DEFAULT_QUEUE']
       end
-      if queue
-        # Pass the command components separately for the queue microservice to use the 3-parameter cmd() method
-        QueueModel.queue_command(queue,
-          target_name: target_name,
-          cmd_name: cmd_name,
-          cmd_params: cmd_params,
-          validate: validate,
-          timeout: timeout,
-          username: username,
-          scope: scope)
-      else
-        CommandTopic.send_command(command, timeout: timeout, scope: scope)
-      end
-      return command
+      return false unless queue
+
+      # Pass the command components separately for the queue microservice to use the 3-parameter cmd() method
+      QueueModel.queue_command(queue,
+        target_name: command['target_name'],
+        cmd_name: command['cmd_name'],
+        cmd_params: command['cmd_params'],
+        validate: validate,
+        timeout: timeout,
+        username: command['username'],
+        scope: scope)
+      return true
     end
   end
 end
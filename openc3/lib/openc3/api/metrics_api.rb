@@ -65,6 +65,11 @@ module OpenC3
         next unless metrics and metrics['values']
         metrics['values'].each do |metric_name, data|
           value = data['value']
+          # Histograms (published by the Python Metric) are compared by their mean
+          if value.is_a?(Hash)
+            next unless value['count'].to_i > 0
+            value = value['sum'] / value['count']
+          end
           if sum_metrics[metric_name]
             sum_metrics[metric_name] += value
           elsif duration_metrics[metric_name]
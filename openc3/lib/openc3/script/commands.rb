@@ -188,6 +188,30 @@ module OpenC3
       _cmd('cmd_raw_no_checks', nil, *args, **kwargs)
     end
 
+    # Send many commands with one call
+    #
+    # Usage:
+    #   cmd_many(['INST ABORT', ['INST', 'COLLECT', {'TYPE' => 'NORMAL'}]])
+    # A command can also be a Hash with its own keyword arguments such as the ack timeout:
+    #   cmd_many([{'command' => 'INST ABORT', 'timeout' => 1}, 'INST CLEAR'], timeout: 10)
+    # Hazardous commands are not prompted for like they are by cmd. The HazardousError
+    # is raised and the commands after it are not sent.
+    def cmd_many(commands, raw: false, range_check: true, hazardous_check: true, log_message: nil, scope: $openc3_scope, token: $openc3_token, **kwargs)
+      no_range = !range_check
+      no_hazardous = !hazardous_check
+      if $disconnect
+        commands.each do |args|
+          args = args['command'] if args.is_a?(Hash)
+          _cmd_disconnect('cmd_many', raw, no_range, no_hazardous, *Array(args), scope: scope)
+        end
+      else
+        sent = $api_server.cmd_many(commands, raw: raw, range_check: range_check, hazardous_check: hazardous_check, log_message: log_message, scope: scope, token: token, **kwargs)
+        if log_message.nil? or log_message
+          sent.each { |command| _log_cmd(command, raw, no_range, no_hazardous) }
+        end
+      end
+    end
+
     # Builds a command binary
     #
     # Accepts two different calling styles:
@@ -455,13 +455,16 @@ module OpenC3
       stream_action('remove', items: items, packets: packets, scope: scope)
     end
 
-    # Convenience method to read all data until end marker is received.
+    # Yield each batch (an Array of Hashes) as it arrives until the end marker
+    # is received. Only one batch is held in RAM at a time. Returns an
+    # Enumerator if no block is given.
     # Omitting end_time streams realtime and endlessly: no end marker is ever
-    # sent, so a timeout is the only way the collection ends on its own.
-    # Warning: DATA IS STORED IN RAM.  Do not use this with large queries
-    def self.read_all(items: nil, packets: nil, start_time: nil, end_time: nil, scope: nil, timeout: nil)
+    # sent, so a timeout (or breaking out of the block) is the only way it ends.
+    def self.read_batches(items: nil, packets: nil, start_time: nil, end_time: nil, scope: nil, timeout: nil)
+      unless block_given?
+        return enum_for(:read_batches, items: items, packets: packets, start_time: start_time, end_time: end_time, scope: scope, timeout: timeout)
+      end
       read_all_start_time = Time.now
-      data = []
       self.new do |api|
         api.add(items: items, packets: packets, start_time: start_time, end_time: end_time, scope: scope)
         while true
@@ -472,24 +475,32 @@ module OpenC3
             # never gets one, so a close is an ordinary way for it to end.
             raise "WebSocket closed before end marker" if end_time
 
-            return data
+            return
           end
           # An empty batch is the explicit end marker sent after a historical
           # query is complete.
-          if batch.empty?
-            return data
-          else
-            data.concat(batch)
-          end
+          return if batch.empty?
+          yield batch
           if timeout
-            if (Time.now - read_all_start_time) > timeout
-              return data
-            end
+            return if (Time.now - read_all_start_time) > timeout
           end
         end
       end
     end
 
+    # Convenience method to read all data until end marker is received.
+    # Omitting end_time streams realtime and endlessly: no end marker is ever
+    # sent, so a timeout is the only way the collection ends on its own.
+    # Warning: DATA IS STORED IN RAM.  Do not use this with large queries.
+    # Use read_batches instead.
+    def self.read_all(items: nil, packets: nil, start_time: nil, end_time: nil, scope: nil, timeout: nil)
+      data = []
+      read_batches(items: items, packets: packets, start_time: start_time, end_time: end_time, scope: scope, timeout: timeout) do |batch|
+        data.concat(batch)
+      end
+      return data
+    end
+
     # private
 
     # Accept either a Time or an already converted 64-bit nanosecond value
@@ -125,8 +125,10 @@ module OpenC3
     end
 
     # We build the json hash without converting to a json string to allow modifying the hash
-    # app/models/table.rb uses this ability to add the real definition filename
-    def self.build_json_hash(binary, definition_filename)
+    # app/models/table.rb uses this ability to add the real definition filename.
+    # Pass row_offset and row_count to return only a page of each table's rows.
+    # Paged results are for viewing, save requires every row.
+    def self.build_json_hash(binary, definition_filename, row_offset: 0, row_count: nil)
       config = TableConfig.process_file(definition_filename)
       tables = []
       json = { tables: tables }
@@ -143,52 +145,105 @@ module OpenC3
           headers: [],
           rows: [],
         }
-        col = 0
-        row = 0
-        table.sorted_items.each_with_index do |item, _index|
-          next if item.hidden
-          if table.num_columns == 1
-            if row == 0
-              tables[-1][:headers] = [ "INDEX", "NAME", "VALUE" ]
-            end
-            tables[-1][:rows] << [
-              {
-                index: row + 1,
-                name: item.name,
-                value: table.read(item.name, :FORMATTED),
-                states: item.states,
-                editable: item.editable,
-              },
-            ]
-          else
-            if row == 0 && col == 0
-              tables[-1][:headers] << "INDEX"
-            end
-            if row == 0
-              tables[-1][:headers] << item.name[0..-2]
-            end
-            if col == 0
-              # Each row is an array of items
-              tables[-1][:rows][row] = []
-            end
-            tables[-1][:rows][row] << {
-              index: row + 1,
-              name: item.name,
-              value: table.read(item.name, :FORMATTED),
-              states: item.states,
-              editable: item.editable,
-            }
-          end
-          col += 1
-          if col == table.num_columns
-            col = 0
-            row += 1
-          end
+        tables[-1][:rowOffset] = row_offset if row_offset != 0 or row_count
+        items = table.sorted_items.reject { |item| item.hidden }
+        next if items.empty?
+
+        # Items are laid out row by row so item N is in row N / columns
+        columns = [table.num_columns, 1].max
+        if table.num_columns == 1
+          tables[-1][:headers] = [ "INDEX", "NAME", "VALUE" ]
+        else
+          tables[-1][:headers] = ["INDEX"] + items[0...columns].map { |item| item.name[0..-2] }
+        end
+
+        first = row_offset * columns
+        page_items = row_count ? items[first...((row_offset + row_count) * columns)] : items[first..]
+        page_items ||= []
+        values = formatted_values(table, page_items, row_offset, row_count)
+        page_items.each_with_index do |item, index|
+          # Each row is an array of items
+          tables[-1][:rows] << [] if index % columns == 0
+          tables[-1][:rows][-1] << {
+            index: row_offset + (index / columns) + 1,
+            name: item.name,
+            value: values[index],
+            states: item.states,
+            editable: item.editable,
+          }
         end
       end
       json.as_json()
     end
 
+    # Pack directives for whole byte items keyed by [data_type, bit_size]
+    PACK_DIRECTIVES = {
+      [:INT, 8] => 'c', [:INT, 16] => 's', [:INT, 32] => 'l', [:INT, 64] => 'q',
+      [:UINT, 8] => 'C', [:UINT, 16] => 'S', [:UINT, 32] => 'L', [:UINT, 64] => 'Q',
+    }
+    FLOAT_DIRECTIVES = {
+      [:BIG_ENDIAN, 32] => 'g', [:BIG_ENDIAN, 64] => 'G',
+      [:LITTLE_ENDIAN, 32] => 'e', [:LITTLE_ENDIAN, 64] => 'E',
+    }
+
+    # Read the FORMATTED values of many table items at once. The RAW values are
+    # read in a single pass over the table buffer and then formatted.
+    def self.formatted_values(table, items, row_offset = 0, row_count = nil)
+      raw_values = unpack_rows(table, row_offset, row_count)
+      # Hidden items shift which table rows the items come from so make sure all were unpacked
+      if raw_values.nil? or !items.all? { |item| raw_values.key?(item.name) }
+        raw_values = table.read_items(items, :RAW)
+      end
+      buffer = table.buffer(false)
+      items.map { |item| table.read_item(item, :FORMATTED, buffer, raw_values[item.name]) }
+    end
+
+    # Read the RAW values of a ROW_COLUMN table by unpacking every row with the
+    # same directives. Only possible if the items in a row are byte aligned
+    # whole byte integers and floats of the same endianness. Returns nil otherwise.
+    def self.unpack_rows(table, row_offset = 0, row_count = nil)
+      columns = table.num_columns
+      return nil if table.type != :ROW_COLUMN or columns < 1 or table.sorted_items.length != columns * table.num_rows
+
+      row_items = table.sorted_items[0...columns]
+      endianness = row_items[0].endianness
+      row_bit_offset = row_items[0].bit_offset
+      return nil if row_bit_offset % 8 != 0
+
+      row_format = ''
+      position = row_bit_offset
+      row_items.each do |item|
+        if item.data_type == :FLOAT
+          directive = FLOAT_DIRECTIVES[[endianness, item.bit_size]]
+        else
+          directive = PACK_DIRECTIVES[[item.data_type, item.bit_size]]
+          directive += (endianness == :BIG_ENDIAN ? '>' : '<') if directive and item.bit_size > 8
+        end
+        return nil if directive.nil? or item.endianness != endianness or item.array_size
+        return nil if item.bit_offset < position or item.bit_offset % 8 != 0
+
+        row_format << ('x' * ((item.bit_offset - position) / 8)) << directive
+        position = item.bit_offset + item.bit_size
+      end
+      row_size = (position - row_bit_offset) / 8
+      return nil if table.num_rows > 1 and table.sorted_items[columns].bit_offset - row_bit_offset != row_size * 8
+
+      first_row = [row_offset, table.num_rows].min
+      last_row = row_count ? [row_offset + row_count, table.num_rows].min : table.num_rows
+      buffer = table.buffer(false)
+      start = row_bit_offset / 8 + first_row * row_size
+      return nil if buffer.length < start + (last_row - first_row) * row_size
+
+      values = {}
+      (first_row...last_row).each do |row|
+        row_values = buffer.unpack(row_format, offset: start + (row - first_row) * row_size)
+        row_values.each_with_index do |value, column|
+          values[table.sorted_items[row * columns + column].name] = value
+        end
+      end
+      values
+    end
+
     def self.load_binary(config, data)
       binary_data_index = 0
       total_table_length = 0
@@ -0,0 +1,134 @@
+# encoding: ascii-8bit
+
+# Copyright 2026 OpenC3, Inc.
+# All Rights Reserved.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See LICENSE.md for more details.
+
+# This file may also be used under the terms of a commercial license
+# if purchased from OpenC3, Inc.
+
+require 'openc3/utilities/store'
+require 'openc3/utilities/logger'
+
+module OpenC3
+  # Demultiplexes an ACKCMD topic to the threads waiting on it.
+  #
+  # Each process has one dispatcher per ack topic. A single background thread reads
+  # the topic and hands the ack for each message id to the thread which registered it,
+  # so senders never read each other's acks and can have many messages in flight.
+  # The thread only runs while acks are pending and continues from the last offset it read.
+  class AckDispatcher
+    # Milliseconds to block reading the ack topic
+    READ_TIMEOUT_MS = 100
+    # Maximum number of acks kept which arrived before their sender registered
+    UNCLAIMED_LIMIT = 1000
+
+    @@instances = {}
+    @@instance_mutex = Mutex.new
+
+    attr_reader :store
+
+    # Get the dispatcher for an ack topic. This must be called before writing
+    # the message to be acknowledged so the ack is not missed.
+    def self.instance(ack_topic, db_shard: 0)
+      store = EphemeralStore.instance(db_shard: db_shard)
+      @@instance_mutex.synchronize do
+        dispatcher = @@instances[[ack_topic, db_shard]]
+        # The store is replaced when the connection is reset
+        if dispatcher.nil? or !dispatcher.store.equal?(store)
+          dispatcher = self.new(ack_topic, store)
+          @@instances[[ack_topic, db_shard]] = dispatcher
+        end
+        return dispatcher
+      end
+    end
+
+    def initialize(ack_topic, store)
+      @ack_topic = ack_topic
+      @store = store
+      # Only acks written after the dispatcher is created are read
+      @offset = store.get_last_offset(ack_topic)
+      @pending = {}
+      @unclaimed = {}
+      @mutex = Mutex.new
+      @thread = nil
+    end
+
+    # @param msg_id [String] Id returned by Topic.write_topic for the message being acknowledged
+    # @return [Queue] Queue which receives the ack msg_hash (pass it to #wait)
+    def register(msg_id)
+      queue = Queue.new
+      @mutex.synchronize do
+        msg_hash = @unclaimed.delete(msg_id)
+        if msg_hash
+          queue << msg_hash
+          return queue
+        end
+        @pending[msg_id] = queue
+        @thread ||= Thread.new { run() }
+      end
+      return queue
+    end
+
+    # Wait for a registered ack
+    #
+    # @return [Hash|nil] The ack msg_hash or nil if the timeout expired
+    def wait(msg_id, queue, timeout)
+      msg_hash = queue.pop(timeout: [timeout, 0].max)
+      if msg_hash.nil?
+        discard(msg_id)
+        return nil
+      end
+      raise msg_hash if msg_hash.is_a?(Exception)
+      return msg_hash
+    end
+
+    # Stop waiting for an ack which is no longer needed
+    def discard(msg_id)
+      @mutex.synchronize { @pending.delete(msg_id) }
+    end
+
+    def run
+      while true
+        @store.read_topics([@ack_topic], [@offset], READ_TIMEOUT_MS) do |_topic, msg_id, msg_hash, _redis|
+          @offset = msg_id
+          dispatch(msg_hash)
+        end
+        @mutex.synchronize do
+          if @pending.empty?
+            @thread = nil
+            return
+          end
+        end
+      end
+    rescue => e
+      Logger.error("AckDispatcher for #{@ack_topic} failed: #{e.formatted}")
+      pending = nil
+      @mutex.synchronize do
+        pending = @pending
+        @pending = {}
+        @thread = nil
+      end
+      pending.each_value { |queue| queue << e }
+    end
+
+    def dispatch(msg_hash)
+      msg_id = msg_hash['id']
+      return unless msg_id
+      @mutex.synchronize do
+        queue = @pending.delete(msg_id)
+        if queue
+          queue << msg_hash
+        else
+          # The sender may not have registered yet
+          @unclaimed[msg_id] = msg_hash
+          @unclaimed.delete(@unclaimed.first[0]) if @unclaimed.length > UNCLAIMED_LIMIT
+        end
+      end
+    end
+  end
+end
@@ -16,6 +16,7 @@
 # if purchased from OpenC3, Inc.
 
 require 'openc3/topics/topic'
+require 'openc3/topics/ack_dispatcher'
 require 'openc3/utilities/store_queued'
 require 'openc3/utilities/open_telemetry'
 
@@ -23,6 +24,9 @@ module OpenC3
   class CommandTopic < Topic
     # TODO: This is in several places, should maybe be a parameter in settings?
     COMMAND_ACK_TIMEOUT_S = 30
+    # Commands sent before waiting for an ack. This must be well under the ack
+    # topic length (100) or acks could be trimmed before they are read.
+    MAX_IN_FLIGHT = 50
 
     def self.write_packet(packet, scope:)
       topic = "#{scope}__COMMAND__{#{packet.target_name}}__#{packet.packet_name}"
@@ -41,49 +45,100 @@ module OpenC3
     # @param command [Hash] Command hash structure read to be written to a topic
     # @param timeout [Float] Timeout in seconds. Set to 0 or negative for fire-and-forget mode (no ACK waiting).
     def self.send_command(command, timeout: COMMAND_ACK_TIMEOUT_S, scope:, obfuscated_items: [])
-      timeout = COMMAND_ACK_TIMEOUT_S unless timeout
-      # Save the existing cmd_params Hash and JSON generate before writing to the topic
-      cmd_params = command['cmd_params']
-      command['cmd_params'] = JSON.generate(command['cmd_params'].as_json, allow_nan: true)
-      OpenC3.inject_context(command)
-
-      db_shard = Store.db_shard_for_target(command['target_name'], scope: scope)
-
-      # Fire-and-forget mode: skip ACK waiting when timeout <= 0
-      if timeout <= 0
-        Topic.write_topic("{#{scope}__CMD}TARGET__#{command['target_name']}", command, '*', 100, db_shard: db_shard)
-        command["cmd_params"] = cmd_params # Restore the original cmd_params Hash
-        return command
-      end
+      return send_commands([command], timeout: timeout, scope: scope)[0]
+    end
 
-      ack_topic = "{#{scope}__ACKCMD}TARGET__#{command['target_name']}"
-      Topic.update_topic_offsets([ack_topic], db_shard: db_shard)
-      cmd_id = Topic.write_topic("{#{scope}__CMD}TARGET__#{command['target_name']}", command, '*', 100, db_shard: db_shard)
-      command["cmd_params"] = cmd_params # Restore the original cmd_params Hash
-      time = Time.now
-      while (Time.now - time) < timeout
-        Topic.read_topics([ack_topic], db_shard: db_shard) do |_topic, _msg_id, msg_hash, _redis|
-          if msg_hash["id"] == cmd_id
-            if msg_hash["result"] == "SUCCESS"
-              return command
-            # Check for HazardousError which is a special case
-            elsif msg_hash["result"].include?("HazardousError")
-              raise_hazardous_error(msg_hash, command)
-            elsif msg_hash["result"].include?("CriticalCmdError")
-              raise_critical_cmd_error(msg_hash, command)
-            else
-              raise msg_hash["result"]
-            end
+    # Send many commands and then wait for all of their acks. The commands are
+    # pipelined so the total time is about one round trip rather than one per command.
+    # The error for the first command (in order) whose ack is not SUCCESS is raised.
+    # Up to MAX_IN_FLIGHT commands after it have already been sent unless it was isolated.
+    #
+    # @param commands [Array<Hash>] Command hash structures to be written to a topic
+    # @param timeout [Float|Array<Float>] Timeout in seconds for each ack after its command is sent,
+    #   or an Array with the timeout of each command. Set to 0 or negative for fire-and-forget mode.
+    # @param isolate [Array<Boolean>] true for each command which is not pipelined, e.g. a possibly
+    #   hazardous command. Every earlier ack is checked before it is sent and its own ack is
+    #   checked before any later command is sent.
+    # @return [Array<Hash>] The commands
+    def self.send_commands(commands, timeout: COMMAND_ACK_TIMEOUT_S, scope:, isolate: nil)
+      timeouts = timeout.is_a?(Array) ? timeout : Array.new(commands.length, timeout)
+      isolate ||= Array.new(commands.length, false)
+      acks = []
+      checked = 0 # The acks before this index have been checked
+      begin
+        commands.each_with_index do |command, index|
+          cmd_timeout = timeouts[index] || COMMAND_ACK_TIMEOUT_S
+          # Wait for the oldest ack before it can be trimmed from the ack topic
+          # or for every ack if the command is isolated
+          while checked < index and (isolate[index] or index - checked >= MAX_IN_FLIGHT)
+            check_ack(commands[checked], acks[checked])
+            checked += 1
+          end
+          # Fire-and-forget mode: skip ACK waiting when timeout <= 0
+          if cmd_timeout <= 0
+            write_command(command, scope: scope)
+            acks << nil
+            next
           end
+          db_shard = Store.db_shard_for_target(command['target_name'], scope: scope)
+          # Get the dispatcher before writing so the ack can't be missed
+          dispatcher = AckDispatcher.instance("{#{scope}__ACKCMD}TARGET__#{command['target_name']}", db_shard: db_shard)
+          cmd_id = write_command(command, scope: scope)
+          acks << [dispatcher, cmd_id, dispatcher.register(cmd_id), Time.now + cmd_timeout, cmd_timeout]
+          if isolate[index]
+            check_ack(command, acks[index])
+            checked += 1
+          end
+        end
+        (checked...commands.length).each do |index|
+          check_ack(commands[index], acks[index])
+        end
+      ensure
+        acks.each do |ack|
+          ack[0].discard(ack[1]) if ack
         end
       end
-      raise "Timeout of #{timeout}s waiting for cmd ack"
+      return commands
     end
 
     ###########################################################################
     # PRIVATE implementation details
     ###########################################################################
 
+    def self.write_command(command, scope:)
+      # Save the existing cmd_params Hash and JSON generate before writing to the topic
+      cmd_params = command['cmd_params']
+      command['cmd_params'] = JSON.generate(command['cmd_params'].as_json, allow_nan: true)
+      OpenC3.inject_context(command)
+      db_shard = Store.db_shard_for_target(command['target_name'], scope: scope)
+      cmd_id = Topic.write_topic("{#{scope}__CMD}TARGET__#{command['target_name']}", command, '*', 100, db_shard: db_shard)
+      command["cmd_params"] = cmd_params # Restore the original cmd_params Hash
+      return cmd_id
+    end
+
+    def self.check_ack(command, ack)
+      # Fire-and-forget commands have no ack to check
+      return unless ack
+
+      dispatcher, cmd_id, queue, end_time, timeout = ack
+      msg_hash = dispatcher.wait(cmd_id, queue, end_time - Time.now)
+      raise "Timeout of #{timeout}s waiting for cmd ack" unless msg_hash
+      check_ack_result(msg_hash, command)
+    end
+
+    def self.check_ack_result(msg_hash, command)
+      if msg_hash["result"] == "SUCCESS"
+        return
+      # Check for HazardousError which is a special case
+      elsif msg_hash["result"].include?("HazardousError")
+        raise_hazardous_error(msg_hash, command)
+      elsif msg_hash["result"].include?("CriticalCmdError")
+        raise_critical_cmd_error(msg_hash, command)
+      else
+        raise msg_hash["result"]
+      end
+    end
+
     def self.raise_hazardous_error(msg_hash, command)
       _, description, formatted = msg_hash["result"].split("\n")
       # Create and populate a new HazardousError and raise it up
@@ -12,6 +12,7 @@
 # if purchased from OpenC3, Inc.
 
 require 'openc3/topics/topic'
+require 'openc3/topics/ack_dispatcher'
 require 'openc3/config/config_parser'
 
 module OpenC3
@@ -26,24 +27,9 @@ module OpenC3
       # DecomMicroservice is listening to the DECOMINTERFACE topic and is responsible
       # for actually building the command. This was deliberate to allow this to work
       # with or without an interface.
-      db_shard = Store.db_shard_for_target(target_name, scope: scope)
-      ack_topic = "{#{scope}__ACKCMD}TARGET__#{target_name}"
-      Topic.update_topic_offsets([ack_topic], db_shard: db_shard)
-      decom_id = Topic.write_topic("#{scope}__DECOMINTERFACE__{#{target_name}}",
-          { 'build_cmd' => JSON.generate(data, allow_nan: true) }, '*', 100, db_shard: db_shard)
-      time = Time.now
-      while (Time.now - time) < timeout
-        Topic.read_topics([ack_topic], db_shard: db_shard) do |_topic, _msg_id, msg_hash, _redis|
-          if msg_hash["id"] == decom_id
-            if msg_hash["result"] == "SUCCESS"
-              return msg_hash
-            else
-              raise msg_hash["result"]
-            end
-          end
-        end
-      end
-      raise "Timeout of #{timeout}s waiting for cmd ack. Does target '#{target_name}' exist?"
+      msg_hash = write_and_wait_for_ack(target_name, { 'build_cmd' => JSON.generate(data, allow_nan: true) }, timeout: timeout, scope: scope)
+      raise "Timeout of #{timeout}s waiting for cmd ack. Does target '#{target_name}' exist?" unless msg_hash
+      return msg_hash
     end
 
     def self.inject_tlm(target_name, packet_name, item_hash = nil, type: :CONVERTED, stored: false, timeout: 5, received_time: nil, scope:)
@@ -52,27 +38,10 @@ module OpenC3
       data['packet_name'] = packet_name.to_s.upcase
       data['item_hash'] = item_hash
       data['type'] = type
-
-      db_shard = Store.db_shard_for_target(target_name, scope: scope)
       data['stored'] = stored
       data['received_time'] = received_time unless received_time.nil?
-      ack_topic = "{#{scope}__ACKCMD}TARGET__#{target_name}"
-      Topic.update_topic_offsets([ack_topic], db_shard: db_shard)
-      decom_id = Topic.write_topic("#{scope}__DECOMINTERFACE__{#{target_name}}",
-          { 'inject_tlm' => JSON.generate(data, allow_nan: true) }, '*', 100, db_shard: db_shard)
-      time = Time.now
-      while (Time.now - time) < timeout
-        Topic.read_topics([ack_topic], db_shard: db_shard) do |_topic, _msg_id, msg_hash, _redis|
-          if msg_hash["id"] == decom_id
-            if msg_hash["result"] == "SUCCESS"
-              return
-            else
-              raise msg_hash["result"]
-            end
-          end
-        end
-      end
-      raise "Timeout of #{timeout}s waiting for cmd ack. Does target '#{target_name}' exist?"
+      msg_hash = write_and_wait_for_ack(target_name, { 'inject_tlm' => JSON.generate(data, allow_nan: true) }, timeout: timeout, scope: scope)
+      raise "Timeout of #{timeout}s waiting for cmd ack. Does target '#{target_name}' exist?" unless msg_hash
     end
 
     def self.get_tlm_buffer(target_name, packet_name, timeout: 5, scope:)
@@ -81,29 +50,27 @@ module OpenC3
       data['packet_name'] = packet_name.to_s.upcase
       # DecomMicroservice is listening to the DECOMINTERFACE topic and has
       # the most recent decommed packets including subpackets
-      db_shard = Store.db_shard_for_target(target_name, scope: scope)
-      ack_topic = "{#{scope}__ACKCMD}TARGET__#{target_name}"
-      Topic.update_topic_offsets([ack_topic], db_shard: db_shard)
-      decom_id = Topic.write_topic("#{scope}__DECOMINTERFACE__{#{target_name}}",
-          { 'get_tlm_buffer' => JSON.generate(data, allow_nan: true) }, '*', 100, db_shard: db_shard)
-      time = Time.now
-      while (Time.now - time) < timeout
-        Topic.read_topics([ack_topic], db_shard: db_shard) do |_topic, _msg_id, msg_hash, _redis|
-          if msg_hash["id"] == decom_id
-            if msg_hash["result"] == "SUCCESS"
-              msg_hash["stored"] = ConfigParser.handle_true_false(msg_hash["stored"])
-              extra = msg_hash["extra"]
-              if extra and extra.length > 0
-                msg_hash["extra"] = JSON.parse(extra, allow_nan: true, create_additions: true)
-              end
-              return msg_hash
-            else
-              raise msg_hash["result"]
-            end
-          end
-        end
+      msg_hash = write_and_wait_for_ack(target_name, { 'get_tlm_buffer' => JSON.generate(data, allow_nan: true) }, timeout: timeout, scope: scope)
+      raise "Timeout of #{timeout}s waiting for ack. Does target '#{target_name}' exist?" unless msg_hash
+      msg_hash["stored"] = ConfigParser.handle_true_false(msg_hash["stored"])
+      extra = msg_hash["extra"]
+      if extra and extra.length > 0
+        msg_hash["extra"] = JSON.parse(extra, allow_nan: true, create_additions: true)
       end
-      raise "Timeout of #{timeout}s waiting for ack. Does target '#{target_name}' exist?"
+      return msg_hash
+    end
+
+    # Write a request to the DecomMicroservice and wait for its ack
+    #
+    # @return [Hash|nil] The ack msg_hash or nil on timeout. Raises if the request failed.
+    def self.write_and_wait_for_ack(target_name, request, timeout:, scope:)
+      db_shard = Store.db_shard_for_target(target_name, scope: scope)
+      # Get the dispatcher before writing so the ack can't be missed
+      dispatcher = AckDispatcher.instance("{#{scope}__ACKCMD}TARGET__#{target_name}", db_shard: db_shard)
+      decom_id = Topic.write_topic("#{scope}__DECOMINTERFACE__{#{target_name}}", request, '*', 100, db_shard: db_shard)
+      msg_hash = dispatcher.wait(decom_id, dispatcher.register(decom_id), timeout)
+      raise msg_hash["result"] if msg_hash and msg_hash["result"] != "SUCCESS"
+      return msg_hash
     end
   end
 end
@@ -20,11 +20,17 @@ require 'openc3/topics/topic'
 module OpenC3
   # LimitsEventTopic keeps track of not only the <SCOPE>__openc3_limits_events topic
   # but also the ancillary key value stores. The LIMITS_CHANGE event updates the
-  # <SCOPE>__current_limits key. The LIMITS_SET event updates the <SCOPE>__limits_sets.
+  # <SCOPE>__current_limits key and the <SCOPE>__out_of_limits index which holds only
+  # the YELLOW and RED items. The LIMITS_SET event updates the <SCOPE>__limits_sets.
   # The LIMITS_SETTINGS event updates the <SCOPE>__current_limits_settings.
   # While this isn't a clean separation of topics (streams) and models (key-value)
   # it helps maintain consistency as the topic and model are linked.
   class LimitsEventTopic < Topic
+    OUT_OF_LIMITS_STATES = %w(RED RED_HIGH RED_LOW YELLOW YELLOW_HIGH YELLOW_LOW)
+    # Field always present in the out_of_limits index once it has been built so
+    # an empty index can be told apart from a missing one
+    INDEX_BUILT_FIELD = '__INDEX_BUILT__'
+
     # Collect all unique target db_shards from TargetModel
     def self._active_db_shards(scope:)
       db_shards = Set.new([0])
@@ -47,6 +53,11 @@ module OpenC3
         unless event[:suppress_stored]
           field = "#{event[:target_name]}__#{event[:packet_name]}__#{event[:item_name]}"
           Store.hset("#{scope}__current_limits", field, event[:new_limits_state])
+          if OUT_OF_LIMITS_STATES.include?(event[:new_limits_state].to_s)
+            Store.hset("#{scope}__out_of_limits", field, event[:new_limits_state])
+          else
+            Store.hdel("#{scope}__out_of_limits", field)
+          end
         end
 
       when :LIMITS_SETTINGS
@@ -140,16 +151,41 @@ module OpenC3
 
     def self.out_of_limits(scope:)
       out_of_limits = []
-      limits = Store.hgetall("#{scope}__current_limits")
+      limits = Store.hgetall("#{scope}__out_of_limits")
+      # The index may already hold items written by LIMITS_CHANGE events
+      # so only the marker field shows it was built from current_limits
+      limits = build_out_of_limits_index(scope: scope) unless limits.key?(INDEX_BUILT_FIELD)
       limits.each do |item, limits_state|
-        if %w(RED RED_HIGH RED_LOW YELLOW YELLOW_HIGH YELLOW_LOW).include?(limits_state)
-          target_name, packet_name, item_name = item.split('__')
-          out_of_limits << [target_name, packet_name, item_name, limits_state]
-        end
+        next if item == INDEX_BUILT_FIELD
+
+        target_name, packet_name, item_name = item.split('__')
+        out_of_limits << [target_name, packet_name, item_name, limits_state]
       end
       out_of_limits
     end
 
+    # Build the out_of_limits index from the full current_limits hash. This only
+    # happens the first time out_of_limits is called for a scope whose index
+    # hasn't been built yet. current_limits is updated by every LIMITS_CHANGE
+    # so it also covers the items already written to the index. current_limits
+    # is watched so a LIMITS_CHANGE written while the index is being built
+    # aborts the transaction and the index is built again from the new states.
+    def self.build_out_of_limits_index(scope:)
+      loop do
+        index = { INDEX_BUILT_FIELD => 'true' }
+        result = Store.watch("#{scope}__current_limits") do |redis|
+          redis.hgetall("#{scope}__current_limits").each do |item, limits_state|
+            index[item] = limits_state if OUT_OF_LIMITS_STATES.include?(limits_state)
+          end
+          redis.multi do |transaction|
+            transaction.hmset("#{scope}__out_of_limits", *index.flatten)
+          end
+        end
+        # multi returns nil if current_limits changed after it was watched
+        return index unless result.nil?
+      end
+    end
+
     # Returns all the limits sets as keys with the value 'true' or 'false'
     # where only the active set is 'true'
     #
@@ -178,6 +214,19 @@ module OpenC3
         end
       end
 
+      limits = Store.hgetall("#{scope}__out_of_limits")
+      limits.each do |item, _limits_state|
+        if packet_name
+          if item =~ /^#{target_name}__#{packet_name}__/
+            Store.hdel("#{scope}__out_of_limits", item)
+          end
+        else
+          if item =~ /^#{target_name}__/
+            Store.hdel("#{scope}__out_of_limits", item)
+          end
+        end
+      end
+
       limits_settings = Store.hgetall("#{scope}__current_limits_settings")
       limits_settings.each do |item, _limits_settings|
         if packet_name
@@ -33,6 +33,7 @@ require 'openc3/models/environment_model'
 require 'openc3/models/script_engine_model'
 require 'openc3/models/script_status_model'
 require 'fileutils'
+require 'socket'
 
 if not defined? RAILS_ROOT
   if ENV['RAILS_ROOT']
@@ -605,8 +606,14 @@ class RunningScript
       process.environment['OPENC3_SCOPE'] = scope
       process.environment['RAILS_ROOT'] = RAILS_ROOT
 
-      process.detach = true
-      process.start
+      # Python scripts without a plugin venv can start in an already warm worker
+      # from scripts/script_worker_pool.py. Otherwise spawn a new process.
+      pooled = python_venv_dir.nil? && runner_path.end_with?('run_script.py') &&
+        start_in_worker_pool(process, running_script_id, scope, script_cwd)
+      unless pooled
+        process.detach = true
+        process.start
+      end
       running_script_id
     rescue => e
       begin
@@ -622,6 +629,34 @@ class RunningScript
     end
   end
 
+  # Hand the script to an idle worker in scripts/script_worker_pool.py. Each
+  # scope has its own pool because the workers import the scope as the default
+  # of the script APIs, so only scopes with a pool socket are pooled.
+  # @return [Boolean] Whether a worker accepted the script
+  def self.start_in_worker_pool(process, running_script_id, scope, script_cwd)
+    socket_path = ENV.fetch('OPENC3_SCRIPT_WORKER_POOL_SOCKET', '/tmp/script_worker_pool_{scope}.sock').gsub('{scope}', scope.to_s)
+    return false unless File.socket?(socket_path)
+
+    UNIXSocket.open(socket_path) do |socket|
+      request = { args: [running_script_id.to_s, scope], cwd: script_cwd, environment: process.environment }
+      socket.write(JSON.generate(request) + "\n")
+      # Closing the socket without claiming the worker tells it to ignore the
+      # request so the script is only run by the process we spawn instead
+      return false unless socket.wait_readable(5)
+
+      response = JSON.parse(socket.gets.to_s)
+      raise response['error'] if response['error']
+      return false if response['pid'].nil?
+
+      # Claim the worker so it runs the script
+      socket.write("start\n")
+      return true
+    end
+  rescue => e
+    OpenC3::Logger.warn("Script worker pool unavailable, spawning process: #{e.message}")
+    false
+  end
+
   def initialize(script_status)
     @@instance = self
     # Flush the replay queue (used by running_script_anycable_publish) quickly so
@@ -1,4 +1,4 @@
-# Copyright 2024 OpenC3, Inc.
+# Copyright 2026 OpenC3, Inc.
 # All Rights Reserved.
 #
 # This program is distributed in the hope that it will be useful,
@@ -16,14 +16,8 @@ from .json_accessor import JsonAccessor
 
 class CborAccessor(JsonAccessor):
     @classmethod
-    def class_read_item(cls, item, buffer):
-        if item.data_type == "DERIVED":
-            return None
-        if isinstance(buffer, bytearray):
-            parsed = loads(buffer)
-        else:
-            parsed = buffer
-        return super().class_read_item(item, parsed)
+    def decode_buffer(cls, buffer):
+        return loads(buffer)
 
     @classmethod
     def class_write_item(cls, item, value, buffer):
@@ -41,10 +35,6 @@ class CborAccessor(JsonAccessor):
             buffer[0:] = dumps(decoded)
         return value
 
-    @classmethod
-    def class_read_items(cls, items, buffer):
-        return super().class_read_items(items, loads(buffer))
-
     @classmethod
     def class_write_items(cls, items, values, buffer):
         decoded = loads(buffer)
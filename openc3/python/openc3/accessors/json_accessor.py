@@ -9,6 +9,8 @@
 # This file may also be used under the terms of a commercial license
 # if purchased from OpenC3, Inc.
 
+import re
+from copy import deepcopy
 from functools import lru_cache
 
 
@@ -43,13 +45,94 @@ def _parse_jsonpath(path):
     return parse(path)
 
 
+# Matches a single step of a simple JSONPath: .name, ['name'], ["name"] or [0]
+_SIMPLE_JSONPATH_STEP = re.compile(r"\.([A-Za-z_][A-Za-z0-9_]*)|\['([^'\\]*)'\]|\[\"([^\"\\]*)\"\]|\[(\d+)\]")
+# Words the jsonpath-ng lexer treats as operators rather than field names
+_JSONPATH_RESERVED_WORDS = ("where", "wherenot")
+
+
+# Compile simple dotted / indexed paths like $.a.b[2] into a tuple of dict keys
+# and list indexes which can be walked directly without jsonpath-ng.
+# Returns None for anything more complex (wildcards, filters, slices, ...).
+@lru_cache(maxsize=4096)
+def _compile_jsonpath(path):
+    if not path.startswith("$"):
+        return None
+    steps = []
+    position = 1
+    while position < len(path):
+        match = _SIMPLE_JSONPATH_STEP.match(path, position)
+        if match is None:
+            return None
+        name, single_quoted, double_quoted, index = match.groups()
+        if name is not None:
+            if name in _JSONPATH_RESERVED_WORDS:
+                return None
+            steps.append(name)
+        elif index is not None:
+            steps.append(int(index))
+        elif single_quoted is not None:
+            steps.append(single_quoted)
+        else:
+            steps.append(double_quoted)
+        position = match.end()
+    return tuple(steps)
+
+
+# Walk a compiled simple path. Mirrors jsonpath-ng semantics: keys only match
+# dicts and indexes only match lists so a type mismatch is simply not found.
+def _find_compiled(steps, document):
+    value = document
+    for step in steps:
+        if isinstance(step, int):
+            if not isinstance(value, list) or step >= len(value):
+                return None
+        elif not isinstance(value, dict) or step not in value:
+            return None
+        value = value[step]
+    return value
+
+
 class JsonAccessor(Accessor):
+    def __init__(self, packet=None):
+        super().__init__(packet)
+        # Tuple of (buffer bytes, decoded document) for the last buffer read
+        self._decoded_cache = None
+
+    # Read items from the decoded document of the last buffer rather than
+    # decoding the entire buffer for every item
+    def read_item(self, item, buffer):
+        if item.parent_item is None and item.data_type != "DERIVED" and isinstance(buffer, bytearray):
+            value = self.__class__.class_read_item(item, self.decoded_document(buffer))
+            if item.data_type in ("ANY", "OBJECT", "ARRAY") and isinstance(value, (dict, list)):
+                # Don't hand out references into the cached document
+                value = deepcopy(value)
+            return value
+        return super().read_item(item, buffer)
+
+    # Return the decoded document for the buffer. The document is cached and only
+    # decoded again when the buffer contents change.
+    def decoded_document(self, buffer):
+        cache = self._decoded_cache
+        if cache is not None and cache[0] == buffer:
+            return cache[1]
+        document = self.__class__.decode_buffer(buffer)
+        self._decoded_cache = (bytes(buffer), document)
+        return document
+
+    @classmethod
+    def decode_buffer(cls, buffer):
+        return json_loads(buffer)
+
     @classmethod
     def class_read_item(cls, item, buffer):
         if item.data_type == "DERIVED":
             return None
         if isinstance(buffer, bytearray):
-            buffer = json_loads(buffer)
+            buffer = cls.decode_buffer(buffer)
+        steps = _compile_jsonpath(item.key)
+        if steps is not None:
+            return cls.convert_to_type(_find_compiled(steps, buffer), item)
         result = _parse_jsonpath(item.key).find(buffer)
         if len(result) == 0:
             return None
@@ -81,7 +164,7 @@ class JsonAccessor(Accessor):
     @classmethod
     def class_read_items(cls, items, buffer):
         if isinstance(buffer, bytearray):
-            buffer = json_loads(buffer)
+            buffer = cls.decode_buffer(buffer)
         return super().class_read_items(items, buffer)
 
     @classmethod
@@ -46,6 +46,7 @@ WHITELIST.extend(
         "cmd_raw_no_range_check",
         "cmd_raw_no_hazardous_check",
         "cmd_raw_no_checks",
+        "cmd_many",
         "build_cmd",
         "build_command",  # DEPRECATED
         "enable_cmd",
@@ -181,6 +182,60 @@ def cmd_raw_no_checks(*args, **kwargs):
     )
 
 
+# Sends many commands without waiting for each acknowledgement in turn. All the commands are
+# written first and then their acknowledgements are collected so the total time is about one
+# round trip rather than one per command. Each command is given in either calling style of cmd:
+#   cmd_many(["INST ABORT", ["INST", "COLLECT", {"TYPE": "NORMAL"}]])
+# A command can also be a dict with its own keyword arguments such as the ack timeout:
+#   cmd_many([{"command": "INST ABORT", "timeout": 1}, "INST CLEAR"], timeout=10)
+#
+# The error for the first command which fails (e.g. HazardousError) is raised. Commands which
+# could be hazardous or are restricted are not pipelined: they are only sent once every earlier
+# command is acknowledged and nothing after them is sent until they are acknowledged. This holds
+# whatever hazardous_check is because the interface may hold them for approval when critical
+# commanding is enabled. Other commands after a failed command may already have been sent.
+#
+# @param commands [Array<String|Array>] Commands to send
+# @param raw [Boolean] Whether to send the commands without conversions like cmd_raw
+# @param range_check [Boolean] Whether to check the parameters against their ranges like cmd_no_range_check
+# @param hazardous_check [Boolean] Whether to reject hazardous commands like cmd_no_hazardous_check
+# @return [Array<Hash>] The commands which were sent
+def cmd_many(commands, raw=False, range_check=True, hazardous_check=True, **kwargs):
+    scope = kwargs.get("scope") or OPENC3_SCOPE
+    if raw:
+        method_name = "cmd_raw"
+    else:
+        method_name = "cmd"
+    if not range_check:
+        method_name += "_no_range_check" if hazardous_check else "_no_checks"
+    elif not hazardous_check:
+        method_name += "_no_hazardous_check"
+    to_send = []
+    timeouts = []
+    isolate = []
+    for args in commands:
+        cmd_kwargs = kwargs
+        if isinstance(args, dict):
+            cmd_kwargs = {**kwargs, **args}
+            args = cmd_kwargs.pop("command")
+        if isinstance(args, str):
+            args = [args]
+        command, packet, timeout, validate = _build_cmd_hash(
+            method_name,
+            *args,
+            range_check=range_check,
+            hazardous_check=hazardous_check,
+            raw=raw,
+            **cmd_kwargs,
+        )
+        if not _queue_cmd(command, timeout, validate, scope, cmd_kwargs.get("queue")):
+            to_send.append(command)
+            timeouts.append(timeout)
+            isolate.append(_cmd_needs_isolation(packet))
+    CommandTopic.send_commands(to_send, timeout=timeouts, scope=scope, isolate=isolate)
+    return to_send
+
+
 # Build a command binary
 def build_cmd(*args, range_check=True, raw=False, timeout=5, scope=OPENC3_SCOPE, manual=False):
     match len(args):
@@ -580,6 +635,32 @@ def _cmd_implementation(
     raw,
     manual=False,
     **kwargs,
+):
+    scope = kwargs.get("scope") or OPENC3_SCOPE
+    command, _, timeout, validate = _build_cmd_hash(
+        method_name,
+        *args,
+        range_check=range_check,
+        hazardous_check=hazardous_check,
+        raw=raw,
+        manual=manual,
+        **kwargs,
+    )
+    if not _queue_cmd(command, timeout, validate, scope, kwargs.get("queue")):
+        CommandTopic.send_command(command, timeout=timeout, scope=scope)
+    return command
+
+
+# Authorize and build the command hash written to the CMD topic
+# Returns the command hash, packet hash, ack timeout and whether to validate the command
+def _build_cmd_hash(
+    method_name,
+    *args,
+    range_check,
+    hazardous_check,
+    raw,
+    manual=False,
+    **kwargs,
 ):
     scope = OPENC3_SCOPE
     if kwargs.get("scope"):
@@ -694,18 +775,35 @@ def _cmd_implementation(
     # 'username' as "Executed By" and queue_username as "Queued By".
     if queue_username:
         command["queue_username"] = queue_username
+    return command, packet, timeout, validate
 
+
+# Whether the packet hash is hazardous or has any hazardous states. The default
+# value of a parameter can be hazardous so the given parameters aren't considered.
+# Whether the packet hash is restricted, hazardous or has any hazardous states. These
+# commands can be rejected or held for approval by the interface so cmd_many doesn't pipeline
+# them. The default value of a parameter can be hazardous so the given parameters aren't considered.
+def _cmd_needs_isolation(packet):
+    if packet.get("restricted") or packet.get("hazardous") is not None:
+        return True
+    for item in packet["items"]:
+        for state in (item.get("states") or {}).values():
+            if state.get("hazardous") is not None:
+                return True
+    return False
+
+
+# Queue the command if requested. Returns whether the command was queued.
+def _queue_cmd(command, timeout, validate, scope, queue=None):
     # Users have to explicitly opt into a default queue by setting the OPENC3_DEFAULT_QUEUE
     # At which point ALL commands will go to that queue unless they specifically opt out with queue=False
-    queue = kwargs.get("queue")
     if os.environ.get("OPENC3_DEFAULT_QUEUE", False) and queue is None:
         queue = os.environ["OPENC3_DEFAULT_QUEUE"]
-    if queue:
-        # Pull the command out of the script string, e.g. cmd("INST ABORT")
-        queued = cmd_string.split('("')[1].split('")')[0]
-        QueueModel.queue_command(
-            queue, command=queued, username=username, scope=scope, validate=validate, timeout=timeout
-        )
-    else:
-        CommandTopic.send_command(command, timeout=timeout, scope=scope)
-    return command
+    if not queue:
+        return False
+    # Pull the command out of the script string, e.g. cmd("INST ABORT")
+    queued = command["cmd_string"].split('("')[1].split('")')[0]
+    QueueModel.queue_command(
+        queue, command=queued, username=command["username"], scope=scope, validate=validate, timeout=timeout
+    )
+    return True
@@ -66,25 +66,21 @@ def get_overall_limits_state(ignored_items=None, scope=OPENC3_SCOPE):
     out_of_limits = get_out_of_limits(scope=scope)
     overall = "GREEN"
 
-    # Build easily matchable ignore list
+    # Build easily matchable ignore prefixes. An ITEM of None ignores the entire packet.
+    ignored_prefixes = []
     if ignored_items is not None:
-        new_items = []
         for item in ignored_items:
             if len(item) != 3:
                 raise RuntimeError(f"Invalid ignored item: {item}. Must be [TGT, PKT, ITEM] where ITEM can be None.")
             if item[2] is None:
-                item[2] = ""
-            new_items.append("__".join(item))
-        ignored_items = new_items
-    else:
-        ignored_items = []
+                ignored_prefixes.append(f"{item[0]}__{item[1]}__")
+            else:
+                ignored_prefixes.append("__".join(item))
+    ignored_prefixes = tuple(ignored_prefixes)
 
     for target_name, packet_name, item_name, limits_state in out_of_limits:
         # Ignore this item if we match one of the ignored items
-        for item in ignored_items:
-            if item in f"{target_name}__{packet_name}__{item_name}":
-                break
-        else:  # Executed if 'for item in ignored_items:' did NOT break
+        if not f"{target_name}__{packet_name}__{item_name}".startswith(ignored_prefixes):
             if limits_state == "RED" or limits_state == "RED_HIGH" or limits_state == "RED_LOW":
                 overall = limits_state
                 break  # Red is as high as we go so no need to look for more
@@ -50,6 +50,11 @@ def main(args: list[str] | None = None) -> None:
     bridge_parser.add_argument("variables", nargs="*", help="Variables in key=value format")
     bridgesetup_parser = subparsers.add_parser("bridgesetup", help="Generate a default bridge configuration file")
     bridgesetup_parser.add_argument("filename", nargs="?", default="bridge.txt", help="Output filename")
+    latency_parser = subparsers.add_parser(
+        "latency", help="Report where the telemetry pipeline latency goes (requires OPENC3_PIPELINE_TRACE)"
+    )
+    latency_parser.add_argument("target", nargs="?", default=None, help="Only report on this target")
+    latency_parser.add_argument("--scope", default="DEFAULT", help="Scope to report on")
     parsed_args = parser.parse_args(args)
 
     if parsed_args.command is None:
@@ -61,6 +66,8 @@ def main(args: list[str] | None = None) -> None:
         handle_bridge_command(parsed_args)
     elif parsed_args.command == "bridgesetup":
         handle_bridgesetup_command(parsed_args)
+    elif parsed_args.command == "latency":
+        handle_latency_command(parsed_args)
 
 
 def run_bridge(filename, params):
@@ -92,5 +99,13 @@ def handle_bridgesetup_command(args) -> None:
         BridgeConfig.generate_default(filename)
 
 
+def handle_latency_command(args) -> None:
+    from openc3.models.metric_model import MetricModel
+    from openc3.utilities.pipeline_trace import PipelineTrace
+
+    target_name = args.target.upper() if args.target else None
+    print(PipelineTrace.report(MetricModel.all(scope=args.scope), target_name))
+
+
 if __name__ == "__main__":
     main()
@@ -31,6 +31,7 @@ class ConfigParser:
     # Regular expression used to break up an individual line into a keyword and
     # comma delimited parameters. Handles parameters in single or double quotes.
     PARSING_REGEX = r"(?:\"(?:[^\\\"]|\\.)*\") | (?:'(?:[^\\']|\\.)*') | \S+"
+    PARSING_PATTERN = re.compile(PARSING_REGEX, re.X)
 
     class Error(Exception):
         """Error which gets raised by ConfigParser in #verify_num_parameters. This
@@ -128,7 +129,7 @@ class ConfigParser:
                 yield_non_keyword_lines,
                 remove_quotes_arg,
                 os.path.getsize(file.name),
-                ConfigParser.PARSING_REGEX,
+                ConfigParser.PARSING_PATTERN,
             )
 
     def verify_num_parameters(self, min_num_params: int, max_num_params: int | None, usage: str = "") -> None:
@@ -436,8 +437,13 @@ class ConfigParser:
         yield_non_keyword_lines: bool,
         remove_quotes_arg: bool,
         size: int,
-        rx: str,
+        rx: str | re.Pattern,
     ) -> Generator[tuple[str | None, list[str]], None, None]:
+        # Compile once rather than for every line
+        if isinstance(rx, str):
+            rx = re.compile(rx, re.X)
+        # Lines without quotes tokenize the same with a plain whitespace split
+        fast_split = rx.pattern == ConfigParser.PARSING_REGEX
         string_concat = False
         self.line_number = 0
         self.keyword = None
@@ -494,10 +500,12 @@ class ConfigParser:
             # Update self.line for external access
             self.line = line_buffer
 
-            data = re.compile(rx, re.X).findall(line_buffer)
-            first_item = ""
-            if len(data) > 0:
-                first_item += data[0]
+            quoted = not fast_split or '"' in line_buffer or "'" in line_buffer
+            if quoted:
+                data = rx.findall(line_buffer)
+            else:
+                data = line_buffer.split()
+            first_item = data[0] if data else ""
 
             if (len(first_item) == 0) or (first_item[0] == "#"):
                 self.keyword = None
@@ -528,7 +536,7 @@ class ConfigParser:
                     if (len(string) > 0) and (string[0] == "#") and not ((len(string) > 1) and (string[1] == "{")):
                         break
 
-                    if remove_quotes_arg:
+                    if remove_quotes_arg and quoted:
                         self.parameters.append(remove_quotes(string))
                     else:
                         self.parameters.append(string)
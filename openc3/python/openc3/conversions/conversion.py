@@ -40,6 +40,16 @@ class Conversion:
     def call(self, value, packet, buffer):
         raise RuntimeError("call method must be defined by subclass")
 
+    # Perform the conversion on every value of an array item. Subclasses can
+    # override this to convert the whole array at once.
+    #
+    # self.param values [list] The values to convert
+    # self.param packet [Packet] The packet which contains the values
+    # self.param buffer [String] The packet buffer
+    # self.return [list] The converted values
+    def call_array(self, values, packet, buffer):
+        return [self.call(value, packet, buffer) for value in values]
+
     # self.return [String] The conversion class
     def __str__(self):
         return self.__class__.__name__
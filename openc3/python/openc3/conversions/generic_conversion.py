@@ -72,6 +72,10 @@ class GenericConversion(Conversion):
             exec(self.exec_lines, generic_globals)
             return eval(self.eval_line, generic_globals)
 
+    # Code objects can't be pickled so unpickling compiles code_to_eval again
+    def __reduce__(self):
+        return (self.__class__, tuple(self.params))
+
     # self.return [String] The conversion class followed by the code to evaluate
     def __str__(self):
         return self.code_to_eval
@@ -9,6 +9,7 @@
 # This file may also be used under the terms of a commercial license
 # if purchased from OpenC3, Inc.
 
+import numpy as np
 
 from openc3.conversions.conversion import Conversion
 
@@ -45,6 +46,23 @@ class PolynomialConversion(Conversion):
             result += coeff * raised_to_power
         return result
 
+    # @param (see Conversion#call_array)
+    # @return [Array<Float>] The values with the polynomial applied
+    def call_array(self, values, myself, buffer):
+        array = np.asarray(values)
+        if array.dtype.kind not in "iuf":
+            # Values such as None can't be vectorized
+            return super().call_array(values, myself, buffer)
+        values = array.astype(np.float64)
+
+        # Same order of operations as call so the results are identical
+        result = np.full(values.shape, self.coeffs[0])
+        raised_to_power = np.ones(values.shape)
+        for coeff in self.coeffs[1:]:
+            raised_to_power *= values
+            result += coeff * raised_to_power
+        return result.tolist()
+
     # @return [String] Class followed by the list of coefficients
     def __str__(self):
         result = ""
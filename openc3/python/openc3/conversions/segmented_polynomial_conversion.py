@@ -9,6 +9,7 @@
 # This file may also be used under the terms of a commercial license
 # if purchased from OpenC3, Inc.
 
+import numpy as np
 
 from openc3.conversions.conversion import Conversion
 
@@ -57,6 +58,16 @@ class SegmentedPolynomialConversion(Conversion):
                 converted += float(self.coeffs[index]) * (value**index)
             return converted
 
+        # Perform the polynomial conversion on a numpy array
+        #
+        # @param values [numpy.ndarray] The values to convert
+        # @return [numpy.ndarray] The converted values
+        def calculate_array(self, values):
+            converted = np.zeros(values.shape)
+            for index in range(0, len(self.coeffs)):
+                converted += float(self.coeffs[index]) * (values**index)
+            return converted
+
     # Initialize the converted_type to :FLOAT and converted_bit_size to 64.
     #
     # @param segments [Array] Array of segments typically generated by as_json
@@ -105,6 +116,23 @@ class SegmentedPolynomialConversion(Conversion):
         else:
             return None
 
+    # @param (see Conversion#call_array)
+    # @return [Array<Float>] The values with the polynomial applied
+    def call_array(self, values, packet, buffer):
+        if not self.segments:
+            return super().call_array(values, packet, buffer)
+        array = np.asarray(values)
+        if array.dtype.kind not in "iuf":
+            # Values such as None can't be vectorized
+            return super().call_array(values, packet, buffer)
+        values = array.astype(np.float64)
+
+        # Segments are sorted by descending lower_bound so the first match wins
+        # and values below every lower_bound use the last segment
+        conditions = [values >= segment.lower_bound for segment in self.segments]
+        choices = [segment.calculate_array(values) for segment in self.segments]
+        return np.select(conditions, choices, default=choices[-1]).tolist()
+
     # @return [String] The name of the class followed by a description of all
     #   the polynomial segments.
     def __str__(self):
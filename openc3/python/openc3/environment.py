@@ -49,6 +49,7 @@ _openc3_local_mode = "OPENC3_LOCAL_MODE"
 _openc3_local_mode_path = "OPENC3_LOCAL_MODE_PATH"
 _openc3_no_bucket_policy = "OPENC3_NO_BUCKET_POLICY"
 _openc3_log_stderr = "OPENC3_LOG_STDERR"
+_openc3_packet_definitions_dir = "OPENC3_PACKET_DEFINITIONS_DIR"
 
 # The following variables are only used with COSMOS Enterprise
 _openc3_api_user = "OPENC3_API_USER"
@@ -146,6 +147,8 @@ OPENC3_LOCAL_MODE = os.environ.get(_openc3_local_mode)
 OPENC3_LOCAL_MODE_PATH = os.environ.get(_openc3_local_mode_path)
 OPENC3_NO_BUCKET_POLICY = os.environ.get(_openc3_no_bucket_policy)
 OPENC3_LOG_STDERR = get_env_bool(_openc3_log_stderr)
+# Directory shared by the microservices on a host to share their packet definitions (see System)
+OPENC3_PACKET_DEFINITIONS_DIR = os.environ.get(_openc3_packet_definitions_dir)
 
 OPENC3_SCOPE = os.environ.get(_openc3_scope, "DEFAULT")
 OPENC3_API_PASSWORD = os.environ.get(_openc3_api_password)
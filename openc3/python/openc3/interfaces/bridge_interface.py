@@ -22,7 +22,11 @@ bridge_microservice; and this interface is the COSMOS end of that pipe.
 
 The Iroh stream carries **raw device bytes** (no framing), so this behaves like
 any other byte-stream interface and normal COSMOS PROTOCOLs (BURST, LENGTH,
-TERMINATED, ...) can be layered on top via the interface configuration.
+TERMINATED, ...) can be layered on top via the interface configuration. When the
+interface has BRIDGE_PROTOCOLs they run on the host, which then sends each packet
+framed by ``BridgeFrameProtocol``; InterfaceModel adds that protocol first so the
+packet boundaries are restored before any regular PROTOCOLs. The READY/GO
+handshake confirms both ends agree on whether the data is framed.
 
 The interface takes the BRIDGE_NAME (its first parameter, or the
 ``OPENC3_BRIDGE_NAME`` environment variable) and looks up that bridge's current
@@ -40,6 +44,7 @@ import threading
 
 from openc3.config.config_parser import ConfigParser
 from openc3.interfaces.interface import Interface
+from openc3.interfaces.protocols.bridge_frame_protocol import BridgeFrameProtocol
 from openc3.models.bridge_interface_model import BridgeInterfaceModel
 from openc3.models.bridge_model import BridgeModel
 from openc3.utilities.logger import Logger
@@ -65,6 +70,11 @@ CTRL_RECONNECT_DELAY = 5.0
 # are consumed before raw device data flows, so they never mix with it.
 BRIDGE_READY = b"\x01"
 BRIDGE_GO = b"\x02"
+# Sent instead of READY/GO when the data is framed by BridgeFrameProtocol (the
+# interface has BRIDGE_PROTOCOLs). A peer which disagrees on framing, like a host
+# from before BRIDGE_PROTOCOLs, is rejected rather than having its bytes misread.
+BRIDGE_READY_FRAMED = b"\x03"
+BRIDGE_GO_FRAMED = b"\x04"
 
 
 def _iroh_error_detail(error):
@@ -275,11 +285,17 @@ class BridgeInterface(Interface):
             # Do NOT report connected yet. Wait for the host's READY, which only
             # arrives once the host has connected and paired its own data leg and
             # is ready — so a successful connect() proves the host is up. (req 1)
+            framed = self._framed()
             ready = await asyncio.wait_for(self._read_exact(recv, len(BRIDGE_READY)), timeout=self.connect_timeout)
-            if ready != BRIDGE_READY:
+            if ready != (BRIDGE_READY_FRAMED if framed else BRIDGE_READY):
+                if ready in (BRIDGE_READY, BRIDGE_READY_FRAMED):
+                    host = "frames" if ready == BRIDGE_READY_FRAMED else "does not frame"
+                    raise RuntimeError(
+                        f"{self.name}: bridge framing mismatch, the host {host} packets (check its BRIDGE_PROTOCOLs and version)"
+                    )
                 raise RuntimeError(f"{self.name}: unexpected bridge handshake {ready!r}")
             # Tell the host it may now connect its device and start reading. (req 2)
-            await self._send(BRIDGE_GO)
+            await self._send(BRIDGE_GO_FRAMED if framed else BRIDGE_GO)
             self._connected = True
             self._reader_task = self._loop.create_task(self._reader(recv))
         except BaseException:
@@ -288,6 +304,10 @@ class BridgeInterface(Interface):
             await self._close_data()
             raise
 
+    def _framed(self):
+        """Whether the host frames the data, i.e. InterfaceModel added BridgeFrameProtocol"""
+        return any(isinstance(protocol, BridgeFrameProtocol) for protocol in self.read_protocols)
+
     async def _read_exact(self, recv, n):
         """Read exactly n bytes from an Iroh recv stream (for the fixed-size
         handshake). read(k) returns at most k bytes, so this never over-reads
@@ -51,7 +51,7 @@ class Handler(BaseHTTPRequestHandler):
                             self.send_header(key, value)
                 self.end_headers()
 
-                self.wfile.write(packet.buffer)
+                self.wfile.write(packet.buffer_view())
 
                 # Save the Request
                 packet_name = None
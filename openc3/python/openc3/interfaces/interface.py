@@ -67,6 +67,8 @@ class Interface:
         self.written_raw_data = ""
         self.read_raw_data_time = None
         self.written_raw_data_time = None
+        # Nanoseconds from epoch when read_interface last returned data (used by PipelineTrace)
+        self.read_data_time_ns = None
         self.config_params = []
         self.interfaces = []
         self.stream_log_pair = None
@@ -171,6 +173,7 @@ class Interface:
                     if data is None:
                         Logger.info(f"{self.name}: read_interface requested disconnect")
                         return None
+                    self.read_data_time_ns = time.time_ns()
                 else:
                     data = b""
                     first = False
@@ -136,7 +136,7 @@ class MqttInterface(Interface):
             identified_packet = self.read_packets_by_topic.get(topic)
             if identified_packet:
                 identified_packet = identified_packet.clone()
-                identified_packet.buffer = packet.buffer
+                identified_packet.buffer = packet.buffer_view()
                 packet = identified_packet
             packet.received_time = None
         return packet
@@ -0,0 +1,65 @@
+# Copyright 2026 OpenC3, Inc.
+# All Rights Reserved.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See LICENSE.md for more details.
+#
+# This file may also be used under the terms of a commercial license
+# if purchased from OpenC3, Inc.
+
+import struct
+
+from openc3.interfaces.protocols.length_protocol import LengthProtocol
+
+
+# Protocol for the frames tunneled by a host interface with BRIDGE_PROTOCOLs.
+# The host runs the BRIDGE_PROTOCOLs next to the device and sends each packet
+# prefixed by its length as a 4 byte big endian unsigned integer. This restores
+# the packet boundaries on the COSMOS side without parsing the packets again.
+# Commands are framed the same way on their way to the host.
+class BridgeFrameProtocol(LengthProtocol):
+    HEADER = struct.Struct(">I")
+
+    # self.param max_length [Integer] The maximum allowed packet length
+    # self.param allow_empty_data [True/False/None] See Protocol#initialize
+    def __init__(self, max_length=None, allow_empty_data=None):
+        super().__init__(
+            0,  # length_bit_offset
+            self.HEADER.size * 8,  # length_bit_size
+            self.HEADER.size,  # length_value_offset
+            1,  # length_bytes_per_count
+            "BIG_ENDIAN",
+            self.HEADER.size,  # discard_leading_bytes
+            None,  # sync_pattern
+            max_length,
+            True,  # fill_length_and_sync_pattern
+            allow_empty_data,
+        )
+
+    # Frame a packet buffer for the tunnel
+    #
+    # self.param data [bytes] Packet data
+    # self.return [bytes] The length header followed by the data
+    @classmethod
+    def frame(cls, data):
+        return cls.HEADER.pack(len(data)) + data
+
+    # Split the complete frames from the start of a buffer
+    #
+    # self.param buffer [bytes] Data read from the tunnel
+    # self.return [Array] The packet data of each complete frame and the remaining bytes
+    @classmethod
+    def unframe(cls, buffer):
+        packets = []
+        offset = 0
+        header_size = cls.HEADER.size
+        while len(buffer) - offset >= header_size:
+            (length,) = cls.HEADER.unpack_from(buffer, offset)
+            end = offset + header_size + length
+            if end > len(buffer):
+                break
+            packets.append(bytes(buffer[offset + header_size : end]))
+            offset = end
+        return packets, buffer[offset:]
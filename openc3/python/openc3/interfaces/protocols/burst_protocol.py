@@ -110,7 +110,7 @@ class BurstProtocol(Protocol):
                 0,
                 len(self.sync_pattern) * 8,
                 "BLOCK",
-                packet.buffer_no_copy(),
+                packet.buffer_view(),
                 "BIG_ENDIAN",
                 "ERROR",
             )
@@ -60,7 +60,7 @@ class CmdResponseProtocol(Protocol):
         if self.response_packet is not None:
             # Grab the response packet specified in the command
             result_packet = System.telemetry.packet(self.response_packet[0], self.response_packet[1]).clone()
-            result_packet.buffer = packet.buffer
+            result_packet.buffer = packet.buffer_view()
             result_packet.received_time = None
             result_packet.stored = packet.stored
             result_packet.extra = packet.extra
@@ -168,7 +168,7 @@ class CrcProtocol(Protocol):
     def write_packet(self, packet):
         if self.write_item_name:
             end_range = int(packet.get_item(self.write_item_name).bit_offset / 8)
-            crc = self.crc.calc(packet.buffer_no_copy()[0:end_range])
+            crc = self.crc.calc(packet.buffer_view()[0:end_range])
             packet.write(self.write_item_name, crc)
         return packet
 
@@ -90,7 +90,7 @@ class LengthProtocol(BurstProtocol):
         # If the start of the length field is past what we discard, then the
         # length field is inside the packet
         if self.fill_fields and self.length_bit_offset >= (self.discard_leading_bytes * 8):
-            length = self.calculate_length(len(packet.buffer_no_copy()) + self.discard_leading_bytes)
+            length = self.calculate_length(len(packet.buffer_view()) + self.discard_leading_bytes)
             # Subtract off the discarded bytes since they haven't been added yet
             # Adding bytes happens in the write_data method
             offset = self.length_bit_offset - (self.discard_leading_bytes * 8)
@@ -100,7 +100,7 @@ class LengthProtocol(BurstProtocol):
                 offset,
                 self.length_bit_size,
                 "UINT",
-                packet.buffer_no_copy(),
+                packet.buffer_view(),
                 self.length_endianness,
                 "ERROR",
             )
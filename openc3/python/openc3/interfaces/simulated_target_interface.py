@@ -123,7 +123,7 @@ class SimulatedTargetInterface(Interface):
         if self.connected():
             # Update count of commands sent through this interface
             self.write_count += 1
-            self.bytes_written += len(packet.buffer)
+            self.bytes_written += len(packet.buffer_view())
             self.written_raw_data_time = datetime.now(timezone.utc)
             self.written_raw_data = packet.buffer
 
@@ -146,7 +146,7 @@ class SimulatedTargetInterface(Interface):
         if len(self.pending_packets) != 0:
             self.read_count += 1
             packet = self.pending_packets.pop(0).clone()
-            self.bytes_read += len(packet.buffer)
+            self.bytes_read += len(packet.buffer_view())
             self.read_raw_data_time = datetime.now(timezone.utc)
             self.read_raw_data = packet.buffer
         return packet
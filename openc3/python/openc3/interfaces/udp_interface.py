@@ -9,6 +9,8 @@
 # This file may also be used under the terms of a commercial license
 # if purchased from OpenC3, Inc.
 
+import socket
+from collections import deque
 
 from openc3.config.config_parser import ConfigParser
 from openc3.interfaces.interface import Interface
@@ -80,6 +82,11 @@ class UdpInterface(Interface):
             self.bind_address = "127.0.0.1"
         self.write_socket = None
         self.read_socket = None
+        # Maximum datagrams to receive per wakeup (None reads one datagram at a time)
+        self.read_batch_size = None
+        # Socket receive buffer size in bytes (None uses the OS default)
+        self.receive_buffer_size = None
+        self.read_datagrams = deque()
         if self.read_port is None:
             self.read_allowed = False
         if self.write_dest_port is None:
@@ -132,6 +139,9 @@ class UdpInterface(Interface):
                     self.ttl,
                     self.bind_address,
                 )
+        if self.read_socket and self.receive_buffer_size:
+            self.read_socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, self.receive_buffer_size)
+        self.read_datagrams.clear()
         self.thread_sleeper = None
         super().connect()
 
@@ -153,6 +163,7 @@ class UdpInterface(Interface):
         close_socket(self.read_socket)
         self.write_socket = None
         self.read_socket = None
+        self.read_datagrams.clear()
         if self.thread_sleeper:
             self.thread_sleeper.cancel()
         self.thread_sleeper = None
@@ -171,7 +182,13 @@ class UdpInterface(Interface):
     # Reads from the socket if the read_port is defined
     def read_interface(self):
         try:
-            data = self.read_socket.read(self.read_timeout)
+            if self.read_batch_size:
+                # Drain every waiting datagram in one wakeup and then hand them out one at a time
+                if not self.read_datagrams:
+                    self.read_datagrams.extend(self.read_socket.read_batch(self.read_timeout, self.read_batch_size))
+                data = self.read_datagrams.popleft()
+            else:
+                data = self.read_socket.read(self.read_timeout)
             if len(data) <= 0:
                 Logger.info(f"{self.name}: Udp read returned 0 bytes (stream closed)")
             extra = None
@@ -179,7 +196,8 @@ class UdpInterface(Interface):
             return (data, extra)
         # TODO: select.select can throw TypeErorr: fileno() returned a non-integer
         # Does it also throw socket.error?
-        except (OSError, TypeError):
+        # IndexError if disconnect clears the read_datagrams before they are handed out
+        except (OSError, TypeError, IndexError):
             return None, None
 
     # Writes to the socket
@@ -189,6 +207,16 @@ class UdpInterface(Interface):
         self.write_socket.write(data, self.write_timeout)
         return data, extra
 
+    def set_option(self, option_name, option_values):
+        super().set_option(option_name, option_values)
+        match option_name.upper():
+            case "READ_BATCH_SIZE":
+                self.read_batch_size = int(option_values[0])
+                if self.read_batch_size <= 1:
+                    self.read_batch_size = None
+            case "RECEIVE_BUFFER_SIZE":
+                self.receive_buffer_size = int(option_values[0])
+
     def details(self):
         result = super().details()
         result["hostname"] = self.hostname
@@ -9,14 +9,80 @@
 # This file may also be used under the terms of a commercial license
 # if purchased from OpenC3, Inc.
 
+import ctypes
 import ipaddress
+import os
 import select
 import socket
+import sys
 
 
 # socket.MSG_DONTWAIT is Unix-only; on Windows we rely on setblocking(False).
 _MSG_DONTWAIT = getattr(socket, "MSG_DONTWAIT", 0)
 
+# Largest possible UDP datagram
+MAX_DATAGRAM_SIZE = 65536
+
+
+class _Iovec(ctypes.Structure):
+    _fields_ = [("iov_base", ctypes.c_void_p), ("iov_len", ctypes.c_size_t)]
+
+
+class _Msghdr(ctypes.Structure):
+    _fields_ = [
+        ("msg_name", ctypes.c_void_p),
+        ("msg_namelen", ctypes.c_uint32),
+        ("msg_iov", ctypes.c_void_p),
+        ("msg_iovlen", ctypes.c_size_t),
+        ("msg_control", ctypes.c_void_p),
+        ("msg_controllen", ctypes.c_size_t),
+        ("msg_flags", ctypes.c_int),
+    ]
+
+
+class _Mmsghdr(ctypes.Structure):
+    _fields_ = [("msg_hdr", _Msghdr), ("msg_len", ctypes.c_uint)]
+
+
+# recvmmsg receives multiple datagrams in a single system call (Linux only)
+_recvmmsg = None
+if sys.platform.startswith("linux"):
+    try:
+        _recvmmsg = ctypes.CDLL(None, use_errno=True).recvmmsg
+        _recvmmsg.argtypes = [ctypes.c_int, ctypes.c_void_p, ctypes.c_uint, ctypes.c_int, ctypes.c_void_p]
+        _recvmmsg.restype = ctypes.c_int
+    except (OSError, AttributeError):
+        _recvmmsg = None
+
+
+# Pre-allocated buffers and message headers for recvmmsg
+class RecvmmsgBuffers:
+    def __init__(self, count, size=MAX_DATAGRAM_SIZE):
+        self.count = count
+        self.size = size
+        self.buffers = ctypes.create_string_buffer(count * size)
+        self.iovecs = (_Iovec * count)()
+        self.messages = (_Mmsghdr * count)()
+        buffers_address = ctypes.addressof(self.buffers)
+        iovecs_address = ctypes.addressof(self.iovecs)
+        for index in range(count):
+            self.iovecs[index].iov_base = buffers_address + index * size
+            self.iovecs[index].iov_len = size
+            self.messages[index].msg_hdr.msg_iov = iovecs_address + index * ctypes.sizeof(_Iovec)
+            self.messages[index].msg_hdr.msg_iovlen = 1
+
+    # @return [Array<bytes>] The datagrams which were waiting on the socket
+    def receive(self, fileno):
+        count = _recvmmsg(fileno, ctypes.addressof(self.messages), self.count, _MSG_DONTWAIT, None)
+        if count < 0:
+            error = ctypes.get_errno()
+            raise OSError(error, os.strerror(error))
+        buffers_address = ctypes.addressof(self.buffers)
+        return [
+            ctypes.string_at(buffers_address + index * self.size, self.messages[index].msg_len)
+            for index in range(count)
+        ]
+
 
 class UdpReadWriteSocket:
     # @param bind_port [Integer[ Port to write data out from and receive data on (0 = randomly assigned)
@@ -40,6 +106,7 @@ class UdpReadWriteSocket:
     ):
         self.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         self.socket.setblocking(False)
+        self.recvmmsg_buffers = None
 
         # Basic setup to reuse address
         self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
@@ -101,7 +168,7 @@ class UdpReadWriteSocket:
         data = None
         while True:
             try:
-                data, _ = self.socket.recvfrom(65536, _MSG_DONTWAIT)
+                data, _ = self.socket.recvfrom(MAX_DATAGRAM_SIZE, _MSG_DONTWAIT)
             except OSError as e:
                 if e.args[0] == socket.EAGAIN or e.args[0] == socket.EWOULDBLOCK:
                     result = select.select([self.socket], [], [], read_timeout)
@@ -112,6 +179,44 @@ class UdpReadWriteSocket:
             break
         return data
 
+    # Wait for data and then return every datagram already waiting on the socket
+    # (up to max_datagrams) in a single wakeup. Uses recvmmsg where available and
+    # otherwise drains the socket with non-blocking reads.
+    # @param read_timeout [Float] Time in seconds to wait for the first datagram
+    # @param max_datagrams [Integer] Maximum number of datagrams to return
+    # @return [Array<bytes>] The datagrams received
+    def read_batch(self, read_timeout=None, max_datagrams=64):
+        while True:
+            try:
+                datagrams = self._receive_datagrams(max_datagrams)
+            except OSError as e:
+                if e.args[0] == socket.EAGAIN or e.args[0] == socket.EWOULDBLOCK:
+                    datagrams = []
+                else:
+                    raise e
+            if datagrams:
+                return datagrams
+            result = select.select([self.socket], [], [], read_timeout)
+            if len(result[0]) == 0 and len(result[1]) == 0 and len(result[2]) == 0:
+                raise TimeoutError
+
+    def _receive_datagrams(self, max_datagrams):
+        if _recvmmsg is not None:
+            if self.recvmmsg_buffers is None or self.recvmmsg_buffers.count != max_datagrams:
+                self.recvmmsg_buffers = RecvmmsgBuffers(max_datagrams)
+            return self.recvmmsg_buffers.receive(self.socket.fileno())
+
+        datagrams = []
+        while len(datagrams) < max_datagrams:
+            try:
+                data, _ = self.socket.recvfrom(MAX_DATAGRAM_SIZE, _MSG_DONTWAIT)
+            except OSError as e:
+                if datagrams and (e.args[0] == socket.EAGAIN or e.args[0] == socket.EWOULDBLOCK):
+                    break
+                raise e
+            datagrams.append(data)
+        return datagrams
+
     # Defer all methods to the UDPSocket
     def __getattr__(self, func):
         def method(*args, **kwargs):
@@ -49,7 +49,7 @@ from openc3.logs.packet_log_constants import (
     OPENC3_TARGET_DECLARATION_ENTRY_TYPE_MASK,
     OPENC3_TARGET_DECLARATION_SECONDARY_FIXED_SIZE,
 )
-from openc3.packets.json_packet import JsonPacket
+from openc3.packets.json_packet import JsonPacket, LazyJsonPacket
 from openc3.packets.packet import Packet
 
 
@@ -62,8 +62,18 @@ class PacketLogReader:
 
     MAX_READ_SIZE = 1_000_000_000
 
-    def __init__(self):
-        """Create a new log file reader."""
+    def __init__(self, lazy: bool = False, items: list[str] | None = None):
+        """
+        Create a new log file reader.
+
+        Args:
+            lazy: Return JSON packets as LazyJsonPacket which only decode their
+                data when an item is read
+            items: Optional list of item names. JSON packets only decode and keep
+                these items.
+        """
+        self._lazy = lazy
+        self._items = set(items) if items is not None else None
         self._reset()
 
     def _reset(self):
@@ -75,6 +85,7 @@ class PacketLogReader:
         self._target_ids = []
         self._packets = []  # List of [cmd_or_tlm, target_name, packet_name, id, key_map]
         self._packet_ids = []
+        self._projected_key_maps = {}  # packet_index -> key_map projected to self._items
         self._redis_offset = None
         self._last_offsets = {}
 
@@ -320,7 +331,7 @@ class PacketLogReader:
         has_received_time: bool,
         has_extra: bool,
     ) -> JsonPacket:
-        """Read a JSON packet entry."""
+        """Read a JSON packet entry. Returns a LazyJsonPacket if lazy or items were given."""
         # Parse packet_index (2 bytes) and timestamp (8 bytes)
         packet_index, time_nsec = struct.unpack(">HQ", entry[2:12])
 
@@ -338,6 +349,31 @@ class PacketLogReader:
         if cmd_or_tlm != lookup_cmd_or_tlm:
             raise ValueError(f"Packet type mismatch, packet:{cmd_or_tlm}, lookup:{lookup_cmd_or_tlm}")
 
+        if self._lazy or self._items is not None:
+            if key_map is not None and self._items is not None:
+                projected_key_map = self._projected_key_maps.get(packet_index)
+                if projected_key_map is None:
+                    projected_key_map = LazyJsonPacket.project_key_map(key_map, self._items)
+                    self._projected_key_maps[packet_index] = projected_key_map
+                key_map = projected_key_map
+            packet = LazyJsonPacket(
+                cmd_or_tlm,
+                target_name,
+                packet_name,
+                time_nsec,
+                stored,
+                json_data,
+                is_cbor,
+                key_map,
+                received_time_nsec_since_epoch=received_time_nsec,
+                extra=extra,
+                names=self._items,
+            )
+            if not self._lazy:
+                # Decode the projected items now
+                packet.json_hash  # noqa: B018
+            return packet
+
         if is_cbor:
             json_hash = cbor2.loads(json_data)
         else:
@@ -455,6 +491,7 @@ class PacketLogReader:
         else:
             key_map = json.loads(key_map_bytes)
 
+        self._projected_key_maps.pop(packet_index, None)
         if packet_index < len(self._packets):
             # Append key_map to existing packet entry
             if len(self._packets[packet_index]) == 4:
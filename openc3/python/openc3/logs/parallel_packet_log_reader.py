@@ -0,0 +1,253 @@
+# Copyright 2026 OpenC3, Inc.
+# All Rights Reserved.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See LICENSE.md for more details.
+#
+# This file may also be used under the terms of a commercial license
+# if purchased from OpenC3, Inc.
+
+"""
+Parallel packet log reader for replaying many log files at once.
+
+Each log file is read by a worker process with its own PacketLogReader (and
+System if target names are given). Workers filter and transform the packets
+and spool the results to a temporary file. The results are merged back in
+time order with a k-way heap merge which follows each file as it is written.
+"""
+
+import contextlib
+import heapq
+import multiprocessing
+import os
+import pickle
+import shutil
+import tempfile
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed, wait
+from datetime import datetime
+from typing import Any
+
+from openc3.environment import OPENC3_LOGS_BUCKET
+from openc3.logs.packet_log_reader import PacketLogReader
+from openc3.packets.json_packet import JsonPacket
+from openc3.packets.packet import Packet
+from openc3.utilities.bucket import Bucket
+from openc3.utilities.bucket_utilities import BucketUtilities
+
+
+def packet_time_nsec(packet: Packet | JsonPacket) -> int:
+    """The packet time in nanoseconds as read from the log file"""
+    if isinstance(packet, JsonPacket):
+        return packet.time_nsec
+    # Set by PacketLogReader for raw packets
+    return packet._time_nsec
+
+
+def packet_to_hash(packet: Packet | JsonPacket) -> dict:
+    """Default transform which returns the packet as a picklable dict"""
+    result = {
+        "time_nsec": packet_time_nsec(packet),
+        "cmd_or_tlm": packet.cmd_or_tlm,
+        "target_name": packet.target_name,
+        "packet_name": packet.packet_name,
+        "stored": packet.stored,
+    }
+    if isinstance(packet, JsonPacket):
+        result["json_hash"] = packet.json_hash
+    else:
+        result["buffer"] = packet.buffer_view()
+    return result
+
+
+class ParallelPacketLogReader:
+    """
+    Reads many packet log files in parallel and yields the results in time order.
+
+    The transform is called in the worker processes for each packet within the
+    time range. It must be picklable (i.e. a module level function) and return a
+    picklable result or None to drop the packet. Packets within each file are
+    expected to be in time order as written by the PacketLogWriter.
+    """
+
+    # Default number of worker processes (None uses the number of CPUs)
+    PROCESSES = int(os.environ.get("OPENC3_LOG_REPLAY_PROCESSES", 0)) or None
+    # Workers are spawned rather than forked since forking a process with threads
+    # (e.g. the logger or bucket upload threads) can deadlock the child
+    START_METHOD = "spawn"
+    # Seconds to wait for a worker to write more results before checking again
+    FOLLOW_PERIOD = 0.05
+
+    def __init__(
+        self,
+        transform: Callable[[Packet | JsonPacket], Any] = packet_to_hash,
+        processes: int | None = None,
+        target_names: list[str] | None = None,
+        target_config_dir: str | None = None,
+        lazy: bool = False,
+        items: list[str] | None = None,
+        bucket: str | None = OPENC3_LOGS_BUCKET,
+    ):
+        """
+        Args:
+            transform: Called with each packet in a worker. Returns the result to yield or None.
+            processes: Number of worker processes. Defaults to PROCESSES.
+            target_names: Targets to load into each worker's System. Raw packets are
+                only identified and defined when given.
+            target_config_dir: Directory where the target config folders are
+            lazy: Passed to PacketLogReader for JSON packets
+            items: Passed to PacketLogReader for JSON packets
+            bucket: Bucket to download log files from if they are not local files
+        """
+        self.transform = transform
+        self.processes = processes or self.PROCESSES
+        self.target_names = target_names
+        self.target_config_dir = target_config_dir
+        self.lazy = lazy
+        self.items = items
+        self.bucket = bucket
+
+    def each(
+        self,
+        files: list[str],
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+        ordered: bool = True,
+    ) -> Iterator[Any]:
+        """
+        Read every file and yield the transformed results.
+
+        Args:
+            files: Local log file paths or bucket keys. Bucket files ending in .gz are uncompressed.
+            start_time: Optional start time filter
+            end_time: Optional end time filter
+            ordered: Merge the results from every file in time order. Otherwise the
+                results of each file are yielded as soon as its worker finishes.
+        """
+        tmp_dir = tempfile.mkdtemp()
+        executor = ProcessPoolExecutor(
+            max_workers=self.processes,
+            mp_context=multiprocessing.get_context(self.START_METHOD),
+            initializer=_init_worker,
+            initargs=(self.target_names, self.target_config_dir),
+        )
+        try:
+            result_paths = [os.path.join(tmp_dir, str(index)) for index in range(len(files))]
+            futures = [
+                executor.submit(
+                    _read_file,
+                    file,
+                    result_path,
+                    self.bucket,
+                    start_time,
+                    end_time,
+                    self.transform,
+                    self.target_names is not None,
+                    self.lazy,
+                    self.items,
+                )
+                for file, result_path in zip(files, result_paths, strict=True)
+            ]
+            if ordered:
+                # Merge the results while the workers are still writing them
+                merged = heapq.merge(
+                    *[
+                        _follow_results(future, result_path, self.FOLLOW_PERIOD)
+                        for future, result_path in zip(futures, result_paths, strict=True)
+                    ],
+                    key=lambda x: x[0],
+                )
+                for _, result in merged:
+                    yield result
+            else:
+                for future in as_completed(futures):
+                    yield from (result for _, result in _read_results(future.result()))
+        finally:
+            # Don't wait for the remaining files if the caller stopped early
+            executor.shutdown(wait=False, cancel_futures=True)
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+def _init_worker(target_names, target_config_dir):
+    if target_names:
+        from openc3.system.system import System
+
+        System.instance(target_names, target_config_dir)
+        # Each worker reads one file at a time in a single thread
+        System.commands.set_single_owner(True)
+        System.telemetry.set_single_owner(True)
+
+
+def _read_file(file, result_path, bucket, start_time, end_time, transform, identify_and_define, lazy, items):
+    """Read a log file in a worker and spool the (time_nsec, result) tuples to result_path"""
+    filename = file
+    temp_files = []
+    if not os.path.exists(file) or file.endswith(".gz"):
+        filename = f"{result_path}.bin"
+        if file.endswith(".gz"):
+            filename += ".gz"
+        if os.path.exists(file):
+            # Link local compressed files so they uncompress into the temp dir
+            os.symlink(os.path.abspath(file), filename)
+        else:
+            Bucket.get_client().get_object(bucket=bucket, key=file, path=filename)
+        temp_files.append(filename)
+        if filename.endswith(".gz"):
+            filename = BucketUtilities.uncompress_file(filename)
+            temp_files.append(filename)
+
+    try:
+        reader = PacketLogReader(lazy=lazy, items=items)
+        with open(result_path, "wb") as result_file:
+            for packet in reader.each(filename, identify_and_define, start_time, end_time):
+                result = transform(packet)
+                if result is not None:
+                    pickle.dump((packet_time_nsec(packet), result), result_file, pickle.HIGHEST_PROTOCOL)
+    finally:
+        for path in temp_files:
+            with contextlib.suppress(OSError):
+                os.remove(path)
+    return result_path
+
+
+def _read_results(result_path):
+    with open(result_path, "rb") as result_file:
+        while True:
+            try:
+                yield pickle.load(result_file)
+            except EOFError:
+                break
+
+
+def _follow_results(future, result_path, follow_period):
+    """Yield the (time_nsec, result) tuples from result_path while the worker is still writing them"""
+    result_file = None
+    try:
+        while True:
+            # Once the worker is done everything it wrote can be read
+            done = future.done()
+            if result_file is None:
+                with contextlib.suppress(FileNotFoundError):
+                    result_file = open(result_path, "rb")  # noqa: SIM115
+            if result_file is not None:
+                position = result_file.tell()
+                try:
+                    yield pickle.load(result_file)
+                    continue
+                except (EOFError, pickle.UnpicklingError):
+                    if done:
+                        # Only a partially written result can't be unpickled
+                        if result_file.read(1):
+                            raise
+                    else:
+                        result_file.seek(position)
+            if done:
+                # Raises the error from the worker if there was one
+                future.result()
+                return
+            wait([future], timeout=follow_period)
+    finally:
+        if result_file is not None:
+            result_file.close()
@@ -51,10 +51,9 @@ from openc3.microservices.microservice import Microservice
 from openc3.models.bridge_interface_model import BridgeInterfaceModel
 from openc3.models.bridge_model import BridgeModel
 from openc3.models.host_interface_microservice_model import HostInterfaceMicroserviceModel
-from openc3.models.model import Model
 from openc3.models.scope_model import ScopeModel
 from openc3.topics.config_topic import ConfigTopic
-from openc3.topics.topic import Topic
+from openc3.utilities.async_store import AsyncStore, EphemeralAsyncStore
 from openc3.utilities.store_queued import EphemeralStoreQueued
 
 
@@ -189,9 +188,17 @@ class BridgeMicroservice(Microservice):
         change this relay's MicroserviceModel — which would make the operator
         respawn it. Sorted so an unchanged set never looks changed to
         _stream_watcher."""
+        return self._relayed_streams(HostInterfaceMicroserviceModel.all(self.scope))
+
+    async def _load_streams(self):
+        """_streams read through the AsyncStore so the event loop isn't blocked."""
+        models = await AsyncStore.instance().hgetall(f"{self.scope}__{HostInterfaceMicroserviceModel.PRIMARY_KEY}")
+        return self._relayed_streams({key.decode(): value for key, value in models.items()})
+
+    def _relayed_streams(self, models):
         streams = []
-        for _name, data in HostInterfaceMicroserviceModel.all(self.scope).items():
-            if isinstance(data, str):
+        for _name, data in models.items():
+            if isinstance(data, (str, bytes)):
                 data = json.loads(data)
             if data.get("bridge_name") != self.bridge_name:
                 continue
@@ -321,6 +328,10 @@ class BridgeMicroservice(Microservice):
         finally:
             watcher.cancel()
             streams.cancel()
+            # The clients are bound to this loop so close them before it finishes
+            for store in (AsyncStore, EphemeralAsyncStore):
+                with contextlib.suppress(Exception):
+                    await store.close_instances()
 
     async def _shutdown_watcher(self, endpoint):
         """Close the endpoint on shutdown so the accept loop wakes and exits."""
@@ -331,18 +342,6 @@ class BridgeMicroservice(Microservice):
             if inspect.isawaitable(result):
                 _ = await result
 
-    def _read_config_changes(self, topic, offset, timeout_ms):
-        """Block (in an executor thread) until a config change is published on the
-        ConfigTopic or timeout_ms elapses, returning the message ids read. Fully
-        drains the read_topics generator here since its blocking xread only runs
-        while iterating. Offsets are passed in explicitly (not left to the store's
-        thread-local tracking) so this is correct across executor threads."""
-        ids = []
-        with contextlib.suppress(Exception):
-            for _topic, msg_id, _msg_hash, _redis in Topic.read_topics([topic], [offset], timeout_ms):
-                ids.append(msg_id)
-        return ids
-
     def _refresh_alpns(self, endpoint, streams):
         """Advertise a changed stream set, committing it only after success."""
         if streams == self.streams:
@@ -369,23 +368,23 @@ class BridgeMicroservice(Microservice):
         Wakes immediately on ConfigTopic changes (interface created/deleted, ...)
         and also re-checks every STREAM_REFRESH_INTERVAL as a fallback (covers a
         missed message or a bridge created before this watcher started)."""
-        loop = asyncio.get_event_loop()
+        store = EphemeralAsyncStore.instance()
         config_topic = f"{self.scope}{ConfigTopic.PRIMARY_KEY}"
         timeout_ms = int(STREAM_REFRESH_INTERVAL * 1000)
         # Start at the current end of the topic so we only wake on NEW changes.
         try:
-            offset = await loop.run_in_executor(None, Topic.get_last_offset, config_topic)
+            offset = await store.get_last_offset(config_topic)
         except Exception:
             offset = "0-0"
         while not self.cancel_thread:
-            # Block until a config change arrives or the fallback interval elapses.
-            ids = await loop.run_in_executor(None, self._read_config_changes, config_topic, offset, timeout_ms)
-            if ids:
-                offset = ids[-1]
+            # Await a config change or the fallback interval without tying up an executor thread.
+            with contextlib.suppress(Exception):
+                async for _topic, msg_id, _msg_hash, _redis in store.read_topics([config_topic], [offset], timeout_ms):
+                    offset = msg_id
             if self.cancel_thread:
                 break
             try:
-                streams = self._streams()
+                streams = await self._load_streams()
             except Exception as error:
                 self.logger.warn(f"Bridge '{self.bridge_name}': stream refresh error: {_iroh_error_detail(error)}")
                 continue
@@ -760,9 +759,9 @@ class BridgeMicroservice(Microservice):
         # slow and fully synchronous. Running it on the event loop would stall the
         # data-path _pump tasks for the duration, so a client that polls this API
         # (openc3-app, every operator cycle) causes periodic latency bursts in the
-        # bridged stream. The plugin list is a fast Redis read done on the loop;
-        # the heavy disk/CPU work runs in a thread so byte pumping keeps going.
-        gems = self._plugin_gem_names()
+        # bridged stream. The plugin list is awaited through the AsyncStore; the
+        # heavy disk/CPU work runs in a thread so byte pumping keeps going.
+        gems = await self._plugin_gem_names()
         loop = asyncio.get_event_loop()
         payload = await loop.run_in_executor(None, self._build_files_payload, gems, have)
         with contextlib.suppress(Exception):
@@ -770,10 +769,10 @@ class BridgeMicroservice(Microservice):
             await send.finish()
         await self._drain_close(conn)
 
-    def _plugin_gem_names(self):
+    async def _plugin_gem_names(self):
         """The set of plugin gem filenames installed in this scope (Redis read)."""
-        plugins = Model.all(f"{self.scope}__openc3_plugins")
-        return {str(name).split("__")[0] for name in plugins}
+        plugins = await AsyncStore.instance().hkeys(f"{self.scope}__openc3_plugins")
+        return {name.decode().split("__")[0] for name in plugins}
 
     def _build_files_payload(self, gems, have):
         """Build the api/files hash-delta JSON (changed/new files + deletions) for
@@ -32,6 +32,8 @@ from openc3.top_level import kill_thread
 from openc3.topics.limits_event_topic import LimitsEventTopic
 from openc3.topics.telemetry_decom_topic import TelemetryDecomTopic
 from openc3.topics.topic import Topic
+from openc3.utilities.metric import Metric
+from openc3.utilities.pipeline_trace import PipelineTrace
 from openc3.utilities.thread_manager import ThreadManager
 from openc3.utilities.time import from_nsec_from_epoch, to_nsec_from_epoch
 
@@ -115,12 +117,23 @@ class DecomMicroservice(Microservice):
         self.limits_response_queue = queue.Queue()
         self.limits_response_thread = None
         System.telemetry.set_limits_change_callback(self.limits_change_callback)
+        # Only the microservice thread decoms the packets
+        System.telemetry.set_single_owner(True)
         LimitsEventTopic.sync_system(scope=self.scope)
         target_model = TargetModel.get_model(name=self.target_names[0], scope=self.scope)
         self.stored_limits_mode = target_model.stored_limits_mode if target_model else "PROCESS"
         self.error_count = 0
-        self.metric.set(name="decom_total", value=self.count, type="counter")
+        self.decom_total = self.metric.counter("decom_total")
         self.metric.set(name="decom_error_total", value=self.error_count, type="counter")
+        self.decom_topic_delta = self.metric.gauge(
+            "decom_topic_delta_seconds",
+            unit="seconds",
+            help="Delta time between data written to stream and decom start",
+        )
+        self.decom_duration = self.metric.histogram(
+            "decom_duration_seconds", buckets=Metric.exponential_buckets(0.00001, 2, 16), unit="seconds"
+        )
+        self.pipeline_trace = PipelineTrace(self.metric)
 
     def run(self):
         self.limits_response_thread = LimitsResponseThread(
@@ -158,7 +171,7 @@ class DecomMicroservice(Microservice):
                             continue
                     else:
                         self.decom_packet(topic, msg_id, msg_hash, redis)
-                        self.metric.set(name="decom_total", value=self.count, type="counter")
+                        self.decom_total.inc()
                     self.count += 1
             except Exception as error:
                 self.error_count += 1
@@ -172,16 +185,11 @@ class DecomMicroservice(Microservice):
     def decom_packet(self, topic, msg_id, msg_hash, _redis):
         # OpenC3.in_span("decom_packet") do
         msgid_seconds_from_epoch = int(msg_id.split("-")[0]) / 1000.0
-        delta = time.time() - msgid_seconds_from_epoch
-        self.metric.set(
-            name="decom_topic_delta_seconds",
-            value=delta,
-            type="gauge",
-            unit="seconds",
-            help="Delta time between data written to stream and decom start",
-        )
-
         start = time.time()
+        self.decom_topic_delta.set(start - msgid_seconds_from_epoch)
+        trace = PipelineTrace.loads(msg_hash)
+        if trace is not None:
+            PipelineTrace.stamp(trace, "decom_start")
 
         #######################################
         # Build packet object from topic data
@@ -229,13 +237,17 @@ class DecomMicroservice(Microservice):
                 packet_or_subpacket.check_limits(System.limits_set())
 
             # This is what actually decommutates the packet and updates the CVT
+            # Each subpacket gets its own copy of the trace to stamp
+            packet_trace = None if trace is None else dict(trace)
             TelemetryDecomTopic.write_packet(
                 packet_or_subpacket,
                 include_limits_states=not disable_stored_limits,
                 scope=self.scope,
+                trace=packet_trace,
             )
-        diff = time.time() - start  # seconds as a float
-        self.metric.set(name="decom_duration_seconds", value=diff, type="gauge", unit="seconds")
+            if packet_trace is not None:
+                self.pipeline_trace.record(packet_or_subpacket.target_name, packet_trace, PipelineTrace.DECOM_STAGES)
+        self.decom_duration.observe(time.time() - start)
 
     def handle_subpacket(self, packet, subpacket):
         # Subpacket received time always = packet.received_time
@@ -250,12 +262,13 @@ class DecomMicroservice(Microservice):
                 subpacket, self.target_names, subpackets=True
             )
         else:
-            # Identify and update subpacket
+            # Identify and update subpacket. The subpacket is discarded afterwards
+            # so the current value table packet adopts its buffer without copying
             if subpacket.identified():
                 try:
                     # Preidentifed subpacket - place it into the current value table
                     identified_subpacket = System.telemetry.update(
-                        subpacket.target_name, subpacket.packet_name, subpacket.buffer
+                        subpacket.target_name, subpacket.packet_name, subpacket.buffer_view(), adopt=True
                     )
                 except Exception:
                     # Subpacket identified but we don't know about it
@@ -266,12 +279,12 @@ class DecomMicroservice(Microservice):
                     subpacket.target_name = None
                     subpacket.packet_name = None
                     identified_subpacket = System.telemetry.identify_and_set_buffer(
-                        subpacket.buffer, self.target_names, subpackets=True
+                        subpacket.buffer_view(), self.target_names, subpackets=True, adopt=True
                     )
             else:
                 # Subpacket needs to be identified
                 identified_subpacket = System.telemetry.identify_and_set_buffer(
-                    subpacket.buffer, self.target_names, subpackets=True
+                    subpacket.buffer_view(), self.target_names, subpackets=True, adopt=True
                 )
 
         if identified_subpacket:
@@ -280,16 +293,16 @@ class DecomMicroservice(Microservice):
             identified_subpacket.extra = subpacket.extra
             subpacket = identified_subpacket
         else:
-            unknown_subpacket = System.telemetry.update("UNKNOWN", "UNKNOWN", subpacket.buffer)
+            unknown_subpacket = System.telemetry.update("UNKNOWN", "UNKNOWN", subpacket.buffer_view(), adopt=True)
             unknown_subpacket.received_time = subpacket.received_time
             unknown_subpacket.stored = subpacket.stored
             unknown_subpacket.extra = subpacket.extra
             subpacket = unknown_subpacket
-            num_bytes_to_print = min(InterfaceMicroservice.UNKNOWN_BYTES_TO_PRINT, len(subpacket.buffer))
-            data = subpacket.buffer_no_copy()[0:(num_bytes_to_print)]
+            num_bytes_to_print = min(InterfaceMicroservice.UNKNOWN_BYTES_TO_PRINT, len(subpacket.buffer_view()))
+            data = subpacket.buffer_view()[0:(num_bytes_to_print)]
             prefix = "".join([format(x, "02x") for x in data])
             self.logger.warn(
-                f"{self.name} {subpacket.target_name} packet length: {len(subpacket.buffer)} starting with: {prefix}"
+                f"{self.name} {subpacket.target_name} packet length: {len(subpacket.buffer_view())} starting with: {prefix}"
             )
 
         TargetModel.sync_tlm_packet_counts(subpacket, self.target_names, scope=self.scope)
@@ -336,7 +349,9 @@ class DecomMicroservice(Microservice):
                 case "BLUE" | "GREEN" | "GREEN_LOW" | "GREEN_HIGH":
                     # Only print INFO messages if we're changing ... not on initialization
                     if old_limits_state:
-                        self.logger.info(message, other=time)
+                        # Rate limit an item flapping in and out of limits rather than each value
+                        key = f"{packet.target_name} {packet.packet_name} {item.name}"
+                        self.logger.info(message, other=time, key=key)
                 case "YELLOW" | "YELLOW_LOW" | "YELLOW_HIGH":
                     self.logger.warn(message, other=time, type=self.logger.NOTIFICATION)
                 case "RED" | "RED_LOW" | "RED_HIGH":
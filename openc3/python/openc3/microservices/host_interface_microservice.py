@@ -13,7 +13,7 @@
 
 This runs on the host computer (outside Docker) so it can reach hardware such
 as serial ports. It builds the real interface, opens the device, and tunnels
-**raw bytes** over Iroh to the COSMOS bridge_microservice hub, which pairs it
+**raw bytes** (or framed packets, see below) over Iroh to the COSMOS bridge_microservice hub, which pairs it
 with the matching COSMOS ``bridge_interface`` by the ``stream/<name>`` ALPN:
 
     host interface  <--stream/NAME-->  bridge_microservice  <--stream/NAME-->  bridge_interface (COSMOS)
@@ -23,8 +23,10 @@ regular ``PROTOCOL``s stay on the Docker side of COSMOS (applied by the
 bridge_interface). Protocols declared with ``BRIDGE_PROTOCOL`` are the exception:
 they are handed down in the host config and run **here**, next to the device, so
 protocol processing that must live near the hardware (framing, timing-sensitive
-handshakes, CRC, ...) happens before bytes ever cross the Iroh tunnel. There is
-no Redis access on the host.
+handshakes, CRC, ...) happens before bytes ever cross the Iroh tunnel. Each
+packet they produce is then framed with a length prefix (``BridgeFrameProtocol``,
+which COSMOS adds to the bridge_interface) so packet boundaries survive the
+tunnel. There is no Redis access on the host.
 
 The host uses the normal COSMOS ``Logger`` API, but configured so it only writes
 its JSON records to **stdout** (no Redis). openc3-app captures that stdout and
@@ -46,8 +48,10 @@ import json
 import os
 import signal
 import sys
+import threading
 import traceback
 
+from openc3.interfaces.protocols.bridge_frame_protocol import BridgeFrameProtocol
 from openc3.packets.packet import Packet
 from openc3.top_level import get_class_from_module
 from openc3.utilities.logger import Logger
@@ -93,6 +97,15 @@ PUMP_CHUNK_BYTES = 65536
 # Delay between reconnect attempts.
 RECONNECT_DELAY = 5.0
 
+# Data read from the device is batched into one write to the tunnel until this
+# many seconds pass or this many bytes are ready. With BRIDGE_PROTOCOLs each
+# packet is framed by BridgeFrameProtocol so the batch keeps packet boundaries.
+BATCH_DELAY = 0.001
+BATCH_BYTES = 65536
+
+# Reads queued by the device reader thread before it waits for the tunnel.
+READ_QUEUE_SIZE = 1000
+
 # Data-channel readiness handshake (MUST match bridge_interface.py). After the
 # data legs pair, the host sends READY (up, paired, ready) and waits for the
 # COSMOS bridge_interface to reply GO before it connects the device — so we never
@@ -100,6 +113,11 @@ RECONNECT_DELAY = 5.0
 # device data flows, so they never mix with it.
 BRIDGE_READY = b"\x01"
 BRIDGE_GO = b"\x02"
+# Sent instead of READY/GO when the data is framed by BridgeFrameProtocol (we run
+# BRIDGE_PROTOCOLs). A COSMOS which disagrees on framing, like one from before
+# BRIDGE_PROTOCOLs, rejects our READY rather than misreading the frames.
+BRIDGE_READY_FRAMED = b"\x03"
+BRIDGE_GO_FRAMED = b"\x04"
 
 # Max wait for COSMOS's GO after we send READY before giving up and parking.
 HANDSHAKE_TIMEOUT = 30.0
@@ -404,12 +422,13 @@ class HostInterfaceMicroservice:
                 send = bi.send()
                 recv = bi.recv()
                 await recv.read(PRIME_BYTES)
-                # 2. Tell COSMOS we are up, paired, and ready (req 1).
-                await send.write_all(BRIDGE_READY)
+                # 2. Tell COSMOS we are up, paired, and ready (req 1) and whether
+                #    the data is framed.
+                await send.write_all(BRIDGE_READY_FRAMED if self.protocols else BRIDGE_READY)
                 # 3. Wait for COSMOS to confirm it is connected before we open the
                 #    device. COSMOS is authoritative on connection order (req 2).
                 go = await asyncio.wait_for(self._read_exact(recv, len(BRIDGE_GO)), timeout=HANDSHAKE_TIMEOUT)
-                if go != BRIDGE_GO:
+                if go != (BRIDGE_GO_FRAMED if self.protocols else BRIDGE_GO):
                     raise RuntimeError(f"unexpected bridge handshake {go!r}")
                 Logger.info(f"{self.name}: bridged to COSMOS on {alpn.decode()}")
 
@@ -474,40 +493,107 @@ class HostInterfaceMicroservice:
             buf += bytes(chunk)
         return buf
 
+    def _device_reader(self, loop, interface, read_queue, slots, stop):
+        """Read from the device in a dedicated thread and hand each read to the
+        event loop. This replaces an executor hop per read. Ends with None when
+        the interface (or a protocol) requests a disconnect or the read fails."""
+        try:
+            while not self.shutdown and not stop.is_set():
+                if self.protocols:
+                    packet = interface.read()
+                    data = None if packet is None else bytes(packet.buffer)
+                else:
+                    data, _extra = interface.read_interface()
+                    if data is not None:
+                        data = bytes(data)
+                if data is None:  # interface/protocol requested disconnect
+                    break
+                if self.protocols:
+                    data = BridgeFrameProtocol.frame(data)
+                while not slots.acquire(timeout=1.0):
+                    if stop.is_set():
+                        return
+                loop.call_soon_threadsafe(read_queue.put_nowait, data)
+        except Exception as error:
+            # Reads fail once the session ends and the device is disconnected
+            if not stop.is_set():
+                Logger.error(f"{self.name}: device read error: {_iroh_error_detail(error)}")
+        finally:
+            with contextlib.suppress(RuntimeError):  # the loop is already closed
+                loop.call_soon_threadsafe(read_queue.put_nowait, None)
+
     async def _device_to_bridge(self, loop, interface, send):
         """Read from the device and forward to COSMOS. With BRIDGE_PROTOCOLs the
         interface's protocol-aware read() runs here (so read protocols process
-        the bytes next to the device) and the resulting packet buffer is tunneled;
-        otherwise raw bytes pass through unchanged."""
-        while not self.shutdown:
-            if self.protocols:
-                packet = await loop.run_in_executor(None, interface.read)
-                if packet is None:  # interface/protocol requested disconnect
-                    break
-                data = packet.buffer
-            else:
-                data, _extra = await loop.run_in_executor(None, interface.read_interface)
-                if data is None:  # interface requested disconnect
-                    break
-            await send.write_all(bytes(data))
+        the bytes next to the device) and each resulting packet is framed by
+        BridgeFrameProtocol; otherwise raw bytes pass through unchanged. Data
+        ready within BATCH_DELAY (up to BATCH_BYTES) is sent in one write."""
+        read_queue = asyncio.Queue()
+        # Bounds the queue so a slow tunnel pushes back on the device reads
+        slots = threading.Semaphore(READ_QUEUE_SIZE)
+        stop = threading.Event()
+        reader = threading.Thread(
+            target=self._device_reader, args=(loop, interface, read_queue, slots, stop), daemon=True
+        )
+        reader.start()
+        try:
+            await self._send_batches(loop, read_queue, slots, send)
+        finally:
+            stop.set()
         with contextlib.suppress(Exception):
             await send.finish()
 
+    async def _send_batches(self, loop, read_queue, slots, send):
+        """Write the queued reads to the tunnel in batches until the reader ends."""
+        done = False
+        while not done and not self.shutdown:
+            data = await read_queue.get()
+            if data is None:
+                break
+            slots.release()
+            batch = [data]
+            size = len(data)
+            deadline = loop.time() + BATCH_DELAY
+            while size < BATCH_BYTES:
+                try:
+                    data = read_queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        data = await asyncio.wait_for(read_queue.get(), remaining)
+                    except asyncio.TimeoutError:
+                        break
+                if data is None:
+                    done = True
+                    break
+                slots.release()
+                batch.append(data)
+                size += len(data)
+            await send.write_all(b"".join(batch))
+
     async def _bridge_to_device(self, loop, interface, recv):
         """Read bytes from COSMOS and write them to the device. With
-        BRIDGE_PROTOCOLs the bytes are wrapped in a packet and sent through the
-        interface's protocol-aware write() so write protocols run here; otherwise
-        they are written raw."""
+        BRIDGE_PROTOCOLs the bytes are BridgeFrameProtocol frames and each is
+        wrapped in a packet and sent through the interface's protocol-aware
+        write() so write protocols run here; otherwise they are written raw."""
+        buffer = b""
         while not self.shutdown:
             data = await recv.read(PUMP_CHUNK_BYTES)
             if not data:  # stream closed
                 break
             if self.protocols:
-                packet = Packet(None, None, "BIG_ENDIAN", None, bytes(data))
-                await loop.run_in_executor(None, interface.write, packet)
+                packets, buffer = BridgeFrameProtocol.unframe(buffer + bytes(data))
+                if packets:
+                    await loop.run_in_executor(None, self._write_packets, interface, packets)
             else:
                 await loop.run_in_executor(None, interface.write_interface, bytes(data))
 
+    def _write_packets(self, interface, packets):
+        for data in packets:
+            interface.write(Packet(None, None, "BIG_ENDIAN", None, data))
+
 
 if __name__ == "__main__":
     HostInterfaceMicroservice().run()
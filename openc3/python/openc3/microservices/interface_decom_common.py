@@ -79,7 +79,7 @@ def handle_build_cmd(build_cmd_json, msg_id, scope):
             "target_name": command.target_name,
             "packet_name": command.packet_name,
             "received_count": command.received_count,
-            "buffer": json.dumps(command.buffer_no_copy(), cls=JsonEncoder),
+            "buffer": json.dumps(command.buffer_view(), cls=JsonEncoder),
         }
     # If there is an error due to parameter out of range, etc, we rescue it so we can
     # write the ACKCMD}TARGET topic and allow the TelemetryDecomTopic.build_cmd to return
@@ -106,7 +106,7 @@ def handle_get_tlm_buffer(get_tlm_buffer_json, msg_id, scope):
             "packet_name": packet.packet_name,
             "received_count": packet.received_count,
             "stored": str(packet.stored).lower(),  # Match ruby behavior of "true"/"false"
-            "buffer": json.dumps(packet.buffer_no_copy(), cls=JsonEncoder),
+            "buffer": json.dumps(packet.buffer_view(), cls=JsonEncoder),
         }
         if packet.extra:
             msg_hash["extra"] = json.dumps(packet.extra)
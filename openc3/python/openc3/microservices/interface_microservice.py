@@ -15,6 +15,7 @@
 import contextlib
 import json
 import os
+import queue
 import sys
 import threading
 import time
@@ -42,6 +43,7 @@ from openc3.topics.router_topic import RouterTopic
 from openc3.topics.telemetry_topic import TelemetryTopic
 from openc3.utilities.json import JsonDecoder, JsonEncoder
 from openc3.utilities.logger import Logger
+from openc3.utilities.pipeline_trace import PipelineTrace
 from openc3.utilities.sleeper import Sleeper
 from openc3.utilities.store_queued import EphemeralStoreQueued, StoreQueued
 from openc3.utilities.thread_manager import ThreadManager
@@ -53,6 +55,87 @@ with contextlib.suppress(ModuleNotFoundError):
     from openc3enterprise.models.critical_cmd_model import CriticalCmdModel
 
 
+class InterfaceCmdPublishThread:
+    """Does the work for a command after it is written to the interface so it stays
+    off the ack path. Commands are counted, logged and written to the COMMAND and
+    DECOMCMD topics in the order they were sent. The counts for all the commands
+    waiting in the queue are incremented in Redis together."""
+
+    # Maximum number of commands waiting to be published before the handler blocks
+    QUEUE_SIZE = 1000
+
+    def __init__(self, handler, logger, scope):
+        self.handler = handler
+        self.logger = logger
+        self.scope = scope
+        self.queue = queue.Queue(maxsize=self.QUEUE_SIZE)
+        self.thread = None
+
+    def start(self):
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+        ThreadManager.instance().register(self.thread, stop_object=self)
+        return self.thread
+
+    def stop(self):
+        if self.thread:
+            kill_thread(self, self.thread)
+            self.thread = None
+
+    def graceful_kill(self):
+        self.queue.put(None)
+
+    def put(self, command, log_message):
+        if self.thread:
+            self.queue.put((command, log_message))
+        else:
+            self.publish([(command, log_message)])
+
+    def run(self):
+        while True:
+            entries = [self.queue.get()]
+            # Publish everything which is already waiting together
+            while True:
+                try:
+                    entries.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            done = entries[-1] is None
+            if done:
+                entries.pop()
+            try:
+                if entries:
+                    self.publish(entries)
+            except Exception:
+                self.logger.error(f"{self.handler.interface.name}: publish: {traceback.format_exc()}")
+            finally:
+                for _ in range(len(entries) + int(done)):
+                    self.queue.task_done()
+            if done:
+                break
+
+    def publish(self, entries):
+        counts = {}
+        for command, _ in entries:
+            key = (command.target_name, command.packet_name)
+            counts[key] = counts.get(key, 0) + 1
+        received_counts = {}
+        for (target_name, packet_name), count in counts.items():
+            total = TargetModel.increment_command_count(target_name, packet_name, count, scope=self.scope)
+            System.commands.packet(target_name, packet_name).received_count = total
+            received_counts[(target_name, packet_name)] = total - count
+
+        for command, log_message in entries:
+            key = (command.target_name, command.packet_name)
+            received_counts[key] += 1
+            command.received_count = received_counts[key]
+            if log_message:
+                self.logger.info(command.extra["cmd_string"], user=command.extra["username"], scope=self.scope)
+            CommandDecomTopic.write_packet(command, scope=self.scope)
+            CommandTopic.write_packet(command, scope=self.scope)
+        InterfaceStatusModel.set(self.handler.interface.as_json(), queued=True, scope=self.scope)
+
+
 class InterfaceCmdHandlerThread:
     def __init__(self, interface, tlm, logger=None, metric=None, db_shard=0, scope=None):
         self.interface = interface
@@ -77,8 +160,14 @@ class InterfaceCmdHandlerThread:
                 type="counter",
             )
             self.metric.set(name="interface_cmd_total", value=self.count, type="counter")
+        # Received count of each command packet sent by this thread. It is advanced
+        # as each command is written while the global count is only incremented
+        # when the command is published (see #next_received_count)
+        self.received_counts = {}
+        self.publish_thread = InterfaceCmdPublishThread(self, self.logger, scope)
 
     def start(self):
+        self.publish_thread.start()
         self.thread = threading.Thread(target=self.run, daemon=True)
         self.thread.start()
         ThreadManager.instance().register(self.thread, stop_object=self)
@@ -92,8 +181,22 @@ class InterfaceCmdHandlerThread:
         time.sleep(0.001)  # Allow other threads to run
 
     def run(self):
-        # receive_commands does a while True and does not return
-        InterfaceTopic.receive_commands(self.process_cmd, self.interface, self.scope, db_shard=self.db_shard)
+        try:
+            # receive_commands does a while True and only returns on shutdown
+            InterfaceTopic.receive_commands(self.process_cmd, self.interface, self.scope, db_shard=self.db_shard)
+        finally:
+            # Publish any commands which are still queued
+            self.publish_thread.stop()
+
+    def next_received_count(self, target_name, packet_name):
+        """Advance the local received count of a command packet. The System packet holds
+        the global count from the last publish, which also counts the commands sent by
+        other interfaces, so the local count never falls behind it."""
+        key = (target_name, packet_name)
+        orig_command = System.commands.packet(target_name, packet_name)
+        count = max(self.received_counts.get(key, 0), orig_command.received_count) + 1
+        self.received_counts[key] = count
+        return count
 
     def process_cmd(self, topic, msg_id, msg_hash, _redis):
         # OpenC3.with_context(msg_hash) do
@@ -302,11 +405,9 @@ class InterfaceCmdHandlerThread:
                 if not self.interface.cmd_target_enabled.get(command.target_name, False):
                     return None  # Don't ack disabled targets
 
-                orig_command = System.commands.packet(command.target_name, command.packet_name)
-                orig_command.received_count = TargetModel.increment_command_count(
-                    command.target_name, command.packet_name, 1, scope=self.scope
-                )
-                command.received_count = orig_command.received_count
+                # The InterfaceCmdPublishThread increments the global count and
+                # sets the final received_count before the command is published
+                command.received_count = self.next_received_count(command.target_name, command.packet_name)
                 command.received_time = datetime.now(timezone.utc)
             except ValueError as e:
                 # Command parameter out of range is a user error, not a bug,
@@ -380,14 +481,6 @@ class InterfaceCmdHandlerThread:
                     if self.metric is not None:
                         self.metric.set(name="interface_cmd_total", value=self.count, type="counter")
 
-                    log_message = ConfigParser.handle_true_false(msg_hash.get(b"log_message", b"TRUE").decode())
-                    if log_message:
-                        self.logger.info(
-                            msg_hash.get(b"cmd_string", b"").decode(),
-                            user=msg_hash.get(b"username", b"").decode(),
-                            scope=self.scope,
-                        )
-
                     self.interface.write(command)
 
                     command.obfuscate()
@@ -402,9 +495,9 @@ class InterfaceCmdHandlerThread:
                         if reason:
                             command.extra["cmd_reason"] = reason
 
-                    CommandDecomTopic.write_packet(command, scope=self.scope)
-                    CommandTopic.write_packet(command, scope=self.scope)
-                    InterfaceStatusModel.set(self.interface.as_json(), queued=True, scope=self.scope)
+                    # Logging, counts, topics and status happen after the ack
+                    log_message = ConfigParser.handle_true_false(msg_hash.get(b"log_message", b"TRUE").decode())
+                    self.publish_thread.put(command, log_message)
 
                     if not result:
                         message = f"post_check returned false for {command.extra['cmd_string']} due to {reason}"
@@ -611,6 +704,8 @@ class RouterTlmHandlerThread:
 class InterfaceMicroservice(Microservice):
     UNKNOWN_BYTES_TO_PRINT = 16
     DISCONNECT_WAIT_TIME = 1
+    # Default number of seconds between interface/router status and metric snapshots
+    STATUS_UPDATE_PERIOD = 1.0
 
     def __init__(self, name):
         self.mutex = threading.Lock()
@@ -621,6 +716,10 @@ class InterfaceMicroservice(Microservice):
         self.connection_failed_messages = []
         self.connection_lost_messages = []
         self.handler_thread = None
+        self.status_thread = None
+        self.status_sleeper = None
+        self.last_status = None
+        self.last_status_count = None
 
         super().__init__(name)
         self.interface_or_router = self.__class__.__name__.split("Microservice")[0].upper()
@@ -660,6 +759,11 @@ class InterfaceMicroservice(Microservice):
                 StoreQueued.instance().set_update_interval(update_interval)
             if option_name.upper() == "SYNC_PACKET_COUNT_DELAY_SECONDS":
                 TargetModel.sync_packet_count_delay_seconds = float(option_values[0])
+        self.status_update_period = float(
+            self.interface.options.get("STATUS_UPDATE_PERIOD", [InterfaceMicroservice.STATUS_UPDATE_PERIOD])[0]
+        )
+        # Stamp received telemetry with the time it spends in each stage of the pipeline
+        self.trace_pipeline = PipelineTrace.ENABLED and self.interface_or_router == "INTERFACE"
 
         if self.interface_or_router == "INTERFACE":
             self.handler_thread = InterfaceCmdHandlerThread(
@@ -681,6 +785,12 @@ class InterfaceMicroservice(Microservice):
             )
         self.handler_thread.start()
 
+        # Status and packet count metrics are published periodically rather than per packet
+        self.status_sleeper = Sleeper()
+        self.status_thread = threading.Thread(target=self._interface_status_thread, daemon=True)
+        self.status_thread.start()
+        ThreadManager.instance().register(self.status_thread)
+
     # Called to connect the interface/router. It takes optional parameters to
     # rebuilt the interface/router. Once we set the state to 'ATTEMPTING' the
     # run method handles the actual connection.
@@ -755,20 +865,12 @@ class InterfaceMicroservice(Microservice):
                             try:
                                 packet = self.interface.read()
                                 if packet is not None:
-                                    self.handle_packet(packet)
-                                    self.count += 1
-                                    if self.interface_or_router == "INTERFACE":
-                                        self.metric.set(
-                                            name="interface_tlm_total",
-                                            value=self.count,
-                                            type="counter",
-                                        )
+                                    if self.trace_pipeline:
+                                        self.handle_packet(packet, trace=self.start_trace())
                                     else:
-                                        self.metric.set(
-                                            name="router_cmd_total",
-                                            value=self.count,
-                                            type="counter",
-                                        )
+                                        self.handle_packet(packet)
+                                    # Published by the status thread
+                                    self.count += 1
                                 else:
                                     self.logger.info(
                                         f"{self.interface.name}: Internal disconnect requested (returned None)"
@@ -797,10 +899,49 @@ class InterfaceMicroservice(Microservice):
                 RouterStatusModel.set(self.interface.as_json(), queued=True, scope=self.scope)
         self.logger.info(f"{self.interface.name}: Stopped packet reading")
 
-    def handle_packet(self, packet):
+    # Publish the interface/router status and the packet count metric if they
+    # changed since the last snapshot. Called periodically by the status thread
+    # so the per packet path only has to increment counters.
+    def publish_status(self):
+        if self.count != self.last_status_count:
+            self.last_status_count = self.count
+            if self.interface_or_router == "INTERFACE":
+                self.metric.set(name="interface_tlm_total", value=self.count, type="counter")
+            else:
+                self.metric.set(name="router_cmd_total", value=self.count, type="counter")
+
         # Skip status update if stop() has been called to avoid re-creating the status model
-        if not self.cancel_thread:
-            InterfaceStatusModel.set(self.interface.as_json(), queued=True, scope=self.scope)
+        if self.cancel_thread:
+            return
+        status = self.interface.as_json()
+        if status == self.last_status:
+            return
+        self.last_status = status
+        if self.interface_or_router == "INTERFACE":
+            InterfaceStatusModel.set(status, queued=True, scope=self.scope)
+        else:
+            RouterStatusModel.set(status, queued=True, scope=self.scope)
+
+    def _interface_status_thread(self):
+        while not self.cancel_thread:
+            try:
+                self.publish_status()
+            except Exception:
+                # If cancelled during exception handling exit silently
+                if self.cancel_thread:
+                    break
+                self.logger.error(f"{self.interface.name}: Status update failed: {traceback.format_exc()}")
+            if self.status_sleeper.sleep(self.status_update_period):
+                break
+
+    # Start a PipelineTrace for a packet the interface just returned
+    def start_trace(self):
+        trace = {}
+        if self.interface.read_data_time_ns is not None:
+            trace["received"] = self.interface.read_data_time_ns
+        return PipelineTrace.stamp(trace, "protocol")
+
+    def handle_packet(self, packet, trace=None):
         if packet.received_time is None:
             packet.received_time = datetime.now(timezone.utc)
 
@@ -812,7 +953,9 @@ class InterfaceMicroservice(Microservice):
             if packet.identified():
                 try:
                     # Preidentifed packet - place it into the current value table
-                    identified_packet = System.telemetry.update(packet.target_name, packet.packet_name, packet.buffer)
+                    identified_packet = System.telemetry.update(
+                        packet.target_name, packet.packet_name, packet.buffer_view()
+                    )
                 except Exception:
                     # Packet identified but we don't know about it
                     # Clear packet_name and target_name and try to identify
@@ -822,12 +965,12 @@ class InterfaceMicroservice(Microservice):
                     packet.target_name = None
                     packet.packet_name = None
                     identified_packet = System.telemetry.identify_and_set_buffer(
-                        packet.buffer, self.interface.tlm_target_names
+                        packet.buffer_view(), self.interface.tlm_target_names
                     )
             else:
                 # Packet needs to be identified
                 identified_packet = System.telemetry.identify_and_set_buffer(
-                    packet.buffer, self.interface.tlm_target_names
+                    packet.buffer_view(), self.interface.tlm_target_names
                 )
 
         if identified_packet:
@@ -836,7 +979,7 @@ class InterfaceMicroservice(Microservice):
             identified_packet.extra = packet.extra
             packet = identified_packet
         else:
-            unknown_packet = System.telemetry.update("UNKNOWN", "UNKNOWN", packet.buffer)
+            unknown_packet = System.telemetry.update("UNKNOWN", "UNKNOWN", packet.buffer_view())
             unknown_packet.received_time = packet.received_time
             unknown_packet.stored = packet.stored
             unknown_packet.extra = packet.extra
@@ -849,17 +992,19 @@ class InterfaceMicroservice(Microservice):
                 queued=self.queued,
                 scope=self.scope,
             )
-            num_bytes_to_print = min(InterfaceMicroservice.UNKNOWN_BYTES_TO_PRINT, len(packet.buffer))
-            data = packet.buffer_no_copy()[0:(num_bytes_to_print)]
+            num_bytes_to_print = min(InterfaceMicroservice.UNKNOWN_BYTES_TO_PRINT, len(packet.buffer_view()))
+            data = packet.buffer_view()[0:(num_bytes_to_print)]
             prefix = "".join([format(x, "02x") for x in data])
             self.logger.warn(
-                f"{self.interface.name} {packet.target_name} packet length: {len(packet.buffer)} starting with: {prefix}"
+                f"{self.interface.name} {packet.target_name} packet length: {len(packet.buffer_view())} starting with: {prefix}",
+                # Rate limit unknown packets together as each message is different
+                key=f"{self.interface.name} unknown telemetry",
             )
 
         # Write to stream
         if self.interface.tlm_target_enabled.get(packet.target_name, False):
             TargetModel.sync_tlm_packet_counts(packet, self.interface.tlm_target_names, scope=self.scope)
-            TelemetryTopic.write_packet(packet, queued=self.queued, scope=self.scope)
+            TelemetryTopic.write_packet(packet, queued=self.queued, scope=self.scope, trace=trace)
 
     def handle_connection_failed(self, connection, connect_error):
         self.error = connect_error
@@ -964,6 +1109,8 @@ class InterfaceMicroservice(Microservice):
                 self.handler_thread.stop()
             if self.interface_thread_sleeper:
                 self.interface_thread_sleeper.cancel()
+            if self.status_sleeper:
+                self.status_sleeper.cancel()
             if self.interface:
                 self.interface.disconnect()
                 if self.interface_or_router == "INTERFACE":
@@ -113,6 +113,7 @@ class Microservice:
         Logger.scope = self.scope
         Logger.microservice_name = self.name
         self.logger = Logger()
+        Logger.start_writer()
         self.logger.scope = self.scope
         self.logger.microservice_name = self.name
         self.secrets = Secrets.get_client()
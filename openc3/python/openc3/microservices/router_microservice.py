@@ -14,7 +14,6 @@ import sys
 import traceback
 
 from openc3.microservices.interface_microservice import InterfaceMicroservice
-from openc3.models.router_status_model import RouterStatusModel
 from openc3.system.system import System
 from openc3.topics.router_topic import RouterTopic
 from openc3.utilities.thread_manager import ThreadManager
@@ -22,10 +21,9 @@ from openc3.utilities.thread_manager import ThreadManager
 
 class RouterMicroservice(InterfaceMicroservice):
     def handle_packet(self, packet):
-        RouterStatusModel.set(self.interface.as_json(), scope=self.scope)
         if not packet.identified():
             # Need to identify so we can find the target
-            identified_packet = System.commands.identify(packet.buffer_no_copy(), self.interface.cmd_target_names)
+            identified_packet = System.commands.identify(packet.buffer_view(), self.interface.cmd_target_names)
             if identified_packet:
                 packet = identified_packet
 
@@ -34,7 +32,7 @@ class RouterMicroservice(InterfaceMicroservice):
                 defined_packet = System.commands.packet(packet.target_name, packet.packet_name)
                 defined_packet.received_time = packet.received_time
                 defined_packet.stored = packet.stored
-                defined_packet.buffer = packet.buffer
+                defined_packet.buffer = packet.buffer_view()
                 packet = defined_packet
             except Exception:
                 self.logger.warn(f"Error defining packet of {len(packet)} bytes")
@@ -65,7 +63,7 @@ class RouterMicroservice(InterfaceMicroservice):
                             self.logger.info(System.commands.format(packet, target.ignored_parameters))
                         else:
                             self.logger.warn(
-                                f"Unidentified packet of {len(packet.buffer_no_copy())} bytes being routed to target {self.interface.cmd_target_names[0]}"
+                                f"Unidentified packet of {len(packet.buffer_view())} bytes being routed to target {self.interface.cmd_target_names[0]}"
                             )
                 except Exception:
                     self.logger.error(f"Problem formatting command from router=\n{traceback.format_exc()}")
@@ -23,6 +23,8 @@ from openc3.api.tlm_api import get_tlm
 from openc3.microservices.microservice import Microservice
 from openc3.topics.config_topic import ConfigTopic
 from openc3.topics.topic import Topic
+from openc3.utilities.metric import Metric
+from openc3.utilities.pipeline_trace import PipelineTrace
 from openc3.utilities.questdb_client import QuestDBClient
 from openc3.utilities.store import EphemeralStore
 from openc3.utilities.thread_manager import ThreadManager
@@ -31,6 +33,7 @@ from openc3.utilities.thread_manager import ThreadManager
 class TsdbMicroservice(Microservice):
     TRIM_KEEP_MS = 60000  # 1 minute
     DEFAULT_FLUSH_PERIOD_S = 5.0  # 5 seconds
+    MAX_PENDING_TRACES = 10000
 
     # QuestDB returns "table does not exist" when QDB_LINE_AUTO_CREATE_NEW_TABLES=false
     # and an ILP write targets a table we haven't created (e.g. after a DROP from the admin UI).
@@ -84,6 +87,16 @@ class TsdbMicroservice(Microservice):
         self.error_count = 0
         self.metric.set(name="tsdb_ingest_total", value=self.ingest_count, type="counter")
         self.metric.set(name="tsdb_ingest_error_total", value=self.error_count, type="counter")
+        self.ingest_duration = self.metric.histogram(
+            "tsdb_ingest_duration_seconds", buckets=Metric.exponential_buckets(0.0001, 2, 16), unit="seconds"
+        )
+        self.flush_duration = self.metric.histogram(
+            "tsdb_flush_duration_seconds", buckets=Metric.exponential_buckets(0.0001, 2, 16), unit="seconds"
+        )
+
+        # Traces of the rows written since the last flush
+        self.pipeline_trace = PipelineTrace(self.metric)
+        self.pending_traces = []
 
     def _create_table(self, target_name, packet_name, topic):
         """Create a table for a target/packet combination."""
@@ -172,9 +185,12 @@ class TsdbMicroservice(Microservice):
                 self.questdb.write_row(table_name, values, timestamp_ns, rx_timestamp_ns)
                 self.ingest_count += 1
 
+                trace = PipelineTrace.loads(msg_hash)
+                if trace is not None and len(self.pending_traces) < self.MAX_PENDING_TRACES:
+                    self.pending_traces.append((target_name, trace))
+
             if start is not None:
-                diff = time.time() - start  # seconds as a float
-                self.metric.set(name="tsdb_ingest_duration_seconds", value=diff, type="gauge", unit="seconds")
+                self.ingest_duration.observe(time.time() - start)
             self.metric.set(name="tsdb_ingest_total", value=self.ingest_count, type="counter")
 
         except IngressError as error:
@@ -264,8 +280,18 @@ class TsdbMicroservice(Microservice):
                 # Server-side ILP errors (cast mismatch, missing table) surface at flush,
                 # so route them through the same recovery paths as read_topics
                 self._handle_ingress_error(error)
-            diff = time.time() - now  # seconds as a float
-            self.metric.set(name="tsdb_flush_duration_seconds", value=diff, type="gauge", unit="seconds")
+            self.flush_duration.observe(time.time() - now)
+            self.record_traces()
+
+    def record_traces(self):
+        """Record the pipeline latency of the traced rows written by the last flush"""
+        if not self.pending_traces:
+            return
+        flush_time_ns = time.time_ns()
+        for target_name, trace in self.pending_traces:
+            trace["tsdb_flush"] = flush_time_ns
+            self.pipeline_trace.record(target_name, trace, PipelineTrace.TSDB_STAGES)
+        self.pending_traces = []
 
     def run(self):
         """Main run loop"""
@@ -198,6 +198,11 @@ class InterfaceModel(Model):
             secret_name = option[1]
             secret_value = interface_or_router.secrets.get(secret_name, scope=self.scope)
             interface_or_router.set_option(option[0], [secret_value])
+        if self.bridge_name and self.bridge_protocols:
+            # The host runs the BRIDGE_PROTOCOLs and frames each packet they produce
+            from openc3.interfaces.protocols.bridge_frame_protocol import BridgeFrameProtocol
+
+            interface_or_router.add_protocol(BridgeFrameProtocol, [], "READ_WRITE")
         for protocol in self.protocols:
             klass = get_class_from_module(
                 filename_to_module(protocol[1]),
@@ -206,7 +206,7 @@ class Commands:
         command.stored = False
         command.extra = None
         command.given_values = params
-        command.restore_defaults(command.buffer_no_copy(), list(params.keys()))
+        command.restore_defaults(command.buffer_view(), list(params.keys()))
         command.raw = raw
 
         given_item_names = self._set_parameters(command, params, range_checking)
@@ -280,6 +280,10 @@ class Commands:
     def dynamic_add_packet(self, packet, affect_ids=False):
         self.config.dynamic_add_packet(packet, "COMMAND", affect_ids=affect_ids)
 
+    # Sets single_owner on every command packet (see Telemetry#set_single_owner)
+    def set_single_owner(self, single_owner):
+        self.config.set_packet_attribute("COMMAND", "single_owner", single_owner)
+
     def cmd_unique_id_mode(self, target_name):
         return self.config.cmd_unique_id_mode.get(target_name.upper())
 
@@ -21,6 +21,8 @@ import json
 from datetime import datetime, timezone
 from typing import Any
 
+import cbor2
+
 
 class JsonPacket:
     """
@@ -330,3 +332,91 @@ class JsonPacket:
     def received_time_nsec(self) -> int:
         """Return received time as nanoseconds since epoch."""
         return self._received_time_nsec
+
+
+class LazyJsonPacket(JsonPacket):
+    """
+    JsonPacket which decodes its payload the first time an item is read.
+
+    The names and timestamps are available without decoding so callers which only
+    need times never pay for the decode. If names is given only those items (with
+    all of their value type, limits state and reduced type suffixes) are kept.
+    """
+
+    def __init__(
+        self,
+        cmd_or_tlm: str,
+        target_name: str,
+        packet_name: str,
+        time_nsec_since_epoch: int,
+        stored: bool,
+        data: bytes,
+        is_cbor: bool,
+        key_map: dict | None = None,
+        received_time_nsec_since_epoch: int | None = None,
+        extra: dict | None = None,
+        names: set | None = None,
+    ):
+        """
+        Initialize a LazyJsonPacket.
+
+        Args:
+            data: The encoded packet data
+            is_cbor: Whether data is CBOR (else JSON) encoded
+            key_map: Optional key mapping for CBOR compressed keys. When names is
+                given this only needs to contain the mapped keys of those names
+                (see project_key_map).
+            names: Optional set of item names to keep
+            See JsonPacket for the other arguments
+        """
+        super().__init__(
+            cmd_or_tlm,
+            target_name,
+            packet_name,
+            time_nsec_since_epoch,
+            stored,
+            None,
+            received_time_nsec_since_epoch=received_time_nsec_since_epoch,
+            extra=extra,
+        )
+        self._data = data
+        self._is_cbor = is_cbor
+        self._key_map = key_map
+        self._names = names
+
+    @property
+    def json_hash(self) -> dict:
+        if self._json_hash is None:
+            self._json_hash = self._decode()
+            self._data = None
+        return self._json_hash
+
+    @json_hash.setter
+    def json_hash(self, value):
+        self._json_hash = value
+
+    @property
+    def decoded(self) -> bool:
+        """Whether the payload has been decoded"""
+        return self._json_hash is not None
+
+    @staticmethod
+    def project_key_map(key_map: dict, names: set) -> dict:
+        """Return the subset of a key map whose keys belong to the given item names"""
+        return {key: name for key, name in key_map.items() if name.split("__", 1)[0] in names}
+
+    def _decode(self) -> dict:
+        if self._is_cbor:
+            data = cbor2.loads(self._data)
+        else:
+            data = json.loads(self._data)
+        if not isinstance(data, dict):
+            return data
+        if self._key_map is not None:
+            if self._names is not None:
+                # The key map is projected so only the requested keys are expanded
+                return {name: data[key] for key, name in self._key_map.items() if key in data}
+            return {self._key_map.get(key, key): value for key, value in data.items()}
+        if self._names is not None:
+            return {key: value for key, value in data.items() if key.split("__", 1)[0] in self._names}
+        return data
@@ -159,7 +159,7 @@ class Packet(Structure):
     def packet_time(self):
         item = self.items.get("PACKET_TIME")
         if item is not None:
-            return self.read_item(item, "CONVERTED", self.buffer)
+            return self.read_item(item, "CONVERTED", self.buffer_view())
         else:
             if self.__packet_time is not None:
                 return self.__packet_time
@@ -281,9 +281,16 @@ class Packet(Structure):
 
     @buffer.setter
     def buffer(self, buffer):
+        self.assign_buffer(buffer, True)
+
+    # Set the buffer without copying it (see Structure#adopt_buffer)
+    def adopt_buffer(self, buffer):
+        self.assign_buffer(buffer, False)
+
+    def assign_buffer(self, buffer, copy):
         with self.synchronize():
             try:
-                self.internal_buffer_equals(buffer)
+                self.internal_buffer_equals(buffer, copy)
             # Catch and re-raise the TypeError thrown by internal_buffer_equals
             except TypeError as error:
                 raise error
@@ -571,7 +578,8 @@ class Packet(Structure):
             case "CONVERTED" | "FORMATTED" | "WITH_UNITS":
                 if item.read_conversion:
                     using_cached_value = False
-                    check_cache = buffer == self.buffer
+                    # Only the packet's own buffer is cached. Other buffers could hold anything.
+                    check_cache = buffer is self._buffer
                     if check_cache:
                         with self.synchronize_allow_reads():
                             if self.read_conversion_cache.get(item.name):
@@ -585,8 +593,7 @@ class Packet(Structure):
 
                     if not using_cached_value:
                         if item.array_size is not None:
-                            for index, val in enumerate(value):
-                                value[index] = item.read_conversion.call(val, self, buffer)
+                            value = item.read_conversion.call_array(value, self, buffer)
                         else:
                             value = item.read_conversion.call(value, self, buffer)
 
@@ -607,12 +614,14 @@ class Packet(Structure):
                 # Convert from value to state if possible:
                 if item.states:
                     if isinstance(value, list):
+                        states_by_value = item.states_by_value()
+                        any_state = states_by_value.get(Packet.ANY_STATE)
                         for index, val in enumerate(value):
-                            key = item.states_by_value().get(value[index])
+                            key = states_by_value.get(val)
                             if key is not None:
                                 value[index] = key
-                            elif Packet.ANY_STATE in item.states_by_value():
-                                value[index] = item.states_by_value()[Packet.ANY_STATE]
+                            elif any_state is not None:
+                                value[index] = any_state
                             else:
                                 value[index] = self.apply_format_string_and_units(item, val, value_type)
                     else:
@@ -623,7 +632,8 @@ class Packet(Structure):
                             value = item.states_by_value()[Packet.ANY_STATE]
                         else:
                             value = self.apply_format_string_and_units(item, value, value_type)
-                else:
+                elif value_type != "CONVERTED":
+                    # CONVERTED values are not formatted
                     if isinstance(value, list):
                         for index, val in enumerate(value):
                             value[index] = self.apply_format_string_and_units(item, val, value_type)
@@ -1203,12 +1213,13 @@ class Packet(Structure):
         json_hash = self.read_items(self.sorted_items)
 
         # Now read all other value types - no accessor required
+        buffer = self.buffer_view()
         for item in self.sorted_items:
             given_raw = json_hash[item.name]
             if item.states or (item.read_conversion and item.data_type != "DERIVED"):
-                json_hash[f"{item.name}__C"] = self.read_item(item, "CONVERTED", self.buffer, given_raw)
+                json_hash[f"{item.name}__C"] = self.read_item(item, "CONVERTED", buffer, given_raw)
             if item.format_string or item.units:
-                json_hash[f"{item.name}__F"] = self.read_item(item, "FORMATTED", self.buffer, given_raw)
+                json_hash[f"{item.name}__F"] = self.read_item(item, "FORMATTED", buffer, given_raw)
             if include_limits_states:
                 limits_state = item.limits.state
                 if limits_state:
@@ -1338,7 +1349,7 @@ class Packet(Structure):
         return item
 
     def obfuscate(self):
-        if not self.buffer:
+        if not self.buffer_view():
             return
         if not self.obfuscated_items or len(self.obfuscated_items) == 0:
             return
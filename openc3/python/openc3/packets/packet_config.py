@@ -13,6 +13,7 @@
 # See https://github.com/OpenC3/cosmos/pull/1953
 
 import base64
+import functools
 import os
 import tempfile
 import traceback
@@ -24,6 +25,7 @@ from openc3.conversions.segmented_polynomial_conversion import (
     SegmentedPolynomialConversion,
 )
 from openc3.packets.packet import Packet
+from openc3.packets.packet_definitions import SharedMapping
 from openc3.packets.parsers.format_string_parser import FormatStringParser
 from openc3.packets.parsers.limits_parser import LimitsParser
 from openc3.packets.parsers.limits_response_parser import LimitsResponseParser
@@ -83,6 +85,8 @@ class PacketConfig:
         self.tlm_subpacket_id_signature = {}
         self.tlm_unique_id_mode = {}
         self.tlm_subpacket_unique_id_mode = {}
+        # Attributes set on every packet with set_packet_attribute
+        self.packet_attributes = {"COMMAND": {}, "TELEMETRY": {}}
 
         # Create unknown packets
         self.commands["UNKNOWN"] = {}
@@ -588,6 +592,86 @@ class PacketConfig:
             pc.process_file(tf.name, process_target_name)
         return pc
 
+    @classmethod
+    def from_definitions(cls, definitions):
+        """Create a PacketConfig from shared PacketDefinitions instead of
+        processing the cmd_tlm files. Packets are only unpickled from the shared
+        pages when they are first used, so each process only holds the packets
+        (and their buffers and limits state) it actually uses.
+
+        Args:
+            definitions: PacketDefinitions to load the packets from
+        """
+        pc = cls()
+        tables = definitions.config()
+        for name, value in tables["attributes"].items():
+            setattr(pc, name, value)
+        for cmd_or_tlm, attribute in (("CMD", "commands"), ("TLM", "telemetry")):
+            all_packets = {}
+            for target_name in definitions.target_names(cmd_or_tlm):
+                packet_names = definitions.packet_names(cmd_or_tlm, target_name)
+                all_packets[target_name] = SharedMapping(
+                    {packet_name: packet_name for packet_name in packet_names},
+                    functools.partial(pc._load_shared_packet, definitions, cmd_or_tlm, target_name),
+                )
+            setattr(pc, attribute, all_packets)
+        # The lookup tables hold packet names which load the same packet objects
+        for name, id_value_hash in tables["id_value_hashes"].items():
+            all_packets = pc.commands if name.startswith("cmd") else pc.telemetry
+            setattr(
+                pc,
+                name,
+                {
+                    target_name: SharedMapping(id_values, all_packets[target_name].__getitem__)
+                    for target_name, id_values in id_value_hash.items()
+                },
+            )
+        pc.latest_data = {
+            target_name: SharedMapping(
+                target_latest_data,
+                functools.partial(pc._load_latest_packets, pc.telemetry[target_name]),
+            )
+            for target_name, target_latest_data in tables["latest_data"].items()
+        }
+        return pc
+
+    def _load_shared_packet(self, definitions, cmd_or_tlm, target_name, packet_name):
+        packet = definitions.packet(cmd_or_tlm, target_name, packet_name)
+        for name, value in self.packet_attributes["COMMAND" if cmd_or_tlm == "CMD" else "TELEMETRY"].items():
+            setattr(packet, name, value)
+        return packet
+
+    @staticmethod
+    def _load_latest_packets(target_packets, packet_names):
+        return [target_packets[packet_name] for packet_name in packet_names]
+
+    def loaded_packets(self, cmd_or_tlm="TELEMETRY"):
+        """Every command or telemetry packet which has been loaded. This is every
+        packet unless the PacketConfig was created from_definitions.
+
+        Args:
+            cmd_or_tlm: COMMAND or TELEMETRY
+        """
+        all_packets = self.commands if cmd_or_tlm == "COMMAND" else self.telemetry
+        for packets in list(all_packets.values()):
+            if isinstance(packets, SharedMapping):
+                yield from packets.loaded_values()
+            else:
+                yield from list(packets.values())
+
+    def set_packet_attribute(self, cmd_or_tlm, name, value):
+        """Set an attribute on every command or telemetry packet including
+        packets which are loaded from shared definitions later
+
+        Args:
+            cmd_or_tlm: COMMAND or TELEMETRY
+            name: Name of the Packet attribute
+            value: Value to set
+        """
+        self.packet_attributes[cmd_or_tlm][name] = value
+        for packet in self.loaded_packets(cmd_or_tlm):
+            setattr(packet, name, value)
+
     def reset_processing_variables(self):
         self.current_cmd_or_tlm = None
         self.current_packet = None
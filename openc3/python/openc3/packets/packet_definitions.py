@@ -0,0 +1,498 @@
+# Copyright 2026 OpenC3, Inc.
+# All Rights Reserved.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See LICENSE.md for more details.
+#
+# This file may also be used under the terms of a commercial license
+# if purchased from OpenC3, Inc.
+
+import contextlib
+import glob
+import hashlib
+import io
+import json
+import mmap
+import os
+import pickle
+import struct
+import sys
+import tempfile
+import threading
+from collections.abc import MutableMapping
+
+from openc3.__version__ import __version__
+from openc3.accessors.binary_accessor import BinaryAccessor
+from openc3.packets.structure_item import StructureItem
+
+
+class ItemDefinition:
+    """Immutable layout of a single packet item as stored in PacketDefinitions"""
+
+    __slots__ = (
+        "name",
+        "bit_offset",
+        "bit_size",
+        "data_type",
+        "endianness",
+        "array_size",
+        "overflow",
+        "variable_bit_size",
+        "parent_item",
+    )
+
+    def __init__(
+        self, name, bit_offset, bit_size, data_type, endianness, array_size, overflow, variable_bit_size, parent_item
+    ):
+        self.name = name
+        self.bit_offset = bit_offset
+        self.bit_size = bit_size
+        self.data_type = data_type
+        self.endianness = endianness
+        self.array_size = array_size
+        self.overflow = overflow
+        self.variable_bit_size = variable_bit_size
+        self.parent_item = parent_item
+
+    def __repr__(self):
+        return (
+            f"ItemDefinition({self.name} {self.bit_offset} {self.bit_size} {self.data_type} "
+            f"{self.endianness} {self.array_size})"
+        )
+
+
+class SharedMapping(MutableMapping):
+    """Mapping whose values are loaded the first time they are accessed.
+
+    PacketConfig.from_definitions uses it for the packet tables so a process
+    only unpickles the packets it actually uses from the shared pages.
+    Iteration order is the order of the references.
+    """
+
+    __slots__ = ("_values", "_unloaded", "_load", "_mutex")
+
+    def __init__(self, references, load):
+        """
+        Args:
+            references: Dict of key to the reference passed to load
+            load: Called with a reference to create its value
+        """
+        self._values = dict(references)
+        self._unloaded = set(self._values)
+        self._load = load
+        self._mutex = threading.Lock()
+
+    def __getitem__(self, key):
+        value = self._values[key]
+        if key in self._unloaded:
+            # Every thread must get the same object (e.g. the CVT packet)
+            with self._mutex:
+                if key in self._unloaded:
+                    self._values[key] = self._load(value)
+                    self._unloaded.discard(key)
+                value = self._values[key]
+        return value
+
+    def __setitem__(self, key, value):
+        with self._mutex:
+            self._values[key] = value
+            self._unloaded.discard(key)
+
+    def __delitem__(self, key):
+        with self._mutex:
+            del self._values[key]
+            self._unloaded.discard(key)
+
+    def __contains__(self, key):
+        return key in self._values
+
+    def __iter__(self):
+        return iter(self._values)
+
+    def __len__(self):
+        return len(self._values)
+
+    def __repr__(self):
+        return f"SharedMapping({list(self._values.keys())})"
+
+    def loaded_values(self):
+        """The values which have been loaded (or set)"""
+        return [value for key, value in list(self._values.items()) if key not in self._unloaded]
+
+
+class _DefinitionsPickler(pickle.Pickler):
+    LOCK_TYPE = type(threading.Lock())
+
+    def reducer_override(self, obj):
+        # A structure's mutex belongs to the process using it
+        if isinstance(obj, self.LOCK_TYPE):
+            return (threading.Lock, ())
+        return NotImplemented
+
+
+class PacketDefinitions:
+    """Compact, immutable definitions for every packet in a PacketConfig.
+
+    The item layouts (offsets, sizes, types) are stored in flat arrays followed
+    by the pickled Packet of every packet and the PacketConfig lookup tables.
+    The file is memory mapped, so every process on a host which loads the same
+    file shares its pages. PacketConfig.from_definitions only unpickles the
+    packets a process uses, which then hold that process's mutable state
+    (buffer, limits state, counts). ItemDefinition objects are only created
+    for the items which are accessed and only BinaryAccessor layouts can be
+    read directly from the arrays.
+
+    The packets are pickled, so only load files from a directory which only
+    trusted processes can write (see System.share_packet_definitions).
+    """
+
+    __slots__ = (
+        "filename",
+        "_file",
+        "_mmap",
+        "_view",
+        "_packets",
+        "_config",
+        "_bit_offsets",
+        "_bit_sizes",
+        "_array_sizes",
+        "_name_offsets",
+        "_data_types",
+        "_endianness",
+        "_overflows",
+        "_flags",
+        "_names",
+        "_pickles",
+        "_item_indexes",
+        "_item_cache",
+    )
+
+    MAGIC = b"OC3PDEF2"
+    EXTENSION = ".pdef"
+    # Codes stored for the string attributes. Index in the list is the code.
+    DATA_TYPES = StructureItem.DATA_TYPES
+    ENDIANNESS = BinaryAccessor.ENDIANNESS
+    OVERFLOW_TYPES = BinaryAccessor.OVERFLOW_TYPES
+    # Flags
+    VARIABLE_BIT_SIZE = 1
+    HAS_PARENT = 2
+    NO_ARRAY = -1
+    # int32 columns, the name offsets (uint32) and then the uint8 columns
+    INT_COLUMNS = ("_bit_offsets", "_bit_sizes", "_array_sizes")
+    BYTE_COLUMNS = ("_data_types", "_endianness", "_overflows", "_flags")
+    # PacketConfig attributes which are stored as is
+    CONFIG_ATTRIBUTES = (
+        "name",
+        "limits_groups",
+        "limits_sets",
+        "warnings",
+        "cmd_id_signature",
+        "cmd_subpacket_id_signature",
+        "cmd_unique_id_mode",
+        "cmd_subpacket_unique_id_mode",
+        "tlm_id_signature",
+        "tlm_subpacket_id_signature",
+        "tlm_unique_id_mode",
+        "tlm_subpacket_unique_id_mode",
+    )
+    # PacketConfig attributes which reference packets. The packet names are stored.
+    ID_VALUE_HASHES = (
+        "cmd_id_value_hash",
+        "cmd_subpacket_id_value_hash",
+        "tlm_id_value_hash",
+        "tlm_subpacket_id_value_hash",
+    )
+
+    @classmethod
+    def write(cls, packet_config, filename):
+        """Write the definitions of every packet in the PacketConfig to filename.
+        The file is written to a temp file and renamed so readers never see a partial file."""
+        packets = {}
+        items = []
+        pickles = bytearray()
+        for cmd_or_tlm, all_packets in (("CMD", packet_config.commands), ("TLM", packet_config.telemetry)):
+            packets[cmd_or_tlm] = {}
+            for target_name, target_packets in all_packets.items():
+                packets[cmd_or_tlm][target_name] = {}
+                for packet_name, packet in target_packets.items():
+                    start = len(items)
+                    packet_items = packet.sorted_items
+                    items.extend(packet_items)
+                    packet_pickle = cls._pickle(packet)
+                    packets[cmd_or_tlm][target_name][packet_name] = [
+                        start,
+                        len(packet_items),
+                        packet.accessor.__class__.__name__,
+                        len(pickles),
+                        len(packet_pickle),
+                    ]
+                    pickles += packet_pickle
+        config_pickle = cls._pickle(cls._config_tables(packet_config))
+        config = [len(pickles), len(config_pickle)]
+        pickles += config_pickle
+
+        count = len(items)
+        names = b""
+        name_offsets = [0]
+        columns = {name: [] for name in cls.INT_COLUMNS + cls.BYTE_COLUMNS}
+        for item in items:
+            names += item.name.encode()
+            name_offsets.append(len(names))
+            columns["_bit_offsets"].append(item.bit_offset)
+            columns["_bit_sizes"].append(item.bit_size)
+            array_size = item.array_size
+            columns["_array_sizes"].append(cls.NO_ARRAY if array_size is None else array_size)
+            columns["_data_types"].append(cls.DATA_TYPES.index(item.data_type))
+            columns["_endianness"].append(cls.ENDIANNESS.index(item.endianness))
+            columns["_overflows"].append(cls.OVERFLOW_TYPES.index(item.overflow))
+            flags = 0
+            if item.variable_bit_size:
+                flags |= cls.VARIABLE_BIT_SIZE
+            if item.parent_item is not None:
+                flags |= cls.HAS_PARENT
+            columns["_flags"].append(flags)
+
+        header = json.dumps({"count": count, "packets": packets, "config": config}).encode()
+        data = bytearray(cls.MAGIC)
+        data += struct.pack("<I", len(header))
+        data += header
+        data += b"\x00" * (-len(data) % 8)  # Align the arrays
+        for name in cls.INT_COLUMNS:
+            data += struct.pack(f"<{count}i", *columns[name])
+        data += struct.pack(f"<{count + 1}I", *name_offsets)
+        for name in cls.BYTE_COLUMNS:
+            data += bytes(columns[name])
+        data += names
+        data += pickles
+
+        directory = os.path.dirname(os.path.abspath(filename))
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=directory)
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(data)
+            os.replace(temp_path, filename)
+        except Exception:
+            with contextlib.suppress(OSError):
+                os.remove(temp_path)
+            raise
+
+    @classmethod
+    def load(cls, filename):
+        """Memory map a file written by write"""
+        return cls(filename)
+
+    @classmethod
+    def shared_filename(cls, targets, directory):
+        """Name of the definitions file for the given targets in directory.
+
+        The name is made from the target names and a hash of the target.txt and
+        cmd_tlm file contents (plus the OpenC3 and Python versions), so processes
+        with the same targets use the same file and a new target version gets
+        a new file. The files in the target lib and procedures folders are part
+        of the hash because they are on the search path and the pickled conversions,
+        processors and validators can import them. Paths are relative to the target
+        folder because every microservice extracts its targets to a different directory.
+
+        Args:
+            targets: List of System Target objects
+            directory: Directory to hold the files
+        """
+        names = hashlib.sha256()
+        content = hashlib.sha256(f"{__version__} {sys.version}".encode())
+        for target in sorted(targets, key=lambda target: target.name):
+            names.update(f"{target.name}\n".encode())
+            content.update(f"{target.name}\n".encode())
+            for filename in [target.filename] + target.cmd_tlm_files + cls._search_path_files(target):
+                if filename is None:
+                    continue
+                content.update(f"{os.path.relpath(filename, target.dir)}\n".encode())
+                with open(filename, "rb") as file:
+                    content.update(file.read())
+        return os.path.join(directory, f"{names.hexdigest()[:16]}_{content.hexdigest()}{cls.EXTENSION}")
+
+    @staticmethod
+    def _search_path_files(target):
+        """Sorted files in the target folders which System adds to the search path"""
+        filenames = []
+        for folder in ("lib", "procedures"):
+            for path, dirs, files in os.walk(os.path.join(target.dir, folder)):
+                dirs[:] = sorted(name for name in dirs if name != "__pycache__")
+                filenames.extend(os.path.join(path, name) for name in sorted(files))
+        return filenames
+
+    @classmethod
+    def remove_stale(cls, filename):
+        """Remove the files for older versions of the same targets as filename.
+        Processes which still have them mapped keep working because the pages
+        stay valid until they are unmapped."""
+        directory, basename = os.path.split(filename)
+        prefix = basename.split("_")[0]
+        for stale in glob.glob(os.path.join(directory, f"{prefix}_*{cls.EXTENSION}")):
+            if os.path.basename(stale) != basename:
+                with contextlib.suppress(OSError):
+                    os.remove(stale)
+
+    @classmethod
+    def _pickle(cls, obj):
+        output = io.BytesIO()
+        _DefinitionsPickler(output, pickle.HIGHEST_PROTOCOL).dump(obj)
+        return output.getvalue()
+
+    @classmethod
+    def _config_tables(cls, packet_config):
+        """The PacketConfig lookup tables with packet names in place of the packets"""
+        tables = {"attributes": {}, "id_value_hashes": {}, "latest_data": {}}
+        for name in cls.CONFIG_ATTRIBUTES:
+            tables["attributes"][name] = getattr(packet_config, name)
+        for name in cls.ID_VALUE_HASHES:
+            tables["id_value_hashes"][name] = {}
+            for target_name, id_values in getattr(packet_config, name).items():
+                tables["id_value_hashes"][name][target_name] = {
+                    key: packet.packet_name for key, packet in id_values.items()
+                }
+        for target_name, target_latest_data in packet_config.latest_data.items():
+            tables["latest_data"][target_name] = {
+                item_name: [packet.packet_name for packet in latest_packets]
+                for item_name, latest_packets in target_latest_data.items()
+            }
+        return tables
+
+    def __init__(self, filename):
+        self.filename = filename
+        self._file = open(filename, "rb")  # noqa: SIM115
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap)
+        view = self._view
+        if bytes(view[0:8]) != self.MAGIC:
+            self.close()
+            raise ValueError(f"{filename} is not a packet definitions file")
+        header_length = struct.unpack("<I", view[8:12])[0]
+        header = json.loads(bytes(view[12 : 12 + header_length]))
+        count = header["count"]
+        self._packets = header["packets"]
+        self._config = header["config"]
+        offset = 12 + header_length
+        offset += -offset % 8
+        for name in self.INT_COLUMNS:
+            setattr(self, name, view[offset : offset + (count * 4)].cast("i"))
+            offset += count * 4
+        self._name_offsets = view[offset : offset + ((count + 1) * 4)].cast("I")
+        offset += (count + 1) * 4
+        for name in self.BYTE_COLUMNS:
+            setattr(self, name, view[offset : offset + count])
+            offset += count
+        names_length = self._name_offsets[count]
+        self._names = view[offset : offset + names_length]
+        self._pickles = view[offset + names_length :]
+        self._item_indexes = {}
+        self._item_cache = {}
+
+    def close(self):
+        for name in self.INT_COLUMNS + self.BYTE_COLUMNS + ("_name_offsets", "_names", "_pickles", "_view"):
+            with contextlib.suppress(AttributeError):
+                getattr(self, name).release()
+        self._item_cache = {}
+        self._mmap.close()
+        self._file.close()
+
+    def target_names(self, cmd_or_tlm="TLM"):
+        return list(self._packets[cmd_or_tlm].keys())
+
+    def packet_names(self, cmd_or_tlm, target_name):
+        return list(self._packet(cmd_or_tlm, target_name, None).keys())
+
+    def accessor(self, cmd_or_tlm, target_name, packet_name):
+        """The name of the packet's accessor class"""
+        return self._packet(cmd_or_tlm, target_name, packet_name)[2]
+
+    def packet(self, cmd_or_tlm, target_name, packet_name):
+        """A new Packet unpickled from the shared definition"""
+        _, _, _, offset, length = self._packet(cmd_or_tlm, target_name, packet_name)
+        return pickle.loads(self._pickles[offset : offset + length])
+
+    def config(self):
+        """The PacketConfig lookup tables (see PacketConfig.from_definitions)"""
+        offset, length = self._config
+        return pickle.loads(self._pickles[offset : offset + length])
+
+    def item_names(self, cmd_or_tlm, target_name, packet_name):
+        return list(self._indexes(cmd_or_tlm, target_name, packet_name).keys())
+
+    def items(self, cmd_or_tlm, target_name, packet_name):
+        """ItemDefinitions for every item in the packet sorted by bit offset"""
+        return [self._item(index) for index in self._indexes(cmd_or_tlm, target_name, packet_name).values()]
+
+    def item(self, cmd_or_tlm, target_name, packet_name, item_name):
+        indexes = self._indexes(cmd_or_tlm, target_name, packet_name)
+        index = indexes.get(item_name.upper())
+        if index is None:
+            raise RuntimeError(f"Item '{target_name} {packet_name} {item_name}' does not exist")
+        return self._item(index)
+
+    def read(self, cmd_or_tlm, target_name, packet_name, item_name, buffer):
+        """Read the RAW value of an item from a packet buffer"""
+        item = self.item(cmd_or_tlm, target_name, packet_name, item_name)
+        return self._read(cmd_or_tlm, target_name, packet_name, item, buffer)
+
+    def read_all(self, cmd_or_tlm, target_name, packet_name, buffer):
+        """Read the RAW value of every item from a packet buffer"""
+        result = {}
+        for item in self.items(cmd_or_tlm, target_name, packet_name):
+            result[item.name] = self._read(cmd_or_tlm, target_name, packet_name, item, buffer)
+        return result
+
+    def _read(self, cmd_or_tlm, target_name, packet_name, item, buffer):
+        if self.accessor(cmd_or_tlm, target_name, packet_name) != "BinaryAccessor":
+            raise RuntimeError(f"Packet '{target_name} {packet_name}' does not use the BinaryAccessor")
+        if item.variable_bit_size or item.parent_item:
+            raise RuntimeError(f"Item '{target_name} {packet_name} {item.name}' does not have a fixed layout")
+        return BinaryAccessor.class_read_item(item, buffer)
+
+    def _packet(self, cmd_or_tlm, target_name, packet_name):
+        try:
+            target_packets = self._packets[cmd_or_tlm.upper()][target_name.upper()]
+        except KeyError:
+            raise RuntimeError(f"Target '{target_name}' does not exist") from None
+        if packet_name is None:
+            return target_packets
+        try:
+            return target_packets[packet_name.upper()]
+        except KeyError:
+            raise RuntimeError(f"Packet '{target_name} {packet_name}' does not exist") from None
+
+    def _indexes(self, cmd_or_tlm, target_name, packet_name):
+        """Item name to index for a packet. Only built for packets which are used."""
+        key = (cmd_or_tlm.upper(), target_name.upper(), packet_name.upper())
+        indexes = self._item_indexes.get(key)
+        if indexes is None:
+            start, count = self._packet(*key)[0:2]
+            indexes = {}
+            for index in range(start, start + count):
+                indexes[self._name(index)] = index
+            self._item_indexes[key] = indexes
+        return indexes
+
+    def _name(self, index):
+        return bytes(self._names[self._name_offsets[index] : self._name_offsets[index + 1]]).decode()
+
+    def _item(self, index):
+        item = self._item_cache.get(index)
+        if item is None:
+            array_size = self._array_sizes[index]
+            flags = self._flags[index]
+            item = ItemDefinition(
+                self._name(index),
+                self._bit_offsets[index],
+                self._bit_sizes[index],
+                self.DATA_TYPES[self._data_types[index]],
+                self.ENDIANNESS[self._endianness[index]],
+                None if array_size == self.NO_ARRAY else array_size,
+                self.OVERFLOW_TYPES[self._overflows[index]],
+                bool(flags & self.VARIABLE_BIT_SIZE),
+                bool(flags & self.HAS_PARENT),
+            )
+            self._item_cache[index] = item
+        return item
@@ -15,14 +15,52 @@ import re
 from openc3.config.config_parser import ConfigParser
 from openc3.conversions.conversion import Conversion
 from openc3.packets.packet_item_limits import PacketItemLimits
-from openc3.packets.structure_item import StructureItem
+from openc3.packets.structure_item import StructureItem, validated_attribute
 from openc3.utilities.string import quote_if_necessary, simple_formatted
 
 
 class PacketItem(StructureItem):
+    __slots__ = (
+        "_format_string",
+        "_read_conversion",
+        "_write_conversion",
+        "_id_value",
+        "_states",
+        "_states_by_value",
+        "_description",
+        "_units_full",
+        "_units",
+        "default",
+        "minimum",
+        "maximum",
+        "required",
+        "_hazardous",
+        "_messages_disabled",
+        "_state_colors",
+        "_limits",
+        "persistence_setting",
+        "persistence_count",
+        "_meta",
+        "obfuscate",
+    )
+
     # The allowable state colors
     VALID_STATE_COLORS = ["GREEN", "YELLOW", "RED"]
 
+    format_string = validated_attribute("format_string")
+    read_conversion = validated_attribute("read_conversion")
+    write_conversion = validated_attribute("write_conversion")
+    id_value = validated_attribute("id_value")
+    states = validated_attribute("states")
+    description = validated_attribute("description")
+    units_full = validated_attribute("units_full")
+    units = validated_attribute("units")
+    hazardous = validated_attribute("hazardous")
+    messages_disabled = validated_attribute("messages_disabled")
+    state_colors = validated_attribute("state_colors")
+    limits = validated_attribute("limits")
+    meta = validated_attribute("meta")
+
     def __init__(
         self,
         name,
@@ -56,127 +94,88 @@ class PacketItem(StructureItem):
         self.meta = None
         self.obfuscate = False
 
-    @property
-    def format_string(self):
-        return self.__format_string
-
-    @format_string.setter
-    def format_string(self, format_string):
+    def _validate_format_string(self, format_string):
         if format_string:
             if not isinstance(format_string, str):
                 raise TypeError(f"{self.name}: format_string must be a str but is a {format_string.__class__.__name__}")
             if not re.search(r"%.*(b|B|d|i|o|u|x|X|e|E|f|g|G|a|A|c|p|s|%)", format_string):
                 raise ValueError(f"{self.name}: format_string invalid '{format_string}'")
-            self.__format_string = format_string
+            return format_string
         else:
-            self.__format_string = None
-
-    @property
-    def read_conversion(self):
-        return self.__read_conversion
+            return None
 
-    @read_conversion.setter
-    def read_conversion(self, read_conversion):
+    def _validate_read_conversion(self, read_conversion):
         if read_conversion:
             if not isinstance(read_conversion, Conversion):
                 raise TypeError(
                     f"{self.name}: read_conversion must be a Conversion but is a {read_conversion.__class__.__name__}"
                 )
-            self.__read_conversion = read_conversion
+            return read_conversion
         else:
-            self.__read_conversion = None
+            return None
 
-    @property
-    def write_conversion(self):
-        return self.__write_conversion
-
-    @write_conversion.setter
-    def write_conversion(self, write_conversion):
+    def _validate_write_conversion(self, write_conversion):
         if write_conversion:
             if not isinstance(write_conversion, Conversion):
                 raise TypeError(
                     f"{self.name}: write_conversion must be a Conversion but is a {write_conversion.__class__.__name__}"
                 )
-            self.__write_conversion = write_conversion
+            return write_conversion
         else:
-            self.__write_conversion = None
-
-    @property
-    def id_value(self):
-        return self.__id_value
+            return None
 
-    @id_value.setter
-    def id_value(self, id_value):
+    def _validate_id_value(self, id_value):
         if id_value is not None:
-            self.__id_value = self.convert(id_value, self.data_type)
+            return self.convert(id_value, self.data_type)
         else:
-            self.__id_value = None
+            return None
 
     # Assignment operator for states to make sure it is a dict with uppercase keys
-    @property
-    def states(self):
-        return self.__states
-
-    @states.setter
-    def states(self, states):
+    def _validate_states(self, states):
         if states is not None:
             if not isinstance(states, dict):
                 raise TypeError(f"{self.name}: states must be a dict but is a {states.__class__.__name__}")
 
             # Make sure all states are in upper case
-            self.__states = {}
-            self.__states_by_value = {}
+            upper_states = {}
+            self._states_by_value = {}
             for key, value in states.items():
                 upper = key.upper()
-                self.__states[upper] = value
-                self.__states_by_value[value] = upper
+                upper_states[upper] = value
+                self._states_by_value[value] = upper
             if self.state_colors is None:
                 self.state_colors = {}
+            return upper_states
         else:
-            self.__states = None
-            self.__states_by_value = None
+            self._states_by_value = None
+            return None
 
     def states_by_value(self):
-        return self.__states_by_value
-
-    @property
-    def description(self):
-        return self.__description
+        return self._states_by_value
 
-    @description.setter
-    def description(self, description):
+    def _validate_description(self, description):
         if description:
             if not isinstance(description, str):
                 raise TypeError(f"{self.name}: description must be a str but is a {description.__class__.__name__}")
-            self.__description = description
+            return description
         else:
-            self.__description = None
+            return None
 
-    @property
-    def units_full(self):
-        return self.__units_full
-
-    @units_full.setter
-    def units_full(self, units_full):
+    def _validate_units_full(self, units_full):
         if units_full:
             if not isinstance(units_full, str):
                 raise TypeError(f"{self.name}: units_full must be a str but is a {units_full.__class__.__name__}")
-            self.__units_full = units_full
+            return units_full
         else:
-            self.__units_full = None
-
-    @property
-    def units(self):
-        return self.__units
+            return None
 
-    @units.setter
-    def units(self, units):
+    def _validate_units(self, units):
         if units:
             if not isinstance(units, str):
                 raise TypeError(f"{self.name}: units must be a str but is a {units.__class__.__name__}")
-            self.__units = units
+            return units
         else:
-            self.__units = None
+            return None
 
     def check_default_and_range_data_types(self):
         if self.default is not None and self.write_conversion is None:
@@ -235,84 +234,58 @@ class PacketItem(StructureItem):
                                 f"{self.name}: default must be a bool but is a {self.default.__class__.__name__}"
                             )
 
-    @property
-    def hazardous(self):
-        return self.__hazardous
-
-    @hazardous.setter
-    def hazardous(self, hazardous):
+    def _validate_hazardous(self, hazardous):
         if hazardous is not None:
             if not isinstance(hazardous, dict):
                 raise TypeError(f"{self.name}: hazardous must be a dict but is a {hazardous.__class__.__name__}")
-            self.__hazardous = hazardous
+            return hazardous
         else:
-            self.__hazardous = None
-
-    @property
-    def messages_disabled(self):
-        return self.__messages_disabled
+            return None
 
-    @messages_disabled.setter
-    def messages_disabled(self, messages_disabled):
+    def _validate_messages_disabled(self, messages_disabled):
         if messages_disabled is not None:
             if not isinstance(messages_disabled, dict):
                 raise TypeError(
                     f"{self.name}: messages_disabled must be a dict but is a {messages_disabled.__class__.__name__}"
                 )
 
-            self.__messages_disabled = messages_disabled
+            return messages_disabled
         else:
-            self.__messages_disabled = None
+            return None
 
-    @property
-    def state_colors(self):
-        return self.__state_colors
-
-    @state_colors.setter
-    def state_colors(self, state_colors):
+    def _validate_state_colors(self, state_colors):
         if state_colors is not None:
             if not isinstance(state_colors, dict):
                 raise TypeError(f"{self.name}: state_colors must be a dict but is a {state_colors.__class__.__name__}")
 
-            self.__state_colors = state_colors
+            return state_colors
         else:
-            self.__state_colors = None
-
-    @property
-    def limits(self):
-        return self.__limits
+            return None
 
-    @limits.setter
-    def limits(self, limits):
+    def _validate_limits(self, limits):
         if limits is not None:
             if not isinstance(limits, PacketItemLimits):
                 raise TypeError(f"{self.name}: limits must be a PacketItemLimits but is a {limits.__class__.__name__}")
 
-            self.__limits = limits
+            return limits
         else:
-            self.__limits = None
-
-    @property
-    def meta(self):
-        return self.__meta
+            return None
 
-    @meta.setter
-    def meta(self, meta):
+    def _validate_meta(self, meta):
         if meta is not None:
             if not isinstance(meta, dict):
                 raise TypeError(f"{self.name}: meta must be a dict but is a {meta.__class__.__name__}")
 
-            self.__meta = meta
+            return meta
         else:
-            self.__meta = {}
+            return {}
 
     # Make a light weight clone of this item
     def clone(self):
         item = copy.copy(self)
         # Since we're copying and not calling the constructor
         # we have to manually update the create_index
-        item.create_index = StructureItem.create_index
-        StructureItem.create_index += 1
+        item.create_index = next(StructureItem.create_indexes)
         return item
 
     # def calculate_range(self):
@@ -11,7 +11,7 @@
 
 import copy
 import threading
-from contextlib import contextmanager
+from contextlib import contextmanager, nullcontext
 
 from openc3.accessors.binary_accessor import BinaryAccessor
 from openc3.packets.structure_item import StructureItem
@@ -50,6 +50,8 @@ class Structure:
             self.fixed_size = True
             self.short_buffer_allowed = False
             self.mutex = None
+            # Set when only one thread uses the structure so no mutex is needed
+            self.single_owner = False
             self.accessor = BinaryAccessor(self)
         else:
             raise ValueError(f"Unknown endianness '{default_endianness}', must be 'BIG_ENDIAN' or 'LITTLE_ENDIAN'")
@@ -240,7 +242,7 @@ class Structure:
                 self.defined_length += 1
 
         # Resize the buffer if necessary
-        if self.buffer is not None:
+        if self.buffer_view() is not None:
             self.resize_buffer()
         return item
 
@@ -455,19 +457,33 @@ class Structure:
 
         return string
 
+    # Buffer ownership: a structure owns the bytearray backing its items.
+    #   buffer (get/set) - Copies so the caller and the structure never share data
+    #   buffer_view - Returns the owned buffer without copying. The caller must
+    #     not modify it and it is only valid until the buffer is next assigned.
+    #     buffer_no_copy is the original name and is kept for existing code.
+    #   adopt_buffer - Takes ownership of the given bytearray without copying.
+    #     The caller gives up the buffer and must not use it afterwards.
+    # Internal code which only reads the buffer should use buffer_view. Only
+    # adopt a buffer nothing else holds, e.g. a subpacket which is discarded.
+
     # Get the buffer used by the structure. The current buffer is copied and
     # thus modifications to the returned buffer will have no effect on the
     # structure items.
     #
-    # self.param copy [TrueClass/FalseClass] Whether to copy the buffer
     # self.return [String] Data buffer backing the structure
     @property
     def buffer(self):
         return self.allocate_buffer_if_needed()[:]
 
-    def buffer_no_copy(self):
+    # Get the buffer used by the structure without copying it
+    #
+    # self.return [bytearray] Data buffer backing the structure
+    def buffer_view(self):
         return self.allocate_buffer_if_needed()
 
+    buffer_no_copy = buffer_view
+
     # Set the buffer to be used by the structure. The buffer is copied and thus
     # further modifications to the buffer have no effect on the structure
     # items.
@@ -478,6 +494,15 @@ class Structure:
         with self.synchronize():
             self.internal_buffer_equals(buffer)
 
+    # Set the buffer to be used by the structure without copying it. bytes are
+    # still copied into a bytearray since the structure must be able to write
+    # to its buffer.
+    #
+    # self.param buffer [bytearray] Buffer of data to back the structure items
+    def adopt_buffer(self, buffer):
+        with self.synchronize():
+            self.internal_buffer_equals(buffer, False)
+
     # Make a light weight clone of this structure. This only creates a new buffer
     # of data. The defined structure items are the same.
     #
@@ -486,6 +511,8 @@ class Structure:
     def clone(self):
         struct = copy.copy(self)
         struct._buffer = self.buffer  # Makes a copy
+        # The clone may be handed to other threads
+        struct.single_owner = False
         struct.accessor = copy.copy(self.accessor)
         struct.accessor.packet = struct
         return struct
@@ -505,6 +532,8 @@ class Structure:
         return cloned
 
     CLASS_MUTEX = threading.Lock()
+    # Returned by synchronize and synchronize_allow_reads for single owner structures
+    NO_MUTEX = nullcontext()
 
     def setup_mutex(self):
         if self.mutex:
@@ -513,8 +542,11 @@ class Structure:
             self.mutex_allow_reads = False
             self.mutex = threading.Lock()
 
-    # Take the structure mutex to ensure the buffer does not change while you perform activities
+    # Take the structure mutex to ensure the buffer does not change while you perform activities.
+    # Structures with single_owner set are only used by one thread so no mutex is taken.
     def synchronize(self):
+        if self.single_owner:
+            return Structure.NO_MUTEX
         self.setup_mutex()
         return self.mutex
 
@@ -522,8 +554,13 @@ class Structure:
     # This versions allows reads to happen if a top level function has already taken the mutex
     # self.param top [Boolean] If True this will take the mutex and set an allow reads flag to allow
     #      lower level calls to go forward without getting the mutex
-    @contextmanager
     def synchronize_allow_reads(self, top=False):
+        if self.single_owner:
+            return Structure.NO_MUTEX
+        return self._synchronize_allow_reads(top)
+
+    @contextmanager
+    def _synchronize_allow_reads(self, top):
         self.setup_mutex()
         if top:
             with self.mutex:
@@ -600,11 +637,14 @@ class Structure:
                         # because it started out at zero bit_size
                         adjustment += new_bit_size - item.original_bit_size
 
-    def internal_buffer_equals(self, buffer):
+    def internal_buffer_equals(self, buffer, copy=True):
         if not isinstance(buffer, bytes | bytearray):
             raise TypeError(f"Buffer class is {buffer.__class__.__name__} but must be bytearray")
 
-        self._buffer = bytearray(buffer[:])
+        if copy or not isinstance(buffer, bytearray):
+            self._buffer = bytearray(buffer)
+        else:
+            self._buffer = buffer
         if not self.fixed_size:
             self.recalculate_bit_offsets()
 
@@ -10,14 +10,56 @@
 # if purchased from OpenC3, Inc.
 
 import copy
+import itertools
 from functools import total_ordering
+from operator import attrgetter
 
 from openc3.accessors.binary_accessor import BinaryAccessor
 
 
+def validated_attribute(name, verify=False):
+    """Property for an attribute stored in the _<name> slot. Reads go straight
+    to the slot while assignments are checked by the _validate_<name> method.
+    With verify the overall integrity of a constructed item is verified too."""
+    slot = f"_{name}"
+    validate = f"_validate_{name}"
+
+    def setter(self, value):
+        setattr(self, slot, getattr(self, validate)(value))
+        if verify and self.structure_item_constructed:
+            self.verify_overall()
+
+    return property(attrgetter(slot), setter)
+
+
 @total_ordering
 class StructureItem:
-    create_index = 0
+    # Items are slotted to keep the memory of large packet configurations down.
+    # The __dict__ slot is only allocated if other code adds its own attributes.
+    __slots__ = (
+        "__dict__",
+        "structure_item_constructed",
+        "_name",
+        "_key",
+        "_endianness",
+        "_data_type",
+        "_bit_offset",
+        "original_bit_offset",
+        "_bit_size",
+        "original_bit_size",
+        "_array_size",
+        "original_array_size",
+        "_overflow",
+        "overlap",
+        "_variable_bit_size",
+        "hidden",
+        "parent_item",
+        "structure",
+        "create_index",
+    )
+
+    # Source of the create_index of every item
+    create_indexes = itertools.count()
 
     # Valid data types adds DERIVED to those defined by BinaryAccessor
     DATA_TYPES = [
@@ -33,6 +75,16 @@ class StructureItem:
         "DERIVED",
     ]
 
+    name = validated_attribute("name", verify=True)
+    key = validated_attribute("key")
+    endianness = validated_attribute("endianness", verify=True)
+    bit_offset = validated_attribute("bit_offset", verify=True)
+    bit_size = validated_attribute("bit_size", verify=True)
+    data_type = validated_attribute("data_type", verify=True)
+    array_size = validated_attribute("array_size", verify=True)
+    overflow = validated_attribute("overflow", verify=True)
+    variable_bit_size = validated_attribute("variable_bit_size", verify=True)
+
     # Create a StructureItem by setting all the attributes. It
     # calls all the setter routines to do the attribute verification and then
     # verifies the overall integrity.
@@ -73,59 +125,43 @@ class StructureItem:
         self.hidden = False
         self.parent_item = None
         self.structure = None
-        self.create_index = StructureItem.create_index
-        StructureItem.create_index += 1
+        self.create_index = next(StructureItem.create_indexes)
         self.structure_item_constructed = True
         self.verify_overall()
 
-    @property
-    def name(self):
-        return self.__name
-
-    @name.setter
-    def name(self, name):
+    # Restore the attributes of a copied or unpickled item. The values were
+    # validated by the original item so they are set directly.
+    def __setstate__(self, state):
+        dict_state, slot_state = state if isinstance(state, tuple) else (state, None)
+        if dict_state:
+            self.__dict__.update(dict_state)
+        if slot_state:
+            for name, value in slot_state.items():
+                object.__setattr__(self, name, value)
+
+    def _validate_name(self, name):
         if not isinstance(name, str):
             raise TypeError(f"name must be a String but is a {name.__class__.__name__}")
         if len(name) == 0:
             raise ValueError("name must contain at least one character")
+        return name.upper()
 
-        self.__name = name.upper()
-        if self.structure_item_constructed:
-            self.verify_overall()
-
-    @property
-    def key(self):
-        return self.__key
-
-    @key.setter
-    def key(self, key):
+    def _validate_key(self, key):
         if key is not None:
             if not isinstance(key, str):
                 raise TypeError(f"key must be a String but is a {key.__class__.__name__}")
             if len(key) == 0:
                 raise ValueError("key must contain at least one character")
-        self.__key = key
+        return key
 
-    @property
-    def endianness(self):
-        return self.__endianness
-
-    @endianness.setter
-    def endianness(self, endianness):
+    def _validate_endianness(self, endianness):
         if not isinstance(endianness, str):
             raise TypeError(f"{self.name}: endianness must be a String but is a {endianness.__class__.__name__}")
         if endianness not in BinaryAccessor.ENDIANNESS:
             raise ValueError(f"{self.name}: unknown endianness: {endianness} - Must be 'BIG_ENDIAN' or 'LITTLE_ENDIAN'")
-        self.__endianness = endianness
-        if self.structure_item_constructed:
-            self.verify_overall()
+        return endianness
 
-    @property
-    def bit_offset(self):
-        return self.__bit_offset
-
-    @bit_offset.setter
-    def bit_offset(self, bit_offset):
+    def _validate_bit_offset(self, bit_offset):
         if not isinstance(bit_offset, int):
             raise TypeError(f"{self.name}: bit_offset must be an Integer")
 
@@ -135,17 +171,9 @@ class StructureItem:
 
         if self.data_type == "DERIVED" and bit_offset != 0:
             raise ValueError(f"{self.name}: DERIVED items must have bit_offset of zero")
+        return bit_offset
 
-        self.__bit_offset = bit_offset
-        if self.structure_item_constructed:
-            self.verify_overall()
-
-    @property
-    def bit_size(self):
-        return self.__bit_size
-
-    @bit_size.setter
-    def bit_size(self, bit_size):
+    def _validate_bit_size(self, bit_size):
         if not isinstance(bit_size, int):
             raise TypeError(f"{self.name}: bit_size must be an Integer")
 
@@ -158,32 +186,16 @@ class StructureItem:
             raise ValueError(f"{self.name}: bit_size for FLOAT items must be 32 or 64. Given: {bit_size}")
         if self.data_type == "DERIVED" and bit_size != 0:
             raise ValueError(f"{self.name}: DERIVED items must have bit_size of zero")
+        return bit_size
 
-        self.__bit_size = bit_size
-        if self.structure_item_constructed:
-            self.verify_overall()
-
-    @property
-    def data_type(self):
-        return self.__data_type
-
-    @data_type.setter
-    def data_type(self, data_type):
+    def _validate_data_type(self, data_type):
         if not isinstance(data_type, str):
             raise TypeError(f"{self.name}: data_type must be a str but {data_type} is a {type(data_type).__name__}")
         if data_type not in self.DATA_TYPES:
             raise ValueError(f"{self.name}: unknown data_type: {data_type} - Must be {', '.join(self.DATA_TYPES)}")
+        return data_type
 
-        self.__data_type = data_type
-        if self.structure_item_constructed:
-            self.verify_overall()
-
-    @property
-    def array_size(self):
-        return self.__array_size
-
-    @array_size.setter
-    def array_size(self, array_size):
+    def _validate_array_size(self, array_size):
         if array_size is not None:
             if not isinstance(array_size, int):
                 raise TypeError(f"{self.name}: array_size must be an Integer")
@@ -191,17 +203,9 @@ class StructureItem:
                 raise ValueError(f"{self.name}: array_size must be a multiple of bit_size")
             if self.bit_size <= 0:
                 raise ValueError(f"{self.name}: bit_size cannot be negative or zero for array items")
+        return array_size
 
-        self.__array_size = array_size
-        if self.structure_item_constructed:
-            self.verify_overall()
-
-    @property
-    def overflow(self):
-        return self.__overflow
-
-    @overflow.setter
-    def overflow(self, overflow):
+    def _validate_overflow(self, overflow):
         if not isinstance(overflow, str):
             raise TypeError(f"{self.name}: overflow type must be a String")
 
@@ -209,17 +213,9 @@ class StructureItem:
             raise ValueError(
                 f"{self.name}: unknown overflow type: {overflow} - Must be 'ERROR', 'ERROR_ALLOW_HEX', 'TRUNCATE', or 'SATURATE'"
             )
+        return overflow
 
-        self.__overflow = overflow
-        if self.structure_item_constructed:
-            self.verify_overall()
-
-    @property
-    def variable_bit_size(self):
-        return self.__variable_bit_size
-
-    @variable_bit_size.setter
-    def variable_bit_size(self, variable_bit_size):
+    def _validate_variable_bit_size(self, variable_bit_size):
         if variable_bit_size:
             if not isinstance(variable_bit_size, dict):
                 raise TypeError(f"{self.name}: variable_bit_size must be a dict")
@@ -229,9 +225,7 @@ class StructureItem:
                 raise ValueError(f"{self.name}: variable_bit_size['length_value_bit_offset'] must be an Integer")
             if not isinstance(variable_bit_size["length_bits_per_count"], int):
                 raise ValueError(f"{self.name}: variable_bit_size['length_bits_per_count'] must be an Integer")
-        self.__variable_bit_size = variable_bit_size
-        if self.structure_item_constructed:
-            self.verify_overall()
+        return variable_bit_size
 
     def __eq__(self, other):
         # Comparison primarily based on bit_offset, matching Ruby behavior
@@ -283,8 +277,7 @@ class StructureItem:
         item = copy.copy(self)
         # Since we're copying and not calling the constructor
         # we have to manually update the create_index
-        item.create_index = StructureItem.create_index
-        StructureItem.create_index += 1
+        item.create_index = next(StructureItem.create_indexes)
         return item
 
     def as_json(self):
@@ -262,6 +262,8 @@ class Telemetry:
     # @param packet_data [String] The binary packet data buffer
     # @param target_names [Array<String>] List of target names to limit the search. The
     #   default value of nil means to search all known targets.
+    # @param adopt [Boolean] Whether the packet takes ownership of packet_data
+    #   instead of copying it (see Structure#adopt_buffer)
     # @return [Packet] The identified packet with its data set to the given
     #   packet_data buffer. Returns nil if no packet could be identified.
     def identify_and_set_buffer(
@@ -269,10 +271,14 @@ class Telemetry:
         packet_data: bytes,
         target_names: list[str] | None = None,
         subpackets: bool = False,
+        adopt: bool = False,
     ) -> Optional["Packet"]:
         identified_packet = self.identify(packet_data, target_names, subpackets=subpackets)
         if identified_packet:
-            identified_packet.buffer = packet_data
+            if adopt:
+                identified_packet.adopt_buffer(packet_data)
+            else:
+                identified_packet.buffer = packet_data
         return identified_packet
 
     # Finds a packet from the Current Value Table that matches the given data
@@ -349,12 +355,12 @@ class Telemetry:
         subpackets: bool = False,
     ) -> Optional["Packet"]:
         if not packet.identified():
-            identified_packet = self.identify(packet.buffer_no_copy(), target_names, subpackets=subpackets)
+            identified_packet = self.identify(packet.buffer_view(), target_names, subpackets=subpackets)
             if not identified_packet:
                 return None
 
             identified_packet = identified_packet.clone()
-            identified_packet.buffer = packet.buffer
+            identified_packet.buffer = packet.buffer_view()
             identified_packet.received_time = packet.received_time
             identified_packet.stored = packet.stored
             identified_packet.extra = packet.extra
@@ -368,7 +374,7 @@ class Telemetry:
             except Exception:
                 return None
             identified_packet = identified_packet.clone()
-            identified_packet.buffer = packet.buffer
+            identified_packet.buffer = packet.buffer_view()
             identified_packet.received_time = packet.received_time
             identified_packet.stored = packet.stored
             identified_packet.extra = packet.extra
@@ -384,26 +390,35 @@ class Telemetry:
     # @param target_name (see #packet)
     # @param packet_name (see #packet)
     # @param packet_data (see #identify_tlm!)
+    # @param adopt (see #identify_and_set_buffer)
     # @return [Packet] The packet with its data set to the given packet_data
     #   buffer.
-    def update(self, target_name: str, packet_name: str, packet_data: bytes) -> "Packet":
+    def update(self, target_name: str, packet_name: str, packet_data: bytes, adopt: bool = False) -> "Packet":
         identified_packet = self.packet(target_name, packet_name)
-        identified_packet.buffer = packet_data
+        if adopt:
+            identified_packet.adopt_buffer(packet_data)
+        else:
+            identified_packet.buffer = packet_data
         return identified_packet
 
     # Assigns a limits change callback to all telemetry packets
     #
     # @param limits_change_callback
     def set_limits_change_callback(self, limits_change_callback: Callable) -> None:
-        for _, packets in self.config.telemetry.items():
-            for _, packet in packets.items():
-                packet.limits_change_callback = limits_change_callback
+        self.config.set_packet_attribute("TELEMETRY", "limits_change_callback", limits_change_callback)
+
+    # Sets single_owner on every telemetry packet. Only set this when a single
+    # thread uses the packets (e.g. a DecomMicroservice) so no mutex is needed.
+    #
+    # @param single_owner [Boolean]
+    def set_single_owner(self, single_owner: bool) -> None:
+        self.config.set_packet_attribute("TELEMETRY", "single_owner", single_owner)
 
-    # Resets metadata on every packet in every target
+    # Resets metadata on every packet in every target. Packets which are not
+    # loaded from shared definitions yet have not changed.
     def reset(self) -> None:
-        for _, packets in self.config.telemetry.items():
-            for _, packet in packets.items():
-                packet.reset()
+        for packet in self.config.loaded_packets("TELEMETRY"):
+            packet.reset()
 
     # Returns an array with a "TARGET_NAME PACKET_NAME ITEM_NAME" string for every item in the system
     def all_item_strings(self, include_hidden=False, _splash=None):
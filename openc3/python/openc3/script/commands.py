@@ -99,6 +99,46 @@ def cmd_raw_no_checks(*args, **kwargs):
     return _cmd("cmd_raw_no_checks", None, *args, **kwargs)
 
 
+def cmd_many(
+    commands,
+    raw=False,
+    range_check=True,
+    hazardous_check=True,
+    log_message=None,
+    scope=OPENC3_SCOPE,
+    **kwargs,
+):
+    """Send many commands with one call
+    Usage:
+      cmd_many(['INST ABORT', ['INST', 'COLLECT', {'TYPE': 'NORMAL'}]])
+    A command can also be a dict with its own keyword arguments such as the ack timeout:
+      cmd_many([{'command': 'INST ABORT', 'timeout': 1}, 'INST CLEAR'], timeout=10)
+    Hazardous commands are not prompted for like they are by cmd. The HazardousError
+    is raised and the commands after it are not sent."""
+    no_range = not range_check
+    no_hazardous = not hazardous_check
+    if openc3.script.DISCONNECT:
+        for args in commands:
+            if isinstance(args, dict):
+                args = args["command"]
+            if isinstance(args, str):
+                args = [args]
+            _cmd_disconnect("cmd_many", raw, no_range, no_hazardous, *args, scope=scope)
+    else:
+        sent = openc3.script.API_SERVER.cmd_many(
+            commands,
+            raw=raw,
+            range_check=range_check,
+            hazardous_check=hazardous_check,
+            log_message=log_message,
+            scope=scope,
+            **kwargs,
+        )
+        if log_message is None or log_message:
+            for command in sent:
+                _log_cmd(command, raw, no_range, no_hazardous)
+
+
 def build_cmd(*args, **kwargs):
     """Builds a command binary
     Accepts two different calling styles:
@@ -16,6 +16,8 @@ import sys
 import time
 from datetime import datetime
 
+import numpy
+
 from openc3.environment import OPENC3_SCOPE
 from openc3.script.exceptions import StopScriptError
 from openc3.streams.web_socket_client_stream import WebSocketClientStream
@@ -494,17 +496,16 @@ class StreamingWebSocketApi(CmdTlmWebSocketApi):
         self.write_action(data_hash)
 
     @classmethod
-    def read_all(cls, items=None, packets=None, start_time=None, end_time=None, scope=None, timeout=None):
+    def read_batches(cls, items=None, packets=None, start_time=None, end_time=None, scope=None, timeout=None):
         """
-        Convenience method to read all data until end marker is received.
+        Generator which yields each batch (a list of dicts) as it arrives until
+        the end marker is received. Only one batch is held in RAM at a time.
 
         Omitting end_time streams realtime and endlessly: no end marker is ever
-        sent, so a timeout is the only way the collection ends on its own.
-
-        Warning: DATA IS STORED IN RAM. Do not use this with large queries
+        sent, so a timeout (or stopping iteration) is the only way it ends.
+        The websocket is disconnected when the generator finishes or is closed.
         """
         read_all_start_time = time.time()
-        data = []
         with cls() as api:
             api.add(
                 items=items,
@@ -527,7 +528,137 @@ class StreamingWebSocketApi(CmdTlmWebSocketApi):
                 # historical query is complete.
                 if len(batch) == 0:
                     break
-                data += batch
+                yield batch
                 if timeout is not None and (time.time() - read_all_start_time) > timeout:
                     break
+
+    @classmethod
+    def read_all(cls, items=None, packets=None, start_time=None, end_time=None, scope=None, timeout=None):
+        """
+        Convenience method to read all data until end marker is received.
+
+        Omitting end_time streams realtime and endlessly: no end marker is ever
+        sent, so a timeout is the only way the collection ends on its own.
+
+        Warning: DATA IS STORED IN RAM. Do not use this with large queries.
+        Use read_batches or read_columns instead.
+        """
+        data = []
+        for batch in cls.read_batches(items, packets, start_time, end_time, scope, timeout):
+            data += batch
+        return data
+
+    @classmethod
+    def read_columns(cls, items, start_time=None, end_time=None, scope=None, timeout=None, dtypes=None, dataframe=True):
+        """
+        Read all item data until end marker is received and store it by column.
+        Each batch is converted to typed NumPy arrays as it arrives which takes a
+        fraction of the RAM of read_all's list of dicts.
+
+        Args:
+            items: Same as add. Columns are named by the item_key if given, else the item key
+            dtypes: Optional dict of column name to NumPy dtype. Other columns use
+                the item's data type from the target definition.
+            dataframe: Return a pandas DataFrame indexed by __time if pandas is installed
+
+        Returns:
+            pandas DataFrame or dict of column name to NumPy array. The __time column
+            holds int64 nanoseconds from the unix epoch. Rows from packets which do not
+            contain an item hold NaN (or None for object columns) in its column.
+        """
+        columns = {"__time": numpy.int64}
+        for item in items:
+            key, item_key = (item, item) if isinstance(item, str) else (item[0], item[-1])
+            columns[item_key] = _item_dtype(key, scope or OPENC3_SCOPE)
+        if dtypes:
+            columns.update(dtypes)
+
+        chunks = {name: [] for name in columns}
+        for batch in cls.read_batches(items, None, start_time, end_time, scope, timeout):
+            for name, dtype in columns.items():
+                chunks[name].append(_column_chunk([row.get(name) for row in batch], dtype))
+        data = {}
+        for name, dtype in columns.items():
+            if chunks[name]:
+                data[name] = numpy.concatenate(chunks[name])
+            else:
+                data[name] = numpy.empty(0, dtype=dtype)
+
+        if dataframe:
+            try:
+                import pandas
+            except ImportError:
+                return data
+            return pandas.DataFrame(data).set_index("__time")
         return data
+
+
+def _item_dtype(key, scope):
+    """NumPy dtype for a streamed item key (MODE__CMDORTLM__TARGET__PACKET__ITEM__VALUETYPE__REDUCEDTYPE)
+    based on the item definition in the target model. None lets NumPy infer it."""
+    import openc3.script
+
+    parts = key.split("__")
+    if len(parts) < 6:
+        return None
+    cmd_or_tlm, target_name, packet_name, item_name, value_type = parts[1:6]
+    reduced_type = parts[6] if len(parts) > 6 else None
+    if reduced_type in ("AVG", "STDDEV"):
+        return numpy.float64
+    if value_type == "FORMATTED":
+        return object
+    try:
+        if cmd_or_tlm == "CMD":
+            item = openc3.script.API_SERVER.get_param(target_name, packet_name, item_name, scope=scope)
+        else:
+            item = openc3.script.API_SERVER.get_item(target_name, packet_name, item_name, scope=scope)
+    except Exception:
+        # Items such as LATEST packet items can't be looked up so their type is inferred
+        return None
+
+    data_type = item.get("data_type")
+    bit_size = item.get("bit_size")
+    array_size = item.get("array_size")
+    if value_type == "CONVERTED":
+        if item.get("states"):
+            return object
+        conversion = item.get("read_conversion") or item.get("write_conversion")
+        if conversion:
+            data_type = conversion.get("converted_type")
+            bit_size = conversion.get("converted_bit_size")
+            array_size = conversion.get("converted_array_size")
+    if array_size is not None:
+        return object
+    match data_type:
+        case "FLOAT":
+            return numpy.float32 if bit_size == 32 else numpy.float64
+        case "INT" | "UINT":
+            if not bit_size or bit_size <= 0:
+                return numpy.float64
+            # Round bit fields up to the next native integer size
+            size = next((size for size in (8, 16, 32, 64) if bit_size <= size), 64)
+            return numpy.dtype(f"{'u' if data_type == 'UINT' else 'i'}{size // 8}")
+        case None:
+            return None
+        case _:
+            return object
+
+
+def _column_chunk(values, dtype):
+    """Convert one batch of column values to a NumPy array"""
+    kind = numpy.dtype(dtype).kind if dtype is not None else None
+    if kind == "O":
+        chunk = numpy.empty(len(values), dtype=object)
+        chunk[:] = values
+        return chunk
+    if kind in ("i", "u") and None in values:
+        # Integers can't hold missing values so this chunk becomes float with NaN
+        dtype = numpy.float64
+        kind = "f"
+    if kind == "f":
+        values = [numpy.nan if value is None else value for value in values]
+    try:
+        return numpy.array(values, dtype=dtype)
+    except (TypeError, ValueError, OverflowError):
+        # Values which don't fit the definition, e.g. strings like "Infinity"
+        return _column_chunk(values, object)
@@ -19,10 +19,11 @@ import zipfile
 from threading import Lock
 
 from openc3.config.config_parser import ConfigParser
-from openc3.environment import OPENC3_CONFIG_BUCKET, OPENC3_SCOPE
+from openc3.environment import OPENC3_CONFIG_BUCKET, OPENC3_PACKET_DEFINITIONS_DIR, OPENC3_SCOPE
 from openc3.packets.commands import Commands
 from openc3.packets.limits import Limits
 from openc3.packets.packet_config import PacketConfig
+from openc3.packets.packet_definitions import PacketDefinitions
 from openc3.packets.telemetry import Telemetry
 from openc3.system.target import Target
 from openc3.top_level import add_to_search_path
@@ -233,7 +234,9 @@ class System(metaclass=SystemMeta):
     #
     # @param target_names [Array of target names]
     # @param target_config_dir Directory where target config folders are
-    def __init__(self, target_names, target_config_dir):
+    # @param packet_definitions_dir Directory to share the packet definitions
+    #   through (see share_packet_definitions). Defaults to OPENC3_PACKET_DEFINITIONS_DIR.
+    def __init__(self, target_names, target_config_dir, packet_definitions_dir=OPENC3_PACKET_DEFINITIONS_DIR):
         # Find all the base gem lib directories and add them to the search path
         # Ruby handles this because the gem is installed so lib is in the path
         for path in glob.glob("/gems/gems/**/lib"):
@@ -241,14 +244,47 @@ class System(metaclass=SystemMeta):
         if target_config_dir:
             add_to_search_path(target_config_dir, True)
         self.targets = {}
-        self.packet_config = PacketConfig()
+        self.set_packet_config(PacketConfig())
+        for target_name in target_names:
+            self.add_target(target_name, target_config_dir, process_cmd_tlm=not packet_definitions_dir)
+        if packet_definitions_dir:
+            self.share_packet_definitions(packet_definitions_dir)
+
+    def set_packet_config(self, packet_config):
+        self.packet_config = packet_config
         self.commands = Commands(self.packet_config, self)
         self.telemetry = Telemetry(self.packet_config, self)
         self.limits = Limits(self.packet_config, self)
-        for target_name in target_names:
-            self.add_target(target_name, target_config_dir)
 
-    def add_target(self, target_name, target_config_dir):
+    # Load the packets from the PacketDefinitions file for these targets in
+    # directory so every process on the host with the same targets shares its
+    # memory mapped pages. The first process processes the cmd_tlm files and
+    # writes the file. Only trusted processes may write to directory because
+    # the file holds pickled packets.
+    #
+    # @param directory [String] Directory which holds the definition files
+    def share_packet_definitions(self, directory):
+        filename = PacketDefinitions.shared_filename(self.targets.values(), directory)
+        definitions = None
+        if os.path.exists(filename):
+            try:
+                definitions = PacketDefinitions.load(filename)
+            except Exception as error:
+                Logger.warn(f"Unable to load packet definitions {filename}: {repr(error)}")
+        if definitions is None:
+            for target in self.targets.values():
+                self.process_cmd_tlm(target)
+            try:
+                PacketDefinitions.write(self.packet_config, filename)
+                PacketDefinitions.remove_stale(filename)
+                definitions = PacketDefinitions.load(filename)
+            except Exception as error:
+                # Keep the packets this process just processed
+                Logger.warn(f"Unable to share packet definitions {filename}: {repr(error)}")
+                return
+        self.set_packet_config(PacketConfig.from_definitions(definitions))
+
+    def add_target(self, target_name, target_config_dir, process_cmd_tlm=True):
         parser = ConfigParser()
         folder_name = f"{target_config_dir}/{target_name}"
         if not os.path.exists(folder_name):
@@ -256,12 +292,16 @@ class System(metaclass=SystemMeta):
 
         target = Target(target_name, target_config_dir)
         self.targets[target.name] = target
+        if process_cmd_tlm:
+            self.process_cmd_tlm(target)
+
+    def process_cmd_tlm(self, target):
         errors = []  # Store all errors processing the cmd_tlm files
         try:
             for cmd_tlm_file in target.cmd_tlm_files:
                 self.packet_config.process_file(cmd_tlm_file, target.name)
         except Exception as error:
             trace = "".join(traceback.TracebackException.from_exception(error).format())
-            errors.append(f"Error processing {target_name}:\n{trace}")
+            errors.append(f"Error processing {target.name}:\n{trace}")
         if len(errors) != 0:
             raise Exception("\n".join(errors))
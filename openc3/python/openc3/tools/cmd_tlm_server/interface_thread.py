@@ -155,7 +155,7 @@ class InterfaceThread:
                     try:
                         # Preidentified packet - place it into the current value table
                         identified_packet = System.telemetry.update(
-                            packet.target_name, packet.packet_name, packet.buffer
+                            packet.target_name, packet.packet_name, packet.buffer_view()
                         )
                     except RuntimeError:
                         # Packet identified but we don't know about it
@@ -163,10 +163,12 @@ class InterfaceThread:
                         Logger.warn(f"Received unknown identified telemetry: {packet.target_name} {packet.packet_name}")
                         packet.target_name = None
                         packet.packet_name = None
-                        identified_packet = System.telemetry.identify(packet.buffer, self.interface.tlm_target_names)
+                        identified_packet = System.telemetry.identify(
+                            packet.buffer_view(), self.interface.tlm_target_names
+                        )
                 else:
                     # Packet needs to be identified
-                    identified_packet = System.telemetry.identify(packet.buffer, self.interface.tlm_target_names)
+                    identified_packet = System.telemetry.identify(packet.buffer_view(), self.interface.tlm_target_names)
 
             if identified_packet:
                 identified_packet.received_time = packet.received_time
@@ -175,7 +177,7 @@ class InterfaceThread:
                 packet = identified_packet
             else:
                 # Create unknown packet
-                unknown_packet = System.telemetry.update("UNKNOWN", "UNKNOWN", packet.buffer)
+                unknown_packet = System.telemetry.update("UNKNOWN", "UNKNOWN", packet.buffer_view())
                 unknown_packet.received_time = packet.received_time
                 unknown_packet.stored = packet.stored
                 unknown_packet.extra = packet.extra
@@ -185,7 +187,7 @@ class InterfaceThread:
                 data_length = packet.length
                 string = f"{self.interface.name} - Unknown {data_length} byte packet starting: "
                 num_bytes_to_print = min(self.UNKNOWN_BYTES_TO_PRINT, data_length)
-                data_to_print = packet.buffer[:num_bytes_to_print]
+                data_to_print = packet.buffer_view()[:num_bytes_to_print]
                 for byte in data_to_print:
                     string += f"{byte:02X}"
                 Logger.error(string)
@@ -18,6 +18,8 @@ class TableItem(PacketItem):
     and hidden. All other functionality is inherited from PacketItem.
     """
 
+    __slots__ = ("display_type", "_editable", "_hidden")
+
     def __init__(
         self,
         name,
@@ -9,6 +9,7 @@
 # This file may also be used under the terms of a commercial license
 # if purchased from OpenC3, Inc.
 
+import struct
 from io import StringIO
 
 from openc3.tools.table_manager.table_config import TableConfig
@@ -20,6 +21,20 @@ class TableManagerCore:
     Provides the low level Table Manager methods which do not require a GUI.
     """
 
+    # struct format characters for whole byte items keyed by [data_type, bit_size]
+    STRUCT_FORMATS = {
+        ("INT", 8): "b",
+        ("INT", 16): "h",
+        ("INT", 32): "i",
+        ("INT", 64): "q",
+        ("UINT", 8): "B",
+        ("UINT", 16): "H",
+        ("UINT", 32): "I",
+        ("UINT", 64): "Q",
+        ("FLOAT", 32): "f",
+        ("FLOAT", 64): "d",
+    }
+
     class CoreError(Exception):
         """Generic error raised when a more specific error doesn't work"""
 
@@ -170,13 +185,16 @@ class TableManagerCore:
         return binary
 
     @classmethod
-    def build_json_hash(cls, binary, definition_filename):
+    def build_json_hash(cls, binary, definition_filename, row_offset=0, row_count=None):
         """
         Build JSON hash for the frontend to consume
 
         Args:
             binary: Binary data containing the table(s)
             definition_filename: Table definition filename
+            row_offset: First row of each table to return
+            row_count: Number of rows of each table to return or None for all rows.
+                Paged results are for viewing, save requires every row.
 
         Returns:
             Hash that can be converted to JSON
@@ -199,56 +217,127 @@ class TableManagerCore:
                     "rows": [],
                 }
             )
+            if row_offset or row_count is not None:
+                tables[-1]["rowOffset"] = row_offset
 
-            col = 0
-            row = 0
-            for item in table.sorted_items:
-                if item.hidden:
-                    continue
-
-                if table.num_columns == 1:
-                    if row == 0:
-                        tables[-1]["headers"] = ["INDEX", "NAME", "VALUE"]
-
-                    tables[-1]["rows"].append(
-                        [
-                            {
-                                "index": row + 1,
-                                "name": item.name,
-                                "value": table.read(item.name, "FORMATTED"),
-                                "states": item.states,
-                                "editable": item.editable,
-                            },
-                        ]
-                    )
-                else:
-                    if row == 0 and col == 0:
-                        tables[-1]["headers"].append("INDEX")
-
-                    if row == 0:
-                        tables[-1]["headers"].append(item.name[0:-1])
-
-                    if col == 0:
-                        # Each row is an array of items
-                        tables[-1]["rows"].append([])
-
-                    tables[-1]["rows"][row].append(
-                        {
-                            "index": row + 1,
-                            "name": item.name,
-                            "value": table.read(item.name, "FORMATTED"),
-                            "states": item.states,
-                            "editable": item.editable,
-                        }
-                    )
-
-                col += 1
-                if col == table.num_columns:
-                    col = 0
-                    row += 1
+            items = [item for item in table.sorted_items if not item.hidden]
+            if not items:
+                continue
+            # Items are laid out row by row so item N is in row N // columns
+            columns = max(table.num_columns, 1)
+            if table.num_columns == 1:
+                tables[-1]["headers"] = ["INDEX", "NAME", "VALUE"]
+            else:
+                tables[-1]["headers"] = ["INDEX"] + [item.name[0:-1] for item in items[0:columns]]
+
+            first = row_offset * columns
+            last = None if row_count is None else (row_offset + row_count) * columns
+            page_items = items[first:last]
+            values = cls.formatted_values(table, page_items, row_offset, row_count)
+            row = None
+            for index, item in enumerate(page_items):
+                if index % columns == 0:
+                    # Each row is an array of items
+                    row = []
+                    tables[-1]["rows"].append(row)
+                row.append(
+                    {
+                        "index": row_offset + (index // columns) + 1,
+                        "name": item.name,
+                        "value": values[index],
+                        "states": item.states,
+                        "editable": item.editable,
+                    }
+                )
 
         return json_hash
 
+    @classmethod
+    def formatted_values(cls, table, items, row_offset=0, row_count=None):
+        """
+        Read the FORMATTED values of many table items at once. The RAW values
+        are read in a single pass over the table buffer and only items with
+        conversions, states or array values go through the full read path.
+
+        Args:
+            table: Table containing the items
+            items: List of table items to read
+            row_offset: First row of the table the items are in
+            row_count: Number of rows the items are in or None for the rest of the table
+
+        Returns:
+            List of formatted values in the same order as items
+        """
+        raw_values = cls.unpack_rows(table, row_offset, row_count)
+        # Hidden items shift which table rows the items come from so make sure all were unpacked
+        if raw_values is None or not all(item.name in raw_values for item in items):
+            raw_values = table.read_items(items, "RAW")
+        values = []
+        for item in items:
+            value = raw_values[item.name]
+            if item.read_conversion or item.states or item.data_type == "DERIVED" or isinstance(value, list):
+                values.append(table.read_item(item, "FORMATTED", given_raw=value))
+            else:
+                values.append(table.apply_format_string_and_units(item, value, "FORMATTED"))
+        return values
+
+    @classmethod
+    def unpack_rows(cls, table, row_offset=0, row_count=None):
+        """
+        Read the RAW values of a ROW_COLUMN table by unpacking every row with the
+        same struct format. Only possible if the items in a row are byte aligned
+        whole byte integers and floats of the same endianness.
+
+        Args:
+            table: Table to read
+            row_offset: First row to read
+            row_count: Number of rows to read or None for the rest of the table
+
+        Returns:
+            Hash of item names and RAW values or None if the rows can't be unpacked
+        """
+        columns = table.num_columns
+        if table.type != "ROW_COLUMN" or columns < 1 or len(table.sorted_items) != columns * table.num_rows:
+            return None
+        row_items = table.sorted_items[0:columns]
+        endianness = row_items[0].endianness
+        row_bit_offset = row_items[0].bit_offset
+        if row_bit_offset % 8 != 0:
+            return None
+        row_format = ">" if endianness == "BIG_ENDIAN" else "<"
+        position = row_bit_offset
+        for item in row_items:
+            format = cls.STRUCT_FORMATS.get((item.data_type, item.bit_size))
+            if (
+                format is None
+                or item.endianness != endianness
+                or item.array_size is not None
+                or item.bit_offset < position
+                or item.bit_offset % 8 != 0
+            ):
+                return None
+            row_format += "x" * ((item.bit_offset - position) // 8) + format
+            position = item.bit_offset + item.bit_size
+        row_struct = struct.Struct(row_format)
+        row_size = row_struct.size
+        if table.num_rows > 1 and table.sorted_items[columns].bit_offset - row_bit_offset != row_size * 8:
+            return None
+
+        first_row = min(row_offset, table.num_rows)
+        last_row = table.num_rows if row_count is None else min(row_offset + row_count, table.num_rows)
+        start = row_bit_offset // 8 + first_row * row_size
+        buffer = table.buffer_view()[start : start + (last_row - first_row) * row_size]
+        if len(buffer) != (last_row - first_row) * row_size:
+            return None
+        values = {}
+        items = table.sorted_items[first_row * columns : last_row * columns]
+        index = 0
+        for row_values in row_struct.iter_unpack(buffer):
+            for value in row_values:
+                values[items[index].name] = value
+                index += 1
+        return values
+
     @classmethod
     def load_binary(cls, config, data):
         """
@@ -0,0 +1,136 @@
+# Copyright 2026 OpenC3, Inc.
+# All Rights Reserved.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See LICENSE.md for more details.
+#
+# This file may also be used under the terms of a commercial license
+# if purchased from OpenC3, Inc.
+
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+from openc3.utilities.logger import Logger
+from openc3.utilities.store import EphemeralStore
+
+
+class AckDispatcher:
+    """Demultiplexes an ACKCMD topic to the threads waiting on it.
+
+    Each process has one dispatcher per ack topic. A single background thread reads
+    the topic and resolves the Future registered for each message id so senders
+    never read each other's acks and can have many messages in flight. The thread
+    only runs while acks are pending and continues from the last offset it read.
+    """
+
+    # Milliseconds to block reading the ack topic
+    READ_TIMEOUT_MS = 100
+    # Maximum number of acks kept which arrived before their sender registered
+    UNCLAIMED_LIMIT = 1000
+
+    instances = {}
+    instance_mutex = threading.Lock()
+
+    @classmethod
+    def instance(cls, ack_topic, db_shard=0):
+        """Get the dispatcher for an ack topic. This must be called before writing
+        the message to be acknowledged so the ack is not missed."""
+        store = EphemeralStore.instance(db_shard=db_shard)
+        with cls.instance_mutex:
+            dispatcher = cls.instances.get((ack_topic, db_shard))
+            # The store is replaced when the connection is reset
+            if dispatcher is None or dispatcher.store is not store:
+                dispatcher = cls(ack_topic, store)
+                cls.instances[(ack_topic, db_shard)] = dispatcher
+            return dispatcher
+
+    def __init__(self, ack_topic, store):
+        self.ack_topic = ack_topic
+        self.store = store
+        # Only acks written after the dispatcher is created are read
+        self.offset = store.get_last_offset(ack_topic)
+        self.pending = {}
+        self.unclaimed = OrderedDict()
+        self.mutex = threading.Lock()
+        self.thread = None
+
+    def register(self, msg_id):
+        """Get a Future which resolves to the ack msg_hash for the given message id
+
+        Args:
+            msg_id: Id returned by Topic.write_topic for the message being acknowledged
+        """
+        msg_id = self._normalize(msg_id)
+        future = Future()
+        with self.mutex:
+            msg_hash = self.unclaimed.pop(msg_id, None)
+            if msg_hash is not None:
+                future.set_result(msg_hash)
+                return future
+            self.pending[msg_id] = future
+            if self.thread is None:
+                self.thread = threading.Thread(target=self._run, daemon=True)
+                self.thread.start()
+        return future
+
+    def wait(self, msg_id, future, timeout):
+        """Wait for a registered ack
+
+        Returns:
+            The ack msg_hash or None if the timeout expired
+        """
+        try:
+            return future.result(timeout=max(timeout, 0))
+        except FutureTimeoutError:
+            self.discard(msg_id)
+            return None
+
+    def discard(self, msg_id):
+        """Stop waiting for an ack which is no longer needed"""
+        with self.mutex:
+            self.pending.pop(self._normalize(msg_id), None)
+
+    def _normalize(self, msg_id):
+        if isinstance(msg_id, bytes):
+            return msg_id.decode()
+        return msg_id
+
+    def _run(self):
+        try:
+            while True:
+                for _topic, msg_id, msg_hash, _redis in self.store.read_topics(
+                    [self.ack_topic], [self.offset], self.READ_TIMEOUT_MS
+                ):
+                    self.offset = msg_id
+                    self._dispatch(msg_hash)
+                with self.mutex:
+                    if not self.pending:
+                        self.thread = None
+                        return
+        except Exception as error:
+            Logger.error(f"AckDispatcher for {self.ack_topic} failed: {repr(error)}")
+            with self.mutex:
+                pending = self.pending
+                self.pending = {}
+                self.thread = None
+            for future in pending.values():
+                future.set_exception(error)
+
+    def _dispatch(self, msg_hash):
+        msg_id = msg_hash.get(b"id")
+        if msg_id is None:
+            return
+        msg_id = self._normalize(msg_id)
+        with self.mutex:
+            future = self.pending.pop(msg_id, None)
+            if future is None:
+                # The sender may not have registered yet
+                self.unclaimed[msg_id] = msg_hash
+                if len(self.unclaimed) > self.UNCLAIMED_LIMIT:
+                    self.unclaimed.popitem(last=False)
+                return
+        future.set_result(msg_hash)
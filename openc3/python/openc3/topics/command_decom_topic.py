@@ -54,9 +54,9 @@ class CommandDecomTopic(Topic):
                 if item.write_conversion and not item.states and given_values and item.name in given_values:
                     json_hash[item.name + "__C"] = given_values[item.name]
                 else:
-                    json_hash[item.name + "__C"] = packet.read_item(item, "CONVERTED", packet.buffer, given_raw)
+                    json_hash[item.name + "__C"] = packet.read_item(item, "CONVERTED", packet.buffer_view(), given_raw)
             if item.format_string:
-                json_hash[item.name + "__F"] = packet.read_item(item, "FORMATTED", packet.buffer, given_raw)
+                json_hash[item.name + "__F"] = packet.read_item(item, "FORMATTED", packet.buffer_view(), given_raw)
         msg_hash["json_data"] = json.dumps(json_hash, cls=JsonEncoder)
         if packet.extra:
             msg_hash["extra"] = json.dumps(packet.extra, cls=JsonEncoder)
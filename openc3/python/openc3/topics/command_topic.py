@@ -13,6 +13,7 @@ import json
 import time
 
 from openc3.top_level import CriticalCmdError, HazardousError
+from openc3.topics.ack_dispatcher import AckDispatcher
 from openc3.topics.topic import Topic
 from openc3.utilities.json import JsonEncoder
 from openc3.utilities.store import Store
@@ -22,6 +23,9 @@ from openc3.utilities.time import to_nsec_from_epoch
 
 class CommandTopic(Topic):
     COMMAND_ACK_TIMEOUT_S = 30
+    # Commands sent before waiting for an ack. This must be well under the ack
+    # topic length (100) or acks could be trimmed before they are read.
+    MAX_IN_FLIGHT = 50
 
     @classmethod
     def write_packet(cls, packet, scope):
@@ -33,7 +37,7 @@ class CommandTopic(Topic):
             "packet_name": packet.packet_name,
             "received_count": packet.received_count,
             "stored": str(packet.stored),
-            "buffer": bytes(packet.buffer_no_copy()),
+            "buffer": bytes(packet.buffer_view()),
         }
         if packet.extra:
             msg_hash["extra"] = json.dumps(packet.extra)
@@ -50,30 +54,97 @@ class CommandTopic(Topic):
             scope: COSMOS scope
             obfuscated_items: List of obfuscated items
         """
-        if obfuscated_items is None:
-            obfuscated_items = []
-        if timeout is None:
-            timeout = cls.COMMAND_ACK_TIMEOUT_S
+        return cls.send_commands([command], timeout, scope)[0]
+
+    @classmethod
+    def send_commands(cls, commands, timeout, scope, isolate=None):
+        """Send many commands and then wait for all of their acks. The commands are
+        pipelined so the total time is about one round trip rather than one per command.
+
+        Args:
+            commands: List of command hash structures to be written to a topic
+            timeout: Timeout in seconds for each ack after its command is sent, or a list with the
+                timeout of each command. Set to 0 or negative for fire-and-forget mode.
+            scope: COSMOS scope
+            isolate: List with True for each command which is not pipelined, e.g. a possibly
+                hazardous command. Every earlier ack is checked before it is sent and its own
+                ack is checked before any later command is sent.
+
+        Raises the error for the first command (in order) whose ack is not SUCCESS.
+        Up to MAX_IN_FLIGHT commands after it have already been sent unless it was isolated.
+        """
+        if isinstance(timeout, (list, tuple)):
+            timeouts = timeout
+        else:
+            timeouts = [timeout] * len(commands)
+        if isolate is None:
+            isolate = [False] * len(commands)
+
+        acks = []
+        checked = 0  # The acks before this index have been checked
+        try:
+            for index, (command, timeout, isolated) in enumerate(zip(commands, timeouts, isolate, strict=True)):
+                if timeout is None:
+                    timeout = cls.COMMAND_ACK_TIMEOUT_S
+                # Wait for the oldest ack before it can be trimmed from the ack topic
+                # or for every ack if the command is isolated
+                while checked < index and (isolated or index - checked >= cls.MAX_IN_FLIGHT):
+                    cls._check_ack(commands[checked], acks[checked])
+                    checked += 1
+                # Fire-and-forget mode: skip ACK waiting when timeout <= 0
+                if timeout <= 0:
+                    cls._write_command(command, scope)
+                    acks.append(None)
+                    continue
+                db_shard = Store.db_shard_for_target(command["target_name"], scope=scope)
+                # Get the dispatcher before writing so the ack can't be missed
+                dispatcher = AckDispatcher.instance(
+                    f"{{{scope}__ACKCMD}}TARGET__{command['target_name']}", db_shard=db_shard
+                )
+                cmd_id = cls._write_command(command, scope)
+                acks.append((dispatcher, cmd_id, dispatcher.register(cmd_id), time.time() + timeout, timeout))
+                if isolated:
+                    cls._check_ack(command, acks[index])
+                    checked += 1
+
+            for command, ack in zip(commands[checked:], acks[checked:], strict=True):
+                cls._check_ack(command, ack)
+        finally:
+            for ack in acks:
+                if ack is not None:
+                    ack[0].discard(ack[1])
+        return commands
+
+    ###########################################################################
+    # PRIVATE implementation details
+    ###########################################################################
+
+    @classmethod
+    def _check_ack(cls, command, ack):
+        # Fire-and-forget commands have no ack to check
+        if ack is None:
+            return
+        dispatcher, cmd_id, future, end_time, timeout = ack
+        msg_hash = dispatcher.wait(cmd_id, future, end_time - time.time())
+        if msg_hash is None:
+            raise RuntimeError(f"Timeout of {timeout}s waiting for cmd ack")
+        result = msg_hash[b"result"].decode()
+        if result == "SUCCESS":
+            return
+        # Check for HazardousError which is a special case
+        elif "HazardousError" in result:
+            cls.raise_hazardous_error(msg_hash, command)
+        elif "CriticalCmdError" in result:
+            cls.raise_critical_cmd_error(msg_hash, command)
+        else:
+            raise RuntimeError(result)
+
+    @classmethod
+    def _write_command(cls, command, scope):
         # Save the existing cmd_params Hash and JSON generate before writing to the topic
         cmd_params = command["cmd_params"]
         command["cmd_params"] = json.dumps(command["cmd_params"], cls=JsonEncoder)
-
         db_shard = Store.db_shard_for_target(command["target_name"], scope=scope)
-
-        # Fire-and-forget mode: skip ACK waiting when timeout <= 0
-        if timeout <= 0:
-            Topic.write_topic(
-                f"{{{scope}__CMD}}TARGET__{command['target_name']}",
-                command,
-                "*",
-                100,
-                db_shard=db_shard,
-            )
-            command["cmd_params"] = cmd_params  # Restore the original cmd_params dict
-            return command
-
-        ack_topic = f"{{{scope}__ACKCMD}}TARGET__{command['target_name']}"
-        Topic.update_topic_offsets([ack_topic], db_shard=db_shard)
         cmd_id = Topic.write_topic(
             f"{{{scope}__CMD}}TARGET__{command['target_name']}",
             command,
@@ -82,25 +153,7 @@ class CommandTopic(Topic):
             db_shard=db_shard,
         )
         command["cmd_params"] = cmd_params  # Restore the original cmd_params dict
-        start_time = time.time()
-        while (time.time() - start_time) < timeout:
-            for _, _, msg_hash, _ in Topic.read_topics([ack_topic], db_shard=db_shard):
-                if msg_hash[b"id"] == cmd_id:
-                    result = msg_hash[b"result"].decode()
-                    if result == "SUCCESS":
-                        return command
-                    # Check for HazardousError which is a special case
-                    elif "HazardousError" in result:
-                        cls.raise_hazardous_error(msg_hash, command)
-                    elif "CriticalCmdError" in result:
-                        cls.raise_critical_cmd_error(msg_hash, command)
-                    else:
-                        raise RuntimeError(result)
-        raise RuntimeError(f"Timeout of {timeout}s waiting for cmd ack")
-
-    ###########################################################################
-    # PRIVATE implementation details
-    ###########################################################################
+        return cmd_id
 
     @classmethod
     def raise_hazardous_error(cls, msg_hash, command):
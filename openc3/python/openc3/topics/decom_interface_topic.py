@@ -10,10 +10,10 @@
 # if purchased from OpenC3, Inc.
 
 import json
-import time
 
 from openc3.config.config_parser import ConfigParser
 from openc3.environment import OPENC3_SCOPE
+from openc3.topics.ack_dispatcher import AckDispatcher
 from openc3.topics.topic import Topic
 from openc3.utilities.json import JsonDecoder, JsonEncoder
 from openc3.utilities.store import Store
@@ -40,27 +40,14 @@ class DecomInterfaceTopic(Topic):
         # DecomMicroservice is listening to the DECOMINTERFACE topic and is responsible
         # for actually building the command. This was deliberate to allow this to work
         # with or without an interface.
-        db_shard = Store.db_shard_for_target(target_name, scope=scope)
-        ack_topic = f"{{{scope}__ACKCMD}}TARGET__{target_name}"
-        Topic.update_topic_offsets([ack_topic], db_shard=db_shard)
-        decom_id = Topic.write_topic(
-            f"{scope}__DECOMINTERFACE__{{{target_name}}}",
-            {"build_cmd": json.dumps(data, cls=JsonEncoder)},
-            "*",
-            100,
-            db_shard=db_shard,
+        msg_hash = cls._write_and_wait_for_ack(
+            target_name, {"build_cmd": json.dumps(data, cls=JsonEncoder)}, timeout, scope
         )
-        start_time = time.time()
-        while (time.time() - start_time) < timeout:
-            for _topic, _msg_id, msg_hash, _redis in Topic.read_topics([ack_topic], db_shard=db_shard):
-                if msg_hash[b"id"] == decom_id:
-                    if msg_hash[b"result"] == b"SUCCESS":
-                        msg_hash = {k.decode(): v.decode() for (k, v) in msg_hash.items()}
-                        msg_hash["buffer"] = json.loads(msg_hash["buffer"], cls=JsonDecoder)
-                        return msg_hash
-                    else:
-                        raise RuntimeError(msg_hash[b"result"].decode())
-        raise RuntimeError(f"Timeout of {timeout}s waiting for cmd ack. Does target '{target_name}' exist?")
+        if msg_hash is None:
+            raise RuntimeError(f"Timeout of {timeout}s waiting for cmd ack. Does target '{target_name}' exist?")
+        msg_hash = {k.decode(): v.decode() for (k, v) in msg_hash.items()}
+        msg_hash["buffer"] = json.loads(msg_hash["buffer"], cls=JsonDecoder)
+        return msg_hash
 
     @classmethod
     def inject_tlm(
@@ -79,29 +66,12 @@ class DecomInterfaceTopic(Topic):
         data["packet_name"] = packet_name.upper()
         data["item_hash"] = item_hash
         data["type"] = type
-
-        db_shard = Store.db_shard_for_target(target_name, scope=scope)
         data["stored"] = stored
         if received_time is not None:
             data["received_time"] = received_time
-        ack_topic = f"{{{scope}__ACKCMD}}TARGET__{target_name}"
-        Topic.update_topic_offsets([ack_topic], db_shard=db_shard)
-        decom_id = Topic.write_topic(
-            f"{scope}__DECOMINTERFACE__{{{target_name}}}",
-            {"inject_tlm": json.dumps(data)},
-            "*",
-            100,
-            db_shard=db_shard,
-        )
-        start_time = time.time()
-        while (time.time() - start_time) < timeout:
-            for _topic, _msg_id, msg_hash, _redis in Topic.read_topics([ack_topic]):
-                if msg_hash[b"id"] == decom_id:
-                    if msg_hash[b"result"] == b"SUCCESS":
-                        return
-                    else:
-                        raise RuntimeError(msg_hash[b"result"].decode())
-        raise RuntimeError(f"Timeout of {timeout}s waiting for cmd ack. Does target '{target_name}' exist?")
+        msg_hash = cls._write_and_wait_for_ack(target_name, {"inject_tlm": json.dumps(data)}, timeout, scope)
+        if msg_hash is None:
+            raise RuntimeError(f"Timeout of {timeout}s waiting for cmd ack. Does target '{target_name}' exist?")
 
     @classmethod
     def get_tlm_buffer(cls, target_name, packet_name, timeout=5, scope=OPENC3_SCOPE):
@@ -110,28 +80,33 @@ class DecomInterfaceTopic(Topic):
         data["packet_name"] = packet_name.upper()
         # DecomMicroservice is listening to the DECOMINTERFACE topic and has
         # the most recent decommed packets including subpackets
+        msg_hash = cls._write_and_wait_for_ack(
+            target_name, {"get_tlm_buffer": json.dumps(data, cls=JsonEncoder)}, timeout, scope
+        )
+        if msg_hash is None:
+            raise RuntimeError(f"Timeout of {timeout}s waiting for ack. Does target '{target_name}' exist?")
+        msg_hash = {k.decode(): v.decode() for (k, v) in msg_hash.items()}
+        msg_hash["buffer"] = json.loads(msg_hash["buffer"], cls=JsonDecoder)
+        msg_hash["stored"] = ConfigParser.handle_true_false(msg_hash["stored"])
+        extra = msg_hash.get("extra")
+        if extra is not None:
+            msg_hash["extra"] = json.loads(extra)
+        return msg_hash
+
+    # Write a request to the DecomMicroservice and wait for its ack
+    # Returns the ack msg_hash or None on timeout and raises if the request failed
+    @classmethod
+    def _write_and_wait_for_ack(cls, target_name, request, timeout, scope):
         db_shard = Store.db_shard_for_target(target_name, scope=scope)
-        ack_topic = f"{{{scope}__ACKCMD}}TARGET__{target_name}"
-        Topic.update_topic_offsets([ack_topic], db_shard=db_shard)
+        dispatcher = AckDispatcher.instance(f"{{{scope}__ACKCMD}}TARGET__{target_name}", db_shard=db_shard)
         decom_id = Topic.write_topic(
             f"{scope}__DECOMINTERFACE__{{{target_name}}}",
-            {"get_tlm_buffer": json.dumps(data, cls=JsonEncoder)},
+            request,
             "*",
             100,
             db_shard=db_shard,
         )
-        start_time = time.time()
-        while (time.time() - start_time) < timeout:
-            for _topic, _msg_id, msg_hash, _redis in Topic.read_topics([ack_topic], db_shard=db_shard):
-                if msg_hash[b"id"] == decom_id:
-                    if msg_hash[b"result"] == b"SUCCESS":
-                        msg_hash = {k.decode(): v.decode() for (k, v) in msg_hash.items()}
-                        msg_hash["buffer"] = json.loads(msg_hash["buffer"], cls=JsonDecoder)
-                        msg_hash["stored"] = ConfigParser.handle_true_false(msg_hash["stored"])
-                        extra = msg_hash.get("extra")
-                        if extra is not None:
-                            msg_hash["extra"] = json.loads(extra)
-                        return msg_hash
-                    else:
-                        raise RuntimeError(msg_hash[b"result"].decode())
-        raise RuntimeError(f"Timeout of {timeout}s waiting for ack. Does target '{target_name}' exist?")
+        msg_hash = dispatcher.wait(decom_id, dispatcher.register(decom_id), timeout)
+        if msg_hash is not None and msg_hash[b"result"] != b"SUCCESS":
+            raise RuntimeError(msg_hash[b"result"].decode())
+        return msg_hash
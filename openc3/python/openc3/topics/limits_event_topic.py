@@ -20,11 +20,17 @@ from openc3.utilities.store import Store
 
 # LimitsEventTopic keeps track of not only the <SCOPE>__openc3_limits_events topic
 # but also the ancillary key value stores. The LIMITS_CHANGE event updates the
-# <SCOPE>__current_limits key. The LIMITS_SET event updates the <SCOPE>__limits_sets.
+# <SCOPE>__current_limits key and the <SCOPE>__out_of_limits index which holds only
+# the YELLOW and RED items. The LIMITS_SET event updates the <SCOPE>__limits_sets.
 # The LIMITS_SETTINGS event updates the <SCOPE>__current_limits_settings.
 # While this isn't a clean separation of topics (streams) and models (key-value)
 # it helps maintain consistency as the topic and model are linked.
 class LimitsEventTopic(Topic):
+    OUT_OF_LIMITS_STATES = ("RED", "RED_HIGH", "RED_LOW", "YELLOW", "YELLOW_HIGH", "YELLOW_LOW")
+    # Field always present in the out_of_limits index once it has been built so
+    # an empty index can be told apart from a missing one
+    INDEX_BUILT_FIELD = "__INDEX_BUILT__"
+
     @classmethod
     def _active_db_shards(cls, scope):
         """Collect all unique target db_shards from TargetModel"""
@@ -47,6 +53,10 @@ class LimitsEventTopic(Topic):
                 if not event.get("suppress_stored"):
                     field = f"{event['target_name']}__{event['packet_name']}__{event['item_name']}"
                     Store.hset(f"{scope}__current_limits", field, event["new_limits_state"])
+                    if event["new_limits_state"] in cls.OUT_OF_LIMITS_STATES:
+                        Store.hset(f"{scope}__out_of_limits", field, event["new_limits_state"])
+                    else:
+                        Store.hdel(f"{scope}__out_of_limits", field)
 
             case "LIMITS_SETTINGS":
                 # Limits updated in limits_api.rb to avoid circular reference to TargetModel
@@ -155,22 +165,41 @@ class LimitsEventTopic(Topic):
     @classmethod
     def out_of_limits(cls, scope):
         out_of_limits = []
-        limits = Store.hgetall(f"{scope}__current_limits")
+        limits = Store.hgetall(f"{scope}__out_of_limits")
         # decode the binary string keys to strings
         limits = {k.decode(): v.decode() for (k, v) in limits.items()}
+        # The index may already hold items written by LIMITS_CHANGE events
+        # so only the marker field shows it was built from current_limits
+        if cls.INDEX_BUILT_FIELD not in limits:
+            limits = cls._build_out_of_limits_index(scope)
         for item, limits_state in limits.items():
-            if limits_state in [
-                "RED",
-                "RED_HIGH",
-                "RED_LOW",
-                "YELLOW",
-                "YELLOW_HIGH",
-                "YELLOW_LOW",
-            ]:
-                target_name, packet_name, item_name = item.split("__")
-                out_of_limits.append([target_name, packet_name, item_name, limits_state])
+            if item == cls.INDEX_BUILT_FIELD:
+                continue
+            target_name, packet_name, item_name = item.split("__")
+            out_of_limits.append([target_name, packet_name, item_name, limits_state])
         return out_of_limits
 
+    # Build the out_of_limits index from the full current_limits hash. This only
+    # happens the first time out_of_limits is called for a scope whose index
+    # hasn't been built yet. current_limits is updated by every LIMITS_CHANGE
+    # so it also covers the items already written to the index. current_limits
+    # is watched so a LIMITS_CHANGE written while the index is being built
+    # aborts the transaction and the index is built again from the new states.
+    @classmethod
+    def _build_out_of_limits_index(cls, scope):
+        def build(pipeline):
+            limits = pipeline.hgetall(f"{scope}__current_limits")
+            index = {cls.INDEX_BUILT_FIELD: "true"}
+            for item, limits_state in limits.items():
+                limits_state = limits_state.decode()
+                if limits_state in cls.OUT_OF_LIMITS_STATES:
+                    index[item.decode()] = limits_state
+            pipeline.multi()
+            pipeline.hset(f"{scope}__out_of_limits", mapping=index)
+            return index
+
+        return Store.transaction(build, f"{scope}__current_limits", value_from_callable=True)
+
     # Returns all the limits sets as keys with the value 'true' or 'false'
     # where only the active set is 'true'
     #
@@ -205,6 +234,17 @@ class LimitsEventTopic(Topic):
                 if re.match(rf"^{target_name}__", item):
                     Store.hdel(f"{scope}__current_limits", item)
 
+        limits = Store.hgetall(f"{scope}__out_of_limits")
+        # decode the binary string keys to strings
+        limits = {k.decode(): v for (k, v) in limits.items()}
+        for item, _ in limits.items():
+            if packet_name:
+                if re.match(rf"^{target_name}__{packet_name}__", item):
+                    Store.hdel(f"{scope}__out_of_limits", item)
+            else:
+                if re.match(rf"^{target_name}__", item):
+                    Store.hdel(f"{scope}__out_of_limits", item)
+
         limits_settings = Store.hgetall(f"{scope}__current_limits_settings")
         # decode the binary string keys to strings
         limits_settings = {k.decode(): v for (k, v) in limits_settings.items()}
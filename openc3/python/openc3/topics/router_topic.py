@@ -84,7 +84,7 @@ class RouterTopic(Topic):
                 {
                     "target_name": packet.target_name,
                     "cmd_name": packet.packet_name,
-                    "cmd_buffer": bytes(packet.buffer_no_copy()),
+                    "cmd_buffer": bytes(packet.buffer_view()),
                 },
                 "*",
                 100,
@@ -99,7 +99,7 @@ class RouterTopic(Topic):
                 {
                     "target_name": target_name,
                     "cmd_name": "UNKNOWN",
-                    "cmd_buffer": bytes(packet.buffer_no_copy()),
+                    "cmd_buffer": bytes(packet.buffer_view()),
                 },
                 "*",
                 100,
@@ -14,13 +14,14 @@ import json
 from openc3.models.cvt_model import CvtModel
 from openc3.topics.topic import Topic
 from openc3.utilities.json import JsonEncoder
+from openc3.utilities.pipeline_trace import PipelineTrace
 from openc3.utilities.store import Store
 from openc3.utilities.time import to_nsec_from_epoch
 
 
 class TelemetryDecomTopic(Topic):
     @classmethod
-    def write_packet(cls, packet, id=None, include_limits_states=True, scope=None):
+    def write_packet(cls, packet, id=None, include_limits_states=True, scope=None, trace=None):
         # OpenC3.in_span("write_packet") do
         # Need to build a JSON hash of the decommutated data
         # Support "downward typing"
@@ -44,6 +45,8 @@ class TelemetryDecomTopic(Topic):
         }
         if packet.extra:
             msg_hash["extra"] = json.dumps(packet.extra, cls=JsonEncoder)
+        if trace is not None:
+            msg_hash["trace"] = json.dumps(PipelineTrace.stamp(trace, "decom_end"))
         db_shard = Store.db_shard_for_target(packet.target_name, scope=scope)
         Topic.write_topic(
             f"{scope}__DECOM__{{{packet.target_name}}}__{packet.packet_name}",
@@ -62,3 +65,6 @@ class TelemetryDecomTopic(Topic):
                 packet.packet_name,
                 scope=scope,
             )
+            if trace is not None:
+                # Stamped after the DECOM topic write so it is only seen by the caller
+                PipelineTrace.stamp(trace, "cvt_update")
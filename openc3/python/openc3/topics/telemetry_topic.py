@@ -12,6 +12,7 @@
 import json
 
 from openc3.topics.topic import Topic
+from openc3.utilities.pipeline_trace import PipelineTrace
 from openc3.utilities.store import Store
 from openc3.utilities.store_queued import EphemeralStoreQueued
 from openc3.utilities.time import to_nsec_from_epoch
@@ -19,7 +20,7 @@ from openc3.utilities.time import to_nsec_from_epoch
 
 class TelemetryTopic(Topic):
     @classmethod
-    def write_packet(cls, packet, scope, queued=False):
+    def write_packet(cls, packet, scope, queued=False, trace=None):
         msg_hash = {
             "time": to_nsec_from_epoch(packet.packet_time),
             "received_time": to_nsec_from_epoch(packet.received_time),
@@ -27,10 +28,16 @@ class TelemetryTopic(Topic):
             "target_name": packet.target_name,
             "packet_name": packet.packet_name,
             "received_count": packet.received_count,
-            "buffer": bytes(packet.buffer_no_copy()),
+            "buffer": bytes(packet.buffer_view()),
         }
         if packet.extra:
             msg_hash["extra"] = json.dumps(packet.extra)
+        if trace is not None:
+            # A queued write is only sent when EphemeralStoreQueued flushes so it isn't
+            # stamped and the queue delay is counted in decom_start rather than misattributed
+            if not queued:
+                PipelineTrace.stamp(trace, "telemetry_xadd")
+            msg_hash["trace"] = json.dumps(trace)
         db_shard = Store.db_shard_for_target(packet.target_name, scope=scope)
         if queued:
             EphemeralStoreQueued.instance(db_shard=db_shard).write_topic(
@@ -0,0 +1,261 @@
+# Copyright 2026 OpenC3, Inc.
+# All Rights Reserved.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See LICENSE.md for more details.
+#
+# This file may also be used under the terms of a commercial license
+# if purchased from OpenC3, Inc.
+
+import asyncio
+import contextvars
+import json
+import threading
+import time
+import weakref
+from contextlib import asynccontextmanager
+
+import valkey.asyncio
+from valkey.asyncio.retry import Retry
+from valkey.backoff import EqualJitterBackoff
+from valkey.exceptions import BusyLoadingError, ConnectionError, TimeoutError
+
+from openc3.environment import *
+from openc3.utilities.store import Store, StoreMeta
+
+
+def _close_replaced(inst):
+    # The connections are bound to the loop of the replaced instance so they
+    # are closed from that loop. A loop which isn't running is left to its
+    # owner (see AsyncStore.close_instances).
+    if inst.loop.is_running() and not inst.loop.is_closed():
+        asyncio.run_coroutine_threadsafe(inst.close(), inst.loop)
+
+
+class AsyncStore(metaclass=StoreMeta):
+    """asyncio version of Store for microservices which run on an event loop.
+
+    Commands are awaited instead of blocking a thread so one event loop can read
+    many topics at once, e.g. one task per stream each awaiting read_topics. Like
+    Store, unknown methods are delegated to the valkey client and calls made inside
+    "async with store.pipelined()" are sent as one pipeline when the block exits.
+    """
+
+    # Variable that holds the singleton instances per db_shard
+    my_instances = {}
+
+    # Mutex used to ensure that only one instance is created
+    instance_mutex = threading.Lock()
+
+    # Get the singleton instance for a given db_shard. Must be called from the
+    # event loop using the instance because the connections are bound to it.
+    @classmethod
+    def instance(cls, pool_size=100, db_shard=0):
+        loop = asyncio.get_running_loop()
+        inst = cls.my_instances.get(db_shard)
+        if inst and inst.loop is loop:
+            return inst
+
+        with cls.instance_mutex:
+            inst = cls.my_instances.get(db_shard)
+            if inst is None or inst.loop is not loop:
+                if inst is not None:
+                    _close_replaced(inst)
+                inst = cls(pool_size, db_shard=db_shard)
+                cls.my_instances[db_shard] = inst
+            return inst
+
+    @classmethod
+    async def close_instances(cls):
+        """Close the instances of the running event loop. Call this before the loop
+        finishes as the connections can't be closed once it is closed."""
+        loop = asyncio.get_running_loop()
+        with cls.instance_mutex:
+            instances = [inst for inst in cls.my_instances.values() if inst.loop is loop]
+            for inst in instances:
+                del cls.my_instances[inst.db_shard]
+        for inst in instances:
+            await inst.close()
+
+    @classmethod
+    async def db_shard_for_target(cls, target_name, scope="DEFAULT"):
+        """Look up the db_shard number for a target. Shares the Store cache."""
+        if not target_name:
+            return 0
+
+        cache_key = f"{scope}__{target_name}"
+        now = time.time()
+
+        with Store._db_shard_cache_lock:
+            cached = Store._db_shard_cache.get(cache_key)
+            if cached:
+                db_shard_val, cached_at = cached
+                if (now - cached_at) < Store.DB_SHARD_CACHE_TIMEOUT:
+                    return db_shard_val
+
+        try:
+            result = await AsyncStore.instance(db_shard=0).hget(f"{scope}__openc3_targets", target_name)
+            if result:
+                if isinstance(result, bytes):
+                    result = result.decode()
+                db_shard_val = json.loads(result).get("db_shard", 0)
+                db_shard_val = int(db_shard_val) if db_shard_val else 0
+            else:
+                db_shard_val = 0
+        except Exception:
+            db_shard_val = 0
+
+        with Store._db_shard_cache_lock:
+            Store._db_shard_cache[cache_key] = (db_shard_val, now)
+
+        return db_shard_val
+
+    # Delegate all unknown methods to redis (or the current pipeline)
+    def __getattr__(self, func):
+        return getattr(self.client(), func)
+
+    def __init__(self, pool_size=10, db_shard=0, redis_host=None, redis_port=None):
+        self.db_shard = db_shard
+        self.pool_size = pool_size
+        self.loop = asyncio.get_running_loop()
+        self.redis_host = redis_host or OPENC3_REDIS_HOSTNAME.replace("SHARDNUM", str(db_shard))
+        self.redis_port = redis_port or OPENC3_REDIS_PORT
+        self.redis = self.build_redis()
+        # Offsets are tracked per task as each task reads its own topics
+        self.topic_offsets = weakref.WeakKeyDictionary()
+        self.pipeline = contextvars.ContextVar(f"{self.__class__.__name__}_{db_shard}_pipeline", default=None)
+
+    def build_redis(self):
+        # See Store.build_redis. The client has its own pool of up to pool_size
+        # connections as every concurrent command (like a blocking xread) needs one.
+        # socket_timeout is disabled so a blocking xread can outlast it.
+        return valkey.asyncio.Valkey(
+            host=self.redis_host,
+            port=self.redis_port,
+            username=OPENC3_REDIS_USERNAME,
+            password=OPENC3_REDIS_PASSWORD,
+            socket_timeout=None,
+            max_connections=self.pool_size,
+            retry=Retry(EqualJitterBackoff(cap=5, base=0.625), 3),
+            retry_on_error=[BusyLoadingError, ConnectionError, TimeoutError],
+        )
+
+    def client(self):
+        """The pipeline of the current pipelined block or the client"""
+        pipeline = self.pipeline.get()
+        if pipeline is not None:
+            return pipeline
+        return self.redis
+
+    @asynccontextmanager
+    async def pipelined(self):
+        pipeline = self.redis.pipeline(transaction=False)
+        token = self.pipeline.set(pipeline)
+        try:
+            yield pipeline
+        finally:
+            self.pipeline.reset(token)
+            await pipeline.execute()
+
+    async def close(self):
+        await self.redis.aclose()
+
+    ###########################################################################
+    # Stream APIs
+    ###########################################################################
+
+    async def get_oldest_message(self, topic):
+        result = await self.redis.xrange(topic, count=1)
+        if result and len(result) > 0:
+            return result[0]
+        else:
+            return None
+
+    async def get_newest_message(self, topic):
+        result = await self.redis.xrevrange(topic, count=1)
+        if result and len(result) > 0:
+            first = list(result[0])
+            first[0] = first[0].decode()
+            return first
+        else:
+            return (None, None)
+
+    async def get_last_offset(self, topic):
+        result = await self.redis.xrevrange(topic, count=1)
+        if result and result[0] and result[0][0]:
+            return result[0][0].decode()
+        else:
+            return "0-0"
+
+    def _task_topic_offsets(self):
+        task = asyncio.current_task()
+        topic_offsets = self.topic_offsets.get(task)
+        if topic_offsets is None:
+            topic_offsets = {}
+            self.topic_offsets[task] = topic_offsets
+        return topic_offsets
+
+    async def update_topic_offsets(self, topics):
+        topic_offsets = self._task_topic_offsets()
+        offsets = []
+        for topic in topics:
+            # Normally we will just be grabbing the topic offset
+            # this allows xread to get everything past this point
+            last_id = topic_offsets.get(topic)
+            if last_id:
+                offsets.append(last_id)
+            else:
+                # If there is no topic offset this is the first call.
+                # Get the last offset ID so we'll start getting everything from now on
+                offsets.append(await self.get_last_offset(topic))
+                topic_offsets[topic] = offsets[-1]
+        return offsets
+
+    async def read_topics(self, topics, offsets=None, timeout_ms=1000, count=None):
+        """Async generator of (topic, msg_id, msg_hash, redis) like Store.read_topics"""
+        if len(topics) == 0:
+            return
+        topic_offsets = self._task_topic_offsets()
+        try:
+            if not offsets:
+                offsets = await self.update_topic_offsets(topics)
+            streams = {}
+            for index, topic in enumerate(topics):
+                streams[topic] = offsets[index]
+            result = await self.redis.xread(streams, block=timeout_ms, count=count)
+        except TimeoutError:
+            return
+        if result and len(result) > 0:
+            for topic, messages in result:
+                for msg_id, msg_hash in messages:
+                    if isinstance(topic, bytes):
+                        topic = topic.decode()
+                    if isinstance(msg_id, bytes):
+                        msg_id = msg_id.decode()
+                    topic_offsets[topic] = msg_id
+                    yield topic, msg_id, msg_hash, self.redis
+
+    # Add new entry to the redis stream. See Store.write_topic.
+    async def write_topic(self, topic, msg_hash, id="*", maxlen=None, approximate=True):
+        if not id:
+            id = "*"
+        return await self.client().xadd(topic, msg_hash, id=id, maxlen=maxlen, approximate=approximate)
+
+    # Trims older entries of the redis stream if needed. See Store.trim_topic.
+    async def trim_topic(self, topic, minid, approximate=True, limit=0):
+        return await self.client().xtrim(name=topic, minid=minid, approximate=approximate, limit=limit)
+
+
+class EphemeralAsyncStore(AsyncStore):
+    # Variable that holds the singleton instances per db_shard
+    my_instances = {}
+
+    def __init__(self, pool_size=10, db_shard=0):
+        super().__init__(
+            pool_size,
+            db_shard=db_shard,
+            redis_host=OPENC3_REDIS_EPHEMERAL_HOSTNAME.replace("SHARDNUM", str(db_shard)),
+            redis_port=OPENC3_REDIS_EPHEMERAL_PORT,
+        )
@@ -9,6 +9,8 @@
 # This file may also be used under the terms of a commercial license
 # if purchased from OpenC3, Inc.
 
+import contextlib
+import itertools
 import time
 
 import boto3
@@ -47,6 +49,10 @@ else:  # AWS
 
 class AwsBucket(Bucket):
     CREATE_CHECK_COUNT = 100  # 10 seconds
+    # Size of each part in put_object_multipart. S3 requires all but the last part to be at least 5 MiB.
+    MULTIPART_PART_SIZE = 8 * 1024 * 1024
+    # Number of attempts to upload each part
+    MULTIPART_RETRIES = 3
 
     def __init__(self):
         # Check whether the session is a real Session or a MockS3
@@ -155,6 +161,17 @@ class AwsBucket(Bucket):
                 return None
             raise
 
+    def get_object_if_changed(self, bucket, key, etag=None):
+        if etag is None:
+            return self.get_object(bucket=bucket, key=key)
+        try:
+            return self.client.get_object(Bucket=bucket, Key=key, IfNoneMatch=etag)
+        except ClientError as error:
+            if error.response.get("Error", {}).get("Code") in ("304", "NotModified"):
+                return {"ETag": etag, "Body": None}
+            # Let get_object sort out missing keys and permissions
+            return self.get_object(bucket=bucket, key=key)
+
     def list_objects(self, bucket, prefix=None, max_request=1000, max_total=100_000):
         try:
             result = []
@@ -245,6 +262,83 @@ class AwsBucket(Bucket):
             kw_args["Metadata"] = metadata
         return self.client.put_object(**kw_args)
 
+    # Upload an iterable of bytes chunks as an S3 multipart upload so the object
+    # never has to be held in memory or written to disk. Chunks are collected into
+    # MULTIPART_PART_SIZE parts and each part is retried individually. Objects
+    # which fit in a single part are sent with a single put_object.
+    def put_object_multipart(self, bucket, key, chunks, content_type=None, metadata=None):
+        parts = self._multipart_parts(chunks)
+        first = next(parts)
+        second = next(parts, None)
+        if second is None:
+            return self.put_object(bucket=bucket, key=key, body=first, content_type=content_type, metadata=metadata)
+
+        kw_args = {
+            "Bucket": bucket,
+            "Key": key,
+        }
+        if use_checksum:
+            kw_args["ChecksumAlgorithm"] = "SHA256"
+        if content_type:
+            kw_args["ContentType"] = content_type
+        if metadata:
+            kw_args["Metadata"] = metadata
+        upload_id = self.client.create_multipart_upload(**kw_args)["UploadId"]
+        try:
+            completed = []
+            for part_number, body in enumerate(itertools.chain([first, second], parts), start=1):
+                completed.append(self._upload_part(bucket, key, upload_id, part_number, body))
+            return self.client.complete_multipart_upload(
+                Bucket=bucket,
+                Key=key,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": completed},
+            )
+        except Exception:
+            with contextlib.suppress(Exception):
+                self.client.abort_multipart_upload(Bucket=bucket, Key=key, UploadId=upload_id)
+            raise
+
+    # Collect arbitrarily sized chunks into MULTIPART_PART_SIZE parts.
+    # Always yields at least one (possibly empty) part.
+    def _multipart_parts(self, chunks):
+        part = bytearray()
+        yielded = False
+        for chunk in chunks:
+            part += chunk
+            while len(part) >= self.MULTIPART_PART_SIZE:
+                yield bytes(part[: self.MULTIPART_PART_SIZE])
+                del part[: self.MULTIPART_PART_SIZE]
+                yielded = True
+        if part or not yielded:
+            yield bytes(part)
+
+    def _upload_part(self, bucket, key, upload_id, part_number, body):
+        kw_args = {
+            "Bucket": bucket,
+            "Key": key,
+            "UploadId": upload_id,
+            "PartNumber": part_number,
+            "Body": body,
+        }
+        if use_checksum:
+            kw_args["ChecksumAlgorithm"] = "SHA256"
+        attempt = 1
+        while True:
+            try:
+                response = self.client.upload_part(**kw_args)
+                break
+            except Exception as error:
+                if attempt >= self.MULTIPART_RETRIES:
+                    raise error
+                Logger.warn(f"Error uploading part {part_number} of {bucket}/{key} - retry {attempt}: {error}")
+                attempt += 1
+                time.sleep(1)
+        part = {"ETag": response["ETag"], "PartNumber": part_number}
+        if response.get("ChecksumSHA256"):
+            part["ChecksumSHA256"] = response["ChecksumSHA256"]
+        return part
+
     # @returns [Boolean] Whether the file exists
     def check_object(self, bucket, key, retries=True):
         if retries:
@@ -11,6 +11,7 @@
 
 import importlib
 import inspect
+import tempfile
 import warnings
 
 from openc3.environment import OPENC3_CLOUD
@@ -18,6 +19,9 @@ from openc3.environment import OPENC3_CLOUD
 
 # Interface class implemented by each cloud provider: AWS, GCS, Azure
 class Bucket:
+    # Bytes held in memory by put_object_multipart before spooling to disk
+    SPOOL_MAX_SIZE = 8 * 1024 * 1024
+
     # Raised when the underlying bucket does not exist
     class NotFoundError(Exception):
         pass
@@ -69,6 +73,13 @@ class Bucket:
             f"{self.__class__.__name__} has not implemented method '{inspect.currentframe().f_code.co_name}'"
         )
 
+    # Get the object only if its ETag no longer matches etag. Returns the
+    # get_object response, None if the key does not exist, or
+    # {"ETag": etag, "Body": None} if the object is unchanged. Providers without
+    # conditional reads simply return the whole object.
+    def get_object_if_changed(self, bucket, key, etag=None):
+        return self.get_object(bucket=bucket, key=key)
+
     def list_objects(self, bucket, prefix=None, max_request=None, max_total=None):
         raise NotImplementedError(
             f"{self.__class__.__name__} has not implemented method '{inspect.currentframe().f_code.co_name}'"
@@ -84,6 +95,16 @@ class Bucket:
             f"{self.__class__.__name__} has not implemented method '{inspect.currentframe().f_code.co_name}'"
         )
 
+    # Upload an iterable of bytes chunks. Providers which support multipart uploads
+    # override this to stream the chunks. This default spools the chunks to a
+    # temporary file (in memory until it gets large) and calls put_object.
+    def put_object_multipart(self, bucket, key, chunks, content_type=None, metadata=None):
+        with tempfile.SpooledTemporaryFile(max_size=Bucket.SPOOL_MAX_SIZE) as file:
+            for chunk in chunks:
+                file.write(chunk)
+            file.seek(0)
+            return self.put_object(bucket=bucket, key=key, body=file, content_type=content_type, metadata=metadata)
+
     def check_object(self, bucket, key, retries=True):
         raise NotImplementedError(
             f"{self.__class__.__name__} has not implemented method '{inspect.currentframe().f_code.co_name}'"
@@ -10,6 +10,7 @@
 # if purchased from OpenC3, Inc.
 
 import os
+import queue
 import threading
 import time
 import zlib
@@ -17,6 +18,7 @@ import zlib
 from openc3.environment import OPENC3_LOGS_BUCKET
 from openc3.utilities.bucket import Bucket
 from openc3.utilities.logger import Logger
+from openc3.utilities.metric import Metric
 
 
 class BucketUtilities:
@@ -48,6 +50,23 @@ class BucketUtilities:
     #     # Successful load/require returns true
     #     return True
 
+    # Number of threads uploading log files to the bucket
+    UPLOAD_THREADS = int(os.environ.get("OPENC3_BUCKET_UPLOAD_THREADS", 4))
+    # Number of uploads which can be waiting before move_log_file_to_bucket blocks the caller
+    UPLOAD_QUEUE_SIZE = int(os.environ.get("OPENC3_BUCKET_UPLOAD_QUEUE_SIZE", 100))
+    # Size of each chunk read from a log file when compressing
+    COMPRESS_CHUNK_SIZE = 1_000_000
+
+    # Mutex protecting the upload queue, threads and metrics
+    upload_mutex = threading.Lock()
+    upload_queue = None
+    upload_threads = []
+    upload_active = 0
+    upload_total = 0
+    upload_error_total = 0
+    upload_blocked_total = 0
+    upload_blocked_seconds_total = 0.0
+
     @classmethod
     def move_log_file_to_bucket_thread(cls, filename, bucket_key, metadata=None):
         if metadata is None:
@@ -55,25 +74,33 @@ class BucketUtilities:
         try:
             client = Bucket.get_client()
 
-            orig_filename = None
-            if os.path.splitext(filename)[1] != ".txt":
-                orig_filename = filename
-                filename = cls.compress_file(filename)
+            compress = os.path.splitext(filename)[1] != ".txt"
+            if compress:
                 bucket_key += ".gz"
 
             retry_count = 0
             while retry_count < 3:
                 try:
-                    # We want to open this as a file and pass that to put_object to allow
-                    # this to work with really large files. Otherwise the entire file has
-                    # to be held in memory!
-                    with open(filename, "rb") as file:
-                        client.put_object(
+                    if compress:
+                        # Stream the compressed data straight into the bucket rather
+                        # than writing a compressed copy of the file to disk first
+                        client.put_object_multipart(
                             bucket=OPENC3_LOGS_BUCKET,
                             key=bucket_key,
-                            body=file,
+                            chunks=cls.compress_chunks(filename),
                             metadata=metadata,
                         )
+                    else:
+                        # We want to open this as a file and pass that to put_object to allow
+                        # this to work with really large files. Otherwise the entire file has
+                        # to be held in memory!
+                        with open(filename, "rb") as file:
+                            client.put_object(
+                                bucket=OPENC3_LOGS_BUCKET,
+                                key=bucket_key,
+                                body=file,
+                                metadata=metadata,
+                            )
                     break
                 except Exception as err:
                     # Try to upload file three times
@@ -85,39 +112,137 @@ class BucketUtilities:
 
             Logger.debug(f"wrote {OPENC3_LOGS_BUCKET}/{bucket_key}")
 
-            if orig_filename:
-                os.remove(orig_filename)
             os.remove(filename)
         except Exception as err:
+            with cls.upload_mutex:
+                cls.upload_error_total += 1
             Logger.error(f"Error saving log file to bucket: {filename}\n{str(err)}")
 
+    # Queue the log file to be moved to the bucket by the shared upload threads.
+    # Blocks if UPLOAD_QUEUE_SIZE uploads are already waiting.
+    # Returns a BucketUpload which can be joined to wait for the upload to complete.
     @classmethod
     def move_log_file_to_bucket(cls, filename, bucket_key, metadata=None):
         if metadata is None:
             metadata = {}
-        thread = threading.Thread(
-            target=cls.move_log_file_to_bucket_thread,
-            args=[filename, bucket_key, metadata],
-            daemon=True,
-        )
-        thread.start()
-        return thread
+        upload = BucketUpload(filename, bucket_key, metadata)
+        upload_queue = cls._start_upload_threads()
+        try:
+            upload_queue.put_nowait(upload)
+        except queue.Full:
+            start_time = time.time()
+            upload_queue.put(upload)
+            with cls.upload_mutex:
+                cls.upload_blocked_total += 1
+                cls.upload_blocked_seconds_total += time.time() - start_time
+        return upload
 
     @classmethod
-    def compress_file(cls, filename, chunk_size=50_000_000):
-        zipped = f"{filename}.gz"
+    def _start_upload_threads(cls):
+        with cls.upload_mutex:
+            if cls.upload_queue is None:
+                cls.upload_queue = queue.Queue(maxsize=cls.UPLOAD_QUEUE_SIZE)
+                Metric.add_update_generator(cls)
+            cls.upload_threads = [thread for thread in cls.upload_threads if thread.is_alive()]
+            while len(cls.upload_threads) < cls.UPLOAD_THREADS:
+                thread = threading.Thread(target=cls._upload_thread_body, daemon=True)
+                thread.start()
+                cls.upload_threads.append(thread)
+            return cls.upload_queue
 
+    @classmethod
+    def _upload_thread_body(cls):
+        while True:
+            upload = cls.upload_queue.get()
+            with cls.upload_mutex:
+                cls.upload_active += 1
+            try:
+                cls.move_log_file_to_bucket_thread(upload.filename, upload.bucket_key, upload.metadata)
+            finally:
+                with cls.upload_mutex:
+                    cls.upload_active -= 1
+                    cls.upload_total += 1
+                upload.complete()
+
+    # Called by Metric on each metric cycle
+    @classmethod
+    def generate(cls, metric):
+        with cls.upload_mutex:
+            queue_depth = cls.upload_queue.qsize() if cls.upload_queue else 0
+            metric.set(name="bucket_upload_queue_depth", value=queue_depth, type="gauge")
+            metric.set(name="bucket_upload_active", value=cls.upload_active, type="gauge")
+            metric.set(name="bucket_upload_total", value=cls.upload_total, type="counter")
+            metric.set(name="bucket_upload_error_total", value=cls.upload_error_total, type="counter")
+            metric.set(
+                name="bucket_upload_blocked_total",
+                value=cls.upload_blocked_total,
+                type="counter",
+                help="Number of log files which waited for space in the full upload queue",
+            )
+            metric.set(
+                name="bucket_upload_blocked_seconds_total",
+                value=cls.upload_blocked_seconds_total,
+                type="counter",
+                unit="seconds",
+            )
+
+    # Yields the compressed contents of the file without writing it to disk
+    @classmethod
+    def compress_chunks(cls, filename, chunk_size=None):
+        if chunk_size is None:
+            chunk_size = cls.COMPRESS_CHUNK_SIZE
         obj = zlib.compressobj()
-        with open(zipped, "wb") as zip_file, open(filename, "rb") as file:
+        with open(filename, "rb") as file:
             while True:
                 chunk = file.read(chunk_size)
                 if chunk:
                     compressed = obj.compress(chunk)
-                    zip_file.write(compressed)
+                    if compressed:
+                        yield compressed
                 else:
                     compressed = obj.flush()
                     if compressed:
-                        zip_file.write(compressed)
+                        yield compressed
                     break
 
+    @classmethod
+    def compress_file(cls, filename, chunk_size=50_000_000):
+        zipped = f"{filename}.gz"
+
+        with open(zipped, "wb") as zip_file:
+            for compressed in cls.compress_chunks(filename, chunk_size):
+                zip_file.write(compressed)
+
         return zipped
+
+    # Handles both gzip (Ruby) and zlib (Python) compressed log files
+    @classmethod
+    def uncompress_file(cls, filename, chunk_size=50_000_000):
+        unzipped = filename[:-3]  # Drop .gz
+
+        obj = zlib.decompressobj(zlib.MAX_WBITS | 32)
+        with open(filename, "rb") as zip_file, open(unzipped, "wb") as file:
+            while chunk := zip_file.read(chunk_size):
+                file.write(obj.decompress(chunk))
+            file.write(obj.flush())
+
+        return unzipped
+
+
+# Handle to a log file queued by BucketUtilities.move_log_file_to_bucket.
+# Supports join() like the Thread previously returned.
+class BucketUpload:
+    def __init__(self, filename, bucket_key, metadata):
+        self.filename = filename
+        self.bucket_key = bucket_key
+        self.metadata = metadata
+        self.done = threading.Event()
+
+    def complete(self):
+        self.done.set()
+
+    def is_alive(self):
+        return not self.done.is_set()
+
+    def join(self, timeout=None):
+        self.done.wait(timeout)
@@ -9,9 +9,14 @@
 # This file may also be used under the terms of a commercial license
 # if purchased from OpenC3, Inc.
 
+import atexit
+import contextlib
 import json
 import socket
 import sys
+import threading
+import time
+from collections import deque
 from datetime import datetime, timezone
 from enum import IntEnum
 from threading import Lock
@@ -26,6 +31,10 @@ CLASS_ATTRS = [
     "instance_mutex",
     "my_instance",
     "scope",
+    "async_enabled",
+    "writer",
+    "sampler",
+    "start_writer",
     "__dict__",
     "LOG",
     "NOTIFICATION",
@@ -84,12 +93,201 @@ class LogLevel(IntEnum):
     FATAL = 4
 
 
+class LogSampler:
+    """Rate limits log messages which are logged with a key (e.g. Logger.info(message, key=key)).
+    Messages without a key, such as the command log, are never sampled.
+
+    Each key may log limits[level] messages per PERIOD. The rest are suppressed
+    and counted. The count is added to the next message logged with the key as
+    "suppressed" or logged as a summary of the most recent suppressed message by
+    the LogWriter once the period is over. NOTIFICATION and ALERT messages are
+    never sampled as each one is shown to the operators.
+    """
+
+    PERIOD = 1.0
+    # Messages per key per PERIOD. Levels which are not listed are never sampled.
+    DEFAULT_LIMITS = {"DEBUG": 10, "INFO": 10, "WARN": 10, "ERROR": 10}
+    # Keys tracked before expired keys are forgotten without waiting for the LogWriter
+    MAX_KEYS = 10000
+
+    def __init__(self, limits=None):
+        self.limits = dict(self.DEFAULT_LIMITS if limits is None else limits)
+        # key => [window start, count, suppressed, logger, log_level, scope, log_args]
+        # where log_args are the build_log_data arguments of the last message
+        self.keys = {}
+        # States expired to make room for new keys which are waiting to be summarized
+        self.expired = []
+        self.suppressed_total = 0
+        # Messages are checked from every logging thread while the LogWriter expires keys
+        self.mutex = Lock()
+
+    def check(self, logger, log_level, key, scope, log_args):
+        """Returns (allowed, suppressed count to report with the message)
+
+        log_args are the (message, user, type, url, other) of the message
+        """
+        limit = self.limits.get(log_level)
+        if limit is None or log_args[2] in (Logger.NOTIFICATION, Logger.ALERT):
+            return True, 0
+        now = time.monotonic()
+        with self.mutex:
+            state = self.keys.get((log_level, key))
+            if state is None or now - state[0] >= self.PERIOD:
+                if state is None and len(self.keys) >= self.MAX_KEYS:
+                    self.expired.extend(self._expire(now))
+                suppressed = state[2] if state is not None else 0
+                self.keys[(log_level, key)] = [now, 1, 0, logger, log_level, scope, log_args]
+                return True, suppressed
+            if state[1] < limit:
+                state[1] += 1
+                return True, 0
+            state[2] += 1
+            state[6] = log_args
+            self.suppressed_total += 1
+            return False, 0
+
+    def expire(self):
+        """Forget the keys whose period is over and return the states which suppressed messages"""
+        with self.mutex:
+            expired = self.expired
+            self.expired = []
+            return expired + self._expire(time.monotonic())
+
+    # Must be called with the mutex held
+    def _expire(self, now):
+        expired = []
+        for key, state in list(self.keys.items()):
+            if now - state[0] >= self.PERIOD:
+                self.keys.pop(key, None)
+                if state[2] > 0:
+                    expired.append(state)
+        return expired
+
+
+class LogWriter:
+    """Writes log messages to stdout and the store from a dedicated thread.
+
+    Logging threads only append to a deque so they never wait on stdout or the
+    store. The writer writes everything queued as one batch. When the queue is
+    full new messages are dropped and counted.
+    """
+
+    QUEUE_SIZE = 10000
+    # Seconds the writer waits when there is nothing to write
+    WRITE_INTERVAL = 0.05
+
+    def __init__(self):
+        self.queue = deque()
+        self.dropped_total = 0
+        self.written_total = 0
+        # Only held while writing so it never blocks logging threads
+        self.write_mutex = Lock()
+        self.running = True
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+        atexit.register(self.stop)
+
+    def put(self, entry):
+        if len(self.queue) >= self.QUEUE_SIZE:
+            self.dropped_total += 1
+            return False
+        self.queue.append(entry)
+        return True
+
+    def run(self):
+        next_expire = time.monotonic() + LogSampler.PERIOD
+        while self.running:
+            try:
+                if not self.flush():
+                    time.sleep(self.WRITE_INTERVAL)
+                if time.monotonic() >= next_expire:
+                    next_expire = time.monotonic() + LogSampler.PERIOD
+                    self.log_summaries()
+            except Exception as error:
+                # Keep writing as nothing else would empty the queue
+                self.report_error("LogWriter", error)
+                time.sleep(self.WRITE_INTERVAL)
+
+    def flush(self):
+        """Write everything queued. Returns whether anything was written."""
+        with self.write_mutex:
+            entries = []
+            while True:
+                try:
+                    entries.append(self.queue.popleft())
+                except IndexError:
+                    break
+            if not entries:
+                return False
+            lines = {}
+            for io, topic, data in entries:
+                # A message which fails to write is reported and the rest of the batch is still written
+                try:
+                    if io is not None:
+                        lines.setdefault(io, []).append(json.dumps(data, default=str))
+                    if topic is not None:
+                        EphemeralStoreQueued.write_topic(topic, data)
+                except Exception as error:
+                    self.report_error("LogWriter message", error)
+            for io, io_lines in lines.items():
+                try:
+                    io.write("\n".join(io_lines) + "\n")
+                    io.flush()
+                except Exception as error:
+                    self.report_error("LogWriter output", error)
+            self.written_total += len(entries)
+            return True
+
+    # The Logger can't be used to report its own errors
+    @staticmethod
+    def report_error(source, error):
+        with contextlib.suppress(Exception):
+            print(f"{source} error: {repr(error)}", file=sys.__stderr__, flush=True)
+
+    def log_summaries(self):
+        sampler = Logger.sampler
+        if sampler is None:
+            return
+        for _, _, suppressed, logger, log_level, scope, log_args in sampler.expire():
+            data = logger.build_log_data(log_level, *log_args)
+            data["suppressed"] = suppressed
+            self.put(logger.log_outputs(log_level, scope) + (data,))
+
+    def stop(self):
+        self.running = False
+        self.flush()
+
+    # Called by Metric on each metric cycle
+    def generate(self, metric):
+        metric.set(name="log_queue_depth", value=len(self.queue), type="gauge")
+        metric.set(name="log_written_total", value=self.written_total, type="counter")
+        metric.set(
+            name="log_dropped_total",
+            value=self.dropped_total,
+            type="counter",
+            help="Log messages dropped because the log queue was full",
+        )
+        if Logger.sampler is not None:
+            metric.set(
+                name="log_suppressed_total",
+                value=Logger.sampler.suppressed_total,
+                type="counter",
+                help="Log messages suppressed by rate limiting",
+            )
+
+
 # Supports different levels of logging and only writes if the level
 # is exceeded.
 class Logger(metaclass=LoggerMeta):
     instance_mutex = Lock()
     my_instance = None
     scope = OPENC3_SCOPE
+    # Whether start_writer starts a LogWriter (set OPENC3_LOG_ASYNC=false to log synchronously)
+    async_enabled = get_env_bool("OPENC3_LOG_ASYNC", True)
+    # LogWriter used by every Logger once started, otherwise messages are written by the caller
+    writer = None
+    # LogSampler started with the writer which reports the messages it suppresses
+    sampler = None
 
     DEBUG = LogLevel.DEBUG
     INFO = LogLevel.INFO
@@ -124,11 +322,25 @@ class Logger(metaclass=LoggerMeta):
             cls.my_instance = cls(level)
             return cls.my_instance
 
+    # Start writing log messages from a dedicated thread (see LogWriter)
+    @classmethod
+    def start_writer(cls):
+        if not Logger.async_enabled:
+            return
+        with Logger.instance_mutex:
+            if Logger.writer is None:
+                # Imported here because Metric depends on the Logger
+                from openc3.utilities.metric import Metric
+
+                Logger.sampler = LogSampler()
+                Logger.writer = LogWriter()
+                Metric.add_update_generator(Logger.writer)
+
     # @param message [String] The message to print if the log level is at or
     #   below the method name log level.
     # @param block [Proc] Block to call which should return a string to append
     #   to the log message
-    def debug(self, message=None, scope=None, user=None, type=LOG, url=None, other=None):
+    def debug(self, message=None, scope=None, user=None, type=LOG, url=None, other=None, key=None):
         scope = scope or self.scope
         if self.level <= LogLevel.DEBUG:
             self.log_message(
@@ -139,10 +351,11 @@ class Logger(metaclass=LoggerMeta):
                 type=type,
                 url=url,
                 other=other,
+                key=key,
             )
 
     # (see #debug)
-    def info(self, message=None, scope=None, user=None, type=LOG, url=None, other=None):
+    def info(self, message=None, scope=None, user=None, type=LOG, url=None, other=None, key=None):
         scope = scope or self.scope
         if self.level <= LogLevel.INFO:
             self.log_message(
@@ -153,10 +366,11 @@ class Logger(metaclass=LoggerMeta):
                 type=type,
                 url=url,
                 other=other,
+                key=key,
             )
 
     # (see #debug)
-    def warn(self, message=None, scope=None, user=None, type=LOG, url=None, other=None):
+    def warn(self, message=None, scope=None, user=None, type=LOG, url=None, other=None, key=None):
         scope = scope or self.scope
         if self.level <= LogLevel.WARN:
             self.log_message(
@@ -167,10 +381,11 @@ class Logger(metaclass=LoggerMeta):
                 type=type,
                 url=url,
                 other=other,
+                key=key,
             )
 
     # (see #debug)
-    def error(self, message=None, scope=None, user=None, type=LOG, url=None, other=None):
+    def error(self, message=None, scope=None, user=None, type=LOG, url=None, other=None, key=None):
         scope = scope or self.scope
         if self.level <= LogLevel.ERROR:
             self.log_message(
@@ -181,10 +396,11 @@ class Logger(metaclass=LoggerMeta):
                 type=type,
                 url=url,
                 other=other,
+                key=key,
             )
 
     # (see #debug)
-    def fatal(self, message=None, scope=None, user=None, type=LOG, url=None, other=None):
+    def fatal(self, message=None, scope=None, user=None, type=LOG, url=None, other=None, key=None):
         scope = scope or self.scope
         if self.level <= LogLevel.FATAL:
             self.log_message(
@@ -195,6 +411,7 @@ class Logger(metaclass=LoggerMeta):
                 type=type,
                 url=url,
                 other=other,
+                key=key,
             )
 
     def build_log_data(
@@ -231,20 +448,46 @@ class Logger(metaclass=LoggerMeta):
             data = data | other
         return data
 
-    def log_message(self, log_level: str, message: str | None, scope, user, type, url, other=None):
+    def log_message(self, log_level: str, message: str | None, scope, user, type, url, other=None, key=None):
+        suppressed = 0
+        sampler = Logger.sampler
+        if sampler is not None and key is not None:
+            log_args = (message, user, type, url, other)
+            allowed, suppressed = sampler.check(self, log_level, key, scope, log_args)
+            if not allowed:
+                return
+        data = self.build_log_data(log_level, message, user, type, url, other)
+        if suppressed:
+            data["suppressed"] = suppressed
+        writer = Logger.writer
+        # Write fatal messages immediately because the process is probably exiting
+        if writer is not None and log_level != "FATAL":
+            writer.put(self.log_outputs(log_level, scope) + (data,))
+            return
+        if writer is not None:
+            writer.flush()
         with self.instance_mutex:
-            data = self.build_log_data(log_level, message, user, type, url, other)
-            if self.stdout:
-                if (log_level in ["WARN", "ERROR", "FATAL"]) and OPENC3_LOG_STDERR:
-                    io = sys.stderr
-                else:
-                    io = sys.stdout
+            io, topic = self.log_outputs(log_level, scope)
+            if io is not None:
                 print(json.dumps(data), file=io)
                 io.flush()
-            if self.no_store is False:
-                if scope is not None:
-                    EphemeralStoreQueued.write_topic(f"{scope}__openc3_log_messages", data)
-                else:
-                    # The base openc3_log_messages doesn't have an associated logger
-                    # so it must be limited to prevent unbounded stream growth
-                    EphemeralStoreQueued.write_topic("NOSCOPE__openc3_log_messages", data)
+            if topic is not None:
+                EphemeralStoreQueued.write_topic(topic, data)
+
+    # The stream and store topic a message is written to (or None)
+    def log_outputs(self, log_level: str, scope):
+        io = None
+        if self.stdout:
+            if (log_level in ["WARN", "ERROR", "FATAL"]) and OPENC3_LOG_STDERR:
+                io = sys.stderr
+            else:
+                io = sys.stdout
+        topic = None
+        if self.no_store is False:
+            if scope is not None:
+                topic = f"{scope}__openc3_log_messages"
+            else:
+                # The base openc3_log_messages doesn't have an associated logger
+                # so it must be limited to prevent unbounded stream growth
+                topic = "NOSCOPE__openc3_log_messages"
+        return io, topic
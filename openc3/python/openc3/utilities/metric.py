@@ -9,6 +9,7 @@
 # This file may also be used under the terms of a commercial license
 # if purchased from OpenC3, Inc.
 
+import bisect
 import contextlib
 import importlib
 import json
@@ -21,6 +22,116 @@ from openc3.utilities.sleeper import Sleeper
 from openc3.utilities.store import Store
 
 
+class MetricHandle:
+    """Base class of the metric handles returned by Metric.counter, gauge and histogram.
+
+    Handles which are updated from many threads give each thread its own shard
+    so no lock is taken per update. The shards are combined when the metric is
+    published by the Metric update thread.
+    """
+
+    type = None
+
+    def __init__(self, name, help=None, unit=None, labels=None):
+        self.name = name
+        self.help = help
+        self.unit = unit
+        self.labels = labels
+        # Shard of each thread by thread id. A thread id is only reused after the
+        # thread exits so its shard is never updated by two threads at once.
+        self.shards = {}
+        self.mutex = threading.Lock()
+
+    def _shard(self):
+        shard = self.shards.get(threading.get_ident())
+        if shard is None:
+            shard = self._new_shard()
+            with self.mutex:
+                self.shards[threading.get_ident()] = shard
+        return shard
+
+    def _new_shard(self):
+        raise NotImplementedError()
+
+    def as_json(self):
+        entry = {"value": self.value, "type": self.type}
+        if self.unit is not None:
+            entry["unit"] = self.unit
+        if self.help is not None:
+            entry["help"] = self.help
+        if self.labels is not None:
+            entry["labels"] = self.labels
+        return entry
+
+
+class MetricCounter(MetricHandle):
+    """Monotonic counter which is cheap to increment from many threads"""
+
+    type = "counter"
+
+    def inc(self, amount=1):
+        self._shard()[0] += amount
+
+    def _new_shard(self):
+        return [0]
+
+    @property
+    def value(self):
+        with self.mutex:
+            return sum(shard[0] for shard in self.shards.values())
+
+
+class MetricGauge(MetricHandle):
+    """Gauge holding the last value set. Setting it is a single attribute assignment."""
+
+    type = "gauge"
+
+    def __init__(self, name, help=None, unit=None, labels=None):
+        super().__init__(name, help=help, unit=unit, labels=labels)
+        self.value = 0
+
+    def set(self, value):
+        self.value = value
+
+
+class MetricHistogram(MetricHandle):
+    """Prometheus style histogram with fixed bucket upper bounds. The published value
+    holds the cumulative count of each bucket (le) plus the total count and sum."""
+
+    type = "histogram"
+    # Prometheus client default buckets in seconds
+    DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 7.5, 10.0)
+
+    def __init__(self, name, buckets=None, help=None, unit=None, labels=None):
+        super().__init__(name, help=help, unit=unit, labels=labels)
+        self.buckets = sorted(buckets if buckets is not None else self.DEFAULT_BUCKETS)
+
+    def observe(self, value):
+        shard = self._shard()
+        # Values equal to a bound belong to that bucket and the last count is +Inf
+        shard[0][bisect.bisect_left(self.buckets, value)] += 1
+        shard[1] += value
+
+    def _new_shard(self):
+        return [[0] * (len(self.buckets) + 1), 0.0]
+
+    @property
+    def value(self):
+        counts = [0] * (len(self.buckets) + 1)
+        total = 0.0
+        with self.mutex:
+            for shard_counts, shard_sum in self.shards.values():
+                for index, count in enumerate(shard_counts):
+                    counts[index] += count
+                total += shard_sum
+        buckets = []
+        cumulative = 0
+        for bound, count in zip(self.buckets + ["+Inf"], counts, strict=True):
+            cumulative += count
+            buckets.append([bound, cumulative])
+        return {"buckets": buckets, "count": cumulative, "sum": total}
+
+
 class Metric:
     # The update interval. How often in seconds metrics are updated by this process
     UPDATE_INTERVAL = 5
@@ -44,6 +155,8 @@ class Metric:
         self.scope = scope
         self.microservice = microservice
         self.data = {}
+        # Counter, gauge and histogram handles by name
+        self.handles = {}
         self.mutex = threading.Lock()
 
         # Look up db_shard from MicroserviceModel
@@ -86,6 +199,42 @@ class Metric:
         with self.mutex:
             self.data = self.data | data
 
+    # Handles are registered once and then updated without taking the Metric mutex
+    # so they are cheap enough to update for every packet. Registering an existing
+    # name returns the existing handle.
+    def counter(self, name, help=None, unit=None, labels=None):
+        return self._register(MetricCounter, name, help=help, unit=unit, labels=labels)
+
+    def gauge(self, name, help=None, unit=None, labels=None):
+        return self._register(MetricGauge, name, help=help, unit=unit, labels=labels)
+
+    def histogram(self, name, buckets=None, help=None, unit=None, labels=None):
+        return self._register(MetricHistogram, name, buckets=buckets, help=help, unit=unit, labels=labels)
+
+    def _register(self, handle_class, name, **kwargs):
+        with self.mutex:
+            handle = self.handles.get(name)
+            if handle is None:
+                handle = handle_class(name, **kwargs)
+                self.handles[name] = handle
+            elif type(handle) is not handle_class:
+                raise RuntimeError(f"Metric {name} is already registered as a {handle.type}")
+            return handle
+
+    # The values to publish. Must be called with the mutex held.
+    def values(self):
+        if not self.handles:
+            return self.data
+        values = dict(self.data)
+        for name, handle in self.handles.items():
+            values[name] = handle.as_json()
+        return values
+
+    @staticmethod
+    def exponential_buckets(start, factor, count):
+        """Histogram buckets starting at start with each factor times the one before"""
+        return [start * factor**index for index in range(count)]
+
     def update_thread_body(self):
         Metric.update_sleeper = Sleeper()
         while True:
@@ -101,7 +250,7 @@ class Metric:
                             metric_json = {}
                             metric_json["name"] = instance.microservice
                             metric_json["db_shard"] = instance.db_shard
-                            values = instance.data
+                            values = instance.values()
                             metric_json["values"] = values
                             if len(values) > 0:
                                 MetricModel.set(metric_json, scope=instance.scope)
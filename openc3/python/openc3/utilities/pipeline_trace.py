@@ -0,0 +1,217 @@
+# Copyright 2026 OpenC3, Inc.
+# All Rights Reserved.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See LICENSE.md for more details.
+#
+# This file may also be used under the terms of a commercial license
+# if purchased from OpenC3, Inc.
+
+import json
+import math
+import time
+
+from openc3.environment import get_env_bool
+
+
+class LatencyHistogram:
+    """Log scale histogram of latencies in seconds.
+
+    Each bucket is GROWTH times wider than the one before it so percentiles are
+    accurate to within one bucket (about 19%) from a microsecond to over an hour
+    using a fixed amount of memory.
+    """
+
+    MIN_SECONDS = 1e-6
+    GROWTH = 2**0.25
+    NUM_BUCKETS = 128
+    LOG_GROWTH = math.log(GROWTH)
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.buckets = [0] * self.NUM_BUCKETS
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def record(self, seconds):
+        # Stamps can come from different hosts so clock skew can make this negative
+        if seconds < 0:
+            seconds = 0.0
+        self.count += 1
+        self.sum += seconds
+        if seconds > self.max:
+            self.max = seconds
+        if seconds <= self.MIN_SECONDS:
+            index = 0
+        else:
+            index = min(int(math.log(seconds / self.MIN_SECONDS) / self.LOG_GROWTH) + 1, self.NUM_BUCKETS - 1)
+        self.buckets[index] += 1
+
+    def percentile(self, percent):
+        """Upper bound of the bucket holding the given percentile (0 - 100)"""
+        if self.count == 0:
+            return 0.0
+        rank = max(math.ceil(percent / 100.0 * self.count), 1)
+        cumulative = 0
+        for index, bucket_count in enumerate(self.buckets):
+            cumulative += bucket_count
+            if cumulative >= rank:
+                return min(self.MIN_SECONDS * self.GROWTH**index, self.max)
+        return self.max
+
+    def as_json(self):
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "p50": self.percentile(50),
+            "p99": self.percentile(99),
+            "max": self.max,
+        }
+
+
+class PipelineTrace:
+    """End to end latency tracing of telemetry through the interface, decom and tsdb microservices.
+
+    When OPENC3_PIPELINE_TRACE is set the interface microservice stamps each packet
+    with the wall clock time in nanoseconds at each stage. The stamps travel with the
+    packet in the "trace" field of the TELEMETRY and DECOM topics. The decom and tsdb
+    microservices record the time spent in each stage (since the stage before it) into
+    a histogram per target which is published through Metric as a summary of the
+    latency percentiles over the last PUBLISH_INTERVAL.
+    """
+
+    ENABLED = get_env_bool("OPENC3_PIPELINE_TRACE")
+
+    # Stages in pipeline order
+    STAGES = [
+        "received",  # Interface read the data completing the packet
+        "protocol",  # Interface protocols returned the packet
+        "telemetry_xadd",  # Packet written to the TELEMETRY topic (not stamped for queued writes)
+        "decom_start",  # DecomMicroservice read the packet
+        "decom_end",  # Packet decommutated and written to the DECOM topic
+        "cvt_update",  # Current value table updated
+        "tsdb_flush",  # Packet flushed to the TSDB
+    ]
+    # Pseudo stage for the time from the first to the last stamp
+    TOTAL = "total"
+    # Stages recorded by each microservice
+    DECOM_STAGES = ["protocol", "telemetry_xadd", "decom_start", "decom_end", "cvt_update"]
+    TSDB_STAGES = ["tsdb_flush", TOTAL]
+    METRIC_NAME = "pipeline_latency_seconds"
+    # Seconds of data summarized by each published histogram
+    PUBLISH_INTERVAL = 5.0
+
+    @staticmethod
+    def stamp(trace, stage):
+        trace[stage] = time.time_ns()
+        return trace
+
+    @staticmethod
+    def loads(msg_hash):
+        """Get the trace from a topic msg_hash or None if the packet is not traced"""
+        trace = msg_hash.get(b"trace")
+        if trace is None:
+            return None
+        return json.loads(trace)
+
+    def __init__(self, metric):
+        self.metric = metric
+        self.histograms = {}
+        self.next_publish_time = time.time() + self.PUBLISH_INTERVAL
+
+    def record(self, target_name, trace, stages):
+        """Record the latency of the given stages of a trace. Each stage is timed from
+        the closest earlier stage in the trace so missing stamps are skipped over.
+
+        Args:
+            target_name: Target the traced packet belongs to
+            trace: Dict of stage name to nanosecond stamp
+            stages: Stages to record, which can include TOTAL
+        """
+        previous = None
+        for stage in self.STAGES:
+            stamp = trace.get(stage)
+            if stamp is None:
+                continue
+            if previous is not None and stage in stages:
+                self._histogram(target_name, stage).record((stamp - previous) / 1_000_000_000)
+            previous = stamp
+        if self.TOTAL in stages:
+            stamps = [trace[stage] for stage in self.STAGES if stage in trace]
+            if len(stamps) > 1:
+                self._histogram(target_name, self.TOTAL).record((stamps[-1] - stamps[0]) / 1_000_000_000)
+        if time.time() >= self.next_publish_time:
+            self.publish()
+
+    def publish(self):
+        """Publish the histograms recorded since the last publish to Metric"""
+        self.next_publish_time = time.time() + self.PUBLISH_INTERVAL
+        for (target_name, stage), histogram in self.histograms.items():
+            # Keep the last published values until there is new data
+            if histogram.count == 0:
+                continue
+            self.metric.set(
+                name=f"{self.METRIC_NAME}__{target_name}__{stage}",
+                value=histogram.as_json(),
+                type="summary",
+                unit="seconds",
+                help=f"Latency of the {stage} stage of the telemetry pipeline",
+                labels={"target_name": target_name, "stage": stage},
+            )
+            histogram.reset()
+
+    def _histogram(self, target_name, stage):
+        histogram = self.histograms.get((target_name, stage))
+        if histogram is None:
+            histogram = LatencyHistogram()
+            self.histograms[(target_name, stage)] = histogram
+        return histogram
+
+    @classmethod
+    def report(cls, metrics, target_name=None):
+        """Build a text report of where the pipeline latency goes for each target
+
+        Args:
+            metrics: MetricModel.all() result for a scope
+            target_name: Only report on this target
+        """
+        # Combine the stages published by every microservice
+        targets = {}
+        for microservice in metrics.values():
+            for data in microservice.get("values", {}).values():
+                labels = data.get("labels") or {}
+                stage = labels.get("stage")
+                target = labels.get("target_name")
+                if data.get("type") != "summary" or stage is None or target is None:
+                    continue
+                if target_name is not None and target != target_name:
+                    continue
+                targets.setdefault(target, {})[stage] = data["value"]
+
+        lines = []
+        for target in sorted(targets):
+            stages = targets[target]
+            means = {stage: value["sum"] / value["count"] for stage, value in stages.items() if value["count"]}
+            stage_total = sum(mean for stage, mean in means.items() if stage != cls.TOTAL)
+            lines.append(target)
+            lines.append(f"  {'STAGE':<16}{'COUNT':>8}{'P50 ms':>12}{'P99 ms':>12}{'MAX ms':>12}{'SHARE':>8}")
+            for stage in cls.STAGES[1:] + [cls.TOTAL]:
+                value = stages.get(stage)
+                if value is None:
+                    continue
+                if stage != cls.TOTAL and stage_total > 0:
+                    share = f"{means.get(stage, 0.0) / stage_total * 100.0:.1f}%"
+                else:
+                    share = ""
+                lines.append(
+                    f"  {stage:<16}{value['count']:>8}{value['p50'] * 1000.0:>12.3f}"
+                    f"{value['p99'] * 1000.0:>12.3f}{value['max'] * 1000.0:>12.3f}{share:>8}"
+                )
+        if not lines:
+            return "No pipeline latency metrics found. Is OPENC3_PIPELINE_TRACE set for the interfaces?"
+        return "\n".join(lines)
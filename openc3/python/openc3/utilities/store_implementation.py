@@ -64,6 +64,7 @@ class StoreMeta(type):
         {
             "instance",
             "instance_mutex",
+            "close_instances",
             "my_instances",
             "db_shard_for_target",
             "_db_shard_cache",
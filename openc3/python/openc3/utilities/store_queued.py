@@ -11,12 +11,10 @@
 
 import atexit
 import contextlib
-import queue
 import threading
 import time
 import traceback
 
-from openc3.utilities.sleeper import Sleeper
 from openc3.utilities.store import EphemeralStore, Store, StoreMeta
 
 
@@ -34,12 +32,29 @@ def kill_thread(owner, thread, timeout=1.0):
 
 
 class StoreQueued(metaclass=StoreMeta):
+    """Queues store calls and sends them to Redis in a pipeline from a background thread.
+
+    Writes where only the last value matters (hset of a key and field or set of a
+    key) replace the earlier queued write so e.g. a status updated on every packet
+    is only sent once per flush. The queue is flushed every update_interval or as
+    soon as FLUSH_THRESHOLD calls are queued. Once MAX_QUEUE_SIZE calls are queued
+    callers wait for the flush so memory is bounded when Redis is slow.
+    """
+
     # Variable that holds the singleton instances per db_shard
     my_instances = {}
 
     # Mutex used to ensure that only one instance is created
     instance_mutex = threading.Lock()
 
+    # Last writer wins calls and the number of leading args identifying what they write
+    COALESCE_ARGS = {"hset": 2, "set": 1}
+    # Number of queued calls which triggers a flush before update_interval
+    FLUSH_THRESHOLD = 1000
+    # Number of queued calls at which callers wait for a flush
+    MAX_QUEUE_SIZE = 100000
+    METRIC_NAME = "store_queued"
+
     # Get the singleton instance for a given db_shard
     @classmethod
     def instance(cls, update_interval=1, db_shard=0):
@@ -56,14 +71,27 @@ class StoreQueued(metaclass=StoreMeta):
         self.update_interval = update_interval
         self.db_shard = db_shard
         self.store = self.store_instance()
-        # Queue to hold the store requests
-        self.store_queue = queue.Queue()
-        # Sleeper used to delay update thread
-        self.update_sleeper = Sleeper()
+        # Queued calls by sequence number in the order they will be sent
+        self.store_queue = {}
+        self.sequence = 0
+        # key => {(method, identifying args) => sequence} of the writes which can be replaced
+        self.coalesce_index = {}
+        self.queue_mutex = threading.Condition()
+        # Set to flush early or shutdown
+        self.flush_event = threading.Event()
+        self.cancel_thread = False
+        self.coalesced_total = 0
+        self.flushed_total = 0
+        self.max_flush_seconds = 0.0
 
         # Use atexit to shutdown cleanly no matter how we die
         atexit.register(self.shutdown)
 
+        # Imported here because Metric depends on the models which use StoreQueued
+        from openc3.utilities.metric import Metric
+
+        Metric.add_update_generator(self)
+
         # Thread used to call methods on the store
         self.update_thread = threading.Thread(target=self.store_thread_body, daemon=True)
         self.update_thread.start()
@@ -72,16 +100,56 @@ class StoreQueued(metaclass=StoreMeta):
         if interval > 0.0:
             self.update_interval = interval
 
+    def queue(self, func, args, kwargs):
+        """Queue a store call, replacing an earlier queued write it makes redundant"""
+        with self.queue_mutex:
+            while len(self.store_queue) >= self.MAX_QUEUE_SIZE and self._flushing_thread():
+                self.flush_event.set()
+                self.queue_mutex.wait(self.update_interval)
+            # execute_command is passed the Redis command before the key
+            key_index = 1 if func == "execute_command" else 0
+            key = args[key_index] if len(args) > key_index else None
+            num_args = self.COALESCE_ARGS.get(func)
+            if num_args is not None and len(args) == num_args + 1 and not kwargs:
+                writes = self.coalesce_index.setdefault(args[0], {})
+                identity = (func, args[1:num_args])
+                sequence = writes.pop(identity, None)
+                if sequence is not None:
+                    del self.store_queue[sequence]
+                    self.coalesced_total += 1
+                writes[identity] = self.sequence
+            elif key is not None:
+                # Any other call on the key must stay after the writes queued before it
+                self.coalesce_index.pop(key, None)
+            self.store_queue[self.sequence] = [func, args, kwargs]
+            self.sequence += 1
+            if len(self.store_queue) >= self.FLUSH_THRESHOLD and not self.flush_event.is_set():
+                self.flush_event.set()
+
+    def _flushing_thread(self):
+        return (
+            self.update_thread is not None
+            and self.update_thread.is_alive()
+            and threading.current_thread() != self.update_thread
+        )
+
     def process_queue(self):
-        if not self.store_queue.empty():
+        with self.queue_mutex:
+            actions = list(self.store_queue.values())
+            self.store_queue = {}
+            self.coalesce_index = {}
+            self.queue_mutex.notify_all()
+        if actions:
+            start_time = time.time()
             # Pipeline the requests to redis to improve performance
             with self.store.redis_pool.get(), self.store.redis_pool.pipelined():
-                while not self.store_queue.empty():
-                    action = self.store_queue.get()
+                for action in actions:
                     getattr(self.store, action[0])(*action[1], **action[2])
+            self.flushed_total += len(actions)
+            self.max_flush_seconds = max(self.max_flush_seconds, time.time() - start_time)
 
     def store_thread_body(self):
-        while True:
+        while not self.cancel_thread:
             start_time = time.time()
 
             try:
@@ -89,17 +157,15 @@ class StoreQueued(metaclass=StoreMeta):
             except Exception:
                 print(f"StoreQueued thread error (db_shard={self.db_shard}):\n{traceback.format_exc()}")
 
-            # Only check whether to update at a set interval
+            # Only check whether to update at a set interval unless flushed early
             run_time = time.time() - start_time
             sleep_time = self.update_interval - run_time
             if sleep_time < 0:
                 sleep_time = 0
-            if self.update_sleeper.sleep(sleep_time):
-                break
+            self.flush_event.wait(sleep_time)
+            self.flush_event.clear()
 
     def shutdown(self):
-        if self.update_sleeper:
-            self.update_sleeper.cancel()
         if self.update_thread:
             kill_thread(self, self.update_thread)
         self.update_thread = None
@@ -111,7 +177,7 @@ class StoreQueued(metaclass=StoreMeta):
     # Record the message for pipelining by the thread
     def __getattr__(self, func):
         def method(*args, **kwargs):
-            return self.store_queue.put([func, args, kwargs])
+            return self.queue(func, args, kwargs)
 
         return method
 
@@ -120,13 +186,37 @@ class StoreQueued(metaclass=StoreMeta):
         return Store.instance(db_shard=self.db_shard)
 
     def graceful_kill(self):
-        # Do nothing
-        pass
+        self.cancel_thread = True
+        self.flush_event.set()
+
+    # Called by Metric on each metric cycle
+    def generate(self, metric):
+        labels = {"db_shard": self.db_shard}
+        name = f"{self.METRIC_NAME}__{self.db_shard}"
+        metric.set(name=f"{name}_queue_depth", value=len(self.store_queue), type="gauge", labels=labels)
+        metric.set(
+            name=f"{name}_flush_duration_seconds",
+            value=self.max_flush_seconds,
+            type="gauge",
+            unit="seconds",
+            help="Longest flush to the store since the last metric update",
+            labels=labels,
+        )
+        self.max_flush_seconds = 0.0
+        metric.set(name=f"{name}_flushed_total", value=self.flushed_total, type="counter", labels=labels)
+        metric.set(
+            name=f"{name}_coalesced_total",
+            value=self.coalesced_total,
+            type="counter",
+            help="Queued writes replaced by a later write to the same key",
+            labels=labels,
+        )
 
 
 class EphemeralStoreQueued(StoreQueued):
     # Variable that holds the singleton instances per db_shard
     my_instances = {}
+    METRIC_NAME = "ephemeral_store_queued"
 
     def store_instance(self):
         return EphemeralStore.instance(db_shard=self.db_shard)
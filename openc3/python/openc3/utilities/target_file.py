@@ -9,12 +9,33 @@
 # This file may also be used under the terms of a commercial license
 # if purchased from OpenC3, Inc.
 
+import contextlib
+import hashlib
+import os
+import tempfile
+import threading
+import time
+
 from openc3.environment import OPENC3_CONFIG_BUCKET, OPENC3_LOCAL_MODE
 from openc3.utilities.bucket import Bucket
 from openc3.utilities.local_mode import LocalMode
 
 
 class TargetFile:
+    # Seconds a cached file is trusted before it is revalidated against the bucket
+    REVALIDATE_PERIOD = float(os.environ.get("OPENC3_TARGET_FILE_CACHE_REVALIDATE_PERIOD", 2.0))
+    # Optional directory to share cached files between processes (i.e. scripts)
+    CACHE_DIR = os.environ.get("OPENC3_TARGET_FILE_CACHE_DIR")
+
+    # Bucket key => [etag, body, time validated]. body is None if the key does not exist.
+    cache = {}
+    # Bucket path => [dirs, files, time listed]
+    list_cache = {}
+    cache_mutex = threading.Lock()
+    # Bucket client shared by every lookup. It is created on first use because
+    # creating a client is expensive compared to a conditional get.
+    bucket_client = None
+
     @classmethod
     def body(cls, scope, name):
         name = name.split("*")[0]  # Split '*' that indicates modified
@@ -24,12 +45,95 @@ class TargetFile:
             if local_file:
                 return local_file.read()
 
-        bucket = Bucket.get_client()
-        resp = bucket.get_object(bucket=OPENC3_CONFIG_BUCKET, key=f"{scope}/targets_modified/{name}")
-        if not resp:
+        body = cls.get(f"{scope}/targets_modified/{name}")
+        if body is None:
             # Now try the original
-            resp = bucket.get_object(bucket=OPENC3_CONFIG_BUCKET, key=f"{scope}/targets/{name}")
-        if resp and resp["Body"]:
-            return resp["Body"].read()
+            body = cls.get(f"{scope}/targets/{name}")
+        return body
+
+    # Get a file from the config bucket through the cache. Cached files are
+    # revalidated by ETag so unchanged files are not transferred again.
+    #
+    # @return [bytes|None] The file contents or None if the key does not exist
+    @classmethod
+    def get(cls, key):
+        with cls.cache_mutex:
+            entry = cls.cache.get(key)
+        if entry is not None and (time.time() - entry[2]) < cls.REVALIDATE_PERIOD:
+            return entry[1]
+        if entry is None or entry[1] is None:
+            entry = cls._read_disk_cache(key) or entry
+
+        etag = entry[0] if entry else None
+        resp = cls._bucket_client().get_object_if_changed(bucket=OPENC3_CONFIG_BUCKET, key=key, etag=etag)
+        if not resp:
+            body = None
+            etag = None
+        elif resp["Body"] is None:
+            body = entry[1]  # Not modified
         else:
+            body = resp["Body"].read()
+            etag = resp.get("ETag")
+            if etag is not None:
+                cls._write_disk_cache(key, etag, body)
+
+        with cls.cache_mutex:
+            cls.cache[key] = [etag, body, time.time()]
+        return body
+
+    # List a path in the config bucket through the cache. Listings have no ETag
+    # so they are listed again once they are older than the REVALIDATE_PERIOD.
+    #
+    # @return [tuple] The dirs and files at the path
+    @classmethod
+    def list_files(cls, path):
+        with cls.cache_mutex:
+            entry = cls.list_cache.get(path)
+        if entry is not None and (time.time() - entry[2]) < cls.REVALIDATE_PERIOD:
+            return entry[0], entry[1]
+
+        dirs, files = cls._bucket_client().list_files(OPENC3_CONFIG_BUCKET, path)
+        with cls.cache_mutex:
+            cls.list_cache[path] = [dirs, files, time.time()]
+        return dirs, files
+
+    @classmethod
+    def clear_cache(cls):
+        with cls.cache_mutex:
+            cls.cache = {}
+            cls.list_cache = {}
+
+    @classmethod
+    def _bucket_client(cls):
+        with cls.cache_mutex:
+            if cls.bucket_client is None:
+                cls.bucket_client = Bucket.get_client()
+            return cls.bucket_client
+
+    @classmethod
+    def _disk_cache_path(cls, key):
+        return os.path.join(cls.CACHE_DIR, hashlib.sha256(key.encode()).hexdigest())
+
+    # The disk cache file is the ETag on the first line followed by the body
+    @classmethod
+    def _read_disk_cache(cls, key):
+        if not cls.CACHE_DIR:
+            return None
+        try:
+            with open(cls._disk_cache_path(key), "rb") as file:
+                etag = file.readline()[:-1].decode()
+                return [etag, file.read(), 0]
+        except OSError:
             return None
+
+    @classmethod
+    def _write_disk_cache(cls, key, etag, body):
+        if not cls.CACHE_DIR:
+            return
+        # Write to a temp file and rename so readers never see a partial file
+        with contextlib.suppress(OSError):
+            os.makedirs(cls.CACHE_DIR, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=cls.CACHE_DIR)
+            with os.fdopen(fd, "wb") as file:
+                file.write(etag.encode() + b"\n" + body)
+            os.replace(temp_path, cls._disk_cache_path(key))
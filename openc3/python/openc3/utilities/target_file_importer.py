@@ -9,13 +9,17 @@
 # This file may also be used under the terms of a commercial license
 # if purchased from OpenC3, Inc.
 
+import contextlib
+import hashlib
 import importlib
+import linecache
+import marshal
 import os
 import sys
 import tempfile
+import threading
 
-from openc3.environment import OPENC3_CONFIG_BUCKET, OPENC3_SCOPE
-from openc3.utilities.bucket import Bucket
+from openc3.environment import OPENC3_SCOPE
 from openc3.utilities.target_file import TargetFile
 
 
@@ -23,7 +27,42 @@ from openc3.utilities.target_file import TargetFile
 # PathFinder locates modules according to a path like structure
 # which is what we're doing with target file imports
 _real_pathfinder = sys.meta_path[-1]
-_bucket_client = Bucket.get_client()
+
+# Compiled code keyed by the SHA256 of the source so identical files share code
+_code_cache = {}
+_code_cache_mutex = threading.Lock()
+
+
+# Compile the source of a target file, reusing bytecode compiled by this or
+# (with TargetFile.CACHE_DIR) any other process for the same source
+def compile_target_file(source, filename):
+    digest = hashlib.sha256(source.encode()).hexdigest()
+    with _code_cache_mutex:
+        code = _code_cache.get((digest, filename))
+    if code is not None:
+        return code
+
+    cache_path = None
+    if TargetFile.CACHE_DIR:
+        magic = importlib.util.MAGIC_NUMBER.hex()
+        cache_path = os.path.join(TargetFile.CACHE_DIR, f"{digest}.{magic}.pyc")
+        with contextlib.suppress(OSError, ValueError, EOFError, TypeError):
+            with open(cache_path, "rb") as file:
+                code = marshal.load(file)
+            # co_filename is baked into the code so only reuse it for the same file
+            if code.co_filename != filename:
+                code = None
+    if code is None:
+        code = compile(source, filename, "exec", dont_inherit=True)
+        if cache_path:
+            with contextlib.suppress(OSError):
+                fd, temp_path = tempfile.mkstemp(dir=TargetFile.CACHE_DIR)
+                with os.fdopen(fd, "wb") as file:
+                    marshal.dump(code, file)
+                os.replace(temp_path, cache_path)
+    with _code_cache_mutex:
+        _code_cache[(digest, filename)] = code
+    return code
 
 
 class MyLoader(importlib.abc.Loader):
@@ -32,13 +71,13 @@ class MyLoader(importlib.abc.Loader):
     # here based on the contents provided by the spec.loader_state.
     def create_module(self, spec):
         if spec.loader_state:
-            with tempfile.NamedTemporaryFile(mode="w+t", suffix=".py") as file:
-                file.write(spec.loader_state)
-                file.seek(0)  # Rewind so the file is ready to read
-                spec = importlib.util.spec_from_file_location(spec.name, file.name)
-                module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(module)
-                return module
+            source, filename = spec.loader_state
+            # Register the source so tracebacks can show the lines of the target file
+            linecache.cache[filename] = (len(source), None, source.splitlines(True), filename)
+            module = importlib.util.module_from_spec(importlib.machinery.ModuleSpec(spec.name, None, origin=filename))
+            module.__file__ = filename
+            exec(compile_target_file(source, filename), module.__dict__)
+            return module
         return None
 
     # Normally this is where the module is executed and populated.
@@ -73,7 +112,7 @@ class MyFinder(type(_real_pathfinder)):
         path = f"{OPENC3_SCOPE}/targets/{path_name}/"
 
         # See if anything exists at this path
-        dirs, files = _bucket_client.list_files(OPENC3_CONFIG_BUCKET, path)
+        dirs, files = TargetFile.list_files(path)
         if dirs or files:
             # Create a ModuleSpec using our loader
             spec = importlib.machinery.ModuleSpec(name, MyLoader(), origin=None)
@@ -92,13 +131,15 @@ class MyFinder(type(_real_pathfinder)):
 
             # Try to read the filename based on the last bit of the path
             # NOTE: This handles the target_modified vs target directory
-            body = TargetFile.body(OPENC3_SCOPE, f"{path_name}.py")
+            filename = f"{path_name}.py"
+            body = TargetFile.body(OPENC3_SCOPE, filename)
             if body is None:
-                body = TargetFile.body(OPENC3_SCOPE, os.path.join(path_name, "__init__.py"))
+                filename = os.path.join(path_name, "__init__.py")
+                body = TargetFile.body(OPENC3_SCOPE, filename)
             if body is not None:
                 # If a file was actually there we assign it to loader_state
                 # so the loader can parse it into a real module
-                spec.loader_state = body.decode()
+                spec.loader_state = (body.decode(), filename)
                 return spec
 
             # File not found and we are done
@@ -181,7 +181,7 @@ with open(py_file_name, "w+") as out, source_path.open() as file:
             .replace(".class", ".__class__.__name__")
             .replace("JSON.parse", "json.loads")
             .replace("JSON.generate", "json.dumps")
-            .replace("buffer(False)", "buffer_no_copy()")
+            .replace("buffer(False)", "buffer_view()")
             .replace("else", "else:")
             .replace("elsif", "elif:")
             .replace("true", "True")
@@ -442,3 +442,14 @@ class TestCborAccessor(unittest.TestCase):
         )
         self.assertEqual(CborAccessor.class_read_item(item13, self.data2), "art")
         self.assertEqual(CborAccessor.class_read_item(item14, self.data2), 14)
+
+    def test_should_decode_a_buffer_once_for_multiple_item_reads(self):
+        accessor = CborAccessor()
+        item1 = PacketItem("item1", 0, 0, "INT", "BIG_ENDIAN")
+        item1.key = "$.packet.item1"
+        item2 = PacketItem("item2", 0, 64, "FLOAT", "BIG_ENDIAN")
+        item2.key = "$.packet.item2"
+        with patch("openc3.accessors.cbor_accessor.loads", wraps=loads) as mock_loads:
+            self.assertEqual(accessor.read_item(item1, self.data1), 1)
+            self.assertEqual(accessor.read_item(item2, self.data1), 1.234)
+            self.assertEqual(mock_loads.call_count, 1)
@@ -12,7 +12,9 @@
 import json
 import unittest
 from collections import namedtuple
+from unittest.mock import patch
 
+from openc3.accessors import json_accessor
 from openc3.accessors.json_accessor import JsonAccessor
 from openc3.packets.packet import Packet
 from openc3.packets.packet_item import PacketItem
@@ -474,3 +476,44 @@ class TestJsonAccessor(unittest.TestCase):
         item2 = self.Json("item2", "$.more.item2", "UINT", None)
         JsonAccessor.class_write_item(item2, 456, dict_buffer)
         self.assertEqual(dict_buffer["more"]["item2"], 456)
+
+    def test_should_decode_a_buffer_once_for_multiple_item_reads(self):
+        accessor = JsonAccessor()
+        item1 = PacketItem("item1", 0, 0, "INT", "BIG_ENDIAN")
+        item1.key = "$.packet.item1"
+        item3 = PacketItem("item3", 0, 0, "STRING", "BIG_ENDIAN")
+        item3.key = "$.packet.item3"
+        with patch.object(json_accessor, "json_loads", wraps=json_accessor.json_loads) as mock_loads:
+            self.assertEqual(accessor.read_item(item1, self.data1), 1)
+            self.assertEqual(accessor.read_item(item3, self.data1), "a string")
+            self.assertEqual(mock_loads.call_count, 1)
+
+            # Changing the buffer contents decodes again
+            buffer = bytearray(self.data1.replace(b'"item1": 1', b'"item1": 5'))
+            self.assertEqual(accessor.read_item(item1, buffer), 5)
+            self.assertEqual(mock_loads.call_count, 2)
+
+    def test_should_not_return_references_into_the_cached_document(self):
+        accessor = JsonAccessor()
+        item = PacketItem("item5", 0, 0, "OBJECT", "BIG_ENDIAN")
+        item.key = "$.packet.item5"
+        value = accessor.read_item(item, self.data1)
+        value["another"] = "changed"
+        self.assertEqual(accessor.read_item(item, self.data1), {"another": "object"})
+
+    def test_should_compile_simple_paths(self):
+        self.assertEqual(json_accessor._compile_jsonpath("$"), ())
+        self.assertEqual(json_accessor._compile_jsonpath("$.a.b[2]"), ("a", "b", 2))
+        self.assertEqual(json_accessor._compile_jsonpath("$['a b'][0]"), ("a b", 0))
+        self.assertEqual(json_accessor._compile_jsonpath('$["a"].c'), ("a", "c"))
+        self.assertIsNone(json_accessor._compile_jsonpath("$.a[*]"))
+        self.assertIsNone(json_accessor._compile_jsonpath("$..a"))
+        self.assertIsNone(json_accessor._compile_jsonpath("$.a[-1]"))
+        self.assertIsNone(json_accessor._compile_jsonpath("$.where"))
+
+        # Type mismatches are not found just like jsonpath-ng
+        document = {"a": {"b": [1, 2, 3]}, "l": [{"a": 1}]}
+        self.assertEqual(json_accessor._find_compiled(("a", "b", 2), document), 3)
+        self.assertIsNone(json_accessor._find_compiled(("a", "b", 3), document))
+        self.assertIsNone(json_accessor._find_compiled(("a", 0), document))
+        self.assertIsNone(json_accessor._find_compiled(("l", "a"), document))
@@ -55,7 +55,7 @@ class TestTemplateAccessor(unittest.TestCase):
         item1.key = "VOLTAGE"
         item1.data_type = "FLOAT"
         item1.array_size = None
-        value = accessor.read_item(item1, packet.buffer_no_copy())
+        value = accessor.read_item(item1, packet.buffer_view())
         self.assertEqual(value, 5.0)
 
     def test_should_read_values(self):
@@ -67,7 +67,7 @@ class TestTemplateAccessor(unittest.TestCase):
         item1.key = "CHANNEL"
         item1.data_type = "UINT"
         item1.array_size = None
-        value = accessor.read_item(item1, self.packet.buffer_no_copy())
+        value = accessor.read_item(item1, self.packet.buffer_view())
         self.assertEqual(value, 2)
 
         item2 = namedtuple("Item", ["name", "key", "data_type", "array_size"])
@@ -75,23 +75,23 @@ class TestTemplateAccessor(unittest.TestCase):
         item2.key = "MYVALUE"
         item2.data_type = "FLOAT"
         item2.array_size = None
-        value = accessor.read_item(item2, self.packet.buffer_no_copy())
+        value = accessor.read_item(item2, self.packet.buffer_view())
         self.assertAlmostEqual(value, 5.67, places=2)
 
-        values = accessor.read_items([item1, item2], self.packet.buffer_no_copy())
+        values = accessor.read_items([item1, item2], self.packet.buffer_view())
         self.assertEqual(values["CHANNEL"], 2)
         self.assertAlmostEqual(values["MYVALUE"], 5.67, places=2)
 
         accessor = TemplateAccessor(self.packet2, "(", ")")
         self.packet2.buffer = self.data2
 
-        value = accessor.read_item(item1, self.packet2.buffer_no_copy())
+        value = accessor.read_item(item1, self.packet2.buffer_view())
         self.assertEqual(value, 2)
 
-        value = accessor.read_item(item2, self.packet2.buffer_no_copy())
+        value = accessor.read_item(item2, self.packet2.buffer_view())
         self.assertAlmostEqual(value, 5.67, places=2)
 
-        values = accessor.read_items([item1, item2], self.packet2.buffer_no_copy())
+        values = accessor.read_items([item1, item2], self.packet2.buffer_view())
         self.assertEqual(values["CHANNEL"], 2)
         self.assertAlmostEqual(values["MYVALUE"], 5.67, places=2)
 
@@ -107,10 +107,10 @@ class TestTemplateAccessor(unittest.TestCase):
         item.data_type = "STRING"
         item.array_size = None
 
-        value = accessor.read_item(item, packet.buffer_no_copy())
+        value = accessor.read_item(item, packet.buffer_view())
         self.assertIsNone(value)
 
-        values = accessor.read_items([item], packet.buffer_no_copy())
+        values = accessor.read_items([item], packet.buffer_view())
         self.assertIsNone(values["DUMMY"])
 
     def test_should_write_values(self):
@@ -122,7 +122,7 @@ class TestTemplateAccessor(unittest.TestCase):
         item1.key = "CHANNEL"
         item1.data_type = "UINT"
         item1.array_size = None
-        value = accessor.write_item(item1, 3, self.packet.buffer_no_copy())
+        value = accessor.write_item(item1, 3, self.packet.buffer_view())
         self.assertEqual(value, 3)
         self.assertEqual(self.packet.buffer, b"MEAS:VOLT (@3); SOMETHING ELSE <MYVALUE>;")
 
@@ -131,29 +131,29 @@ class TestTemplateAccessor(unittest.TestCase):
         item2.key = "MYVALUE"
         item2.data_type = "FLOAT"
         item2.array_size = None
-        value = accessor.write_item(item2, 1.234, self.packet.buffer_no_copy())
+        value = accessor.write_item(item2, 1.234, self.packet.buffer_view())
         self.assertAlmostEqual(value, 1.234, places=2)
         self.assertEqual(self.packet.buffer, b"MEAS:VOLT (@3); SOMETHING ELSE 1.234;")
 
         self.packet.restore_defaults()
-        accessor.write_items([item1, item2], [4, 2.345], self.packet.buffer_no_copy())
-        values = accessor.read_items([item1, item2], self.packet.buffer_no_copy())
+        accessor.write_items([item1, item2], [4, 2.345], self.packet.buffer_view())
+        values = accessor.read_items([item1, item2], self.packet.buffer_view())
         self.assertEqual(values["CHANNEL"], 4)
         self.assertAlmostEqual(values["MYVALUE"], 2.345, places=2)
 
         accessor = TemplateAccessor(self.packet2, "(", ")")
         self.packet2.restore_defaults()
 
-        value = accessor.write_item(item1, 3, self.packet2.buffer_no_copy())
+        value = accessor.write_item(item1, 3, self.packet2.buffer_view())
         self.assertEqual(value, 3)
         self.assertEqual(self.packet2.buffer, b"MEAS:VOLT <@3>; SOMETHING ELSE (MYVALUE);")
 
-        value = accessor.write_item(item2, 1.234, self.packet2.buffer_no_copy())
+        value = accessor.write_item(item2, 1.234, self.packet2.buffer_view())
         self.assertAlmostEqual(value, 1.234, places=2)
         self.assertEqual(self.packet2.buffer, b"MEAS:VOLT <@3>; SOMETHING ELSE 1.234;")
 
         self.packet2.restore_defaults()
-        accessor.write_items([item1, item2], [4, 2.345], self.packet2.buffer_no_copy())
-        values = accessor.read_items([item1, item2], self.packet2.buffer_no_copy())
+        accessor.write_items([item1, item2], [4, 2.345], self.packet2.buffer_view())
+        values = accessor.read_items([item1, item2], self.packet2.buffer_view())
         self.assertEqual(values["CHANNEL"], 4)
         self.assertAlmostEqual(values["MYVALUE"], 2.345, places=2)
@@ -21,6 +21,7 @@ from openc3.api.cmd_api import (
     TargetModel,
     build_cmd,
     cmd,
+    cmd_many,
     cmd_no_checks,  # noqa: F401 - accessed dynamically via globals()
     cmd_no_hazardous_check,  # noqa: F401 - accessed dynamically via globals()
     cmd_no_range_check,  # noqa: F401 - accessed dynamically via globals()
@@ -50,6 +51,7 @@ from openc3.models.interface_status_model import InterfaceStatusModel
 from openc3.models.microservice_model import MicroserviceModel
 from openc3.packets.packet import Packet
 from openc3.top_level import HazardousError
+from openc3.topics.command_topic import CommandTopic
 from test.test_helper import capture_io, mock_redis, setup_system
 
 
@@ -108,6 +110,8 @@ class TestCmdApi(unittest.TestCase):
 
         self.icht = InterfaceCmdHandlerThread(self.interface, None, scope="DEFAULT")
         self.thread = self.icht.start()
+        # Publish inline so the logs and counts are written before the ack
+        self.icht.publish_thread.stop()
         time.sleep(0.001)
 
     def tearDown(self):
@@ -320,6 +324,56 @@ class TestCmdApi(unittest.TestCase):
             except HazardousError:
                 self.fail(f"{name} raised HazardousError unexpectedly!")
 
+    def test_cmd_many_sends_all_the_commands(self):
+        commands = cmd_many(
+            [
+                "INST ABORT",
+                ["INST", "COLLECT", {"TYPE": "NORMAL", "Duration": 5}],
+                ["INST", "FLTCMD", {"FLOAT32": 1.5}],
+            ]
+        )
+        self.assertEqual([command["cmd_name"] for command in commands], ["ABORT", "COLLECT", "FLTCMD"])
+        self.assertEqual(commands[1]["cmd_params"], {"TYPE": "NORMAL", "DURATION": 5})
+        self.assertEqual(commands[1]["cmd_string"], 'cmd("INST COLLECT with TYPE NORMAL, DURATION 5")')
+        commands = cmd_many(["INST COLLECT with TYPE 0"], raw=True)
+        self.assertEqual(commands[0]["cmd_string"], 'cmd_raw("INST COLLECT with TYPE 0")')
+
+    def test_cmd_many_raises_the_first_failure(self):
+        with self.assertRaisesRegex(RuntimeError, "not in valid range"):
+            cmd_many(["INST ABORT", "INST COLLECT with TYPE NORMAL, DURATION 1000"])
+        with self.assertRaisesRegex(HazardousError, "Hazardous"):
+            cmd_many(["INST ABORT", "INST COLLECT with TYPE SPECIAL", "INST ABORT"])
+
+    def test_cmd_many_passes_the_checks_and_timeouts(self):
+        commands = cmd_many(
+            ["INST COLLECT with TYPE SPECIAL", "INST COLLECT with TYPE NORMAL, DURATION 1000"],
+            range_check=False,
+            hazardous_check=False,
+        )
+        self.assertEqual(commands[0]["cmd_string"], 'cmd_no_checks("INST COLLECT with TYPE SPECIAL")')
+        self.assertEqual(commands[1]["cmd_params"]["DURATION"], 1000)
+        with self.assertRaisesRegex(HazardousError, "Hazardous"):
+            cmd_many(["INST COLLECT with TYPE SPECIAL"], range_check=False)
+        with patch.object(CommandTopic, "send_commands") as send_commands:
+            cmd_many([{"command": "INST ABORT", "timeout": 1}, "INST CLEAR"], timeout=7)
+            self.assertEqual(send_commands.call_args.kwargs["timeout"], [1, 7])
+
+    def test_cmd_many_isolates_commands_which_may_be_hazardous(self):
+        with patch.object(CommandTopic, "send_commands") as send_commands:
+            cmd_many(["INST ABORT", "INST CLEAR", "INST COLLECT with TYPE NORMAL", "INST FLTCMD"])
+            self.assertEqual(send_commands.call_args.kwargs["isolate"], [False, True, True, False])
+            # Critical commanding can hold them for approval even without the hazardous check
+            cmd_many(["INST ABORT", "INST COLLECT with TYPE NORMAL"], hazardous_check=False)
+            self.assertEqual(send_commands.call_args.kwargs["isolate"], [False, True])
+
+    def test_cmd_many_isolates_restricted_commands(self):
+        packet = TargetModel.packet("INST", "ABORT", type="CMD", scope="DEFAULT")
+        packet["restricted"] = True
+        TargetModel.set_packet("INST", "ABORT", packet, type="CMD", scope="DEFAULT")
+        with patch.object(CommandTopic, "send_commands") as send_commands:
+            cmd_many(["INST FLTCMD", "INST ABORT", "INST FLTCMD"], hazardous_check=False)
+            self.assertEqual(send_commands.call_args.kwargs["isolate"], [False, True, False])
+
     def test_cmd_warns_about_hazardous_commands(self):
         for name in [
             "cmd",
@@ -9,6 +9,8 @@
 # This file may also be used under the terms of a commercial license
 # if purchased from OpenC3, Inc.
 
+import io
+import re
 import tempfile
 import unittest
 from unittest.mock import *
@@ -159,6 +161,32 @@ class TestConfigParser(unittest.TestCase):
             self.assertEqual(self.cp.line_number, 1)
         tf.close()
 
+    def test_tokenizes_lines_with_and_without_quotes_the_same(self):
+        with tempfile.NamedTemporaryFile(mode="w+t") as tf:
+            tf.writelines("keyword\tPARAM1  PARAM2 #Comment\n")
+            tf.writelines("KEYWORD PARAM1 'PARAM2' #Comment\n")
+            tf.writelines('KEYWORD PA"RAM1 "PARAM 2"\n')
+            tf.writelines("# Comment 'quoted'\n")
+            tf.seek(0)
+
+            results = list(self.cp.parse_file(tf.name, True))
+        self.assertEqual(
+            results,
+            [
+                ("KEYWORD", ["PARAM1", "PARAM2"]),
+                ("KEYWORD", ["PARAM1", "PARAM2"]),
+                ("KEYWORD", ['PA"RAM1', "PARAM 2"]),
+                (None, []),
+            ],
+        )
+
+    def test_parse_loop_compiles_the_regex_once(self):
+        lines = io.StringIO("KEYWORD 'PARAM1'\nKEYWORD 'PARAM2'\n")
+        with patch("re.compile", wraps=re.compile) as compile:
+            results = list(self.cp.parse_loop(lines, False, True, 0, ConfigParser.PARSING_REGEX))
+        self.assertEqual(compile.call_count, 1)
+        self.assertEqual(results, [("KEYWORD", ["PARAM1"]), ("KEYWORD", ["PARAM2"])])
+
     def test_handles_inline_line_continuations(self):
         tf = tempfile.NamedTemporaryFile(mode="w+t")
         tf.writelines("KEYWORD PARAM1 & PARAM2")
@@ -14,10 +14,15 @@ import pytest
 from openc3.utilities.logger import Logger
 
 
+# Write log messages synchronously so tests can capture them
+Logger.async_enabled = False
+
+
 @pytest.fixture(autouse=True, scope="function")
 def configure_logging():
     """Let pytest capture log output - only shown on test failure."""
     original_stdout = Logger.stdout
     Logger.stdout = True
+    Logger.sampler = None
     yield
     Logger.stdout = original_stdout
@@ -26,6 +26,15 @@ class TestPolynomialConversion(unittest.TestCase):
         gc = PolynomialConversion(1, 2, 3)
         self.assertEqual(gc.call(1, None, None), 6.0)
 
+    def test_converts_arrays_like_call(self):
+        gc = PolynomialConversion(1.5, 2.25, -0.001, 3e-7)
+        values = [0, 1, -1, 12345, 0.1, 2**40]
+        result = gc.call_array(values, None, None)
+        self.assertEqual(result, [gc.call(value, None, None) for value in values])
+        self.assertIsInstance(result[0], float)
+        # Values which can't be vectorized are converted one at a time
+        self.assertEqual(gc.call_array([1, None], None, None), [gc.call(1, None, None), None])
+
     def test_str_returns_the_equation(self):
         self.assertEqual(str(PolynomialConversion(1, 2, 3)), "1.0 + 2.0x + 3.0x^2")
 
@@ -34,6 +34,17 @@ class TestSegmentedPolynomialConversion(unittest.TestCase):
         self.assertEqual(gc.call(11, None, None), 23.0)
         self.assertEqual(gc.call(20, None, None), 43.0)
 
+    def test_converts_arrays_like_call(self):
+        gc = SegmentedPolynomialConversion()
+        gc.add_segment(10, 1, 2)
+        gc.add_segment(5, 2, 2, 0.5)
+        gc.add_segment(15, 3, 2)
+        values = [1, 5, 9.5, 10, 11, 15, 20, -3]
+        result = gc.call_array(values, None, None)
+        self.assertEqual(result, [gc.call(value, None, None) for value in values])
+        self.assertIsInstance(result, list)
+        self.assertEqual(gc.call_array([], None, None), [])
+
     def test_returns_the_equations(self):
         self.assertEqual(str(SegmentedPolynomialConversion()), "")
         gc = SegmentedPolynomialConversion()
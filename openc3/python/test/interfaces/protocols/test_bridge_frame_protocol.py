@@ -0,0 +1,79 @@
+# Copyright 2026 OpenC3, Inc.
+# All Rights Reserved.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See LICENSE.md for more details.
+
+# This file may also be used under the terms of a commercial license
+# if purchased from OpenC3, Inc.
+
+import unittest
+
+from openc3.interfaces.protocols.bridge_frame_protocol import BridgeFrameProtocol
+from openc3.interfaces.stream_interface import StreamInterface
+from openc3.packets.packet import Packet
+from openc3.streams.stream import Stream
+
+
+class TestBridgeFrameProtocol(unittest.TestCase):
+    reads = []
+    written = b""
+
+    class FrameStream(Stream):
+        def connect(self):
+            pass
+
+        def connected(self):
+            return True
+
+        def disconnect(self):
+            pass
+
+        def read(self):
+            return TestBridgeFrameProtocol.reads.pop(0)
+
+        def write(self, data):
+            TestBridgeFrameProtocol.written += data
+
+    class MyInterface(StreamInterface):
+        def connected(self):
+            return True
+
+    def setUp(self):
+        TestBridgeFrameProtocol.reads = []
+        TestBridgeFrameProtocol.written = b""
+        self.interface = TestBridgeFrameProtocol.MyInterface()
+        self.interface.stream = TestBridgeFrameProtocol.FrameStream()
+        self.interface.add_protocol(BridgeFrameProtocol, [], "READ_WRITE")
+
+    def test_frames_and_unframes_packets(self):
+        self.assertEqual(BridgeFrameProtocol.frame(b"\x01\x02"), b"\x00\x00\x00\x02\x01\x02")
+        data = BridgeFrameProtocol.frame(b"\x01\x02") + BridgeFrameProtocol.frame(b"") + b"\x00\x00\x00\x03\x04"
+        packets, remaining = BridgeFrameProtocol.unframe(data)
+        self.assertEqual(packets, [b"\x01\x02", b""])
+        self.assertEqual(remaining, b"\x00\x00\x00\x03\x04")
+        self.assertEqual(BridgeFrameProtocol.unframe(b"\x00\x00"), ([], b"\x00\x00"))
+
+    def test_reads_packets_from_batched_and_split_frames(self):
+        data = BridgeFrameProtocol.frame(b"\x01\x02\x03") + BridgeFrameProtocol.frame(b"\x04")
+        # Two frames in one read then a frame split across reads
+        TestBridgeFrameProtocol.reads = [data, b"\x00\x00", b"\x00\x02\x05", b"\x06"]
+        self.assertEqual(self.interface.read().buffer, b"\x01\x02\x03")
+        self.assertEqual(self.interface.read().buffer, b"\x04")
+        self.assertEqual(self.interface.read().buffer, b"\x05\x06")
+
+    def test_writes_framed_packets(self):
+        self.interface.write(Packet(None, None, "BIG_ENDIAN", None, b"\x01\x02\x03"))
+        self.assertEqual(TestBridgeFrameProtocol.written, b"\x00\x00\x00\x03\x01\x02\x03")
+        packets, remaining = BridgeFrameProtocol.unframe(TestBridgeFrameProtocol.written)
+        self.assertEqual(packets, [b"\x01\x02\x03"])
+        self.assertEqual(remaining, b"")
+
+    def test_enforces_the_max_length(self):
+        self.interface.read_protocols = []
+        self.interface.add_protocol(BridgeFrameProtocol, [2], "READ")
+        TestBridgeFrameProtocol.reads = [BridgeFrameProtocol.frame(b"\x01\x02\x03")]
+        with self.assertRaisesRegex(ValueError, "larger than max_length"):
+            self.interface.read()
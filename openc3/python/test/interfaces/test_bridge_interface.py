@@ -14,7 +14,14 @@ import sys
 import unittest
 from unittest.mock import AsyncMock, Mock, patch
 
-from openc3.interfaces.bridge_interface import BridgeInterface
+from openc3.interfaces.bridge_interface import (
+    BRIDGE_GO,
+    BRIDGE_GO_FRAMED,
+    BRIDGE_READY,
+    BRIDGE_READY_FRAMED,
+    BridgeInterface,
+)
+from openc3.interfaces.protocols.bridge_frame_protocol import BridgeFrameProtocol
 from test.test_helper import mock_redis
 
 
@@ -116,6 +123,39 @@ class TestBridgeInterface(unittest.TestCase):
         fake_iroh.RelayMode.custom_from_urls.assert_called_once_with(["https://relay.example"])
         self.assertIs(interface._endpoint, endpoint)
 
+    def establish_data(self, framed, ready):
+        interface = BridgeInterface("BRIDGE")
+        interface.name = "INTERFACE"
+        interface.ticket = "ticket"
+        if framed:
+            interface.add_protocol(BridgeFrameProtocol, [], "READ_WRITE")
+        send = Mock(write_all=AsyncMock(), finish=AsyncMock())
+        recv = Mock(read=AsyncMock(side_effect=[b"\x00", ready]))
+        bi = Mock(send=Mock(return_value=send), recv=Mock(return_value=recv))
+        connection = Mock(accept_bi=AsyncMock(return_value=bi))
+        interface._endpoint = Mock(connect=AsyncMock(return_value=connection))
+
+        async def establish():
+            interface._loop = asyncio.get_running_loop()
+            try:
+                await interface._establish_data()
+            finally:
+                await interface._close_data()
+
+        with patch.dict(sys.modules, {"iroh": Mock()}):
+            asyncio.run(establish())
+        return send.write_all.await_args.args[0]
+
+    def test_negotiates_framing_in_the_handshake(self):
+        self.assertEqual(self.establish_data(False, BRIDGE_READY), BRIDGE_GO)
+        self.assertEqual(self.establish_data(True, BRIDGE_READY_FRAMED), BRIDGE_GO_FRAMED)
+
+    def test_rejects_a_host_which_disagrees_on_framing(self):
+        with self.assertRaisesRegex(RuntimeError, "the host does not frame packets"):
+            self.establish_data(True, BRIDGE_READY)
+        with self.assertRaisesRegex(RuntimeError, "the host frames packets"):
+            self.establish_data(False, BRIDGE_READY_FRAMED)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -64,7 +64,7 @@ class InterfaceTestProtocol(Protocol):
                 return "DISCONNECT"
             if self.packet_added_data == "STOP":
                 return packet
-            buffer = packet.buffer_no_copy()
+            buffer = packet.buffer_view()
             buffer += self.packet_added_data
             packet.buffer = buffer
             return packet
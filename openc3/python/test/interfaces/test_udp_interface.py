@@ -168,6 +168,41 @@ class TestUdpInterface(unittest.TestCase):
         i.disconnect()
         close_socket(write)
 
+    def test_reads_batches_of_datagrams(self):
+        write = UdpWriteSocket("127.0.0.1", 8889)
+        i = UdpInterface("127.0.0.1", "None", "8889")
+        i.set_option("READ_BATCH_SIZE", ["16"])
+        i.set_option("RECEIVE_BUFFER_SIZE", ["1048576"])
+        i.connect()
+        # Linux doubles the requested size to allow for bookkeeping overhead
+        self.assertGreaterEqual(i.read_socket.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF), 1048576)
+        for index in range(3):
+            write.write(bytes([index, index]))
+        time.sleep(0.01)
+        with patch.object(i.read_socket, "read_batch", wraps=i.read_socket.read_batch) as read_batch:
+            for index in range(3):
+                packet = i.read()
+                self.assertEqual(packet.buffer, bytes([index, index]))
+            read_batch.assert_called_once()
+        self.assertEqual(i.read_count, 3)
+        self.assertEqual(i.bytes_read, 6)
+        i.disconnect()
+        close_socket(write)
+
+    def test_returns_none_if_disconnected_during_a_batch_read(self):
+        i = UdpInterface("127.0.0.1", "None", "8889")
+        i.set_option("READ_BATCH_SIZE", ["16"])
+        i.connect()
+
+        def read_batch(timeout, batch_size):
+            # disconnect from another thread clears the datagrams which were read
+            i.read_datagrams.clear()
+            return []
+
+        with patch.object(i.read_socket, "read_batch", side_effect=read_batch):
+            self.assertEqual(i.read_interface(), (None, None))
+        i.disconnect()
+
     @patch.object(BucketUtilities, "move_log_file_to_bucket_thread")
     def test_logs_the_raw_data(self, move_log_file):
         move_log_file.return_value = None
@@ -11,6 +11,7 @@
 
 import select
 import struct
+import time
 import unittest
 from unittest.mock import patch
 
@@ -86,6 +87,31 @@ class TestUdpReadSocket(unittest.TestCase):
             udp_read.read(2.0)
         udp_read.close()
 
+    def test_reads_a_batch_of_data(self):
+        udp_read = UdpReadSocket(8888)
+        udp_write = UdpWriteSocket("127.0.0.1", 8888)
+        for index in range(10):
+            udp_write.write(bytes([index]) * (index + 1), 2.0)
+        time.sleep(0.01)
+        self.assertEqual(udp_read.read_batch(2.0, 4), [b"\x00", b"\x01\x01", b"\x02\x02\x02", b"\x03" * 4])
+        self.assertEqual(udp_read.read_batch(2.0, 64), [bytes([index]) * (index + 1) for index in range(4, 10)])
+        with self.assertRaises(TimeoutError):
+            udp_read.read_batch(0.01)
+        udp_read.close()
+        udp_write.close()
+
+    def test_reads_a_batch_of_data_without_recvmmsg(self):
+        udp_read = UdpReadSocket(8888)
+        udp_write = UdpWriteSocket("127.0.0.1", 8888)
+        for index in range(5):
+            udp_write.write(bytes([index]), 2.0)
+        time.sleep(0.01)
+        with patch("openc3.io.udp_sockets._recvmmsg", None):
+            self.assertEqual(udp_read.read_batch(2.0, 3), [b"\x00", b"\x01", b"\x02"])
+            self.assertEqual(udp_read.read_batch(2.0, 3), [b"\x03", b"\x04"])
+        udp_read.close()
+        udp_write.close()
+
     @patch.object(select, "select")
     @patch("socket.socket")
     def test_handles_closed_socket(self, mock_socket, mock_select):
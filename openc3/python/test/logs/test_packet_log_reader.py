@@ -22,13 +22,15 @@ import time
 import unittest
 from datetime import datetime, timezone
 
+import cbor2
+
 from openc3.logs.packet_log_constants import (
     COSMOS2_FILE_HEADER,
     COSMOS4_FILE_HEADER,
 )
 from openc3.logs.packet_log_reader import PacketLogReader
 from openc3.logs.packet_log_writer import PacketLogWriter
-from openc3.packets.json_packet import JsonPacket
+from openc3.packets.json_packet import JsonPacket, LazyJsonPacket
 
 
 # 1 second in nanoseconds
@@ -152,6 +154,30 @@ class TestPacketLogReaderWithJsonTelemetry(unittest.TestCase):
             index += 1
         self.assertEqual(index, 3)
 
+    def test_returns_lazy_packets_which_decode_on_read(self):
+        """returns lazy packets which only decode their data when read"""
+        plr = PacketLogReader(lazy=True)
+        packets = list(plr.each(self.logfile))
+        self.assertEqual([packet.time_nsec for packet in packets], self.times)
+        for packet in packets:
+            self.assertIsInstance(packet, LazyJsonPacket)
+            self.assertFalse(packet.decoded)
+        self.assertEqual(packets[0].read("TEMP1"), 25.5)
+        self.assertTrue(packets[0].decoded)
+        self.assertEqual(packets[0].read_all("RAW"), self.pkt_data)
+        self.assertFalse(packets[1].decoded)
+
+    def test_only_keeps_the_requested_items(self):
+        """only decodes the requested items"""
+        for lazy in [False, True]:
+            plr = PacketLogReader(lazy=lazy, items=["COLLECTS", "TEMP1"])
+            packets = list(plr.each(self.logfile))
+            self.assertEqual(len(packets), 3)
+            for packet in packets:
+                self.assertEqual(packet.decoded, not lazy)
+                self.assertEqual(packet.json_hash, {"COLLECTS": 100, "TEMP1": 25.5})
+                self.assertIsNone(packet.read("CCSDSVER"))
+
 
 class TestPacketLogReaderWithJsonCommands(unittest.TestCase):
     """Tests for PacketLogReader.each() with JSON commands"""
@@ -518,6 +544,30 @@ class TestJsonPacket(unittest.TestCase):
         self.assertEqual(values["COLLECTS"], 100)
         self.assertEqual(values["TEMP1"], 25.5)
 
+    def test_lazy_packet_projects_json_data(self):
+        """LazyJsonPacket keeps every suffix of the requested items"""
+        time_nsec = int(time.time() * 1e9)
+        json_data = b'{"COLLECTS": 100, "COLLECTS__C": "ONE HUNDRED", "COLLECTS__L": "GREEN", "TEMP1": 25.5}'
+
+        packet = LazyJsonPacket("TLM", "INST", "HEALTH_STATUS", time_nsec, False, json_data, False, names={"COLLECTS"})
+
+        self.assertEqual(packet.read("COLLECTS"), "ONE HUNDRED")
+        self.assertEqual(packet.read_with_limits_state("COLLECTS"), ("ONE HUNDRED", "GREEN"))
+        self.assertIsNone(packet.read("TEMP1"))
+
+    def test_lazy_packet_projects_a_key_map(self):
+        """LazyJsonPacket only expands the projected key map"""
+        time_nsec = int(time.time() * 1e9)
+        key_map = {"0": "COLLECTS", "1": "COLLECTS__C", "2": "TEMP1"}
+        projected = LazyJsonPacket.project_key_map(key_map, {"COLLECTS"})
+        self.assertEqual(projected, {"0": "COLLECTS", "1": "COLLECTS__C"})
+
+        data = cbor2.dumps({"0": 100, "1": "ONE HUNDRED", "2": 25.5})
+        packet = LazyJsonPacket(
+            "TLM", "INST", "HEALTH_STATUS", time_nsec, False, data, True, projected, names={"COLLECTS"}
+        )
+        self.assertEqual(packet.json_hash, {"COLLECTS": 100, "COLLECTS__C": "ONE HUNDRED"})
+
     def test_time_properties(self):
         """time properties work correctly"""
         time_nsec = int(time.time() * 1e9)
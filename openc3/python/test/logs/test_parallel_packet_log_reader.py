@@ -0,0 +1,158 @@
+# Copyright 2026 OpenC3, Inc.
+# All Rights Reserved.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See LICENSE.md for more details.
+#
+# This file may also be used under the terms of a commercial license
+# if purchased from OpenC3, Inc.
+
+import os
+import pickle
+import shutil
+import tempfile
+import threading
+import unittest
+from concurrent.futures import Future, ProcessPoolExecutor
+from datetime import datetime, timezone
+from unittest.mock import ANY, patch
+
+from openc3.logs.packet_log_writer import PacketLogWriter
+from openc3.logs.parallel_packet_log_reader import (
+    ParallelPacketLogReader,
+    _follow_results,
+    _read_file,
+    _read_results,
+)
+from openc3.utilities.bucket_utilities import BucketUtilities
+
+
+NSEC_PER_SECOND = 1_000_000_000
+START_NSEC = 1_700_000_000 * NSEC_PER_SECOND
+
+
+# Transforms run in the worker processes so they must be module level functions
+def collects_only(packet):
+    value = packet.read("COLLECTS")
+    if value % 2:
+        return None
+    return (packet.packet_name, value)
+
+
+def packet_name_and_buffer(packet):
+    return (packet.packet_name, packet.buffer_view())
+
+
+class TestParallelPacketLogReader(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir)
+
+    def write_log(self, packet_name, offset, raw_or_json="JSON_PACKET"):
+        plw = PacketLogWriter(self.temp_dir, f"spec_{packet_name.lower()}")
+        for index in range(5):
+            time_nsec = START_NSEC + ((index * 2) + offset) * NSEC_PER_SECOND
+            if raw_or_json == "RAW_PACKET":
+                data = bytes([index])
+            else:
+                data = {"COLLECTS": (index * 2) + offset}
+            plw.write(raw_or_json, "TLM", "INST", packet_name, time_nsec, True, data, None, "0-0")
+        filename = plw.filename
+        plw.shutdown()
+        return filename
+
+    def test_merges_the_files_in_time_order(self):
+        files = [self.write_log("ODD", 1), self.write_log("EVEN", 0)]
+        reader = ParallelPacketLogReader(processes=2)
+        results = list(reader.each(files))
+        self.assertEqual([result["json_hash"]["COLLECTS"] for result in results], list(range(10)))
+        self.assertEqual([result["time_nsec"] for result in results][:2], [START_NSEC, START_NSEC + NSEC_PER_SECOND])
+        self.assertEqual(results[0]["packet_name"], "EVEN")
+        self.assertEqual(results[1]["packet_name"], "ODD")
+
+    def test_follows_the_results_while_the_worker_writes_them(self):
+        future = Future()
+        result_path = os.path.join(self.temp_dir, "results")
+        results = _follow_results(future, result_path, 0.01)
+        with open(result_path, "wb") as result_file:
+            pickle.dump((1, "first"), result_file)
+            result_file.flush()
+            self.assertEqual(next(results), (1, "first"))
+
+            # Only part of the next result has been written
+            data = pickle.dumps((2, "second"))
+            result_file.write(data[:3])
+            result_file.flush()
+
+            def finish():
+                result_file.write(data[3:])
+                result_file.flush()
+                future.set_result(result_path)
+
+            timer = threading.Timer(0.05, finish)
+            timer.start()
+            self.assertEqual(list(results), [(2, "second")])
+            timer.join()
+
+    def test_follow_raises_the_worker_error(self):
+        future = Future()
+        future.set_exception(FileNotFoundError("missing"))
+        with self.assertRaises(FileNotFoundError):
+            list(_follow_results(future, os.path.join(self.temp_dir, "results"), 0.01))
+
+    def test_does_not_wait_for_the_workers_when_closed_early(self):
+        files = [self.write_log("ODD", 1), self.write_log("EVEN", 0)]
+        reader = ParallelPacketLogReader(processes=2)
+        with patch.object(ProcessPoolExecutor, "shutdown", autospec=True) as shutdown:
+            results = reader.each(files)
+            self.assertEqual(next(results)["json_hash"]["COLLECTS"], 0)
+            results.close()
+        shutdown.assert_called_once_with(ANY, wait=False, cancel_futures=True)
+        # Let the workers exit
+        ProcessPoolExecutor.shutdown(shutdown.call_args.args[0])
+
+    def test_filters_by_time_and_transform(self):
+        files = [self.write_log("ODD", 1), self.write_log("EVEN", 0)]
+        reader = ParallelPacketLogReader(collects_only, processes=2, items=["COLLECTS"])
+        start_time = datetime.fromtimestamp((START_NSEC / NSEC_PER_SECOND) + 2, timezone.utc)
+        end_time = datetime.fromtimestamp((START_NSEC / NSEC_PER_SECOND) + 6, timezone.utc)
+        results = list(reader.each(files, start_time, end_time))
+        self.assertEqual(results, [("EVEN", 2), ("EVEN", 4), ("EVEN", 6)])
+
+    def test_yields_each_file_unordered(self):
+        files = [self.write_log("ODD", 1), self.write_log("EVEN", 0)]
+        reader = ParallelPacketLogReader(collects_only, processes=2)
+        results = list(reader.each(files, ordered=False))
+        self.assertEqual(sorted(results), [("EVEN", 0), ("EVEN", 2), ("EVEN", 4), ("EVEN", 6), ("EVEN", 8)])
+
+    def test_reads_compressed_raw_files(self):
+        filename = self.write_log("RAW", 0, "RAW_PACKET")
+        compressed = BucketUtilities.compress_file(filename)
+        os.remove(filename)
+        reader = ParallelPacketLogReader(packet_name_and_buffer, processes=1)
+        results = list(reader.each([compressed]))
+        self.assertEqual(results, [("RAW", bytes([index])) for index in range(5)])
+        self.assertEqual(os.listdir(self.temp_dir), [os.path.basename(compressed)])
+
+    def test_downloads_bucket_files(self):
+        filename = self.write_log("EVEN", 0)
+        bucket_key = "DEFAULT/decom_logs/tlm/INST/20231114/file.bin"
+
+        def get_object(bucket, key, path):
+            self.assertEqual((bucket, key), ("logs", bucket_key))
+            shutil.copyfile(filename, path)
+
+        # Call the worker function directly so the bucket mock is in this process
+        result_path = os.path.join(self.temp_dir, "results")
+        with patch("openc3.utilities.bucket.Bucket.get_client") as get_client:
+            get_client.return_value.get_object.side_effect = get_object
+            _read_file(bucket_key, result_path, "logs", None, None, collects_only, False, False, None)
+        results = [result for _, result in _read_results(result_path)]
+        self.assertEqual(results, [("EVEN", 0), ("EVEN", 2), ("EVEN", 4), ("EVEN", 6), ("EVEN", 8)])
+        self.assertFalse(os.path.exists(f"{result_path}.bin"))
+
+
+if __name__ == "__main__":
+    unittest.main()
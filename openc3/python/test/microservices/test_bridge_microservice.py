@@ -10,10 +10,14 @@
 # if purchased from OpenC3, Inc.
 
 import asyncio
+import json
 import unittest
 from unittest.mock import Mock, patch
 
+import fakeredis
+
 from openc3.microservices.bridge_microservice import BridgeMicroservice
+from openc3.utilities.async_store import AsyncStore
 
 
 class FakeRecv:
@@ -176,6 +180,20 @@ class TestBridgeMicroservice(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(self.service.streams, ["OLD"])
         self.service.logger.warn.assert_called_once()
 
+    async def test_loads_streams_and_plugins_through_the_async_store(self):
+        redis = fakeredis.FakeAsyncValkey()
+        self.addAsyncCleanup(redis.aclose)
+        AsyncStore.my_instances = {}
+        key = "DEFAULT__openc3_host_interface_microservices"
+        await redis.hset(key, "A", json.dumps({"bridge_name": "BRIDGE", "stream": "B"}))
+        await redis.hset(key, "C", json.dumps({"bridge_name": "BRIDGE", "stream": "A"}))
+        await redis.hset(key, "D", json.dumps({"bridge_name": "OTHER", "stream": "D"}))
+        await redis.hset("DEFAULT__openc3_plugins", "plugin-1.0.gem__20260101", "{}")
+        with patch("valkey.asyncio.Valkey", return_value=redis):
+            self.assertEqual(await self.service._load_streams(), ["A", "B"])
+            self.assertEqual(await self.service._plugin_gem_names(), {"plugin-1.0.gem"})
+        AsyncStore.my_instances = {}
+
 
 if __name__ == "__main__":
     unittest.main()
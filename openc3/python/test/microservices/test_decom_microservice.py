@@ -264,6 +264,26 @@ class TestDecomMicroservice(unittest.TestCase):
                 stdout.getvalue(),
             )
 
+    def test_records_the_pipeline_latency_of_traced_packets(self):
+        packet = System.telemetry.packet("INST", "HEALTH_STATUS")
+        packet.received_time = datetime.now(timezone.utc)
+        now = time.time_ns()
+        TelemetryTopic.write_packet(packet, scope="DEFAULT", trace={"received": now - 2000, "protocol": now - 1000})
+        for _ in range(100):
+            if ("INST", "cvt_update") in self.dm.pipeline_trace.histograms:
+                break
+            time.sleep(0.01)
+        self.dm.pipeline_trace.publish()
+        for stage in ["protocol", "telemetry_xadd", "decom_start", "decom_end", "cvt_update"]:
+            value = self.dm.metric.data[f"pipeline_latency_seconds__INST__{stage}"]["value"]
+            self.assertEqual(value["count"], 1)
+        self.assertAlmostEqual(self.dm.metric.data["pipeline_latency_seconds__INST__protocol"]["value"]["max"], 1e-6)
+
+        # The trace is passed on to the TSDB through the DECOM topic
+        _, msg_hash = Topic.get_newest_message("DEFAULT__DECOM__{INST}__HEALTH_STATUS")
+        trace = json.loads(msg_hash[b"trace"])
+        self.assertEqual(list(trace.keys()), ["received", "protocol", "telemetry_xadd", "decom_start", "decom_end"])
+
     def test_handles_exceptions_in_the_thread(self):
         with patch.object(self.dm, "microservice_cmd") as mock_microservice_cmd:
             mock_microservice_cmd.side_effect = Exception("Bad command")
@@ -312,7 +332,9 @@ class TestDecomMicroservice(unittest.TestCase):
         time.sleep(0.02)
 
         # Verify that even though the limits response sleeps for 0.1s, the decom thread is not blocked
-        self.assertLess(self.dm.metric.data["decom_duration_seconds"]["value"], 0.02)
+        duration = self.dm.decom_duration.value
+        self.assertEqual(duration["count"], 1)
+        self.assertLess(duration["sum"], 0.02)
 
     def test_constructor_handles_disabled_limits_during_sync_system(self):
         # Regression: limits_response_queue must be initialized before the
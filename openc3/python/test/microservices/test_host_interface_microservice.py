@@ -4,12 +4,148 @@
 import asyncio
 import threading
 import unittest
-from unittest.mock import patch
+from unittest.mock import AsyncMock, Mock, patch
 
-from openc3.microservices.host_interface_microservice import HostInterfaceMicroservice
+from openc3.interfaces.protocols.bridge_frame_protocol import BridgeFrameProtocol
+from openc3.microservices.host_interface_microservice import (
+    BRIDGE_GO,
+    BRIDGE_GO_FRAMED,
+    BRIDGE_READY,
+    BRIDGE_READY_FRAMED,
+    HostInterfaceMicroservice,
+)
+from openc3.packets.packet import Packet
+
+
+class FakeInterface:
+    """Returns the given reads then None like a disconnected interface"""
+
+    def __init__(self, reads):
+        self.reads = list(reads)
+        self.written = []
+
+    def read(self):
+        if self.reads:
+            return Packet(None, None, "BIG_ENDIAN", None, self.reads.pop(0))
+        return None
+
+    def read_interface(self):
+        if self.reads:
+            return self.reads.pop(0), None
+        return None, None
+
+    def write(self, packet):
+        self.written.append(packet.buffer)
+
+    def write_interface(self, data):
+        self.written.append(data)
+
+
+class FakeSend:
+    def __init__(self):
+        self.writes = []
+        self.finished = False
+
+    async def write_all(self, data):
+        self.writes.append(data)
+
+    async def finish(self):
+        self.finished = True
+
+
+class FakeRecv:
+    def __init__(self, chunks):
+        self.chunks = list(chunks)
+
+    async def read(self, _size):
+        if self.chunks:
+            return self.chunks.pop(0)
+        return b""
 
 
 class TestHostInterfaceMicroservice(unittest.IsolatedAsyncioTestCase):
+    def service(self, protocols):
+        service = HostInterfaceMicroservice.__new__(HostInterfaceMicroservice)
+        service.name = "HOST"
+        service.shutdown = False
+        service.protocols = protocols
+        return service
+
+    async def test_batches_framed_packets_read_by_the_reader_thread(self):
+        service = self.service([["READ_WRITE", "crc_protocol.py"]])
+        interface = FakeInterface([b"\x01", b"\x02\x03", b"\x04"])
+        send = FakeSend()
+        with patch("openc3.microservices.host_interface_microservice.BATCH_DELAY", 1.0):
+            await service._device_to_bridge(asyncio.get_running_loop(), interface, send)
+        data = b"".join(send.writes)
+        self.assertEqual(BridgeFrameProtocol.unframe(data), ([b"\x01", b"\x02\x03", b"\x04"], b""))
+        # Reads ready within the batch window are sent together
+        self.assertLess(len(send.writes), 3)
+        self.assertTrue(send.finished)
+
+    async def test_limits_each_batch_to_batch_bytes(self):
+        service = self.service([])
+        interface = FakeInterface([b"\x01" * 4] * 6)
+        send = FakeSend()
+        with (
+            patch("openc3.microservices.host_interface_microservice.BATCH_DELAY", 1.0),
+            patch("openc3.microservices.host_interface_microservice.BATCH_BYTES", 8),
+        ):
+            await service._device_to_bridge(asyncio.get_running_loop(), interface, send)
+        # Raw data is not framed
+        self.assertEqual(b"".join(send.writes), b"\x01" * 24)
+        self.assertTrue(all(len(write) <= 8 for write in send.writes))
+
+    async def test_reader_waits_for_the_tunnel_when_the_queue_is_full(self):
+        service = self.service([])
+        interface = FakeInterface([b"\x01"] * 20)
+        send = FakeSend()
+        with patch("openc3.microservices.host_interface_microservice.READ_QUEUE_SIZE", 2):
+            await service._device_to_bridge(asyncio.get_running_loop(), interface, send)
+        self.assertEqual(b"".join(send.writes), b"\x01" * 20)
+
+    async def test_writes_each_framed_command_as_a_packet(self):
+        service = self.service([["READ_WRITE", "crc_protocol.py"]])
+        interface = FakeInterface([])
+        data = BridgeFrameProtocol.frame(b"\x01\x02") + BridgeFrameProtocol.frame(b"\x03")
+        # The second frame is split across reads
+        recv = FakeRecv([data[:8], data[8:]])
+        await service._bridge_to_device(asyncio.get_running_loop(), interface, recv)
+        self.assertEqual(interface.written, [b"\x01\x02", b"\x03"])
+
+    async def handshake(self, protocols, go):
+        service = self.service(protocols)
+        service.channel = "HOST"
+        service._connect_event = asyncio.Event()
+        service._connect_event.set()
+        service.build_interface = Mock(side_effect=RuntimeError("device opened"))
+
+        def set_desired(_connected):
+            service.shutdown = True
+
+        service._set_desired = set_desired
+        send = FakeSend()
+        recv = FakeRecv([b"\x00", go])
+        bi = Mock(send=Mock(return_value=send), recv=Mock(return_value=recv))
+        connection = Mock(accept_bi=AsyncMock(return_value=bi))
+        endpoint = Mock(connect=AsyncMock(return_value=connection))
+        with patch("openc3.microservices.host_interface_microservice.Logger") as logger:
+            await service._data_loop(endpoint, None)
+        return send.writes, service.build_interface.called, logger.error.call_args
+
+    async def test_announces_framing_in_the_handshake(self):
+        writes, opened, _error = await self.handshake([], BRIDGE_GO)
+        self.assertEqual(writes, [BRIDGE_READY])
+        self.assertTrue(opened)
+        writes, opened, _error = await self.handshake([["READ_WRITE", "crc_protocol.py"]], BRIDGE_GO_FRAMED)
+        self.assertEqual(writes, [BRIDGE_READY_FRAMED])
+        self.assertTrue(opened)
+
+    async def test_does_not_open_the_device_when_cosmos_disagrees_on_framing(self):
+        _writes, opened, error = await self.handshake([["READ_WRITE", "crc_protocol.py"]], BRIDGE_GO)
+        self.assertFalse(opened)
+        self.assertIn("unexpected bridge handshake", error.args[0])
+
     async def test_device_operation_times_out_without_blocking_event_loop(self):
         service = HostInterfaceMicroservice.__new__(HostInterfaceMicroservice)
         service.name = "HOST"
@@ -539,6 +539,8 @@ class TestInterfaceMicroservice(unittest.TestCase):
         }
         with patch("openc3.microservices.interface_microservice.CommandDecomTopic.write_packet") as mock_write:
             result = handler.process_cmd(topic, msg_id, full_msg_hash, None)
+            # The command is published after the ack
+            handler.publish_thread.queue.join()
         self.assertEqual(result, "SUCCESS")
         # queue_username must be copied into the command extra so Command History
         # can show "Queued By" for queued commands
@@ -568,6 +570,45 @@ class TestInterfaceMicroservice(unittest.TestCase):
         result = handler.process_cmd(topic, msg_id, full_msg_hash, None)
         self.assertIsNone(result)
 
+    def test_publish_thread_counts_and_publishes_commands_after_the_ack(self):
+        im = InterfaceMicroservice("DEFAULT__INTERFACE__INST_INT")
+        self.addCleanup(im.shutdown)
+        publish_thread = im.handler_thread.publish_thread
+        TargetModel.increment_command_count("INST", "ABORT", 10, scope="DEFAULT")
+
+        commands = []
+        for cmd_name, cmd_params in [("ABORT", {}), ("COLLECT", {"TYPE": "NORMAL"}), ("ABORT", {})]:
+            command = System.commands.build_cmd("INST", cmd_name, cmd_params)
+            command.extra = {"cmd_string": f"cmd('INST {cmd_name}')", "username": "test_user"}
+            commands.append(command)
+
+        with patch("openc3.microservices.interface_microservice.CommandTopic.write_packet") as write_packet:
+            for stdout in capture_io():
+                for command in commands:
+                    publish_thread.put(command, command.packet_name == "ABORT")
+                publish_thread.queue.join()
+                self.assertEqual(stdout.getvalue().count("cmd('INST ABORT')"), 2)
+                self.assertNotIn("INST COLLECT", stdout.getvalue())
+        # Commands are published in order with their global counts
+        self.assertEqual([call.args[0] for call in write_packet.call_args_list], commands)
+        self.assertEqual([command.received_count for command in commands], [11, 1, 12])
+        self.assertEqual(TargetModel.get_command_count("INST", "ABORT", scope="DEFAULT"), 12)
+        self.assertEqual(System.commands.packet("INST", "ABORT").received_count, 12)
+
+    def test_advances_the_received_count_before_the_command_is_published(self):
+        im = InterfaceMicroservice("DEFAULT__INTERFACE__INST_INT")
+        self.addCleanup(im.shutdown)
+        handler = im.handler_thread
+        # Nothing has been published yet
+        self.assertEqual([handler.next_received_count("INST", "ABORT") for _ in range(3)], [1, 2, 3])
+        self.assertEqual(handler.next_received_count("INST", "COLLECT"), 1)
+        # Another interface sent the packet so the published global count is ahead
+        System.commands.packet("INST", "ABORT").received_count = 10
+        self.assertEqual(handler.next_received_count("INST", "ABORT"), 11)
+        # A publish which is behind the local count doesn't move it back
+        System.commands.packet("INST", "ABORT").received_count = 5
+        self.assertEqual(handler.next_received_count("INST", "ABORT"), 12)
+
     def test_process_cmd_supports_interface_directives(self):
         """Directive messages on the CMD}INTERFACE topic: interface_details and
         target_control (enable/disable and the error path)."""
@@ -767,3 +808,51 @@ class TestInterfaceMicroservice(unittest.TestCase):
 
         im.shutdown()
         time.sleep(0.1)  # Allow threads to exit
+
+    def test_status_update_period_option(self):
+        model = InterfaceModel(
+            name="INST_INT",
+            scope="DEFAULT",
+            target_names=["INST"],
+            cmd_target_names=["INST"],
+            tlm_target_names=["INST"],
+            config_params=["test_interface.py"],
+            options=[["STATUS_UPDATE_PERIOD", "2.5"]],
+        )
+        model.update()
+
+        im = InterfaceMicroservice("DEFAULT__INTERFACE__INST_INT")
+        self.assertEqual(im.status_update_period, 2.5)
+
+        im.shutdown()
+        time.sleep(0.1)  # Allow threads to exit
+
+    def test_handle_packet_defers_status_to_publish_status(self):
+        im = InterfaceMicroservice("DEFAULT__INTERFACE__INST_INT")
+        # Stop the status thread so only explicit publishes are counted
+        im.status_sleeper.cancel()
+        im.status_thread.join()
+        im.interface.connect()
+        packet = im.interface.read()
+
+        with patch.object(InterfaceStatusModel, "set") as mock_set:
+            im.handle_packet(packet)
+            im.count += 1
+            mock_set.assert_not_called()
+
+            im.publish_status()
+            mock_set.assert_called_once()
+            self.assertEqual(mock_set.call_args[0][0]["rxcnt"], 1)
+            self.assertEqual(im.metric.data["interface_tlm_total"]["value"], 1)
+
+            # Nothing changed so nothing is published
+            im.publish_status()
+            mock_set.assert_called_once()
+
+            im.interface.read()
+            im.publish_status()
+            self.assertEqual(mock_set.call_count, 2)
+            self.assertEqual(mock_set.call_args[0][0]["rxcnt"], 2)
+
+        im.shutdown()
+        time.sleep(0.1)  # Allow threads to exit
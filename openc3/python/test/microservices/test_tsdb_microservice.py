@@ -1937,6 +1937,64 @@ class TestTsdbMicroservice(unittest.TestCase):
         columns = call_args[1]["columns"]
         self.assertNotIn("COSMOS_EXTRA", columns)
 
+    @patch("openc3.utilities.questdb_client.Sender")
+    @patch("openc3.utilities.questdb_client.psycopg.connect")
+    @patch("openc3.microservices.microservice.System")
+    def test_records_pipeline_latency_when_traced_rows_are_flushed(self, mock_system, mock_psycopg, mock_sender):
+        """Test traced rows record the tsdb_flush and total latency after the flush"""
+        mock_sender.return_value = Mock()
+        mock_query = Mock()
+        mock_psycopg.return_value = mock_query
+        mock_cursor = Mock()
+        mock_query.cursor.return_value.__enter__ = Mock(return_value=mock_cursor)
+        mock_query.cursor.return_value.__exit__ = Mock(return_value=False)
+
+        orig_xread = self.redis.xread
+
+        def xread_side_effect(*args, **kwargs):
+            if "block" in kwargs:
+                kwargs.pop("block")
+            return orig_xread(*args, **kwargs)
+
+        self.redis.xread = Mock(side_effect=xread_side_effect)
+
+        model = MicroserviceModel(
+            "DEFAULT__TSDB__TEST",
+            scope="DEFAULT",
+            topics=["DEFAULT__DECOM__{INST}__HEALTH_STATUS"],
+            target_names=["INST"],
+        )
+        model.create()
+
+        tsdb = TsdbMicroservice("DEFAULT__TSDB__TEST")
+
+        now = time.time_ns()
+        for trace in [None, {"received": now - 3_000_000, "decom_end": now - 1_000_000}]:
+            msg_hash = {
+                b"target_name": b"INST",
+                b"packet_name": b"HEALTH_STATUS",
+                b"time": str(now).encode(),
+                b"stored": b"false",
+                b"json_data": json.dumps({"TEMP1": 42}).encode(),
+            }
+            if trace:
+                msg_hash[b"trace"] = json.dumps(trace).encode()
+            Topic.write_topic("DEFAULT__DECOM__{INST}__HEALTH_STATUS", msg_hash, "*", 100)
+
+        tsdb.read_topics()
+        self.assertEqual(len(tsdb.pending_traces), 1)
+
+        tsdb.next_flush_time_s = 0
+        tsdb.flush_if_needed()
+        self.assertEqual(tsdb.pending_traces, [])
+        tsdb.pipeline_trace.publish()
+        flush = tsdb.metric.data["pipeline_latency_seconds__INST__tsdb_flush"]["value"]
+        total = tsdb.metric.data["pipeline_latency_seconds__INST__total"]["value"]
+        self.assertEqual(flush["count"], 1)
+        self.assertGreaterEqual(flush["max"], 0.001)
+        self.assertGreaterEqual(total["max"], 0.003)
+        self.assertNotIn("pipeline_latency_seconds__INST__decom_end", tsdb.metric.data)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -176,6 +176,28 @@ class TestInterfaceModel(unittest.TestCase):
         json = model.as_json()
         self.assertEqual(json["secret_options"], [["password", "password"]])
 
+    def test_frames_a_bridged_interface_with_bridge_protocols(self):
+        model = InterfaceModel(
+            name="TEST_INT",
+            scope="DEFAULT",
+            config_params=["openc3/interfaces/serial_interface.py"],
+            bridge_name="BRIDGE",
+            protocols=[["READ_WRITE", "openc3/interfaces/protocols/crc_protocol.py"]],
+        )
+        interface = model.build()
+        self.assertEqual(interface.__class__.__name__, "BridgeInterface")
+        self.assertEqual([p.__class__.__name__ for p in interface.read_protocols], ["CrcProtocol"])
+
+        model.bridge_protocols = [["READ_WRITE", "openc3/interfaces/protocols/length_protocol.py"]]
+        interface = model.build()
+        # The host frames each packet so the frame protocol is closest to the tunnel
+        self.assertEqual(
+            [p.__class__.__name__ for p in interface.read_protocols], ["BridgeFrameProtocol", "CrcProtocol"]
+        )
+        self.assertEqual(
+            [p.__class__.__name__ for p in interface.write_protocols], ["CrcProtocol", "BridgeFrameProtocol"]
+        )
+
     def test_encodes_all_the_input_parameters(self):
         model = InterfaceModel(name="TEST_INT", scope="DEFAULT")
         json = model.as_json()
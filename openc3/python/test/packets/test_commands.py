@@ -600,6 +600,14 @@ class TestCommands(unittest.TestCase):
         identified = cmd.identify(packet_data, ["TGT1"], subpackets=True)
         self.assertIsNone(identified)
 
+    def test_set_single_owner_sets_each_packet(self):
+        self.cmd.set_single_owner(True)
+        for _target_name, packets in self.cmd.all().items():
+            for _packet_name, packet in packets.items():
+                self.assertTrue(packet.single_owner)
+        self.cmd.set_single_owner(False)
+        self.assertFalse(self.cmd.packet("TGT1", "PKT1").single_owner)
+
     def test_cmd_unique_id_mode_returns_mode_for_target(self):
         import tempfile
 
@@ -25,6 +25,7 @@ from openc3.conversions.generic_conversion import GenericConversion
 from openc3.conversions.packet_time_seconds_conversion import (
     PacketTimeSecondsConversion,
 )
+from openc3.conversions.polynomial_conversion import PolynomialConversion
 from openc3.conversions.received_time_seconds_conversion import (
     ReceivedTimeSecondsConversion,
 )
@@ -481,6 +482,18 @@ class PacketReadReadItem(unittest.TestCase):
         self.assertEqual(self.p.read("ITEM", "WITH_UNITS", b"\x04"), "FALSE")
         self.assertEqual(self.p.read_item(i, "WITH_UNITS", b"\x04"), "FALSE")
 
+    def test_converts_array_values_with_call_array(self):
+        self.p.append_item("item", 8, "UINT", 32)
+        i = self.p.get_item("ITEM")
+        i.read_conversion = PolynomialConversion(1, 2)
+        with patch.object(PolynomialConversion, "call", wraps=i.read_conversion.call) as call:
+            self.assertEqual(self.p.read_item(i, "CONVERTED", b"\x00\x01\x02\x03"), [1.0, 3.0, 5.0, 7.0])
+            call.assert_not_called()
+        i.states = {"ONE": 1.0, "THREE": 3.0}
+        self.assertEqual(self.p.read_item(i, "CONVERTED", b"\x00\x01\x02\x03"), ["ONE", "THREE", 5.0, 7.0])
+        i.units = "V"
+        self.assertEqual(self.p.read_item(i, "FORMATTED", b"\x00\x01\x02\x03"), ["ONE", "THREE", "5.0 V", "7.0 V"])
+
     def test_reads_the_with_units_array_value(self):
         self.p.append_item("item", 8, "UINT", 16)
         i = self.p.get_item("ITEM")
@@ -675,6 +688,30 @@ class PacketWrite(unittest.TestCase):
         self.assertEqual(self.p.read("ITEM"), 4)
         self.assertEqual(cache[i.name], 4)
 
+    def test_only_caches_conversions_of_the_packet_buffer(self):
+        self.p.append_item("item", 8, "UINT")
+        i = self.p.get_item("ITEM")
+        i.read_conversion = GenericConversion("value / 2")
+        self.p.buffer = b"\x04"
+        self.assertEqual(self.p.read_item(i, "CONVERTED", self.p.buffer_view()), 2)
+        self.assertEqual(self.p.read_conversion_cache[i.name], 2)
+        # An equal buffer which isn't the packet's buffer is converted but not cached
+        self.p.read_conversion_cache = {}
+        self.assertEqual(self.p.read_item(i, "CONVERTED", self.p.buffer), 2)
+        self.assertEqual(self.p.read_conversion_cache, {})
+
+    def test_adopts_a_buffer_without_copying(self):
+        self.p.append_item("item", 8, "UINT")
+        i = self.p.get_item("ITEM")
+        i.read_conversion = GenericConversion("value / 2")
+        self.p.buffer = b"\x04"
+        self.assertEqual(self.p.read("ITEM"), 2)
+        buffer = bytearray(b"\x08")
+        self.p.adopt_buffer(buffer)
+        self.assertIs(self.p.buffer_view(), buffer)
+        self.assertEqual(self.p.read_conversion_cache, {})
+        self.assertEqual(self.p.read("ITEM"), 4)
+
     def test_writes_the_converted_value(self):
         self.p.append_item("item", 8, "UINT")
         i = self.p.get_item("ITEM")
@@ -1212,13 +1249,13 @@ class PacketRestoreDefaults(unittest.TestCase):
         i.write_conversion = GenericConversion("value * 2")
         p.write("test3", 0x01020304)
         self.assertEqual(p.buffer, b"\x01\x02\x03\x04\x02\x04\x06\x08")
-        p.restore_defaults(p.buffer_no_copy(), ["test1", "test2", "test3"])
+        p.restore_defaults(p.buffer_view(), ["test1", "test2", "test3"])
         self.assertEqual(p.buffer, b"\x01\x02\x03\x04\x02\x04\x06\x08")
-        p.restore_defaults(p.buffer_no_copy(), ["test1", "test3"])
+        p.restore_defaults(p.buffer_view(), ["test1", "test3"])
         self.assertEqual(p.buffer, b"\x01\x02\x01\x02\x02\x04\x06\x08")
-        p.restore_defaults(p.buffer_no_copy(), ["test3"])
+        p.restore_defaults(p.buffer_view(), ["test3"])
         self.assertEqual(p.buffer, b"\x03\x04\x01\x02\x02\x04\x06\x08")
-        p.restore_defaults(p.buffer_no_copy())
+        p.restore_defaults(p.buffer_view())
         self.assertEqual(p.buffer, b"\x03\x04\x01\x02\x04\x06\x08\x0a")
 
     def test_resets_the_packet_to_just_derived_items(self):
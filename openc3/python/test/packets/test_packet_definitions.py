@@ -0,0 +1,240 @@
+# Copyright 2026 OpenC3, Inc.
+# All Rights Reserved.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See LICENSE.md for more details.
+#
+# This file may also be used under the terms of a commercial license
+# if purchased from OpenC3, Inc.
+
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from openc3.packets.packet_config import PacketConfig
+from openc3.packets.packet_definitions import PacketDefinitions, SharedMapping
+from openc3.packets.telemetry import Telemetry
+from openc3.system.system import System
+from openc3.system.target import Target
+from test.test_helper import mock_redis, setup_system
+
+
+TARGET_CONFIG_DIR = os.path.join(os.path.dirname(__file__), "..", "install", "config", "targets")
+
+
+class TestPacketDefinitions(unittest.TestCase):
+    def setUp(self):
+        mock_redis(self)
+        setup_system()
+        self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir)
+        self.filename = os.path.join(self.temp_dir, "definitions.bin")
+        PacketDefinitions.write(System.instance().packet_config, self.filename)
+        self.definitions = PacketDefinitions.load(self.filename)
+        self.addCleanup(self.definitions.close)
+
+    def test_loads_the_packet_and_item_names(self):
+        self.assertIn("INST", self.definitions.target_names("TLM"))
+        self.assertEqual(self.definitions.packet_names("TLM", "INST"), list(System.telemetry.packets("INST").keys()))
+        packet = System.telemetry.packet("INST", "HEALTH_STATUS")
+        self.assertEqual(
+            self.definitions.item_names("TLM", "INST", "HEALTH_STATUS"), [item.name for item in packet.sorted_items]
+        )
+        self.assertEqual(self.definitions.accessor("CMD", "INST", "COLLECT"), "BinaryAccessor")
+
+    def test_matches_the_packet_item_layouts(self):
+        for cmd_or_tlm, packets in (("CMD", System.commands), ("TLM", System.telemetry)):
+            for target_name in ("INST", "SYSTEM"):
+                for packet_name, packet in packets.packets(target_name).items():
+                    for item in packet.sorted_items:
+                        definition = self.definitions.item(cmd_or_tlm, target_name, packet_name, item.name)
+                        self.assertEqual(definition.bit_offset, item.bit_offset)
+                        self.assertEqual(definition.bit_size, item.bit_size)
+                        self.assertEqual(definition.data_type, item.data_type)
+                        self.assertEqual(definition.endianness, item.endianness)
+                        self.assertEqual(definition.array_size, item.array_size)
+                        self.assertEqual(definition.overflow, item.overflow)
+
+    def test_reads_raw_values_from_a_buffer(self):
+        packet = System.telemetry.packet("INST", "HEALTH_STATUS").clone()
+        packet.write("COLLECTS", 1234)
+        packet.write("TEMP1", 4321, "RAW")
+        packet.write("ARY", list(range(10)))
+        packet.write("DURATION", 1.5)
+        buffer = packet.buffer_view()
+        self.assertEqual(self.definitions.read("TLM", "INST", "HEALTH_STATUS", "collects", buffer), 1234)
+        self.assertEqual(self.definitions.read("TLM", "INST", "HEALTH_STATUS", "ARY", buffer), list(range(10)))
+        values = self.definitions.read_all("TLM", "INST", "HEALTH_STATUS", buffer)
+        self.assertEqual(values["TEMP1"], 4321)
+        self.assertEqual(values["DURATION"], 1.5)
+        self.assertIsNone(values["RECEIVED_COUNT"])
+
+    def test_caches_item_definitions(self):
+        item = self.definitions.item("TLM", "INST", "HEALTH_STATUS", "COLLECTS")
+        self.assertIs(self.definitions.item("TLM", "INST", "HEALTH_STATUS", "COLLECTS"), item)
+        with self.assertRaises(AttributeError):
+            item.extra = 1
+
+    def test_complains_about_unknown_names(self):
+        with self.assertRaisesRegex(RuntimeError, "Target 'NOPE' does not exist"):
+            self.definitions.packet_names("TLM", "NOPE")
+        with self.assertRaisesRegex(RuntimeError, "Packet 'INST NOPE' does not exist"):
+            self.definitions.items("TLM", "INST", "NOPE")
+        with self.assertRaisesRegex(RuntimeError, "Item 'INST HEALTH_STATUS NOPE' does not exist"):
+            self.definitions.item("TLM", "INST", "HEALTH_STATUS", "NOPE")
+
+    def test_complains_about_invalid_files(self):
+        filename = os.path.join(self.temp_dir, "invalid.bin")
+        with open(filename, "wb") as file:
+            file.write(b"\x00" * 16)
+        with self.assertRaisesRegex(ValueError, "is not a packet definitions file"):
+            PacketDefinitions.load(filename)
+
+    def test_unpickles_a_new_packet_each_time(self):
+        first = self.definitions.packet("TLM", "INST", "HEALTH_STATUS")
+        second = self.definitions.packet("TLM", "INST", "HEALTH_STATUS")
+        self.assertIsNot(first, second)
+        self.assertIsNot(first, System.telemetry.packet("INST", "HEALTH_STATUS"))
+        self.assertEqual(list(first.items.keys()), list(System.telemetry.packet("INST", "HEALTH_STATUS").items.keys()))
+        # Generic conversions are compiled again
+        first.write("TEMP1", 0, "RAW")
+        self.assertEqual(
+            first.read("TEMP1"),
+            System.telemetry.packet("INST", "HEALTH_STATUS").read("TEMP1", "CONVERTED", first.buffer_view()),
+        )
+
+    def test_packet_config_from_definitions_loads_packets_when_used(self):
+        config = PacketConfig.from_definitions(self.definitions)
+        original = System.instance().packet_config
+        self.assertEqual(list(config.telemetry["INST"].keys()), list(original.telemetry["INST"].keys()))
+        self.assertEqual(config.limits_groups, original.limits_groups)
+        self.assertEqual(config.tlm_unique_id_mode, original.tlm_unique_id_mode)
+        self.assertEqual(config.telemetry["INST"].loaded_values(), [])
+
+        packet = config.telemetry["INST"]["HEALTH_STATUS"]
+        self.assertIs(config.telemetry["INST"]["HEALTH_STATUS"], packet)
+        self.assertEqual(config.telemetry["INST"].loaded_values(), [packet])
+        self.assertNotIn(packet, list(config.loaded_packets("COMMAND")))
+        self.assertEqual(list(config.loaded_packets("TELEMETRY")), [packet])
+
+        # The lookup tables load the same packet objects
+        self.assertIn(packet, config.latest_data["INST"]["TEMP1"])
+        self.assertIn(packet, config.tlm_id_value_hash["INST"].values())
+
+    def test_packet_config_from_definitions_sets_attributes_on_packets_loaded_later(self):
+        config = PacketConfig.from_definitions(self.definitions)
+        loaded = config.telemetry["INST"]["ADCS"]
+        config.set_packet_attribute("TELEMETRY", "single_owner", True)
+        self.assertTrue(loaded.single_owner)
+        self.assertTrue(config.telemetry["INST"]["HEALTH_STATUS"].single_owner)
+        self.assertFalse(config.commands["INST"]["COLLECT"].single_owner)
+
+    def test_telemetry_identifies_and_decoms_shared_packets(self):
+        config = PacketConfig.from_definitions(self.definitions)
+        telemetry = Telemetry(config, System.instance())
+        original = System.telemetry.packet("INST", "HEALTH_STATUS").clone()
+        for item in original.id_items:
+            original.write_item(item, item.id_value, "RAW")
+        original.write("COLLECTS", 1234)
+        original.write("TEMP1", 50)
+        packet = telemetry.identify_and_set_buffer(original.buffer, ["INST"])
+        self.assertEqual(packet.packet_name, "HEALTH_STATUS")
+        self.assertIs(packet, telemetry.packet("INST", "HEALTH_STATUS"))
+        self.assertEqual(packet.read("COLLECTS"), 1234)
+        self.assertAlmostEqual(packet.read("TEMP1"), 50, delta=0.1)
+        self.assertIs(telemetry.newest_packet("INST", "TEMP1"), packet)
+
+    def test_filename_depends_on_the_target_files(self):
+        target_config_dir = os.path.join(self.temp_dir, "targets")
+        shutil.copytree(os.path.join(TARGET_CONFIG_DIR, "INST"), os.path.join(target_config_dir, "INST"))
+        filename = PacketDefinitions.shared_filename([Target("INST", TARGET_CONFIG_DIR)], self.temp_dir)
+        # Targets extracted to another directory use the same file
+        self.assertEqual(
+            PacketDefinitions.shared_filename([Target("INST", target_config_dir)], self.temp_dir), filename
+        )
+        with open(os.path.join(target_config_dir, "INST", "cmd_tlm", "inst_tlm.txt"), "a") as file:
+            file.write("\n")
+        changed = PacketDefinitions.shared_filename([Target("INST", target_config_dir)], self.temp_dir)
+        self.assertNotEqual(changed, filename)
+        # Both versions are for the same targets
+        self.assertEqual(os.path.basename(changed).split("_")[0], os.path.basename(filename).split("_")[0])
+
+    def test_filename_depends_on_the_target_lib_files(self):
+        target_config_dir = os.path.join(self.temp_dir, "targets")
+        shutil.copytree(os.path.join(TARGET_CONFIG_DIR, "INST"), os.path.join(target_config_dir, "INST"))
+        filename = PacketDefinitions.shared_filename([Target("INST", target_config_dir)], self.temp_dir)
+        # Compiled files are not part of the version
+        os.makedirs(os.path.join(target_config_dir, "INST", "lib", "__pycache__"))
+        with open(os.path.join(target_config_dir, "INST", "lib", "__pycache__", "helper.pyc"), "wb") as file:
+            file.write(b"compiled")
+        self.assertEqual(
+            PacketDefinitions.shared_filename([Target("INST", target_config_dir)], self.temp_dir), filename
+        )
+        with open(os.path.join(target_config_dir, "INST", "lib", "helper.py"), "w") as file:
+            file.write("SCALE = 2\n")
+        changed = PacketDefinitions.shared_filename([Target("INST", target_config_dir)], self.temp_dir)
+        self.assertNotEqual(changed, filename)
+        with open(os.path.join(target_config_dir, "INST", "lib", "helper.py"), "w") as file:
+            file.write("SCALE = 3\n")
+        self.assertNotEqual(
+            PacketDefinitions.shared_filename([Target("INST", target_config_dir)], self.temp_dir), changed
+        )
+
+    def test_remove_stale_removes_older_versions_of_the_same_targets(self):
+        filename = PacketDefinitions.shared_filename([Target("INST", TARGET_CONFIG_DIR)], self.temp_dir)
+        prefix = os.path.basename(filename).split("_")[0]
+        stale = os.path.join(self.temp_dir, f"{prefix}_old.pdef")
+        other = os.path.join(self.temp_dir, "0123456789abcdef_old.pdef")
+        for name in (filename, stale, other):
+            with open(name, "wb"):
+                pass
+        PacketDefinitions.remove_stale(filename)
+        self.assertTrue(os.path.exists(filename))
+        self.assertFalse(os.path.exists(stale))
+        self.assertTrue(os.path.exists(other))
+
+
+class TestSystemSharedPacketDefinitions(unittest.TestCase):
+    def setUp(self):
+        mock_redis(self)
+        self.temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.temp_dir)
+
+    def test_processes_the_cmd_tlm_files_once(self):
+        first = System(["SYSTEM", "INST"], TARGET_CONFIG_DIR, packet_definitions_dir=self.temp_dir)
+        files = os.listdir(self.temp_dir)
+        self.assertEqual(len(files), 1)
+        with patch.object(System, "process_cmd_tlm") as process_cmd_tlm:
+            second = System(["SYSTEM", "INST"], TARGET_CONFIG_DIR, packet_definitions_dir=self.temp_dir)
+            process_cmd_tlm.assert_not_called()
+        self.assertEqual(os.listdir(self.temp_dir), files)
+        self.assertIsInstance(second.packet_config.telemetry["INST"], SharedMapping)
+        self.assertEqual(second.telemetry.target_names(), first.telemetry.target_names())
+        self.assertEqual(
+            list(second.commands.packet("INST", "COLLECT").items.keys()),
+            list(first.commands.packet("INST", "COLLECT").items.keys()),
+        )
+        self.assertEqual(second.limits.groups(), first.limits.groups())
+        self.assertEqual(second.targets.keys(), first.targets.keys())
+
+    def test_processes_the_cmd_tlm_files_if_the_file_is_invalid(self):
+        filename = PacketDefinitions.shared_filename([Target("INST", TARGET_CONFIG_DIR)], self.temp_dir)
+        with open(filename, "wb") as file:
+            file.write(b"\x00" * 16)
+        system = System(["INST"], TARGET_CONFIG_DIR, packet_definitions_dir=self.temp_dir)
+        self.assertEqual(system.telemetry.packet("INST", "HEALTH_STATUS").packet_name, "HEALTH_STATUS")
+        # The file was written again
+        PacketDefinitions.load(filename).close()
+
+    def test_processes_the_cmd_tlm_files_without_a_directory(self):
+        system = System(["INST"], TARGET_CONFIG_DIR, packet_definitions_dir=None)
+        self.assertIsInstance(system.packet_config.telemetry["INST"], dict)
+        self.assertEqual(os.listdir(self.temp_dir), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
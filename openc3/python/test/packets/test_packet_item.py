@@ -489,6 +489,27 @@ class TestPacketItem(unittest.TestCase):
         pi2 = self.pi.clone()
         self.assertIsInstance(pi2, PacketItem)
 
+    def test_clones_without_revalidating(self):
+        self.pi.states = {"true": 1, "false": 0}
+        self.pi.description = "description"
+        pi2 = self.pi.clone()
+        self.assertEqual(pi2.states, {"TRUE": 1, "FALSE": 0})
+        self.assertEqual(pi2.states_by_value(), {1: "TRUE", 0: "FALSE"})
+        self.assertEqual(pi2.description, "description")
+        self.assertGreater(pi2.create_index, self.pi.create_index)
+        # Assignments to the clone are still validated
+        with self.assertRaisesRegex(TypeError, "description must be a str"):
+            pi2.description = 1
+
+    def test_allows_other_attributes(self):
+        self.assertNotIn("bit_offset", self.pi.__dict__)
+        self.pi.unknown = 1
+        self.assertEqual(self.pi.__dict__, {"unknown": 1})
+        pi2 = self.pi.clone()
+        self.assertEqual(pi2.unknown, 1)
+        pi2.overlap = True
+        self.assertNotIn("overlap", pi2.__dict__)
+
     def test_converts_to_a_hash(self):
         self.pi.format_string = "%5.1f"
         self.pi.id_value = 10
@@ -604,7 +604,35 @@ class TestStructureBuffer(unittest.TestCase):
         s.write("test3", 0x05060708)
         self.assertEqual(s.buffer, b"\x01\x02\x03\x04\x05\x06\x07\x08")
         self.assertIsNot(s.buffer, s.buffer)
-        self.assertIs(s.buffer_no_copy(), s.buffer_no_copy())
+        self.assertIs(s.buffer_view(), s.buffer_view())
+
+    def test_returns_a_view_of_the_buffer(self):
+        s = Structure("BIG_ENDIAN")
+        s.append_item("test1", 16, "UINT")
+        s.write("test1", 0x0102)
+        self.assertIs(s.buffer_view(), s.buffer_view())
+        # buffer_no_copy is the original name of buffer_view
+        self.assertIs(s.buffer_no_copy(), s.buffer_view())
+        self.assertEqual(s.buffer_view(), b"\x01\x02")
+
+    def test_copies_set_buffers_but_not_adopted_buffers(self):
+        s = Structure("BIG_ENDIAN")
+        s.append_item("test1", 16, "UINT")
+        buffer = bytearray(b"\x01\x02")
+        s.buffer = buffer
+        self.assertIsNot(s.buffer_view(), buffer)
+        s.write("test1", 0x0304)
+        self.assertEqual(buffer, b"\x01\x02")
+        s.adopt_buffer(buffer)
+        self.assertIs(s.buffer_view(), buffer)
+        s.write("test1", 0x0506)
+        self.assertEqual(buffer, b"\x05\x06")
+        # bytes can't be written to so they are copied
+        s.adopt_buffer(b"\x07\x08")
+        self.assertIsInstance(s.buffer_view(), bytearray)
+        self.assertEqual(s.read("test1"), 0x0708)
+        with self.assertRaisesRegex(ValueError, "Buffer length less than defined length"):
+            s.adopt_buffer(bytearray(b"\x00"))
 
     def test_complains_if_the_given_buffer_is_too_small(self):
         s = Structure("BIG_ENDIAN")
@@ -653,15 +681,15 @@ class TestStructureBuffer(unittest.TestCase):
         s.append_item("test3", 32, "UINT")
         s.write("test3", 0x05060708)
         # Get a reference to the original buffer
-        old_buffer = s.buffer_no_copy()
+        old_buffer = s.buffer_view()
 
         s2 = s.clone()
         # Ensure we didn't modify the original buffer object
-        self.assertIs(s.buffer_no_copy(), old_buffer)
+        self.assertIs(s.buffer_view(), old_buffer)
         # Check that they are equal in value
-        self.assertEqual(s2.buffer_no_copy(), s.buffer_no_copy())
+        self.assertEqual(s2.buffer_view(), s.buffer_view())
         # But not the same object
-        # self.assertIsNot(s2.buffer_no_copy(), s.buffer_no_copy())
+        # self.assertIsNot(s2.buffer_view(), s.buffer_view())
         self.assertEqual(s2.read("test1"), [1, 2])
         self.assertEqual(s2.read("test2"), 0x0304)
         self.assertEqual(s2.read("test3"), 0x05060708)
@@ -949,6 +977,23 @@ class TestStructureSynchronize(unittest.TestCase):
             val = s.read("test1")
             self.assertEqual(val, 1)
 
+    def test_single_owner_skips_the_mutex(self):
+        s = Structure("BIG_ENDIAN")
+        s.append_item("test1", 8, "UINT")
+        s.single_owner = True
+        self.assertIs(s.synchronize(), Structure.NO_MUTEX)
+        self.assertIs(s.synchronize_allow_reads(True), Structure.NO_MUTEX)
+        with s.synchronize_allow_reads(True):
+            s.write("test1", 2)
+            self.assertEqual(s.read("test1"), 2)
+        self.assertIsNone(s.mutex)
+
+    def test_clone_clears_single_owner(self):
+        s = Structure("BIG_ENDIAN")
+        s.single_owner = True
+        self.assertFalse(s.clone().single_owner)
+        self.assertFalse(s.deep_copy().single_owner)
+
 
 class TestStructureCalculateTotalBitSize(unittest.TestCase):
     def test_calculates_quic_encoded_integer_bit_size(self):
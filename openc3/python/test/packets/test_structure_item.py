@@ -9,6 +9,7 @@
 # This file may also be used under the terms of a commercial license
 # if purchased from OpenC3, Inc.
 
+import pickle
 import unittest
 from unittest.mock import *
 
@@ -296,6 +297,13 @@ class TestStructureItem(unittest.TestCase):
         si2 = si1.clone()
         self.assertTrue(si1 < si2)
 
+    def test_pickles_the_structure_item(self):
+        si1 = StructureItem("si1", 8, 16, "UINT", "LITTLE_ENDIAN", 32)
+        si2 = pickle.loads(pickle.dumps(si1))
+        self.assertEqual(si2.as_json(), si1.as_json())
+        with self.assertRaisesRegex(ValueError, "array_size must be a multiple of bit_size"):
+            si2.array_size = 20
+
     def test_creates_a_dict(self):
         item = StructureItem("test", 0, 8, "UINT", "BIG_ENDIAN", 16).as_json()
         self.assertEqual(len(item.keys()), 11)
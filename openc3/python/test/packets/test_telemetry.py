@@ -376,6 +376,18 @@ class TestTelemetry(unittest.TestCase):
         self.assertEqual(pkt.read("item3"), 6.0)
         self.assertEqual(pkt.read("item4"), 8.0)
 
+    def test_update_adopts_the_given_buffer(self):
+        buffer = bytearray(b"\x01\x02\x03\x04")
+        pkt = self.tlm.update("TGT1", "PKT1", buffer, adopt=True)
+        self.assertIs(pkt.buffer_view(), buffer)
+        self.assertEqual(pkt.read("item1"), 1)
+        buffer = bytearray(b"\x01\x02\x03\x05")
+        pkt = self.tlm.identify_and_set_buffer(buffer, ["TGT1"], adopt=True)
+        self.assertIs(pkt.buffer_view(), buffer)
+        self.assertEqual(pkt.read("item2"), 2)
+        pkt = self.tlm.update("TGT1", "PKT1", buffer)
+        self.assertIsNot(pkt.buffer_view(), buffer)
+
     def test_assigns_a_callback_to_each_packet(self):
         callback = Mock()
         self.tlm.set_limits_change_callback(callback)
@@ -387,6 +399,14 @@ class TestTelemetry(unittest.TestCase):
         self.tlm.packet("TGT2", "PKT1").check_limits()
         callback.assert_called()
 
+    def test_set_single_owner_sets_each_packet(self):
+        self.tlm.set_single_owner(True)
+        for _target_name, packets in self.tlm.all().items():
+            for _packet_name, packet in packets.items():
+                self.assertTrue(packet.single_owner)
+        self.tlm.set_single_owner(False)
+        self.assertFalse(self.tlm.packet("TGT1", "PKT1").single_owner)
+
     def test_value_complains_about_non_existent_targets(self):
         with self.assertRaisesRegex(RuntimeError, r"Telemetry target 'TGTX' does not exist \(packets lookup\)"):
             self.tlm.value("TGTX", "PKT1", "ITEM1")
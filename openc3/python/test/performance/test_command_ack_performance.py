@@ -0,0 +1,96 @@
+# Copyright 2026 OpenC3, Inc.
+# All Rights Reserved.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See LICENSE.md for more details.
+#
+# This file may also be used under the terms of a commercial license
+# if purchased from OpenC3, Inc.
+
+"""
+Performance benchmark for sending commands one at a time vs pipelined with send_commands.
+
+Run with: poetry run pytest test/performance/test_command_ack_performance.py -v -s
+Skip in CI with: CI=true poetry run pytest (tests are skipped when CI env var is set)
+"""
+
+import os
+import sys
+import threading
+import time
+import unittest
+
+
+# Skip all tests in CI environment
+if os.environ.get("CI"):
+    raise unittest.SkipTest("Skipping performance tests in CI")
+
+from openc3.topics.ack_dispatcher import AckDispatcher
+from openc3.topics.command_topic import CommandTopic
+from openc3.topics.topic import Topic
+from test.test_helper import mock_redis
+
+
+# Simulated Redis round trip for each read by the interface
+ROUND_TRIP_S = 0.001
+
+
+class TestCommandAckPerformance(unittest.TestCase):
+    """Performance benchmark for command acknowledgements"""
+
+    def setUp(self):
+        mock_redis(self)
+        AckDispatcher.instances = {}
+        self.running = True
+        self.interface = threading.Thread(target=self.interface_cmd_handler)
+        self.interface.start()
+
+    def tearDown(self):
+        self.running = False
+        self.interface.join()
+
+    # Acks every command like the InterfaceCmdHandlerThread
+    def interface_cmd_handler(self):
+        offset = "0-0"
+        while self.running:
+            time.sleep(ROUND_TRIP_S)
+            for topic, msg_id, _, _ in Topic.read_topics(["{DEFAULT__CMD}TARGET__INST"], [offset], timeout_ms=10):
+                offset = msg_id
+                Topic.write_ack(topic, "SUCCESS", msg_id)
+
+    def command(self):
+        return {"target_name": "INST", "cmd_name": "ABORT", "cmd_params": {}}
+
+    def test_send_commands_performance(self):
+        """Benchmark sending commands serially and pipelined"""
+        iterations = int(os.environ.get("PERF_ITERATIONS", 200))
+
+        print(f"\n{'=' * 70}")
+        print("Performance Benchmark: CommandTopic.send_command vs send_commands")
+        print(f"Python Version: {sys.version}")
+        print(f"Iterations: {iterations}")
+        print(f"{'=' * 70}")
+
+        # Warm up
+        CommandTopic.send_command(self.command(), timeout=5, scope="DEFAULT")
+
+        start = time.perf_counter()
+        for _ in range(iterations):
+            CommandTopic.send_command(self.command(), timeout=5, scope="DEFAULT")
+        serial = time.perf_counter() - start
+
+        start = time.perf_counter()
+        CommandTopic.send_commands([self.command() for _ in range(iterations)], timeout=5, scope="DEFAULT")
+        pipelined = time.perf_counter() - start
+
+        print("\nResults:")
+        print(f"  Serial commands/second:    {iterations / serial:.2f}")
+        print(f"  Pipelined commands/second: {iterations / pipelined:.2f}")
+        print(f"  Speedup:                   {serial / pipelined:.2f}x")
+        print(f"{'=' * 70}")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+# Copyright 2026 OpenC3, Inc.
+# All Rights Reserved.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See LICENSE.md for more details.
+#
+# This file may also be used under the terms of a commercial license
+# if purchased from OpenC3, Inc.
+
+"""
+Performance benchmark for parsing the demo plugin's command and telemetry definitions.
+
+Run with: poetry run pytest test/performance/test_config_parser_performance.py -v -s
+Skip in CI with: CI=true poetry run pytest (tests are skipped when CI env var is set)
+"""
+
+import glob
+import os
+import sys
+import time
+import unittest
+
+
+# Skip all tests in CI environment
+if os.environ.get("CI"):
+    raise unittest.SkipTest("Skipping performance tests in CI")
+
+from openc3.config.config_parser import ConfigParser
+
+
+DEMO_TARGETS_DIR = os.path.realpath(
+    os.path.join(
+        os.path.dirname(__file__),
+        "../../../../openc3-cosmos-init/plugins/packages/openc3-cosmos-demo/targets",
+    )
+)
+
+
+class TestConfigParserPerformance(unittest.TestCase):
+    """Performance benchmark for ConfigParser.parse_file"""
+
+    def setUp(self):
+        self.filenames = sorted(glob.glob(os.path.join(DEMO_TARGETS_DIR, "*", "cmd_tlm", "*.txt")))
+        if not self.filenames:
+            self.skipTest(f"Demo targets not found in {DEMO_TARGETS_DIR}")
+
+    def test_parse_file_performance(self):
+        """Benchmark tokenizing every demo cmd_tlm file"""
+        iterations = int(os.environ.get("PERF_ITERATIONS", 20))
+
+        print(f"\n{'=' * 70}")
+        print("Performance Benchmark: ConfigParser.parse_file (demo targets)")
+        print(f"Python Version: {sys.version}")
+        print(f"Files: {len(self.filenames)}")
+        print(f"Iterations: {iterations}")
+        print(f"{'=' * 70}")
+
+        # Warm up and count the lines once
+        lines = 0
+        for filename in self.filenames:
+            for _ in ConfigParser().parse_file(filename, True):
+                lines += 1
+
+        # Benchmark
+        start = time.perf_counter()
+        for _ in range(iterations):
+            for filename in self.filenames:
+                for _ in ConfigParser().parse_file(filename, True):
+                    pass
+        elapsed = time.perf_counter() - start
+
+        lines_per_second = (lines * iterations) / elapsed
+        usec_per_line = (elapsed * 1_000_000) / (lines * iterations)
+
+        print("\nResults:")
+        print(f"  Lines per pass:    {lines}")
+        print(f"  Total time:        {elapsed:.4f} seconds")
+        print(f"  Lines/second:      {lines_per_second:.2f}")
+        print(f"  Microseconds/line: {usec_per_line:.2f}")
+        print(f"{'=' * 70}")
+
+
+if __name__ == "__main__":
+    unittest.main()
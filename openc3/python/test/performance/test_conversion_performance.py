@@ -0,0 +1,95 @@
+# Copyright 2026 OpenC3, Inc.
+# All Rights Reserved.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See LICENSE.md for more details.
+#
+# This file may also be used under the terms of a commercial license
+# if purchased from OpenC3, Inc.
+
+"""
+Performance benchmark for converting a 4096 sample array item.
+
+Run with: poetry run pytest test/performance/test_conversion_performance.py -v -s
+Skip in CI with: CI=true poetry run pytest (tests are skipped when CI env var is set)
+"""
+
+import os
+import sys
+import time
+import unittest
+
+
+# Skip all tests in CI environment
+if os.environ.get("CI"):
+    raise unittest.SkipTest("Skipping performance tests in CI")
+
+from openc3.conversions.conversion import Conversion
+from openc3.conversions.polynomial_conversion import PolynomialConversion
+from openc3.conversions.segmented_polynomial_conversion import SegmentedPolynomialConversion
+from openc3.packets.packet import Packet
+
+
+SAMPLES = 4096
+
+
+class TestConversionPerformance(unittest.TestCase):
+    """Performance benchmark for array item read conversions"""
+
+    def setUp(self):
+        self.packet = Packet("TGT", "WAVEFORM")
+        self.packet.append_item("SAMPLES", 16, "INT", SAMPLES * 16)
+        self.packet.buffer = os.urandom(SAMPLES * 2)
+        self.item = self.packet.get_item("SAMPLES")
+
+    def benchmark(self, name, conversion, iterations):
+        self.item.read_conversion = conversion
+        raw = self.packet.read_item(self.item, "RAW")
+
+        # Element by element as done before call_array
+        start = time.perf_counter()
+        for _ in range(iterations):
+            Conversion.call_array(conversion, raw, self.packet, self.packet.buffer)
+        scalar_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(iterations):
+            conversion.call_array(raw, self.packet, self.packet.buffer)
+        array_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(iterations):
+            # Don't measure the cached conversion
+            self.packet.read_conversion_cache = {}
+            self.packet.read_item(self.item, "CONVERTED", self.packet.buffer)
+        read_elapsed = time.perf_counter() - start
+
+        print(f"\n{name}:")
+        print(f"  Microseconds/array (call):       {(scalar_elapsed * 1_000_000) / iterations:.2f}")
+        print(f"  Microseconds/array (call_array): {(array_elapsed * 1_000_000) / iterations:.2f}")
+        print(f"  Microseconds/read_item:          {(read_elapsed * 1_000_000) / iterations:.2f}")
+
+    def test_array_conversion_performance(self):
+        """Benchmark polynomial conversions of a 4096 sample waveform"""
+        iterations = int(os.environ.get("PERF_ITERATIONS", 200))
+
+        print(f"\n{'=' * 70}")
+        print("Performance Benchmark: array item read conversions")
+        print(f"Python Version: {sys.version}")
+        print(f"Samples: {SAMPLES}")
+        print(f"Iterations: {iterations}")
+        print(f"{'=' * 70}")
+
+        self.benchmark("PolynomialConversion", PolynomialConversion(0.5, 0.001, 1e-7), iterations)
+        self.benchmark(
+            "SegmentedPolynomialConversion",
+            SegmentedPolynomialConversion([[-32768, [1, 0.5]], [0, [2, 0.25]], [16384, [3, 0.125, 1e-6]]]),
+            iterations,
+        )
+        print(f"{'=' * 70}")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+# Copyright 2026 OpenC3, Inc.
+# All Rights Reserved.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See LICENSE.md for more details.
+#
+# This file may also be used under the terms of a commercial license
+# if purchased from OpenC3, Inc.
+
+"""
+Performance benchmark for the InterfaceCmdHandlerThread.process_cmd ack path.
+
+Run with: poetry run pytest test/performance/test_interface_cmd_performance.py -v -s
+Skip in CI with: CI=true poetry run pytest (tests are skipped when CI env var is set)
+"""
+
+import json
+import os
+import sys
+import time
+import unittest
+
+
+# Skip all tests in CI environment
+if os.environ.get("CI"):
+    raise unittest.SkipTest("Skipping performance tests in CI")
+
+from openc3.interfaces.interface import Interface
+from openc3.microservices.interface_microservice import InterfaceCmdHandlerThread
+from openc3.models.target_model import TargetModel
+from openc3.utilities.logger import Logger
+from test.test_helper import mock_redis, setup_system
+
+
+class BenchmarkInterface(Interface):
+    def connected(self):
+        return True
+
+    def write_interface(self, data, extra=None):
+        return data, extra
+
+
+class TestInterfaceCmdPerformance(unittest.TestCase):
+    """Performance benchmark for acknowledging commands"""
+
+    def setUp(self):
+        mock_redis(self)
+        setup_system()
+        TargetModel(folder_name="INST", name="INST", scope="DEFAULT").create()
+        interface = BenchmarkInterface()
+        interface.name = "INST_INT"
+        interface.target_names = ["INST"]
+        interface.cmd_target_names = ["INST"]
+        interface.cmd_target_enabled = {"INST": True}
+        # Don't print every command
+        logger = Logger()
+        logger.level = Logger.WARN
+        self.handler = InterfaceCmdHandlerThread(interface, None, logger=logger, scope="DEFAULT")
+        self.msg_hash = {
+            b"target_name": b"INST",
+            b"cmd_name": b"COLLECT",
+            b"cmd_params": json.dumps({"TYPE": "NORMAL", "DURATION": 5}).encode(),
+            b"hazardous_check": b"TRUE",
+            b"cmd_string": b"cmd('INST COLLECT with TYPE NORMAL, DURATION 5')",
+            b"username": b"test_user",
+        }
+
+    def process(self, iterations):
+        topic = "{DEFAULT__CMD}TARGET__INST"
+        start = time.perf_counter()
+        for _ in range(iterations):
+            msg_id = f"{int(time.time() * 1000)}-0"
+            self.assertEqual(self.handler.process_cmd(topic, msg_id, self.msg_hash, None), "SUCCESS")
+        return time.perf_counter() - start
+
+    def test_process_cmd_performance(self):
+        """Benchmark the time to ack a command with the side effects inline and published afterwards"""
+        iterations = int(os.environ.get("PERF_ITERATIONS", 1000))
+
+        print(f"\n{'=' * 70}")
+        print("Performance Benchmark: InterfaceCmdHandlerThread.process_cmd")
+        print(f"Python Version: {sys.version}")
+        print(f"Iterations: {iterations}")
+        print(f"{'=' * 70}")
+
+        # Warm up
+        self.process(10)
+
+        # Without the publish thread running the commands are published inline
+        inline = self.process(iterations)
+        self.handler.publish_thread.start()
+        published = self.process(iterations)
+        self.handler.publish_thread.queue.join()
+        self.handler.publish_thread.stop()
+
+        print("\nResults:")
+        print(f"  Inline usec/ack:     {(inline * 1_000_000) / iterations:.2f}")
+        print(f"  Published usec/ack:  {(published * 1_000_000) / iterations:.2f}")
+        print(f"  Speedup:             {inline / published:.2f}x")
+        print(f"{'=' * 70}")
+
+
+if __name__ == "__main__":
+    unittest.main()
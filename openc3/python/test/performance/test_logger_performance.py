@@ -0,0 +1,87 @@
+# Copyright 2026 OpenC3, Inc.
+# All Rights Reserved.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See LICENSE.md for more details.
+#
+# This file may also be used under the terms of a commercial license
+# if purchased from OpenC3, Inc.
+
+"""
+Performance benchmark for logging from the calling thread vs the LogWriter.
+
+Run with: poetry run pytest test/performance/test_logger_performance.py -v -s
+Skip in CI with: CI=true poetry run pytest (tests are skipped when CI env var is set)
+"""
+
+import os
+import sys
+import time
+import unittest
+from unittest.mock import patch
+
+
+# Skip all tests in CI environment
+if os.environ.get("CI"):
+    raise unittest.SkipTest("Skipping performance tests in CI")
+
+from openc3.utilities.logger import Logger, LogSampler, LogWriter
+
+
+class TestLoggerPerformance(unittest.TestCase):
+    """Performance benchmark for the time a log call blocks the caller"""
+
+    def setUp(self):
+        self.logger = Logger()
+        self.logger.no_store = True
+
+    def tearDown(self):
+        if Logger.writer is not None:
+            Logger.writer.stop()
+            Logger.writer = None
+        Logger.sampler = None
+
+    def log(self, devnull, iterations, key=None):
+        with patch("sys.stdout", devnull):
+            start = time.perf_counter()
+            for count in range(iterations):
+                self.logger.info(f"Message {count}", key=key)
+            return time.perf_counter() - start
+
+    def test_logger_performance(self):
+        """Benchmark unique messages and a storm of messages with the same key"""
+        iterations = int(os.environ.get("PERF_ITERATIONS", 50000))
+
+        print(f"\n{'=' * 70}")
+        print("Performance Benchmark: Logger (synchronous vs LogWriter)")
+        print(f"Python Version: {sys.version}")
+        print(f"Iterations: {iterations}")
+        print(f"{'=' * 70}")
+
+        with open(os.devnull, "w") as devnull:
+            sync_time = self.log(devnull, iterations)
+
+            Logger.writer = LogWriter()
+            with patch.object(LogWriter, "QUEUE_SIZE", iterations), patch("sys.stdout", devnull):
+                async_time = self.log(devnull, iterations)
+                start = time.perf_counter()
+                Logger.writer.flush()
+                drain_time = time.perf_counter() - start
+
+            Logger.sampler = LogSampler()
+            storm_time = self.log(devnull, iterations, key="STORM")
+            # Write everything before devnull is closed
+            Logger.writer.stop()
+            Logger.writer.thread.join()
+
+        print("\nResults:")
+        print(f"  Synchronous msgs/sec:   {iterations / sync_time:,.0f}")
+        print(f"  LogWriter msgs/sec:     {iterations / async_time:,.0f}")
+        print(f"  Speedup:                {sync_time / async_time:.2f}x")
+        print(f"  Drain remaining (ms):   {drain_time * 1000.0:.3f}")
+        print(f"  Sampled storm msgs/sec: {iterations / storm_time:,.0f}")
+        print(f"  Suppressed:             {Logger.sampler.suppressed_total:,}")
+        print(f"  Dropped:                {Logger.writer.dropped_total:,}")
+        print(f"{'=' * 70}")
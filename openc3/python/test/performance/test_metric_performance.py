@@ -0,0 +1,84 @@
+# Copyright 2026 OpenC3, Inc.
+# All Rights Reserved.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See LICENSE.md for more details.
+#
+# This file may also be used under the terms of a commercial license
+# if purchased from OpenC3, Inc.
+
+"""
+Performance benchmark for per packet metrics using Metric.set and metric handles.
+
+Run with: poetry run pytest test/performance/test_metric_performance.py -v -s
+Skip in CI with: CI=true poetry run pytest (tests are skipped when CI env var is set)
+"""
+
+import os
+import sys
+import time
+import unittest
+from unittest.mock import patch
+
+
+# Skip all tests in CI environment
+if os.environ.get("CI"):
+    raise unittest.SkipTest("Skipping performance tests in CI")
+
+from openc3.utilities.metric import Metric
+
+
+class TestMetricPerformance(unittest.TestCase):
+    """Performance benchmark for the metrics DecomMicroservice updates for every packet"""
+
+    def setUp(self):
+        thread_patch = patch.object(Metric, "update_thread", object())
+        thread_patch.start()
+        self.addCleanup(thread_patch.stop)
+        self.metric = Metric("DEFAULT__DECOM__INST_INT", "DEFAULT", db_shard=0)
+        self.addCleanup(Metric.instances.remove, self.metric)
+
+    def test_metric_performance(self):
+        """Benchmark a counter, gauge and duration update per packet"""
+        iterations = int(os.environ.get("PERF_ITERATIONS", 200000))
+
+        print(f"\n{'=' * 70}")
+        print("Performance Benchmark: Per packet metrics (counter, gauge and duration)")
+        print(f"Python Version: {sys.version}")
+        print(f"Iterations: {iterations}")
+        print(f"{'=' * 70}")
+
+        start = time.perf_counter()
+        for count in range(iterations):
+            self.metric.set(name="decom_topic_delta_seconds", value=0.001, type="gauge", unit="seconds")
+            self.metric.set(name="decom_duration_seconds", value=0.0001, type="gauge", unit="seconds")
+            self.metric.set(name="decom_total", value=count, type="counter")
+        set_time = time.perf_counter() - start
+
+        delta = self.metric.gauge("delta_seconds", unit="seconds")
+        duration = self.metric.histogram("duration_seconds", buckets=Metric.exponential_buckets(0.00001, 2, 16))
+        total = self.metric.counter("total")
+        start = time.perf_counter()
+        for _ in range(iterations):
+            delta.set(0.001)
+            duration.observe(0.0001)
+            total.inc()
+        handle_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        with self.metric.mutex:
+            self.metric.values()
+        publish_time = time.perf_counter() - start
+
+        print("\nResults:")
+        print(f"  Metric.set packets/sec: {iterations / set_time:,.0f}")
+        print(f"  Handles packets/sec:    {iterations / handle_time:,.0f}")
+        print(f"  Speedup:                {set_time / handle_time:.2f}x")
+        print(f"  Publish handles (ms):   {publish_time * 1000.0:.3f}")
+        print(f"{'=' * 70}")
+
+
+if __name__ == "__main__":
+    unittest.main()
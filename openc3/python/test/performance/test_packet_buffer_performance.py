@@ -0,0 +1,78 @@
+# Copyright 2026 OpenC3, Inc.
+# All Rights Reserved.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See LICENSE.md for more details.
+#
+# This file may also be used under the terms of a commercial license
+# if purchased from OpenC3, Inc.
+
+"""
+Performance benchmark for decommutating a large packet without copying its buffer.
+
+Run with: poetry run pytest test/performance/test_packet_buffer_performance.py -v -s
+Skip in CI with: CI=true poetry run pytest (tests are skipped when CI env var is set)
+"""
+
+import os
+import sys
+import time
+import unittest
+
+
+# Skip all tests in CI environment
+if os.environ.get("CI"):
+    raise unittest.SkipTest("Skipping performance tests in CI")
+
+from openc3.conversions.polynomial_conversion import PolynomialConversion
+from openc3.packets.packet import Packet
+
+
+ITEMS = 1000
+ITEM_BITS = 64
+
+
+class TestPacketBufferPerformance(unittest.TestCase):
+    """Performance benchmark for an 8 KB packet with 1000 converted items"""
+
+    def setUp(self):
+        self.packet = Packet("TGT", "LARGE")
+        for index in range(ITEMS):
+            item = self.packet.append_item(f"ITEM{index}", ITEM_BITS, "UINT")
+            item.read_conversion = PolynomialConversion(1, 2)
+            item.units = "V"
+        self.buffer = os.urandom(ITEMS * ITEM_BITS // 8)
+        self.packet.buffer = self.buffer
+
+    def test_decom_performance(self):
+        """Benchmark receiving and decommutating the packet"""
+        iterations = int(os.environ.get("PERF_ITERATIONS", 50))
+        received = Packet(None, None)
+        received.buffer = self.buffer
+
+        print(f"\n{'=' * 70}")
+        print("Performance Benchmark: Packet.decom (8 KB, 1000 converted items)")
+        print(f"Python Version: {sys.version}")
+        print(f"Iterations: {iterations}")
+        print(f"{'=' * 70}")
+
+        # Warm up
+        self.packet.decom()
+
+        start = time.perf_counter()
+        for _ in range(iterations):
+            # Same as InterfaceMicroservice.handle_packet -> Telemetry.update
+            self.packet.buffer = received.buffer_view()
+            self.packet.decom()
+        elapsed = time.perf_counter() - start
+
+        print("\nResults:")
+        print(f"  Buffer size:              {len(self.buffer)} bytes")
+        print(f"  Milliseconds/packet:      {(elapsed * 1_000) / iterations:.2f}")
+        print(f"{'=' * 70}")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+# Copyright 2026 OpenC3, Inc.
+# All Rights Reserved.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See LICENSE.md for more details.
+#
+# This file may also be used under the terms of a commercial license
+# if purchased from OpenC3, Inc.
+
+"""
+Performance benchmark for PacketItem memory and packet decom.
+
+Run with: poetry run pytest test/performance/test_packet_item_performance.py -v -s
+Skip in CI with: CI=true poetry run pytest (tests are skipped when CI env var is set)
+"""
+
+import os
+import sys
+import time
+import tracemalloc
+import unittest
+
+
+# Skip all tests in CI environment
+if os.environ.get("CI"):
+    raise unittest.SkipTest("Skipping performance tests in CI")
+
+from openc3.packets.packet_item import PacketItem
+from openc3.system.system import System
+from test.test_helper import mock_redis, setup_system
+
+
+class TestPacketItemPerformance(unittest.TestCase):
+    """Performance benchmark for PacketItem"""
+
+    def setUp(self):
+        mock_redis(self)
+        setup_system()
+
+    def test_packet_item_memory(self):
+        """Measure the memory used by each PacketItem"""
+        count = int(os.environ.get("PERF_ITERATIONS", 20_000))
+
+        tracemalloc.start()
+        start, _ = tracemalloc.get_traced_memory()
+        items = [PacketItem(f"ITEM{index}", index * 8, 8, "UINT", "BIG_ENDIAN") for index in range(count)]
+        end, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        print(f"\n{'=' * 70}")
+        print("Performance Benchmark: PacketItem memory")
+        print(f"Python Version: {sys.version}")
+        print(f"Items: {len(items)}")
+        print(f"  Bytes/item:        {(end - start) / count:.1f}")
+        print(f"{'=' * 70}")
+
+    def test_decom_performance(self):
+        """Benchmark decom and RAW reads of INST HEALTH_STATUS"""
+        iterations = int(os.environ.get("PERF_ITERATIONS", 2000))
+        packet = System.telemetry.packet("INST", "HEALTH_STATUS")
+        packet.buffer = bytes(packet.defined_length)
+
+        print(f"\n{'=' * 70}")
+        print("Performance Benchmark: Packet.decom (INST HEALTH_STATUS)")
+        print(f"Python Version: {sys.version}")
+        print(f"Items: {len(packet.sorted_items)}")
+        print(f"Iterations: {iterations}")
+        print(f"{'=' * 70}")
+
+        # Warm up
+        packet.decom()
+
+        start = time.perf_counter()
+        for _ in range(iterations):
+            packet.decom()
+        decom_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for _ in range(iterations):
+            packet.read_items(packet.sorted_items)
+        read_elapsed = time.perf_counter() - start
+
+        print("\nResults:")
+        print(f"  Microseconds/decom:      {(decom_elapsed * 1_000_000) / iterations:.2f}")
+        print(f"  Microseconds/read_items: {(read_elapsed * 1_000_000) / iterations:.2f}")
+        print(f"{'=' * 70}")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+# Copyright 2026 OpenC3, Inc.
+# All Rights Reserved.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See LICENSE.md for more details.
+#
+# This file may also be used under the terms of a commercial license
+# if purchased from OpenC3, Inc.
+
+"""
+Performance benchmark for decommutating packets with and without single_owner set.
+
+Run with: poetry run pytest test/performance/test_single_owner_performance.py -v -s
+Skip in CI with: CI=true poetry run pytest (tests are skipped when CI env var is set)
+"""
+
+import os
+import sys
+import time
+import unittest
+
+
+# Skip all tests in CI environment
+if os.environ.get("CI"):
+    raise unittest.SkipTest("Skipping performance tests in CI")
+
+from openc3.conversions.polynomial_conversion import PolynomialConversion
+from openc3.packets.packet import Packet
+
+
+ITEMS = 100
+ITEM_BITS = 32
+
+
+class TestSingleOwnerPerformance(unittest.TestCase):
+    """Performance benchmark for a packet with 100 converted items"""
+
+    def setUp(self):
+        self.packet = Packet("TGT", "PKT")
+        for index in range(ITEMS):
+            item = self.packet.append_item(f"ITEM{index}", ITEM_BITS, "UINT")
+            item.read_conversion = PolynomialConversion(1, 2)
+        self.buffer = os.urandom(ITEMS * ITEM_BITS // 8)
+
+    def decom(self, iterations):
+        # Warm up
+        self.packet.buffer = self.buffer
+        self.packet.decom()
+
+        start = time.perf_counter()
+        for _ in range(iterations):
+            # Same as DecomMicroservice.decom_packet -> Telemetry.update
+            self.packet.buffer = self.buffer
+            self.packet.decom()
+        return time.perf_counter() - start
+
+    def test_decom_performance(self):
+        """Benchmark decom of the same packet shared and single owner"""
+        iterations = int(os.environ.get("PERF_ITERATIONS", 2000))
+
+        print(f"\n{'=' * 70}")
+        print("Performance Benchmark: Packet.decom (100 converted items)")
+        print(f"Python Version: {sys.version}")
+        print(f"Iterations: {iterations}")
+        print(f"{'=' * 70}")
+
+        self.packet.single_owner = False
+        shared = self.decom(iterations)
+        self.packet.single_owner = True
+        single_owner = self.decom(iterations)
+
+        print("\nResults:")
+        print(f"  Shared packets/sec:       {iterations / shared:,.0f}")
+        print(f"  Single owner packets/sec: {iterations / single_owner:,.0f}")
+        print(f"  Speedup:                  {shared / single_owner:.2f}x")
+        print(f"{'=' * 70}")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -108,6 +108,14 @@ class Proxy:
         cmd["obfuscated_items"] = []
         return cmd
 
+    def cmd_many(*args, **kwargs):
+        global gArgs
+        global gKwargs
+        sent = [Proxy.cmd(command) for command in args[0]]
+        gArgs = args
+        gKwargs = kwargs
+        return sent
+
     # Duplicate the return in cmd_api.py
     def get_cmd(self, cmd_name, scope):
         return TargetModel.packet(self, cmd_name, type="CMD", scope=scope)
@@ -203,6 +211,27 @@ class TestCommands(unittest.TestCase):
         with self.assertRaisesRegex(RuntimeError, "Item 'INST COLLECT NOPE' does not exist"):
             cmd("INST", "COLLECT", {"NOPE": "NOPE"})
 
+    def test_sends_a_cmd_many(self):
+        for stdout in capture_io():
+            cmd_many(["INST ABORT", "INST ABORT with TYPE NORMAL"], timeout=5)
+            self.assertIn('cmd("INST ABORT")', stdout.getvalue())
+            self.assertIn('cmd("INST ABORT with TYPE NORMAL")', stdout.getvalue())
+        self.assertEqual(gArgs, (["INST ABORT", "INST ABORT with TYPE NORMAL"],))
+        self.assertEqual(gKwargs["timeout"], 5)
+        self.assertTrue(gKwargs["hazardous_check"])
+        # Hazardous commands are not prompted for
+        with self.assertRaises(HazardousError):
+            cmd_many(["INST CLEAR"])
+
+    def test_logs_cmd_many_only_in_disconnect(self):
+        openc3.script.DISCONNECT = True
+        for stdout in capture_io():
+            cmd_many(["INST ABORT", ["INST", "COLLECT", {"TYPE": "SPECIAL"}], {"command": "INST CLEAR"}])
+            self.assertIn('cmd("INST ABORT")', stdout.getvalue())
+            self.assertIn('cmd("INST COLLECT with TYPE SPECIAL")', stdout.getvalue())
+            self.assertIn('cmd("INST CLEAR")', stdout.getvalue())
+        self.assertEqual(gArgs, [])
+
     def test_sends_a_hazardous_cmd(self):
         global gArgs
         global gKwargs
@@ -17,6 +17,7 @@ import unittest
 from datetime import datetime, timedelta, timezone
 from unittest.mock import Mock, patch
 
+import numpy
 from websockets.exceptions import ConnectionClosedOK
 
 from openc3.script.exceptions import StopScriptError
@@ -960,7 +961,7 @@ class TestStreamingWebSocketApiActions(unittest.TestCase):
         self.assertEqual([f["command"] for f in api.stream.frames()], ["subscribe", "message"])
 
 
-class TestStreamingWebSocketApiReadAll(unittest.TestCase):
+class StreamingReadTest(unittest.TestCase):
     def setUp(self):
         self.stream = FakeWebSocketStream()
         # read_all takes no authentication argument, so _generate_auth runs;
@@ -975,6 +976,8 @@ class TestStreamingWebSocketApiReadAll(unittest.TestCase):
         env_patcher.start()
         self.addCleanup(env_patcher.stop)
 
+
+class TestStreamingWebSocketApiReadAll(StreamingReadTest):
     # An empty batch is the end marker the streaming channel sends when the
     # requested time range is exhausted
     def test_concatenates_batches_until_an_empty_batch_ends_the_stream(self):
@@ -1058,6 +1061,125 @@ class TestStreamingWebSocketApiReadAll(unittest.TestCase):
         StreamingWebSocketApi.read_all(items=["ITEM"], end_time=datetime(2026, 1, 1, tzinfo=timezone.utc))
         self.assertEqual(self.stream.disconnect_count, 1)
 
+    def test_read_batches_yields_each_batch_as_it_arrives(self):
+        self.stream.queue_read(
+            '{"type":"confirm_subscription"}',
+            '{"message":[{"__time":1},{"__time":2}]}',
+            '{"message":[{"__time":3}]}',
+            '{"message":[]}',
+        )
+        batches = StreamingWebSocketApi.read_batches(items=["ITEM"], end_time=datetime(2026, 1, 1, tzinfo=timezone.utc))
+        self.assertEqual(next(batches), [{"__time": 1}, {"__time": 2}])
+        self.assertEqual(self.stream.disconnect_count, 0)
+        self.assertEqual(list(batches), [[{"__time": 3}]])
+        self.assertEqual(self.stream.disconnect_count, 1)
+
+    def test_read_batches_disconnects_when_closed_early(self):
+        self.stream.queue_read('{"type":"confirm_subscription"}', '{"message":[{"__time":1}]}')
+        batches = StreamingWebSocketApi.read_batches(items=["ITEM"])
+        next(batches)
+        batches.close()
+        self.assertEqual(self.stream.disconnect_count, 1)
+
+
+class TestStreamingWebSocketApiReadColumns(StreamingReadTest):
+    ITEMS = {
+        "TEMP1": {
+            "data_type": "UINT",
+            "bit_size": 16,
+            "read_conversion": {"converted_type": "FLOAT", "converted_bit_size": 64},
+        },
+        "MODE": {"data_type": "UINT", "bit_size": 8, "states": {"SAFE": 0, "NORMAL": 1}},
+        "COUNT": {"data_type": "UINT", "bit_size": 12},
+    }
+
+    def setUp(self):
+        super().setUp()
+        api_server_patcher = patch("openc3.script.API_SERVER")
+        api_server = api_server_patcher.start()
+        self.addCleanup(api_server_patcher.stop)
+        api_server.get_item.side_effect = lambda target, packet, item, scope: self.ITEMS[item]
+
+    def read_columns(self, count=None, **kwargs):
+        mode = "DECOM__TLM__INST__HEALTH_STATUS__MODE__CONVERTED"
+        count_key = "DECOM__TLM__INST__HEALTH_STATUS__COUNT__RAW"
+        last_row = {"__type": "ITEMS", "__time": 3, "T": 3.5}
+        if count is not None:
+            last_row[count_key] = count
+        self.stream.queue_read(
+            '{"type":"confirm_subscription"}',
+            json.dumps(
+                {
+                    "message": [
+                        {"__type": "ITEMS", "__time": 1, "T": 1.5, mode: "SAFE", count_key: 4000},
+                        {"__type": "ITEMS", "__time": 2, "T": 2.5, mode: "NORMAL", count_key: 4001},
+                    ]
+                }
+            ),
+            json.dumps({"message": [last_row]}),
+            '{"message":[]}',
+        )
+        return StreamingWebSocketApi.read_columns(
+            [
+                ["DECOM__TLM__INST__HEALTH_STATUS__TEMP1__CONVERTED", "T"],
+                "DECOM__TLM__INST__HEALTH_STATUS__MODE__CONVERTED",
+                "DECOM__TLM__INST__HEALTH_STATUS__COUNT__RAW",
+            ],
+            end_time=datetime(2026, 1, 1, tzinfo=timezone.utc),
+            **kwargs,
+        )
+
+    def test_read_columns_types_the_columns_from_the_item_definitions(self):
+        data = self.read_columns(dataframe=False)
+        self.assertEqual(
+            list(data.keys()),
+            [
+                "__time",
+                "T",
+                "DECOM__TLM__INST__HEALTH_STATUS__MODE__CONVERTED",
+                "DECOM__TLM__INST__HEALTH_STATUS__COUNT__RAW",
+            ],
+        )
+        self.assertEqual(data["__time"].dtype, numpy.int64)
+        self.assertEqual(data["__time"].tolist(), [1, 2, 3])
+        self.assertEqual(data["T"].dtype, numpy.float64)
+        self.assertEqual(data["T"].tolist(), [1.5, 2.5, 3.5])
+        self.assertEqual(data["DECOM__TLM__INST__HEALTH_STATUS__MODE__CONVERTED"].tolist(), ["SAFE", "NORMAL", None])
+        # The second batch is missing COUNT so its values become NaN
+        count = data["DECOM__TLM__INST__HEALTH_STATUS__COUNT__RAW"]
+        self.assertEqual(count.dtype, numpy.float64)
+        self.assertEqual(count[:2].tolist(), [4000, 4001])
+        self.assertTrue(numpy.isnan(count[2]))
+
+    def test_read_columns_keeps_integer_columns_without_missing_values(self):
+        data = self.read_columns(count=4002, dataframe=False, dtypes={"T": numpy.float32})
+        self.assertEqual(data["T"].dtype, numpy.float32)
+        count = data["DECOM__TLM__INST__HEALTH_STATUS__COUNT__RAW"]
+        self.assertEqual(count.dtype, numpy.uint16)
+        self.assertEqual(count.tolist(), [4000, 4001, 4002])
+
+    def test_read_columns_returns_a_dataframe_when_pandas_is_available(self):
+        pandas = Mock()
+        with patch.dict(sys.modules, {"pandas": pandas}):
+            result = self.read_columns()
+        self.assertIs(result, pandas.DataFrame.return_value.set_index.return_value)
+        pandas.DataFrame.return_value.set_index.assert_called_with("__time")
+
+    def test_read_columns_returns_arrays_without_pandas(self):
+        with patch.dict(sys.modules, {"pandas": None}):
+            result = self.read_columns()
+        self.assertIsInstance(result, dict)
+
+    def test_read_columns_returns_empty_columns_when_there_is_no_data(self):
+        self.stream.queue_read('{"type":"confirm_subscription"}', '{"message":[]}')
+        data = StreamingWebSocketApi.read_columns(
+            ["DECOM__TLM__INST__HEALTH_STATUS__COUNT__RAW"],
+            end_time=datetime(2026, 1, 1, tzinfo=timezone.utc),
+            dataframe=False,
+        )
+        self.assertEqual(data["DECOM__TLM__INST__HEALTH_STATUS__COUNT__RAW"].dtype, numpy.uint16)
+        self.assertEqual(len(data["__time"]), 0)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -21,7 +21,6 @@ os.environ["OPENC3_CONFIG_BUCKET"] = "config"
 os.environ["OPENC3_LOCAL_MODE_PATH"] = os.path.dirname(__file__)
 import io
 import json
-import queue
 import sys
 import threading
 import time
@@ -32,7 +31,6 @@ from openc3.models.cvt_model import CvtModel
 from openc3.models.target_model import TargetModel
 from openc3.system.system import System
 from openc3.utilities.logger import Logger
-from openc3.utilities.sleeper import Sleeper
 from openc3.utilities.store import EphemeralStore, Store
 from openc3.utilities.store_queued import EphemeralStoreQueued, StoreQueued
 
@@ -53,10 +51,11 @@ def my_init(self, update_interval, db_shard=0):
     self.update_interval = update_interval
     self.db_shard = db_shard
     self.store = self.store_instance()
-    # Queue to hold the store requests
-    self.store_queue = queue.Queue()
-    # Sleeper used to delay update thread
-    self.update_sleeper = Sleeper()
+    self.store_queue = {}
+    self.coalesce_index = {}
+    self.queue_mutex = threading.Condition()
+    self.flush_event = threading.Event()
+    self.cancel_thread = False
 
     # Thread used to call methods on the store
     self.update_thread = None
@@ -65,6 +64,9 @@ def my_init(self, update_interval, db_shard=0):
 import openc3.utilities.store_queued
 
 
+# Kept for the tests of StoreQueued itself
+store_queued_init = openc3.utilities.store_queued.StoreQueued.__init__
+store_queued_getattr = openc3.utilities.store_queued.StoreQueued.__getattr__
 openc3.utilities.store_queued.StoreQueued.__init__ = my_init
 openc3.utilities.store_queued.StoreQueued.__getattr__ = my_getattr
 
@@ -194,6 +196,9 @@ class BucketMock:
             data = kwargs["body"]
         self.objs[kwargs["key"]] = data
 
+    def put_object_multipart(self, *args, **kwargs):
+        self.objs[kwargs["key"]] = b"".join(kwargs["chunks"])
+
     def clear(self):
         self.objs = {}
 
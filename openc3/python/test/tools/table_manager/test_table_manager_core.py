@@ -253,6 +253,70 @@ class TestTableManagerCore(unittest.TestCase):
             b"\x00\x00\x00\x01\x01\x01\x00\x00\x00\x02\x00\x00\x00\x00\x00\x03\x01\x00",
         )
 
+    def write_paging_definition(self, hidden=""):
+        def_path = os.path.join(self.temp_dir, "tabledef.txt")
+        with open(def_path, "w") as file:
+            file.write('TABLE "Test" LITTLE_ENDIAN ROW_COLUMN 4\n')
+            file.write('  APPEND_PARAMETER "Value" 16 INT -100 100 0\n')
+            file.write("    UNITS Volts V\n")
+            file.write('  APPEND_PARAMETER "Level" 32 FLOAT -100 100 0\n')
+            file.write('    FORMAT_STRING "%.1f"\n')
+            file.write(f'  APPEND_PARAMETER "Mode" 8 UINT 0 1 0\n{hidden}')
+            file.write("    STATE OFF 0\n")
+            file.write("    STATE ON 1\n")
+            file.write('  APPEND_PARAMETER "Poly" 8 UINT 0 255 0\n')
+            file.write("    POLY_READ_CONVERSION 1 2\n")
+            for row in range(4):
+                file.write(f"DEFAULT {-row} {row}.5 {row % 2} {row}\n")
+        return def_path
+
+    def test_build_json_hash_unpacks_whole_rows(self):
+        def_path = self.write_paging_definition()
+        binary = TableManagerCore.generate(def_path)
+        result = TableManagerCore.build_json_hash(binary, def_path)
+        rows = result["tables"][0]["rows"]
+        self.assertEqual(len(rows), 4)
+        self.assertEqual([item["value"] for item in rows[3]], ["-3 V", "3.5", "ON", "7.0"])
+        self.assertEqual(rows[3][0]["index"], 4)
+        self.assertNotIn("rowOffset", result["tables"][0])
+
+        config = TableConfig.process_file(def_path)
+        TableManagerCore.load_binary(config, binary)
+        table = config.tables["TEST"]
+        values = TableManagerCore.unpack_rows(table, 2, 1)
+        self.assertEqual(values, {"VALUE02": -2, "LEVEL02": 2.5, "MODE02": 0, "POLY02": 2})
+        self.assertEqual(TableManagerCore.unpack_rows(table), table.read_items(table.sorted_items, "RAW"))
+
+    def test_unpack_rows_requires_byte_aligned_items(self):
+        def_path = os.path.join(self.temp_dir, "tabledef.txt")
+        with open(def_path, "w") as file:
+            file.write('TABLE "Test" BIG_ENDIAN ROW_COLUMN 2\n')
+            file.write('  PARAMETER "Value" 4 16 INT -100 100 0\n')
+            file.write('  APPEND_PARAMETER "Level" 16 INT -100 100 0\n')
+            file.write("DEFAULT 1 2\n")
+            file.write("DEFAULT 3 4\n")
+        binary = TableManagerCore.generate(def_path)
+        config = TableConfig.process_file(def_path)
+        TableManagerCore.load_binary(config, binary)
+        table = config.tables["TEST"]
+        self.assertIsNone(TableManagerCore.unpack_rows(table))
+        result = TableManagerCore.build_json_hash(binary, def_path)
+        rows = result["tables"][0]["rows"]
+        self.assertEqual([[item["value"] for item in row] for row in rows], [["1", "2"], ["3", "4"]])
+
+    def test_build_json_hash_pages_rows(self):
+        for hidden in ["", "    HIDDEN\n"]:
+            def_path = self.write_paging_definition(hidden)
+            binary = TableManagerCore.generate(def_path)
+            full = TableManagerCore.build_json_hash(binary, def_path)
+            page = TableManagerCore.build_json_hash(binary, def_path, row_offset=1, row_count=2)
+            self.assertEqual(page["tables"][0]["numRows"], 4)
+            self.assertEqual(page["tables"][0]["rowOffset"], 1)
+            self.assertEqual(page["tables"][0]["headers"], full["tables"][0]["headers"])
+            self.assertEqual(page["tables"][0]["rows"], full["tables"][0]["rows"][1:3])
+            page = TableManagerCore.build_json_hash(binary, def_path, row_offset=3)
+            self.assertEqual(page["tables"][0]["rows"], full["tables"][0]["rows"][3:])
+
     def test_load_binary_mismatch(self):
         """Test loading a binary file that doesn't match the definition size"""
         def_path = self.create_test_files()
@@ -0,0 +1,85 @@
+# Copyright 2026 OpenC3, Inc.
+# All Rights Reserved.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See LICENSE.md for more details.
+#
+# This file may also be used under the terms of a commercial license
+# if purchased from OpenC3, Inc.
+
+import time
+import unittest
+
+from openc3.topics.ack_dispatcher import AckDispatcher
+from openc3.topics.topic import Topic
+from test.test_helper import mock_redis
+
+
+ACK_TOPIC = "{DEFAULT__ACKCMD}TARGET__INST"
+
+
+class TestAckDispatcher(unittest.TestCase):
+    def setUp(self):
+        mock_redis(self)
+        AckDispatcher.instances = {}
+
+    def write_ack(self, msg_id, result="SUCCESS"):
+        Topic.write_topic(ACK_TOPIC, {"result": result, "id": msg_id}, "*", 100)
+
+    def test_returns_one_dispatcher_per_topic(self):
+        dispatcher = AckDispatcher.instance(ACK_TOPIC)
+        self.assertIs(AckDispatcher.instance(ACK_TOPIC), dispatcher)
+        self.assertIsNot(AckDispatcher.instance("{DEFAULT__ACKCMD}TARGET__EXAMPLE"), dispatcher)
+        # A new store (e.g. after a reconnect) gets a new dispatcher
+        mock_redis(self)
+        self.assertIsNot(AckDispatcher.instance(ACK_TOPIC), dispatcher)
+
+    def test_ignores_acks_written_before_it_was_created(self):
+        self.write_ack("1-0")
+        dispatcher = AckDispatcher.instance(ACK_TOPIC)
+        future = dispatcher.register("1-0")
+        self.assertIsNone(dispatcher.wait("1-0", future, 0.2))
+        self.assertEqual(dispatcher.pending, {})
+
+    def test_resolves_each_ack_by_id(self):
+        dispatcher = AckDispatcher.instance(ACK_TOPIC)
+        futures = {msg_id: dispatcher.register(msg_id) for msg_id in ["1-0", "2-0", "3-0"]}
+        # Acks arrive out of order and include acks for other senders
+        for msg_id in ["3-0", "9-0", "1-0", "2-0"]:
+            self.write_ack(msg_id, f"RESULT {msg_id}")
+        for msg_id, future in futures.items():
+            msg_hash = dispatcher.wait(msg_id, future, 5)
+            self.assertEqual(msg_hash[b"result"], f"RESULT {msg_id}".encode())
+        self.assertEqual(dispatcher.pending, {})
+
+    def test_resolves_acks_received_before_registering(self):
+        dispatcher = AckDispatcher.instance(ACK_TOPIC)
+        first = dispatcher.register("1-0")
+        self.write_ack("2-0")
+        for _ in range(100):
+            if "2-0" in dispatcher.unclaimed:
+                break
+            time.sleep(0.01)
+        future = dispatcher.register(b"2-0")
+        self.assertTrue(future.done())
+        self.assertEqual(future.result()[b"id"], b"2-0")
+        self.write_ack("1-0")
+        self.assertIsNotNone(dispatcher.wait("1-0", first, 5))
+
+    def test_reader_thread_only_runs_while_acks_are_pending(self):
+        dispatcher = AckDispatcher.instance(ACK_TOPIC)
+        future = dispatcher.register("1-0")
+        thread = dispatcher.thread
+        self.assertTrue(thread.is_alive())
+        self.write_ack("1-0")
+        dispatcher.wait("1-0", future, 5)
+        thread.join(5)
+        self.assertFalse(thread.is_alive())
+        self.assertIsNone(dispatcher.thread)
+
+        # Acks written while the thread was stopped are still read
+        self.write_ack("2-0")
+        future = dispatcher.register("2-0")
+        self.assertIsNotNone(dispatcher.wait("2-0", future, 5))
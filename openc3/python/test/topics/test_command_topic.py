@@ -11,10 +11,14 @@
 
 import datetime
 import json
+import threading
 import unittest
 from unittest.mock import MagicMock, patch
 
+from openc3.top_level import HazardousError
+from openc3.topics.ack_dispatcher import AckDispatcher
 from openc3.topics.command_topic import CommandTopic
+from openc3.topics.topic import Topic
 from test.test_helper import mock_redis
 
 
@@ -52,7 +56,7 @@ class TestCommandTopic(unittest.TestCase):
         packet.received_time = datetime.datetime.now()
         packet.received_count = 1
         packet.stored = False
-        packet.buffer_no_copy.return_value = b"\x01\x02\x03\x04"
+        packet.buffer_view.return_value = b"\x01\x02\x03\x04"
         packet.extra = extra
         return packet
 
@@ -79,3 +83,117 @@ class TestCommandTopic(unittest.TestCase):
         # Falsy extra (empty dict) should not produce an extra field
         CommandTopic.write_packet(self._make_packet(extra={}), scope="DEFAULT")
         self.assertNotIn("extra", self.captured["msg_hash"])
+
+
+class TestCommandTopicSendCommands(unittest.TestCase):
+    def setUp(self):
+        mock_redis(self)
+        AckDispatcher.instances = {}
+        self.results = {}
+        self.running = True
+        self.responder = threading.Thread(target=self.respond)
+        self.responder.start()
+        self.addCleanup(self.stop)
+
+    def stop(self):
+        self.running = False
+        self.responder.join()
+
+    # Acks each command like the InterfaceCmdHandlerThread with the result for its cmd_name
+    def respond(self):
+        offset = "0-0"
+        while self.running:
+            for topic, msg_id, msg_hash, _ in Topic.read_topics(
+                ["{DEFAULT__CMD}TARGET__INST"], [offset], timeout_ms=10
+            ):
+                offset = msg_id
+                result = self.results.get(msg_hash[b"cmd_name"].decode(), "SUCCESS")
+                if result is not None:
+                    Topic.write_ack(topic, result, msg_id)
+
+    def command(self, cmd_name):
+        return {"target_name": "INST", "cmd_name": cmd_name, "cmd_params": {"VALUE": 1}}
+
+    def test_sends_commands_and_waits_for_all_acks(self):
+        commands = [self.command(f"CMD{index}") for index in range(10)]
+        self.assertIs(CommandTopic.send_commands(commands, timeout=5, scope="DEFAULT"), commands)
+        # The cmd_params are restored after being written as JSON
+        self.assertEqual(commands[0]["cmd_params"], {"VALUE": 1})
+        command = CommandTopic.send_command(self.command("CMD"), timeout=5, scope="DEFAULT")
+        self.assertEqual(command["cmd_name"], "CMD")
+
+    def test_limits_the_commands_in_flight_to_fit_the_ack_topic(self):
+        in_flight = []
+        write_command = CommandTopic._write_command
+        check_ack = CommandTopic._check_ack
+
+        def write(command, scope):
+            in_flight.append(command["cmd_name"])
+            self.assertLessEqual(len(in_flight), 10)
+            return write_command(command, scope)
+
+        def check(command, ack):
+            check_ack(command, ack)
+            self.assertEqual(in_flight.pop(0), command["cmd_name"])
+
+        # More commands than the ack topic holds (maxlen 100)
+        commands = [self.command(f"CMD{index}") for index in range(250)]
+        with (
+            patch.object(CommandTopic, "MAX_IN_FLIGHT", 10),
+            patch.object(CommandTopic, "_write_command", side_effect=write),
+            patch.object(CommandTopic, "_check_ack", side_effect=check),
+        ):
+            CommandTopic.send_commands(commands, timeout=5, scope="DEFAULT")
+        self.assertEqual(in_flight, [])
+
+    def test_raises_the_first_failed_ack(self):
+        self.results["BAD1"] = "RuntimeError: first"
+        self.results["BAD2"] = "RuntimeError: second"
+        commands = [self.command("GOOD"), self.command("BAD1"), self.command("BAD2")]
+        with self.assertRaisesRegex(RuntimeError, "first"):
+            CommandTopic.send_commands(commands, timeout=5, scope="DEFAULT")
+        self.results["HAZ"] = "HazardousError\nDescription\nINST HAZ"
+        with self.assertRaises(HazardousError) as context:
+            CommandTopic.send_commands([self.command("GOOD"), self.command("HAZ")], timeout=5, scope="DEFAULT")
+        self.assertEqual(context.exception.hazardous_description, "Description")
+        self.assertEqual(context.exception.cmd_params, {"VALUE": 1})
+        self.assertEqual(AckDispatcher.instance("{DEFAULT__ACKCMD}TARGET__INST").pending, {})
+
+    def test_sends_nothing_after_an_isolated_command_until_it_is_acked(self):
+        self.results["HAZ"] = "HazardousError\nDescription\nINST HAZ"
+        written = []
+        write_command = CommandTopic._write_command
+
+        def write(command, scope):
+            written.append(command["cmd_name"])
+            return write_command(command, scope)
+
+        commands = [self.command("GOOD1"), self.command("HAZ"), self.command("GOOD2")]
+        with patch.object(CommandTopic, "_write_command", side_effect=write), self.assertRaises(HazardousError):
+            CommandTopic.send_commands(commands, timeout=5, scope="DEFAULT", isolate=[False, True, False])
+        self.assertEqual(written, ["GOOD1", "HAZ"])
+        self.assertEqual(AckDispatcher.instance("{DEFAULT__ACKCMD}TARGET__INST").pending, {})
+
+    def test_times_out_waiting_for_acks(self):
+        self.results["LOST"] = None
+        commands = [self.command("GOOD"), self.command("LOST")]
+        with self.assertRaisesRegex(RuntimeError, r"Timeout of 0.2s waiting for cmd ack"):
+            CommandTopic.send_commands(commands, timeout=0.2, scope="DEFAULT")
+        self.assertEqual(AckDispatcher.instance("{DEFAULT__ACKCMD}TARGET__INST").pending, {})
+
+    def test_does_not_wait_without_a_timeout(self):
+        self.results["LOST"] = None
+        commands = [self.command("LOST")]
+        self.assertIs(CommandTopic.send_commands(commands, timeout=0, scope="DEFAULT"), commands)
+        self.assertEqual(AckDispatcher.instances, {})
+
+    def test_uses_the_timeout_of_each_command(self):
+        self.results["LOST"] = None
+        commands = [self.command("LOST"), self.command("GOOD")]
+        # The fire-and-forget command isn't waited on
+        self.assertIs(CommandTopic.send_commands(commands, timeout=[0, 5], scope="DEFAULT"), commands)
+        commands = [self.command("GOOD"), self.command("LOST")]
+        with self.assertRaisesRegex(RuntimeError, r"Timeout of 0.2s waiting for cmd ack"):
+            CommandTopic.send_commands(commands, timeout=[5, 0.2], scope="DEFAULT")
+        with self.assertRaises(ValueError):
+            CommandTopic.send_commands(commands, timeout=[5], scope="DEFAULT")
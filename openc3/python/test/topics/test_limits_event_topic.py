@@ -12,6 +12,8 @@
 import unittest
 from unittest.mock import *
 
+from valkey.client import Pipeline
+
 from openc3.topics.limits_event_topic import LimitsEventTopic
 from test.test_helper import *
 
@@ -86,6 +88,96 @@ class TestLimitsEventTopic(unittest.TestCase):
         self.assertEqual(len(out), 1)
         self.assertEqual(out[0][3], "RED_HIGH")
 
+    def test_out_of_limits_index_only_holds_yellow_and_red_items(self):
+        event = {
+            "type": "LIMITS_CHANGE",
+            "target_name": "TGT",
+            "packet_name": "PKT",
+            "item_name": "ITEM",
+            "old_limits_state": "GREEN",
+            "new_limits_state": "RED_LOW",
+            "time_nsec": 123456789,
+            "message": "test change",
+        }
+        LimitsEventTopic.write(event, scope="DEFAULT")
+        event["item_name"] = "OTHER"
+        event["new_limits_state"] = "GREEN"
+        LimitsEventTopic.write(event, scope="DEFAULT")
+        self.assertEqual(Store.hgetall("DEFAULT__out_of_limits"), {b"TGT__PKT__ITEM": b"RED_LOW"})
+        self.assertEqual(LimitsEventTopic.out_of_limits(scope="DEFAULT"), [["TGT", "PKT", "ITEM", "RED_LOW"]])
+
+        event["item_name"] = "ITEM"
+        LimitsEventTopic.write(event, scope="DEFAULT")
+        self.assertEqual(LimitsEventTopic.out_of_limits(scope="DEFAULT"), [])
+        # The index remains built even when nothing is out of limits
+        self.assertEqual(
+            Store.hgetall("DEFAULT__out_of_limits"), {LimitsEventTopic.INDEX_BUILT_FIELD.encode(): b"true"}
+        )
+        self.assertEqual(len(Store.hgetall("DEFAULT__current_limits")), 2)
+
+    def test_builds_the_out_of_limits_index_from_current_limits(self):
+        Store.hset(
+            "DEFAULT__current_limits",
+            mapping={"TGT__PKT__ITEM1": "YELLOW_HIGH", "TGT__PKT__ITEM2": "GREEN", "TGT__PKT__ITEM3": "BLUE"},
+        )
+        self.assertEqual(LimitsEventTopic.out_of_limits(scope="DEFAULT"), [["TGT", "PKT", "ITEM1", "YELLOW_HIGH"]])
+        self.assertEqual(Store.hget("DEFAULT__out_of_limits", "TGT__PKT__ITEM1"), b"YELLOW_HIGH")
+        self.assertIsNone(Store.hget("DEFAULT__out_of_limits", "TGT__PKT__ITEM2"))
+
+    def test_builds_the_out_of_limits_index_after_a_limits_event(self):
+        Store.hset(
+            "DEFAULT__current_limits",
+            mapping={"TGT__PKT__ITEM1": "YELLOW_HIGH", "TGT__PKT__ITEM2": "RED_LOW", "TGT__PKT__ITEM3": "GREEN"},
+        )
+        event = {
+            "type": "LIMITS_CHANGE",
+            "target_name": "TGT",
+            "packet_name": "PKT",
+            "item_name": "ITEM3",
+            "old_limits_state": "GREEN",
+            "new_limits_state": "RED_HIGH",
+            "time_nsec": 123456789,
+            "message": "test change",
+        }
+        LimitsEventTopic.write(event, scope="DEFAULT")
+        self.assertEqual(
+            sorted(LimitsEventTopic.out_of_limits(scope="DEFAULT")),
+            [
+                ["TGT", "PKT", "ITEM1", "YELLOW_HIGH"],
+                ["TGT", "PKT", "ITEM2", "RED_LOW"],
+                ["TGT", "PKT", "ITEM3", "RED_HIGH"],
+            ],
+        )
+
+    def test_rebuilds_the_out_of_limits_index_if_a_limits_event_is_written_during_the_build(self):
+        Store.hset("DEFAULT__current_limits", mapping={"TGT__PKT__ITEM1": "RED", "TGT__PKT__ITEM2": "YELLOW"})
+        event = {
+            "type": "LIMITS_CHANGE",
+            "target_name": "TGT",
+            "packet_name": "PKT",
+            "item_name": "ITEM1",
+            "old_limits_state": "RED",
+            "new_limits_state": "GREEN",
+            "time_nsec": 123456789,
+            "message": "test change",
+        }
+        hgetall = Pipeline.hgetall
+        builds = []
+
+        def hgetall_then_change(pipeline, name):
+            result = hgetall(pipeline, name)
+            builds.append(result)
+            if len(builds) == 1:
+                # ITEM1 goes back to GREEN after the first build read the RED state
+                LimitsEventTopic.write(event, scope="DEFAULT")
+            return result
+
+        with patch.object(Pipeline, "hgetall", hgetall_then_change):
+            out = LimitsEventTopic.out_of_limits(scope="DEFAULT")
+        self.assertEqual(len(builds), 2)
+        self.assertEqual(out, [["TGT", "PKT", "ITEM2", "YELLOW"]])
+        self.assertIsNone(Store.hget("DEFAULT__out_of_limits", "TGT__PKT__ITEM1"))
+
     def test_writes_and_reads_limits_settings_events(self):
         event = {
             "type": "LIMITS_SETTINGS",
@@ -87,6 +87,18 @@ class TestTelemetryDecomTopic(unittest.TestCase):
         TelemetryDecomTopic.write_packet(self._make_packet(extra=None), scope="DEFAULT")
         self.assertNotIn("extra", self.captured["msg_hash"])
 
+    def test_stamps_the_trace_before_the_write_and_after_the_cvt_update(self):
+        trace = {"protocol": 1}
+        TelemetryDecomTopic.write_packet(self._make_packet(), scope="DEFAULT", trace=trace)
+        written = json.loads(self.captured["msg_hash"]["trace"])
+        self.assertEqual(list(written.keys()), ["protocol", "decom_end"])
+        self.assertEqual(list(trace.keys()), ["protocol", "decom_end", "cvt_update"])
+        self.assertGreaterEqual(trace["cvt_update"], trace["decom_end"])
+
+    def test_omits_trace_when_none(self):
+        TelemetryDecomTopic.write_packet(self._make_packet(), scope="DEFAULT")
+        self.assertNotIn("trace", self.captured["msg_hash"])
+
     def test_updates_cvt_when_not_stored(self):
         TelemetryDecomTopic.write_packet(self._make_packet(stored=False), scope="DEFAULT")
         self.set_json_mock.assert_called_once()
@@ -0,0 +1,81 @@
+# Copyright 2026 OpenC3, Inc.
+# All Rights Reserved.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See LICENSE.md for more details.
+#
+# This file may also be used under the terms of a commercial license
+# if purchased from OpenC3, Inc.
+
+import datetime
+import json
+import unittest
+from unittest.mock import MagicMock, patch
+
+from openc3.topics.telemetry_topic import TelemetryTopic
+from test.test_helper import mock_redis
+
+
+class TestTelemetryTopic(unittest.TestCase):
+    def setUp(self):
+        mock_redis(self)
+        self.captured = {}
+
+        def fake_write_topic(topic, msg_hash, *args, **kwargs):
+            self.captured["topic"] = topic
+            self.captured["msg_hash"] = msg_hash
+
+        write_patch = patch(
+            "openc3.topics.telemetry_topic.Topic.write_topic",
+            side_effect=fake_write_topic,
+        )
+        write_patch.start()
+        self.addCleanup(write_patch.stop)
+
+        self.store_instance = MagicMock()
+        self.store_instance.write_topic.side_effect = fake_write_topic
+        instance_patch = patch(
+            "openc3.topics.telemetry_topic.EphemeralStoreQueued.instance",
+            return_value=self.store_instance,
+        )
+        instance_patch.start()
+        self.addCleanup(instance_patch.stop)
+
+        shard_patch = patch(
+            "openc3.topics.telemetry_topic.Store.db_shard_for_target",
+            return_value=0,
+        )
+        shard_patch.start()
+        self.addCleanup(shard_patch.stop)
+
+    def _make_packet(self):
+        packet = MagicMock()
+        packet.target_name = "TARGET"
+        packet.packet_name = "PKT"
+        packet.packet_time = datetime.datetime.now()
+        packet.received_time = datetime.datetime.now()
+        packet.received_count = 5
+        packet.stored = False
+        packet.extra = None
+        packet.buffer_view.return_value = b"\x01\x02"
+        return packet
+
+    def test_writes_to_correct_topic(self):
+        TelemetryTopic.write_packet(self._make_packet(), scope="DEFAULT")
+        self.assertEqual(self.captured["topic"], "DEFAULT__TELEMETRY__{TARGET}__PKT")
+        self.assertEqual(self.captured["msg_hash"]["buffer"], b"\x01\x02")
+        self.assertNotIn("trace", self.captured["msg_hash"])
+        self.store_instance.write_topic.assert_not_called()
+
+    def test_stamps_the_trace_of_an_unqueued_write(self):
+        TelemetryTopic.write_packet(self._make_packet(), scope="DEFAULT", trace={"protocol": 1})
+        trace = json.loads(self.captured["msg_hash"]["trace"])
+        self.assertEqual(list(trace.keys()), ["protocol", "telemetry_xadd"])
+
+    def test_does_not_stamp_the_trace_of_a_queued_write(self):
+        # The XADD happens when the queue is flushed so the stamp would be too early
+        TelemetryTopic.write_packet(self._make_packet(), scope="DEFAULT", queued=True, trace={"protocol": 1})
+        self.store_instance.write_topic.assert_called_once()
+        self.assertEqual(json.loads(self.captured["msg_hash"]["trace"]), {"protocol": 1})
@@ -0,0 +1,157 @@
+# Copyright 2026 OpenC3, Inc.
+# All Rights Reserved.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See LICENSE.md for more details.
+#
+# This file may also be used under the terms of a commercial license
+# if purchased from OpenC3, Inc.
+
+import asyncio
+import json
+import unittest
+from unittest.mock import AsyncMock, patch
+
+import fakeredis
+
+from openc3.utilities.async_store import AsyncStore, EphemeralAsyncStore
+from openc3.utilities.store import Store
+
+
+class TestAsyncStore(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.redis = fakeredis.FakeAsyncValkey()
+        patcher = patch("valkey.asyncio.Valkey", return_value=self.redis)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        AsyncStore.my_instances = {}
+        EphemeralAsyncStore.my_instances = {}
+        Store._db_shard_cache = {}
+
+    async def asyncTearDown(self):
+        await self.redis.aclose()
+
+    async def read(self, store, topics, offsets=None, timeout_ms=10):
+        return [message[0:3] async for message in store.read_topics(topics, offsets, timeout_ms)]
+
+    async def test_returns_one_instance_per_db_shard_and_class(self):
+        store = AsyncStore.instance()
+        self.assertIs(AsyncStore.instance(), store)
+        self.assertIsNot(AsyncStore.instance(db_shard=1), store)
+        self.assertIsNot(EphemeralAsyncStore.instance(), store)
+        self.assertEqual(AsyncStore.instance(db_shard=1).db_shard, 1)
+
+    async def test_builds_one_client_for_the_ephemeral_host(self):
+        with patch("valkey.asyncio.Valkey", return_value=self.redis) as valkey:
+            EphemeralAsyncStore.instance()
+        valkey.assert_called_once()
+        self.assertEqual(valkey.call_args.kwargs["host"], "openc3-redis-ephemeral")
+
+    async def test_closes_the_instances_of_the_loop(self):
+        clients = [AsyncMock(), AsyncMock()]
+        with patch("valkey.asyncio.Valkey", side_effect=clients):
+            AsyncStore.instance()
+            AsyncStore.instance(db_shard=1)
+        await AsyncStore.close_instances()
+        self.assertEqual(AsyncStore.my_instances, {})
+        for client in clients:
+            client.aclose.assert_awaited_once()
+
+    async def test_closes_an_instance_replaced_by_another_loop(self):
+        client = AsyncMock()
+        with patch("valkey.asyncio.Valkey", return_value=client):
+            store = AsyncStore.instance()
+
+        def other_loop():
+            async def replace():
+                return AsyncStore.instance()
+
+            return asyncio.run(replace())
+
+        replaced = await asyncio.to_thread(other_loop)
+        self.assertIsNot(replaced, store)
+        await asyncio.sleep(0)
+        client.aclose.assert_awaited_once()
+
+    async def test_delegates_to_redis_from_the_class(self):
+        await AsyncStore.hset("KEY", "FIELD", "VALUE")
+        self.assertEqual(await AsyncStore.hget("KEY", "FIELD"), b"VALUE")
+
+    async def test_pipelines_calls(self):
+        store = AsyncStore.instance()
+        async with store.pipelined():
+            await store.set("KEY", "1")
+            await store.write_topic("TOPIC", {"value": 1})
+            # Nothing is sent until the block exits
+            self.assertIsNone(await self.redis.get("KEY"))
+        self.assertEqual(await self.redis.get("KEY"), b"1")
+        self.assertEqual(await self.redis.xlen("TOPIC"), 1)
+
+    async def test_looks_up_the_db_shard_for_a_target(self):
+        self.assertEqual(await AsyncStore.db_shard_for_target(None), 0)
+        await self.redis.hset("DEFAULT__openc3_targets", "INST", json.dumps({"db_shard": 2}))
+        self.assertEqual(await AsyncStore.db_shard_for_target("INST"), 2)
+        self.assertEqual(await AsyncStore.db_shard_for_target("UNKNOWN"), 0)
+        # The cache is shared with Store
+        self.assertEqual(Store._db_shard_cache["DEFAULT__INST"][0], 2)
+
+    async def test_reads_topics_from_the_last_offset(self):
+        store = EphemeralAsyncStore.instance()
+        await store.write_topic("TOPIC", {"value": 0})
+        # The first read starts at the end of the topic
+        self.assertEqual(await self.read(store, ["TOPIC"]), [])
+        offsets = await store.update_topic_offsets(["TOPIC", "OTHER"])
+        self.assertEqual(offsets[1], "0-0")
+        id1 = await store.write_topic("TOPIC", {"value": 1})
+        id2 = await store.write_topic("OTHER", {"value": 2})
+        messages = await self.read(store, ["TOPIC", "OTHER"])
+        self.assertEqual(
+            messages,
+            [("TOPIC", id1.decode(), {b"value": b"1"}), ("OTHER", id2.decode(), {b"value": b"2"})],
+        )
+        self.assertEqual(await self.read(store, ["TOPIC", "OTHER"]), [])
+        # Explicit offsets
+        messages = await self.read(store, ["TOPIC"], ["0-0"])
+        self.assertEqual([message[2][b"value"] for message in messages], [b"0", b"1"])
+        self.assertEqual(await self.read(store, []), [])
+
+    async def test_tracks_offsets_per_task(self):
+        store = EphemeralAsyncStore.instance()
+        await store.update_topic_offsets(["TOPIC"])
+        await store.write_topic("TOPIC", {"value": 1})
+        # A new task starts at the end of the topic
+        self.assertEqual(await asyncio.create_task(self.read(store, ["TOPIC"])), [])
+        self.assertEqual(len(await self.read(store, ["TOPIC"])), 1)
+
+    async def test_reads_many_topics_concurrently(self):
+        store = EphemeralAsyncStore.instance()
+        topics = [f"TOPIC{i}" for i in range(10)]
+
+        async def reader(topic):
+            await store.update_topic_offsets([topic])
+            for _ in range(50):
+                messages = await self.read(store, [topic])
+                if messages:
+                    return messages[0][2]
+            return None
+
+        tasks = [asyncio.create_task(reader(topic)) for topic in topics]
+        await asyncio.sleep(0.05)
+        for index, topic in enumerate(topics):
+            await store.write_topic(topic, {"value": index})
+        results = await asyncio.gather(*tasks)
+        self.assertEqual(results, [{b"value": str(index).encode()} for index in range(10)])
+
+    async def test_gets_the_oldest_and_newest_messages(self):
+        store = EphemeralAsyncStore.instance()
+        self.assertIsNone(await store.get_oldest_message("TOPIC"))
+        self.assertEqual(await store.get_newest_message("TOPIC"), (None, None))
+        await store.write_topic("TOPIC", {"value": 1})
+        id2 = await store.write_topic("TOPIC", {"value": 2})
+        self.assertEqual((await store.get_oldest_message("TOPIC"))[1], {b"value": b"1"})
+        self.assertEqual(await store.get_newest_message("TOPIC"), [id2.decode(), {b"value": b"2"}])
+        self.assertEqual(await store.get_last_offset("TOPIC"), id2.decode())
+        await store.trim_topic("TOPIC", id2.decode(), approximate=False, limit=None)
+        self.assertEqual(await self.redis.xlen("TOPIC"), 1)
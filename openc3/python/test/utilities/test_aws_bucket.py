@@ -10,7 +10,7 @@
 # if purchased from OpenC3, Inc.
 
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from botocore.exceptions import ClientError
 
@@ -38,3 +38,69 @@ class TestAwsBucketGetObject(unittest.TestCase):
         self.bucket.client.get_object.side_effect = self.error("InternalError")
         with self.assertRaises(ClientError):
             self.bucket.get_object("bucket", "nope")
+
+    def test_get_object_if_changed_returns_no_body_if_not_modified(self):
+        self.bucket.client.get_object.side_effect = self.error("304")
+        self.assertEqual(self.bucket.get_object_if_changed("bucket", "key", '"etag"'), {"ETag": '"etag"', "Body": None})
+        self.assertEqual(self.bucket.client.get_object.call_args.kwargs["IfNoneMatch"], '"etag"')
+
+    def test_get_object_if_changed_returns_none_if_no_object(self):
+        self.bucket.client.get_object.side_effect = self.error("NoSuchKey")
+        self.assertIsNone(self.bucket.get_object_if_changed("bucket", "nope", '"etag"'))
+
+
+class TestAwsBucketPutObjectMultipart(unittest.TestCase):
+    def setUp(self):
+        self.bucket = AwsBucket()
+        self.bucket.client = MagicMock()
+        self.bucket.MULTIPART_PART_SIZE = 4
+        self.bucket.client.create_multipart_upload.return_value = {"UploadId": "ID"}
+        self.bucket.client.upload_part.side_effect = lambda **kwargs: {"ETag": f"E{kwargs['PartNumber']}"}
+
+    def test_uses_put_object_for_a_single_part(self):
+        self.bucket.put_object_multipart("bucket", "key", [b"ab", b"c"])
+        self.bucket.client.put_object.assert_called_once()
+        self.assertEqual(self.bucket.client.put_object.call_args.kwargs["Body"], b"abc")
+        self.bucket.client.create_multipart_upload.assert_not_called()
+
+    def test_uploads_chunks_in_parts(self):
+        self.bucket.put_object_multipart("bucket", "key", [b"abc", b"defgh", b"ij"], metadata={"a": "b"})
+        self.assertEqual(self.bucket.client.create_multipart_upload.call_args.kwargs["Metadata"], {"a": "b"})
+        bodies = [call.kwargs["Body"] for call in self.bucket.client.upload_part.call_args_list]
+        self.assertEqual(bodies, [b"abcd", b"efgh", b"ij"])
+        self.bucket.client.complete_multipart_upload.assert_called_once_with(
+            Bucket="bucket",
+            Key="key",
+            UploadId="ID",
+            MultipartUpload={
+                "Parts": [
+                    {"ETag": "E1", "PartNumber": 1},
+                    {"ETag": "E2", "PartNumber": 2},
+                    {"ETag": "E3", "PartNumber": 3},
+                ]
+            },
+        )
+
+    @patch("openc3.utilities.aws_bucket.time.sleep")
+    def test_retries_a_failed_part(self, _sleep):
+        responses = [RuntimeError("fail"), {"ETag": "E1"}, {"ETag": "E2"}]
+
+        def upload_part(**kwargs):
+            response = responses.pop(0)
+            if isinstance(response, Exception):
+                raise response
+            return response
+
+        self.bucket.client.upload_part.side_effect = upload_part
+        self.bucket.put_object_multipart("bucket", "key", [b"abcdefgh"])
+        self.assertEqual(self.bucket.client.upload_part.call_count, 3)
+        self.bucket.client.complete_multipart_upload.assert_called_once()
+
+    @patch("openc3.utilities.aws_bucket.time.sleep")
+    def test_aborts_the_upload_if_a_part_keeps_failing(self, _sleep):
+        self.bucket.client.upload_part.side_effect = RuntimeError("fail")
+        with self.assertRaises(RuntimeError):
+            self.bucket.put_object_multipart("bucket", "key", [b"abcdefgh"])
+        self.assertEqual(self.bucket.client.upload_part.call_count, AwsBucket.MULTIPART_RETRIES)
+        self.bucket.client.abort_multipart_upload.assert_called_once_with(Bucket="bucket", Key="key", UploadId="ID")
+        self.bucket.client.complete_multipart_upload.assert_not_called()
@@ -0,0 +1,91 @@
+# Copyright 2026 OpenC3, Inc.
+# All Rights Reserved.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See LICENSE.md for more details.
+#
+# This file may also be used under the terms of a commercial license
+# if purchased from OpenC3, Inc.
+
+import gzip
+import os
+import tempfile
+import threading
+import unittest
+import zlib
+from unittest.mock import MagicMock, patch
+
+from openc3.utilities.bucket_utilities import BucketUtilities
+from test.test_helper import BucketMock
+
+
+class TestBucketUtilities(unittest.TestCase):
+    def setUp(self):
+        self.mock_s3 = BucketMock.get_client()
+        self.mock_s3.clear()
+        patcher = patch("openc3.utilities.bucket_utilities.Bucket", BucketMock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+
+    def write_file(self, name, data):
+        filename = os.path.join(self.tmp_dir.name, name)
+        with open(filename, "wb") as file:
+            file.write(data)
+        return filename
+
+    def test_compress_chunks_streams_the_compressed_file(self):
+        data = os.urandom(10_000) * 3
+        filename = self.write_file("test.bin", data)
+        chunks = list(BucketUtilities.compress_chunks(filename, chunk_size=1000))
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual(zlib.decompress(b"".join(chunks)), data)
+        with open(BucketUtilities.compress_file(filename), "rb") as file:
+            self.assertEqual(file.read(), b"".join(chunks))
+
+    def test_uncompress_file_reads_zlib_and_gzip_files(self):
+        data = os.urandom(10_000) * 3
+        filename = self.write_file("test.bin", data)
+        unzipped = BucketUtilities.uncompress_file(BucketUtilities.compress_file(filename), chunk_size=1000)
+        self.assertEqual(unzipped, filename)
+        with open(unzipped, "rb") as file:
+            self.assertEqual(file.read(), data)
+        # Ruby writes gzip files
+        filename = self.write_file("ruby.bin.gz", gzip.compress(data))
+        with open(BucketUtilities.uncompress_file(filename), "rb") as file:
+            self.assertEqual(file.read(), data)
+
+    def test_moves_compressed_log_files_without_a_temporary_file(self):
+        filename = self.write_file("test.bin", b"\x01\x02\x03\x04")
+        BucketUtilities.move_log_file_to_bucket(filename, "DEFAULT/test.bin").join()
+        self.assertEqual(self.mock_s3.files(), ["DEFAULT/test.bin.gz"])
+        self.assertEqual(self.mock_s3.data("DEFAULT/test.bin.gz"), b"\x01\x02\x03\x04")
+        self.assertEqual(os.listdir(self.tmp_dir.name), [])
+
+    def test_moves_text_files_uncompressed(self):
+        filename = self.write_file("test.txt", b"text")
+        BucketUtilities.move_log_file_to_bucket(filename, "DEFAULT/test.txt").join()
+        self.assertEqual(self.mock_s3.objs["DEFAULT/test.txt"], b"text")
+        self.assertFalse(os.path.exists(filename))
+
+    def test_uses_a_bounded_number_of_upload_threads(self):
+        release = threading.Event()
+        move = MagicMock(side_effect=lambda *args: release.wait(5))
+        with patch.object(BucketUtilities, "move_log_file_to_bucket_thread", move):
+            uploads = [BucketUtilities.move_log_file_to_bucket(f"file{i}", f"key{i}") for i in range(10)]
+            self.assertLessEqual(len(BucketUtilities.upload_threads), BucketUtilities.UPLOAD_THREADS)
+            self.assertTrue(any(upload.is_alive() for upload in uploads))
+            release.set()
+            for upload in uploads:
+                upload.join(5)
+                self.assertFalse(upload.is_alive())
+        self.assertEqual(move.call_count, 10)
+
+        metric = MagicMock()
+        BucketUtilities.generate(metric)
+        values = {call.kwargs["name"]: call.kwargs["value"] for call in metric.set.call_args_list}
+        self.assertEqual(values["bucket_upload_queue_depth"], 0)
+        self.assertGreaterEqual(values["bucket_upload_total"], 10)
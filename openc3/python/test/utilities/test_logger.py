@@ -15,9 +15,9 @@ import sys
 import time
 import unittest
 from io import StringIO
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
-from openc3.utilities.logger import Logger
+from openc3.utilities.logger import Logger, LogSampler, LogWriter
 
 
 class TestLogger(unittest.TestCase):
@@ -621,3 +621,230 @@ class TestLogMessage(unittest.TestCase):
         for line in lines:
             data = json.loads(line)
             self.assertIn("Message", data["message"])
+
+
+class TestLogSampler(unittest.TestCase):
+    def setUp(self):
+        self.sampler = LogSampler({"INFO": 2})
+        self.logger = Logger()
+
+    def check(self, key, level="INFO", message=None, type=Logger.LOG):
+        message = message or f"{key} message"
+        return self.sampler.check(self.logger, level, key, "DEFAULT", (message, None, type, None, None))
+
+    def test_limits_messages_per_key(self):
+        self.assertEqual(self.check("A"), (True, 0))
+        self.assertEqual(self.check("A"), (True, 0))
+        self.assertEqual(self.check("A"), (False, 0))
+        self.assertEqual(self.check("A"), (False, 0))
+        # Other keys and unlimited levels are not affected
+        self.assertEqual(self.check("B"), (True, 0))
+        for _ in range(5):
+            self.assertEqual(self.check("A", "FATAL"), (True, 0))
+        # Notifications and alerts are never sampled
+        for _ in range(5):
+            self.assertEqual(self.check("A", type=Logger.NOTIFICATION), (True, 0))
+            self.assertEqual(self.check("A", type=Logger.ALERT), (True, 0))
+        self.assertEqual(self.sampler.suppressed_total, 2)
+
+    def test_reports_the_suppressed_count_in_the_next_period(self):
+        for _ in range(5):
+            self.check("A")
+        self.sampler.keys[("INFO", "A")][0] -= LogSampler.PERIOD
+        self.assertEqual(self.check("A"), (True, 3))
+        self.assertEqual(self.check("A"), (True, 0))
+
+    def test_expires_keys_and_returns_the_ones_which_suppressed(self):
+        for i in range(4):
+            self.check("A", message=f"A message {i}")
+        self.check("B")
+        self.assertEqual(self.sampler.expire(), [])
+        for state in self.sampler.keys.values():
+            state[0] -= LogSampler.PERIOD
+        expired = self.sampler.expire()
+        self.assertEqual(len(expired), 1)
+        # The most recent suppressed message is kept for the summary
+        self.assertEqual(
+            expired[0][2:], [2, self.logger, "INFO", "DEFAULT", ("A message 3", None, Logger.LOG, None, None)]
+        )
+        self.assertEqual(self.sampler.keys, {})
+
+    def test_bounds_the_number_of_keys(self):
+        with patch.object(LogSampler, "MAX_KEYS", 10):
+            for i in range(10):
+                for _ in range(3):
+                    self.check(i)
+            for state in self.sampler.keys.values():
+                state[0] -= LogSampler.PERIOD
+            self.check("new")
+            self.assertEqual(list(self.sampler.keys.keys()), [("INFO", "new")])
+            # The keys expired to make room are still summarized
+            self.assertEqual(len(self.sampler.expire()), 10)
+            self.assertEqual(self.sampler.expire(), [])
+
+    def test_logger_suppresses_messages_by_key(self):
+        orig_stdout = sys.stdout
+        sys.stdout = StringIO()
+        orig_sampler = Logger.sampler
+        Logger.sampler = self.sampler
+        try:
+            logger = Logger()
+            logger.no_store = True
+            for i in range(5):
+                logger.info(f"Value {i}", key="VALUE")
+            # Messages without a key (e.g. each command sent) are never sampled
+            for _ in range(5):
+                logger.info("cmd('INST ABORT')")
+            self.sampler.keys[("INFO", "VALUE")][0] -= LogSampler.PERIOD
+            logger.info("Value 5", key="VALUE")
+            lines = [json.loads(line) for line in sys.stdout.getvalue().strip().split("\n")]
+        finally:
+            Logger.sampler = orig_sampler
+            sys.stdout = orig_stdout
+        self.assertEqual(
+            [line["message"] for line in lines], ["Value 0", "Value 1"] + ["cmd('INST ABORT')"] * 5 + ["Value 5"]
+        )
+        self.assertEqual(lines[-1]["suppressed"], 3)
+
+
+class TestLogWriter(unittest.TestCase):
+    def setUp(self):
+        self.writer = LogWriter()
+        # Stop the thread so the test controls when messages are written
+        self.writer.running = False
+        self.writer.thread.join()
+        self.logger = Logger()
+        self.logger.no_store = True
+
+    def tearDown(self):
+        Logger.writer = None
+
+    def test_batches_messages_until_flushed(self):
+        io = StringIO()
+        for i in range(3):
+            self.assertTrue(self.writer.put((io, None, {"message": f"Message {i}"})))
+        self.assertEqual(io.getvalue(), "")
+        self.assertTrue(self.writer.flush())
+        lines = io.getvalue().strip().split("\n")
+        self.assertEqual([json.loads(line)["message"] for line in lines], ["Message 0", "Message 1", "Message 2"])
+        self.assertFalse(self.writer.flush())
+        self.assertEqual(self.writer.written_total, 3)
+
+    @patch("openc3.utilities.logger.EphemeralStoreQueued")
+    def test_writes_messages_to_their_topic(self, store):
+        self.writer.put((None, "DEFAULT__openc3_log_messages", {"message": "Message"}))
+        self.writer.flush()
+        store.write_topic.assert_called_once_with("DEFAULT__openc3_log_messages", {"message": "Message"})
+
+    def test_keeps_writing_after_a_message_fails(self):
+        io = StringIO()
+        circular = {}
+        circular["self"] = circular
+        self.writer.put((io, None, {"message": "Circular", "other": circular}))
+        self.writer.put((io, None, {"message": "Object", "other": object()}))
+        self.writer.put((io, None, {"message": "Message"}))
+        with patch("sys.__stderr__", StringIO()) as stderr:
+            self.assertTrue(self.writer.flush())
+        self.assertIn("Circular reference", stderr.getvalue())
+        lines = [json.loads(line) for line in io.getvalue().strip().split("\n")]
+        self.assertEqual([line["message"] for line in lines], ["Object", "Message"])
+        self.assertIn("object", lines[0]["other"])
+
+        broken = Mock()
+        broken.write.side_effect = BrokenPipeError()
+        self.writer.put((broken, None, {"message": "Broken"}))
+        self.writer.put((io, None, {"message": "Later"}))
+        with patch("sys.__stderr__", StringIO()) as stderr:
+            self.assertTrue(self.writer.flush())
+        self.assertIn("BrokenPipeError", stderr.getvalue())
+        self.assertEqual(json.loads(io.getvalue().strip().split("\n")[-1])["message"], "Later")
+
+    def test_writer_thread_survives_errors(self):
+        calls = []
+
+        def flush():
+            calls.append(None)
+            if len(calls) == 1:
+                raise RuntimeError("Flush failed")
+            self.writer.running = False
+            return True
+
+        self.writer.running = True
+        with patch.object(self.writer, "flush", flush), patch("sys.__stderr__", StringIO()) as stderr:
+            self.writer.run()
+        self.assertEqual(len(calls), 2)
+        self.assertIn("Flush failed", stderr.getvalue())
+
+    def test_drops_messages_when_full(self):
+        io = StringIO()
+        with patch.object(LogWriter, "QUEUE_SIZE", 2):
+            for i in range(4):
+                self.writer.put((io, None, {"message": f"Message {i}"}))
+        self.assertEqual(self.writer.dropped_total, 2)
+        self.writer.flush()
+        self.assertEqual(len(io.getvalue().strip().split("\n")), 2)
+
+    def test_logger_queues_messages_and_writes_fatal_immediately(self):
+        orig_stdout = sys.stdout
+        sys.stdout = StringIO()
+        Logger.writer = self.writer
+        try:
+            self.logger.info("Queued")
+            self.assertEqual(sys.stdout.getvalue(), "")
+            self.logger.fatal("Fatal")
+            lines = [json.loads(line) for line in sys.stdout.getvalue().strip().split("\n")]
+        finally:
+            sys.stdout = orig_stdout
+        # Queued messages are written first to keep the order
+        self.assertEqual([line["message"] for line in lines], ["Queued", "Fatal"])
+
+    def test_logs_suppressed_message_summaries(self):
+        io = StringIO()
+        self.logger.stdout = True
+        orig_sampler = Logger.sampler
+        Logger.sampler = LogSampler({"WARN": 1})
+        try:
+            for i in range(3):
+                Logger.sampler.check(
+                    self.logger, "WARN", "KEY", "DEFAULT", (f"Warning {i}", None, "custom", None, None)
+                )
+            Logger.sampler.keys[("WARN", "KEY")][0] -= LogSampler.PERIOD
+            with patch("sys.stdout", io):
+                self.writer.log_summaries()
+                self.writer.flush()
+        finally:
+            Logger.sampler = orig_sampler
+        data = json.loads(io.getvalue())
+        self.assertEqual(data["level"], "WARN")
+        self.assertEqual(data["message"], "Warning 2")
+        self.assertEqual(data["type"], "custom")
+        self.assertEqual(data["suppressed"], 2)
+
+    @patch("openc3.utilities.metric.Metric.add_update_generator")
+    def test_start_writer_enables_sampling(self, add_update_generator):
+        orig_async_enabled = Logger.async_enabled
+        Logger.async_enabled = False
+        try:
+            Logger.start_writer()
+            self.assertIsNone(Logger.writer)
+            self.assertIsNone(Logger.sampler)
+            Logger.async_enabled = True
+            Logger.start_writer()
+            self.assertIsInstance(Logger.writer, LogWriter)
+            self.assertIsInstance(Logger.sampler, LogSampler)
+            add_update_generator.assert_called_once_with(Logger.writer)
+        finally:
+            Logger.async_enabled = orig_async_enabled
+            if Logger.writer is not None:
+                Logger.writer.stop()
+
+    def test_generates_metrics(self):
+        metric = Mock()
+        self.writer.put((None, None, {}))
+        self.writer.dropped_total = 4
+        Logger.sampler = LogSampler()
+        self.writer.generate(metric)
+        values = {call.kwargs["name"]: call.kwargs["value"] for call in metric.set.call_args_list}
+        self.assertEqual(values["log_queue_depth"], 1)
+        self.assertEqual(values["log_dropped_total"], 4)
+        self.assertIn("log_suppressed_total", values)
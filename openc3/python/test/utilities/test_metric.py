@@ -0,0 +1,81 @@
+# Copyright 2026 OpenC3, Inc.
+# All Rights Reserved.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See LICENSE.md for more details.
+#
+# This file may also be used under the terms of a commercial license
+# if purchased from OpenC3, Inc.
+
+import threading
+import unittest
+from unittest.mock import patch
+
+from openc3.utilities.metric import Metric
+from test.test_helper import mock_redis
+
+
+class TestMetric(unittest.TestCase):
+    def setUp(self):
+        mock_redis(self)
+        # Don't start the class level update thread
+        thread_patch = patch.object(Metric, "update_thread", object())
+        thread_patch.start()
+        self.addCleanup(thread_patch.stop)
+        self.metric = Metric("DEFAULT__DECOM__INST_INT", "DEFAULT", db_shard=0)
+        self.addCleanup(Metric.instances.remove, self.metric)
+
+    def test_registers_each_handle_once(self):
+        counter = self.metric.counter("decom_total")
+        self.assertIs(self.metric.counter("decom_total"), counter)
+        with self.assertRaisesRegex(RuntimeError, "decom_total is already registered as a counter"):
+            self.metric.histogram("decom_total")
+
+    def test_sums_counter_increments_from_every_thread(self):
+        counter = self.metric.counter("decom_total")
+
+        def count():
+            for _ in range(1000):
+                counter.inc()
+
+        threads = [threading.Thread(target=count) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        counter.inc(5)
+        self.assertEqual(counter.value, 4005)
+        self.assertLessEqual(len(counter.shards), 5)
+
+    def test_gauge_holds_the_last_value(self):
+        gauge = self.metric.gauge("decom_topic_delta_seconds", unit="seconds")
+        gauge.set(1.5)
+        gauge.set(0.5)
+        self.assertEqual(gauge.as_json(), {"value": 0.5, "type": "gauge", "unit": "seconds"})
+
+    def test_histogram_publishes_cumulative_buckets(self):
+        histogram = self.metric.histogram("decom_duration_seconds", buckets=[1.0, 0.1])
+        for value in [0.05, 0.1, 0.5, 2.0]:
+            histogram.observe(value)
+        thread = threading.Thread(target=histogram.observe, args=(0.2,))
+        thread.start()
+        thread.join()
+        self.assertEqual(
+            histogram.value,
+            {"buckets": [[0.1, 2], [1.0, 4], ["+Inf", 5]], "count": 5, "sum": 2.85},
+        )
+
+    def test_exponential_buckets(self):
+        self.assertEqual(Metric.exponential_buckets(0.001, 2, 4), [0.001, 0.002, 0.004, 0.008])
+
+    def test_publishes_handles_with_the_set_values(self):
+        self.metric.set(name="decom_error_total", value=1, type="counter")
+        self.metric.counter("decom_total", help="Packets decommutated").inc()
+        with self.metric.mutex:
+            values = self.metric.values()
+        self.assertEqual(values["decom_error_total"], {"value": 1, "type": "counter"})
+        self.assertEqual(values["decom_total"], {"value": 1, "type": "counter", "help": "Packets decommutated"})
+        # The handles are not added to the set values
+        self.assertNotIn("decom_total", self.metric.data)
@@ -0,0 +1,131 @@
+# Copyright 2026 OpenC3, Inc.
+# All Rights Reserved.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See LICENSE.md for more details.
+#
+# This file may also be used under the terms of a commercial license
+# if purchased from OpenC3, Inc.
+
+import json
+import unittest
+from unittest.mock import Mock
+
+from openc3.utilities.pipeline_trace import LatencyHistogram, PipelineTrace
+
+
+class TestLatencyHistogram(unittest.TestCase):
+    def test_reports_zeros_when_empty(self):
+        self.assertEqual(LatencyHistogram().as_json(), {"count": 0, "sum": 0.0, "p50": 0.0, "p99": 0.0, "max": 0.0})
+
+    def test_calculates_percentiles_within_a_bucket(self):
+        histogram = LatencyHistogram()
+        for i in range(1, 101):
+            histogram.record(i / 1000.0)
+        self.assertEqual(histogram.count, 100)
+        self.assertAlmostEqual(histogram.sum, 5.05)
+        self.assertEqual(histogram.max, 0.1)
+        # Percentiles are the upper bound of their bucket
+        self.assertGreaterEqual(histogram.percentile(50), 0.050)
+        self.assertLess(histogram.percentile(50), 0.050 * LatencyHistogram.GROWTH)
+        self.assertGreaterEqual(histogram.percentile(99), 0.099)
+        self.assertLessEqual(histogram.percentile(99), 0.1)
+        self.assertEqual(histogram.percentile(100), 0.1)
+
+    def test_clamps_negative_and_huge_values(self):
+        histogram = LatencyHistogram()
+        histogram.record(-1.0)
+        histogram.record(1e9)
+        self.assertEqual(histogram.buckets[0], 1)
+        self.assertEqual(histogram.buckets[-1], 1)
+        self.assertEqual(histogram.percentile(50), LatencyHistogram.MIN_SECONDS)
+        self.assertEqual(histogram.max, 1e9)
+
+
+class TestPipelineTrace(unittest.TestCase):
+    def setUp(self):
+        self.metric = Mock()
+        self.trace = PipelineTrace(self.metric)
+
+    def published(self):
+        return {call.kwargs["name"]: call.kwargs for call in self.metric.set.call_args_list}
+
+    def test_loads_the_trace_from_a_msg_hash(self):
+        self.assertIsNone(PipelineTrace.loads({b"buffer": b"\x00"}))
+        trace = PipelineTrace.stamp({}, "protocol")
+        self.assertEqual(PipelineTrace.loads({b"trace": json.dumps(trace).encode()}), trace)
+
+    def test_records_each_stage_from_the_closest_earlier_stamp(self):
+        # No telemetry_xadd stamp so decom_start is timed from protocol
+        trace = {"received": 0, "protocol": 1_000_000, "decom_start": 4_000_000, "decom_end": 5_000_000}
+        self.trace.record("INST", trace, ["protocol", "telemetry_xadd", "decom_start", "decom_end"])
+        self.trace.publish()
+        published = self.published()
+        self.assertEqual(
+            sorted(published.keys()),
+            [
+                "pipeline_latency_seconds__INST__decom_end",
+                "pipeline_latency_seconds__INST__decom_start",
+                "pipeline_latency_seconds__INST__protocol",
+            ],
+        )
+        decom_start = published["pipeline_latency_seconds__INST__decom_start"]
+        self.assertEqual(decom_start["type"], "summary")
+        self.assertEqual(decom_start["labels"], {"target_name": "INST", "stage": "decom_start"})
+        self.assertEqual(decom_start["value"]["count"], 1)
+        self.assertAlmostEqual(decom_start["value"]["max"], 0.003)
+
+    def test_records_the_total(self):
+        trace = {"received": 0, "protocol": 1_000_000, "tsdb_flush": 9_000_000}
+        self.trace.record("INST", trace, PipelineTrace.TSDB_STAGES)
+        self.trace.publish()
+        published = self.published()
+        self.assertAlmostEqual(published["pipeline_latency_seconds__INST__tsdb_flush"]["value"]["max"], 0.008)
+        self.assertAlmostEqual(published["pipeline_latency_seconds__INST__total"]["value"]["max"], 0.009)
+
+    def test_publishes_each_interval_and_keeps_the_last_values(self):
+        self.trace.next_publish_time = 0
+        self.trace.record("INST", {"protocol": 0, "decom_start": 1000}, ["decom_start"])
+        self.assertEqual(self.metric.set.call_count, 1)
+        # Nothing new to publish
+        self.trace.publish()
+        self.assertEqual(self.metric.set.call_count, 1)
+
+    def test_reports_where_the_latency_goes_per_target(self):
+        def value(count, mean):
+            return {"count": count, "sum": count * mean, "p50": mean, "p99": mean * 2, "max": mean * 3}
+
+        def metric(target, stage, count, mean):
+            return {
+                "value": value(count, mean),
+                "type": "summary",
+                "labels": {"target_name": target, "stage": stage},
+            }
+
+        metrics = {
+            "DEFAULT__DECOM__INST_INT": {
+                "values": {
+                    "decom_total": {"value": 10, "type": "counter"},
+                    "a": metric("INST", "decom_end", 10, 0.001),
+                    "b": metric("INST", "decom_start", 10, 0.003),
+                    "c": metric("EXAMPLE", "decom_end", 5, 0.002),
+                }
+            },
+            "DEFAULT__TSDB__INST": {"values": {"d": metric("INST", "total", 10, 0.004)}},
+        }
+        report = PipelineTrace.report(metrics)
+        lines = report.split("\n")
+        self.assertEqual(lines[0], "EXAMPLE")
+        self.assertIn("INST", lines)
+        inst = lines[lines.index("INST") :]
+        self.assertIn("STAGE", inst[1])
+        # Stages are listed in pipeline order with their share of the time
+        self.assertTrue(inst[2].split()[0] == "decom_start" and inst[2].endswith("75.0%"))
+        self.assertTrue(inst[3].split()[0] == "decom_end" and inst[3].endswith("25.0%"))
+        self.assertEqual(inst[4].split(), ["total", "10", "4.000", "8.000", "12.000"])
+
+        report = PipelineTrace.report(metrics, "EXAMPLE")
+        self.assertNotIn("INST", report)
+        self.assertIn("No pipeline latency metrics found", PipelineTrace.report({}))
@@ -0,0 +1,126 @@
+# Copyright 2026 OpenC3, Inc.
+# All Rights Reserved.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See LICENSE.md for more details.
+#
+# This file may also be used under the terms of a commercial license
+# if purchased from OpenC3, Inc.
+
+import time
+import unittest
+from unittest.mock import Mock, patch
+
+from openc3.utilities.metric import Metric
+from openc3.utilities.store_queued import EphemeralStoreQueued, StoreQueued
+from test.test_helper import mock_redis, store_queued_getattr, store_queued_init
+
+
+class TestStoreQueued(unittest.TestCase):
+    def setUp(self):
+        self.redis = mock_redis(self)
+        # test_helper makes StoreQueued call the store directly so restore the real one
+        for name, method in [("__init__", store_queued_init), ("__getattr__", store_queued_getattr)]:
+            patcher = patch.object(StoreQueued, name, method)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def create(self, update_interval=60, cls=StoreQueued):
+        store_queued = cls(update_interval)
+        self.addCleanup(Metric.update_generators.remove, store_queued)
+        self.addCleanup(store_queued.shutdown)
+        return store_queued
+
+    def wait_for(self, condition):
+        for _ in range(100):
+            if condition():
+                return
+            time.sleep(0.01)
+        self.fail("Timed out waiting for the store")
+
+    def queued(self, store_queued):
+        return [(action[0], action[1]) for action in store_queued.store_queue.values()]
+
+    def test_replaces_queued_writes_to_the_same_key_and_field(self):
+        store_queued = self.create()
+        store_queued.hset("STATUS", "INT1", "1")
+        store_queued.hset("STATUS", "INT2", "1")
+        store_queued.set("KEY", "1")
+        store_queued.hset("STATUS", "INT1", "2")
+        store_queued.set("KEY", "2")
+        self.assertEqual(
+            self.queued(store_queued),
+            [("hset", ("STATUS", "INT2", "1")), ("hset", ("STATUS", "INT1", "2")), ("set", ("KEY", "2"))],
+        )
+        self.assertEqual(store_queued.coalesced_total, 2)
+        store_queued.process_queue()
+        self.assertEqual(self.redis.hgetall("STATUS"), {b"INT1": b"2", b"INT2": b"1"})
+        self.assertEqual(self.redis.get("KEY"), b"2")
+        self.assertEqual(store_queued.store_queue, {})
+
+    def test_keeps_writes_before_other_calls_on_the_key(self):
+        store_queued = self.create()
+        store_queued.hset("STATUS", "INT1", "1")
+        store_queued.execute_command("HEXPIRE", "STATUS", 10, "FIELDS", 1, "INT1")
+        store_queued.hset("STATUS", "INT1", "2")
+        store_queued.hdel("STATUS", "INT1")
+        store_queued.hset("STATUS", "INT1", "3")
+        store_queued.hset("STATUS", "INT1", "4")
+        self.assertEqual(
+            [action[0] for action in store_queued.store_queue.values()],
+            ["hset", "execute_command", "hset", "hdel", "hset"],
+        )
+        self.assertEqual(store_queued.coalesced_total, 1)
+
+    def test_does_not_replace_writes_with_options(self):
+        store_queued = self.create()
+        store_queued.set("KEY", "1", ex=10)
+        store_queued.set("KEY", "2", ex=10)
+        store_queued.hset("STATUS", mapping={"INT1": "1"})
+        store_queued.hset("STATUS", mapping={"INT1": "2"})
+        self.assertEqual(len(store_queued.store_queue), 4)
+
+    def test_flushes_early_once_the_threshold_is_queued(self):
+        store_queued = self.create()
+        store_queued.FLUSH_THRESHOLD = 5
+        for i in range(4):
+            store_queued.write_topic("TOPIC", {"value": i})
+        time.sleep(0.1)
+        self.assertEqual(self.redis.xlen("TOPIC"), 0)
+        store_queued.write_topic("TOPIC", {"value": 4})
+        self.wait_for(lambda: self.redis.xlen("TOPIC") == 5)
+
+    def test_waits_for_a_flush_when_the_queue_is_full(self):
+        store_queued = self.create()
+        store_queued.MAX_QUEUE_SIZE = 3
+        for i in range(10):
+            store_queued.write_topic("TOPIC", {"value": i})
+            self.assertLessEqual(len(store_queued.store_queue), 3)
+        # The rest are written at the next update_interval
+        self.wait_for(lambda: self.redis.xlen("TOPIC") + len(store_queued.store_queue) == 10)
+
+    def test_drains_the_queue_at_shutdown(self):
+        store_queued = self.create(cls=EphemeralStoreQueued)
+        store_queued.set("KEY", "1")
+        store_queued.shutdown()
+        self.assertEqual(self.redis.get("KEY"), b"1")
+        self.assertIsNone(store_queued.update_thread)
+
+    def test_generates_metrics(self):
+        store_queued = self.create(cls=EphemeralStoreQueued)
+        store_queued.set("KEY", "1")
+        store_queued.set("KEY", "2")
+        metric = Mock()
+        store_queued.generate(metric)
+        values = {call.kwargs["name"]: call.kwargs for call in metric.set.call_args_list}
+        self.assertEqual(values["ephemeral_store_queued__0_queue_depth"]["value"], 1)
+        self.assertEqual(values["ephemeral_store_queued__0_coalesced_total"]["value"], 1)
+        self.assertEqual(values["ephemeral_store_queued__0_flushed_total"]["labels"], {"db_shard": 0})
+        store_queued.process_queue()
+        metric.reset_mock()
+        store_queued.generate(metric)
+        values = {call.kwargs["name"]: call.kwargs["value"] for call in metric.set.call_args_list}
+        self.assertEqual(values["ephemeral_store_queued__0_flushed_total"], 1)
+        self.assertGreater(values["ephemeral_store_queued__0_flush_duration_seconds"], 0.0)
@@ -0,0 +1,143 @@
+# Copyright 2026 OpenC3, Inc.
+# All Rights Reserved.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See LICENSE.md for more details.
+#
+# This file may also be used under the terms of a commercial license
+# if purchased from OpenC3, Inc.
+
+import importlib
+import io
+import tempfile
+import unittest
+from unittest.mock import *
+
+from openc3.utilities.bucket import Bucket
+from openc3.utilities.target_file import TargetFile
+from test.test_helper import *
+
+
+class FakeBucket:
+    def __init__(self):
+        self.objects = {}
+        self.requests = []
+
+    def get_object_if_changed(self, bucket, key, etag=None):
+        self.requests.append((key, etag))
+        if key not in self.objects:
+            return None
+        object_etag, body = self.objects[key]
+        if etag == object_etag:
+            return {"ETag": etag, "Body": None}
+        return {"ETag": object_etag, "Body": io.BytesIO(body)}
+
+    def list_files(self, bucket, path):
+        self.requests.append((path, None))
+        files = [key[len(path) :] for key in self.objects if key.startswith(path)]
+        return [], files
+
+
+class TestTargetFile(unittest.TestCase):
+    def setUp(self):
+        self.bucket = FakeBucket()
+        patcher = patch.object(Bucket, "get_client", return_value=self.bucket)
+        self.get_client = patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = patch.object(TargetFile, "bucket_client", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        TargetFile.clear_cache()
+        self.addCleanup(TargetFile.clear_cache)
+
+    def test_body_prefers_targets_modified(self):
+        self.bucket.objects["DEFAULT/targets/INST/lib/helper.py"] = ['"1"', b"original"]
+        self.assertEqual(TargetFile.body("DEFAULT", "INST/lib/helper.py"), b"original")
+        self.bucket.objects["DEFAULT/targets_modified/INST/lib/helper.py"] = ['"2"', b"modified"]
+        TargetFile.clear_cache()
+        self.assertEqual(TargetFile.body("DEFAULT", "INST/lib/helper.py*"), b"modified")
+        self.assertIsNone(TargetFile.body("DEFAULT", "INST/lib/nope.py"))
+
+    def test_uses_the_cache_within_the_revalidate_period(self):
+        self.bucket.objects["DEFAULT/targets/INST/lib/helper.py"] = ['"1"', b"original"]
+        with patch.object(TargetFile, "REVALIDATE_PERIOD", 60):
+            TargetFile.body("DEFAULT", "INST/lib/helper.py")
+            TargetFile.body("DEFAULT", "INST/lib/helper.py")
+        self.assertEqual(len(self.bucket.requests), 2)  # modified and original once each
+
+    def test_revalidates_by_etag(self):
+        key = "DEFAULT/targets/INST/lib/helper.py"
+        self.bucket.objects[key] = ['"1"', b"original"]
+        with patch.object(TargetFile, "REVALIDATE_PERIOD", 0):
+            self.assertEqual(TargetFile.get(key), b"original")
+            self.assertEqual(TargetFile.get(key), b"original")
+            self.assertEqual(self.bucket.requests[-1], (key, '"1"'))
+            self.bucket.objects[key] = ['"2"', b"changed"]
+            self.assertEqual(TargetFile.get(key), b"changed")
+            del self.bucket.objects[key]
+            self.assertIsNone(TargetFile.get(key))
+
+    def test_shares_files_through_the_disk_cache(self):
+        key = "DEFAULT/targets/INST/lib/helper.py"
+        self.bucket.objects[key] = ['"1"', b"original"]
+        with tempfile.TemporaryDirectory() as cache_dir, patch.object(TargetFile, "CACHE_DIR", cache_dir):
+            self.assertEqual(TargetFile.get(key), b"original")
+            TargetFile.clear_cache()  # Like a new process
+            self.assertEqual(TargetFile.get(key), b"original")
+            self.assertEqual(self.bucket.requests, [(key, None), (key, '"1"')])
+
+    def test_caches_listings_within_the_revalidate_period(self):
+        path = "DEFAULT/targets/INST/lib/"
+        self.bucket.objects[f"{path}helper.py"] = ['"1"', b"original"]
+        with patch.object(TargetFile, "REVALIDATE_PERIOD", 60):
+            self.assertEqual(TargetFile.list_files(path), ([], ["helper.py"]))
+            self.bucket.objects[f"{path}other.py"] = ['"1"', b"other"]
+            self.assertEqual(TargetFile.list_files(path), ([], ["helper.py"]))
+        self.assertEqual(len(self.bucket.requests), 1)
+        with patch.object(TargetFile, "REVALIDATE_PERIOD", 0):
+            self.assertEqual(TargetFile.list_files(path), ([], ["helper.py", "other.py"]))
+
+    def test_creates_one_bucket_client(self):
+        key = "DEFAULT/targets/INST/lib/helper.py"
+        self.bucket.objects[key] = ['"1"', b"original"]
+        with patch.object(TargetFile, "REVALIDATE_PERIOD", 0):
+            TargetFile.get(key)
+            TargetFile.get(key)
+            TargetFile.get("DEFAULT/targets/INST/lib/nope.py")
+            TargetFile.list_files("DEFAULT/targets/INST/lib/")
+            TargetFile.list_files("DEFAULT/targets/INST/lib/")
+        self.assertEqual(len(self.bucket.requests), 5)
+        self.get_client.assert_called_once_with()
+
+
+class TestTargetFileLoader(unittest.TestCase):
+    with patch("openc3.utilities.bucket.Bucket.get_client"):
+        import openc3.utilities.target_file_importer as target_file_importer
+
+    def test_creates_the_module_without_a_temp_file(self):
+        spec = importlib.machinery.ModuleSpec("INST.lib.helper", self.target_file_importer.MyLoader())
+        spec.loader_state = ("VALUE = 42\ndef name():\n    return __name__\n", "INST/lib/helper.py")
+        with patch("tempfile.NamedTemporaryFile") as temp_file:
+            module = spec.loader.create_module(spec)
+        temp_file.assert_not_called()
+        self.assertEqual(module.VALUE, 42)
+        self.assertEqual(module.name(), "INST.lib.helper")
+        self.assertEqual(module.__file__, "INST/lib/helper.py")
+
+    def test_caches_compiled_code_by_content(self):
+        compile_target_file = self.target_file_importer.compile_target_file
+        code = compile_target_file("VALUE = 1\n", "INST/lib/one.py")
+        self.assertIs(compile_target_file("VALUE = 1\n", "INST/lib/one.py"), code)
+        self.assertIsNot(compile_target_file("VALUE = 2\n", "INST/lib/one.py"), code)
+        with tempfile.TemporaryDirectory() as cache_dir, patch.object(TargetFile, "CACHE_DIR", cache_dir):
+            code = compile_target_file("VALUE = 3\n", "INST/lib/three.py")
+            self.target_file_importer._code_cache.clear()  # Like a new process
+            with patch("builtins.compile") as mock_compile:
+                cached = compile_target_file("VALUE = 3\n", "INST/lib/three.py")
+            mock_compile.assert_not_called()
+            self.assertEqual(cached.co_filename, "INST/lib/three.py")
+            namespace = {}
+            exec(cached, namespace)
+            self.assertEqual(namespace["VALUE"], 3)
@@ -250,6 +250,46 @@ module OpenC3
       end
     end
 
+    describe "cmd_many" do
+      it "sends all the commands" do
+        commands = @api.cmd_many(["INST ABORT", ["INST", "COLLECT", { "TYPE" => "NORMAL", "Duration" => 5 }]])
+        expect(commands.map { |command| command['cmd_name'] }).to eql %w(ABORT COLLECT)
+        expect(commands[1]['cmd_params']).to include('TYPE' => 'NORMAL', 'DURATION' => 5)
+        commands = @api.cmd_many(["INST COLLECT with TYPE 0"], raw: true)
+        expect(commands[0]['cmd_string']).to eql 'cmd_raw("INST COLLECT with TYPE 0")'
+      end
+
+      it "passes the checks and each command's keyword arguments" do
+        commands = @api.cmd_many(["INST CLEAR", "INST COLLECT with TYPE NORMAL, DURATION 1000"], range_check: false, hazardous_check: false)
+        expect(commands[0]['cmd_string']).to eql 'cmd_no_checks("INST CLEAR")'
+        expect(commands[1]['cmd_params']['DURATION']).to eql 1000
+        expect(CommandTopic).to receive(:send_commands).with(anything, hash_including(timeout: [1.0, 7.0])).and_call_original
+        @api.cmd_many([{ "command" => "INST ABORT", "timeout" => 1 }, "INST ABORT"], timeout: 7)
+      end
+
+      it "pipelines the commands and isolates possibly hazardous commands" do
+        expect(CommandTopic).to receive(:send_commands).with(anything, hash_including(isolate: [false, true, false])).and_call_original
+        expect(CommandTopic).to receive(:write_command).twice.and_call_original
+        expect { @api.cmd_many(["INST ABORT", "INST CLEAR", "INST ABORT"]) }.to raise_error(HazardousError)
+      end
+
+      it "isolates possibly hazardous commands without the hazardous check" do
+        # Critical commanding can hold them for approval even without the hazardous check
+        expect(CommandTopic).to receive(:send_commands).with(anything, hash_including(isolate: [false, true])).and_call_original
+        commands = @api.cmd_many(["INST ABORT", "INST CLEAR"], hazardous_check: false)
+        expect(commands.map { |command| command['cmd_name'] }).to eql %w(ABORT CLEAR)
+      end
+
+      it "isolates restricted commands" do
+        packet = TargetModel.packet('INST', 'ABORT', type: :CMD, scope: 'DEFAULT')
+        packet['restricted'] = true
+        TargetModel.set_packet('INST', 'ABORT', packet, type: :CMD, scope: 'DEFAULT')
+        expect(CommandTopic).to receive(:send_commands).with(anything, hash_including(isolate: [false, true, false])).and_call_original
+        commands = @api.cmd_many(["INST FLTCMD", "INST ABORT", "INST FLTCMD"], hazardous_check: false)
+        expect(commands.map { |command| command['cmd_name'] }).to eql %w(FLTCMD ABORT FLTCMD)
+      end
+    end
+
     describe "build_cmd" do
       before(:each) do
         model = MicroserviceModel.new(name: "DEFAULT__DECOM__INST_INT", scope: "DEFAULT",
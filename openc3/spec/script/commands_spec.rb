@@ -282,6 +282,23 @@ module OpenC3
           end
         end
 
+        describe "cmd_many" do
+          it "sends the commands" do
+            capture_io do |stdout|
+              cmd_many(["INST ABORT", ["INST", "COLLECT", { "TYPE" => "NORMAL" }]])
+              expect(stdout.string).to match(/#{@prefix}cmd\(\"INST ABORT\"\)/) # "
+              expect(stdout.string).to match(/#{@prefix}cmd\(\"INST COLLECT with TYPE/) # "
+            end
+          end
+
+          if connect == 'connected'
+            it "raises instead of prompting for a hazardous command" do
+              expect(self).to_not receive(:prompt_for_hazardous)
+              expect { cmd_many(["INST CLEAR"]) }.to raise_error(HazardousError)
+            end
+          end
+        end
+
         describe "cmd_raw" do
           it "sends a command" do
             capture_io do |stdout|
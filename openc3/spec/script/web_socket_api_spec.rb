@@ -1049,6 +1049,32 @@ module OpenC3
         end
         expect(stream.disconnect_count).to eq(1)
       end
+
+      it "yields each batch as it arrives from read_batches" do
+        stream.queue_read(
+          '{"type":"confirm_subscription"}',
+          '{"message":[{"__time":1},{"__time":2}]}',
+          '{"message":[{"__time":3}]}',
+          '{"message":[]}'
+        )
+        batches = []
+        OpenC3.spec_with_password_auth do
+          StreamingWebSocketApi.read_batches(items: ['ITEM'], end_time: 2_000_000_000) do |batch|
+            batches << batch
+            expect(stream.disconnect_count).to eq(0)
+          end
+        end
+        expect(batches).to eq([[{ "__time" => 1 }, { "__time" => 2 }], [{ "__time" => 3 }]])
+        expect(stream.disconnect_count).to eq(1)
+      end
+
+      it "disconnects when breaking out of read_batches" do
+        stream.queue_read('{"type":"confirm_subscription"}', '{"message":[{"__time":1}]}')
+        OpenC3.spec_with_password_auth do
+          StreamingWebSocketApi.read_batches(items: ['ITEM']) { |_batch| break }
+        end
+        expect(stream.disconnect_count).to eq(1)
+      end
     end
   end
 end
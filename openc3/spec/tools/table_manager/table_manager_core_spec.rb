@@ -274,6 +274,54 @@ module OpenC3
         binary = TableManagerCore.save(def_path, result['tables'])
         expect(binary).to eql "\x00\x00\x00\x01\x01\x01\x00\x00\x00\x02\x00\x00\x00\x00\x00\x03\x01\x00"
       end
+
+      it "returns a page of rows" do
+        tmp = File.join(SPEC_DIR, 'tmp')
+        Dir.mkdir(tmp) unless File.exist?(tmp)
+        def_path = "#{tmp}/tabledef.txt"
+        File.open(def_path, 'w') do |file|
+          file.puts 'TABLE "Test" LITTLE_ENDIAN ROW_COLUMN 4'
+          file.puts '  APPEND_PARAMETER "Value" 16 INT -100 100 0'
+          file.puts '    UNITS Volts V'
+          file.puts '  APPEND_PARAMETER "Level" 32 FLOAT -100 100 0'
+          file.puts '    FORMAT_STRING "%.1f"'
+          file.puts '  APPEND_PARAMETER "Mode" 8 UINT 0 1 0'
+          file.puts '    STATE OFF 0'
+          file.puts '    STATE ON 1'
+          4.times { |row| file.puts "DEFAULT #{-row} #{row}.5 #{row % 2}" }
+        end
+
+        binary = TableManagerCore.generate(def_path)
+        full = TableManagerCore.build_json_hash(binary, def_path)
+        expect(full["tables"][0]["rows"][3].map { |item| item["value"] }).to eql ["-3 V", "3.5", "ON"]
+        expect(full["tables"][0]).not_to have_key("rowOffset")
+        page = TableManagerCore.build_json_hash(binary, def_path, row_offset: 1, row_count: 2)
+        expect(page["tables"][0]["numRows"]).to eql 4
+        expect(page["tables"][0]["rowOffset"]).to eql 1
+        expect(page["tables"][0]["headers"]).to eql full["tables"][0]["headers"]
+        expect(page["tables"][0]["rows"]).to eql full["tables"][0]["rows"][1..2]
+      end
+
+      it "reads the items one at a time if they are not byte aligned" do
+        tmp = File.join(SPEC_DIR, 'tmp')
+        Dir.mkdir(tmp) unless File.exist?(tmp)
+        def_path = "#{tmp}/tabledef.txt"
+        File.open(def_path, 'w') do |file|
+          file.puts 'TABLE "Test" BIG_ENDIAN ROW_COLUMN 2'
+          file.puts '  PARAMETER "Value" 4 16 INT -100 100 0'
+          file.puts '  APPEND_PARAMETER "Level" 16 INT -100 100 0'
+          file.puts 'DEFAULT 1 2'
+          file.puts 'DEFAULT 3 4'
+        end
+
+        binary = TableManagerCore.generate(def_path)
+        config = TableConfig.process_file(def_path)
+        TableManagerCore.load_binary(config, binary)
+        expect(TableManagerCore.unpack_rows(config.tables["TEST"])).to be_nil
+        result = TableManagerCore.build_json_hash(binary, def_path)
+        rows = result["tables"][0]["rows"]
+        expect(rows.map { |row| row.map { |item| item["value"] } }).to eql [["1", "2"], ["3", "4"]]
+      end
     end
   end
 end
@@ -0,0 +1,98 @@
+# encoding: ascii-8bit
+
+# Copyright 2026 OpenC3, Inc.
+# All Rights Reserved.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See LICENSE.md for more details.
+
+# This file may also be used under the terms of a commercial license
+# if purchased from OpenC3, Inc.
+
+require 'spec_helper'
+require 'openc3/topics/ack_dispatcher'
+require 'openc3/topics/topic'
+
+module OpenC3
+  describe AckDispatcher do
+    let(:ack_topic) { "{DEFAULT__ACKCMD}TARGET__INST" }
+
+    before(:each) do
+      redis = mock_redis()
+      allow(redis).to receive(:xread).and_wrap_original do |m, *args|
+        # Only use the first two arguments as the last argument is keyword block:
+        result = m.call(*args[0..1])
+        # Create a slight delay to simulate the blocking call
+        sleep 0.001 if result and result.length == 0
+        result
+      end
+      AckDispatcher.class_variable_set(:@@instances, {})
+    end
+
+    def write_ack(msg_id, result = 'SUCCESS')
+      Topic.write_topic(ack_topic, { 'result' => result, 'id' => msg_id }, '*', 100)
+    end
+
+    it "returns one dispatcher per topic" do
+      dispatcher = AckDispatcher.instance(ack_topic)
+      expect(AckDispatcher.instance(ack_topic)).to equal(dispatcher)
+      expect(AckDispatcher.instance("{DEFAULT__ACKCMD}TARGET__EXAMPLE")).not_to equal(dispatcher)
+      # A new store (e.g. after a reconnect) gets a new dispatcher
+      mock_redis()
+      expect(AckDispatcher.instance(ack_topic)).not_to equal(dispatcher)
+    end
+
+    it "ignores acks written before it was created" do
+      write_ack('1-0')
+      dispatcher = AckDispatcher.instance(ack_topic)
+      queue = dispatcher.register('1-0')
+      expect(dispatcher.wait('1-0', queue, 0.2)).to be_nil
+      expect(dispatcher.instance_variable_get(:@pending)).to be_empty
+    end
+
+    it "hands each ack to the sender which registered its id" do
+      dispatcher = AckDispatcher.instance(ack_topic)
+      queues = %w(1-0 2-0 3-0).to_h { |msg_id| [msg_id, dispatcher.register(msg_id)] }
+      # Acks arrive out of order and include acks for other senders
+      %w(3-0 9-0 1-0 2-0).each { |msg_id| write_ack(msg_id, "RESULT #{msg_id}") }
+      queues.each do |msg_id, queue|
+        expect(dispatcher.wait(msg_id, queue, 5)['result']).to eql "RESULT #{msg_id}"
+      end
+      expect(dispatcher.instance_variable_get(:@pending)).to be_empty
+    end
+
+    it "keeps acks received before their sender registered" do
+      dispatcher = AckDispatcher.instance(ack_topic)
+      first = dispatcher.register('1-0')
+      write_ack('2-0')
+      100.times do
+        break if dispatcher.instance_variable_get(:@unclaimed).key?('2-0')
+        sleep 0.01
+      end
+      queue = dispatcher.register('2-0')
+      expect(queue.length).to eql 1
+      expect(dispatcher.wait('2-0', queue, 0)['id']).to eql '2-0'
+      write_ack('1-0')
+      expect(dispatcher.wait('1-0', first, 5)).not_to be_nil
+    end
+
+    it "only runs the reader thread while acks are pending" do
+      dispatcher = AckDispatcher.instance(ack_topic)
+      queue = dispatcher.register('1-0')
+      thread = dispatcher.instance_variable_get(:@thread)
+      expect(thread.alive?).to be true
+      write_ack('1-0')
+      dispatcher.wait('1-0', queue, 5)
+      thread.join(5)
+      expect(thread.alive?).to be false
+      expect(dispatcher.instance_variable_get(:@thread)).to be_nil
+
+      # Acks written while the thread was stopped are still read
+      write_ack('2-0')
+      queue = dispatcher.register('2-0')
+      expect(dispatcher.wait('2-0', queue, 5)).not_to be_nil
+    end
+  end
+end
@@ -18,7 +18,6 @@ module OpenC3
       mock_redis()
       allow(EphemeralStoreQueued).to receive(:write_topic)
       allow(Topic).to receive(:write_topic).and_return('test_cmd_id')
-      allow(Topic).to receive(:update_topic_offsets)
       allow(OpenC3).to receive(:inject_context)
     end
 
@@ -94,17 +93,24 @@ module OpenC3
         }
       end
 
+      # The ack the dispatcher returns or nil for none
+      def ack(result)
+        @dispatcher = double('AckDispatcher')
+        allow(AckDispatcher).to receive(:instance).and_return(@dispatcher)
+        allow(@dispatcher).to receive(:register).and_return(Queue.new)
+        allow(@dispatcher).to receive(:wait).and_return(result && { 'id' => 'test_cmd_id', 'result' => result })
+        allow(@dispatcher).to receive(:discard)
+      end
+
       it "returns command struct on success" do
-        allow(Topic).to receive(:read_topics).and_yield('ack_topic', 'msg_id',
-          { 'id' => 'test_cmd_id', 'result' => 'SUCCESS' }, 'redis')
+        ack('SUCCESS')
 
         result = CommandTopic.send_command(command, scope: 'DEFAULT')
         expect(result).to eq({"cmd_name"=>"COMMAND", "cmd_params"=>{"PARAM1"=>1, "PARAM2"=>"test"}, "cmd_string"=>"TARGET COMMAND with PARAM1 1, PARAM2 \"test\"", "target_name"=>"TARGET", "username"=>"testuser"})
       end
 
       it "writes command to correct topic" do
-        allow(Topic).to receive(:read_topics).and_yield('ack_topic', 'msg_id',
-          { 'id' => 'test_cmd_id', 'result' => 'SUCCESS' }, 'redis')
+        ack('SUCCESS')
         expect(Topic).to receive(:write_topic).with(
           '{DEFAULT__CMD}TARGET__TARGET',
           hash_including('target_name' => 'TARGET', 'cmd_name' => 'COMMAND'),
@@ -116,17 +122,14 @@ module OpenC3
       end
 
       it "raises timeout error when no acknowledgment received" do
-        allow(Topic).to receive(:read_topics).and_return([])
+        ack(nil)
         expect {
           CommandTopic.send_command(command, timeout: 0.1, scope: 'DEFAULT')
         }.to raise_error(/Timeout of 0.1s waiting for cmd ack/)
       end
 
       it "raises HazardousError when result contains HazardousError" do
-        allow(Topic).to receive(:read_topics).and_yield('ack_topic', 'msg_id', {
-          'id' => 'test_cmd_id',
-          'result' => "HazardousError\nHazardous command description\nFormatted command"
-        }, 'redis')
+        ack("HazardousError\nHazardous command description\nFormatted command")
         expect {
           CommandTopic.send_command(command, scope: 'DEFAULT')
         }.to raise_error(HazardousError) do |error|
@@ -138,10 +141,7 @@ module OpenC3
       end
 
       it "raises CriticalCmdError when result contains CriticalCmdError" do
-        allow(Topic).to receive(:read_topics).and_yield('ack_topic', 'msg_id', {
-          'id' => 'test_cmd_id',
-          'result' => "CriticalCmdError\ntest-uuid-123"
-        }, 'redis')
+        ack("CriticalCmdError\ntest-uuid-123")
         expect {
           CommandTopic.send_command(command, scope: 'DEFAULT')
         }.to raise_error(CriticalCmdError) do |error|
@@ -153,10 +153,7 @@ module OpenC3
       end
 
       it "passes obfuscated_items to CriticalCmdError options" do
-        allow(Topic).to receive(:read_topics).and_yield('ack_topic', 'msg_id', {
-          'id' => 'test_cmd_id',
-          'result' => "CriticalCmdError\ntest-uuid-123"
-        }, 'redis')
+        ack("CriticalCmdError\ntest-uuid-123")
 
         obfuscated_items = ['PARAM1', 'PARAM2']
         command['obfuscated_items'] = obfuscated_items
@@ -168,22 +165,98 @@ module OpenC3
       end
 
       it "raises generic error for other error results" do
-        allow(Topic).to receive(:read_topics).and_yield('ack_topic', 'msg_id', {
-          'id' => 'test_cmd_id',
-          'result' => 'Some other error message'
-        }, 'redis')
+        ack('Some other error message')
         expect {
           CommandTopic.send_command(command, scope: 'DEFAULT')
         }.to raise_error('Some other error message')
       end
 
-      it "updates topic offsets for acknowledgment topic" do
-        allow(Topic).to receive(:read_topics).and_yield('ack_topic', 'msg_id',
-          { 'id' => 'test_cmd_id', 'result' => 'SUCCESS' }, 'redis')
+      it "waits for the ack with the dispatcher of the target's ack topic" do
+        ack('SUCCESS')
+        CommandTopic.send_command(command, scope: 'DEFAULT')
+        expect(AckDispatcher).to have_received(:instance).with('{DEFAULT__ACKCMD}TARGET__TARGET', db_shard: 0)
+        expect(@dispatcher).to have_received(:register).with('test_cmd_id')
+        expect(@dispatcher).to have_received(:discard).with('test_cmd_id')
+      end
+
+      it "does not wait for an ack in fire-and-forget mode" do
+        ack(nil)
+        expect(CommandTopic.send_command(command, timeout: 0, scope: 'DEFAULT')).to equal(command)
+        expect(AckDispatcher).not_to have_received(:instance)
+      end
+    end
 
-        expect(Topic).to receive(:update_topic_offsets).with(['{DEFAULT__ACKCMD}TARGET__TARGET'], db_shard: 0)
+    describe "self.send_commands" do
+      def build_command(name)
+        { 'target_name' => 'TARGET', 'cmd_name' => name, 'cmd_params' => {}, 'cmd_string' => "TARGET #{name}", 'username' => 'testuser' }
+      end
 
-        CommandTopic.send_command(command, scope: 'DEFAULT')
+      before(:each) do
+        @events = []
+        @written = []
+        allow(Topic).to receive(:write_topic) do |_topic, command|
+          @written << command['cmd_name']
+          @events << "write #{command['cmd_name']}"
+          "#{@written.length}-0"
+        end
+        # Result of each command by name, nil means no ack is received
+        @results = Hash.new('SUCCESS')
+        @dispatcher = double('AckDispatcher')
+        allow(AckDispatcher).to receive(:instance).and_return(@dispatcher)
+        allow(@dispatcher).to receive(:register) do |msg_id|
+          queue = Queue.new
+          result = @results[@written[msg_id.to_i - 1]]
+          queue << { 'id' => msg_id, 'result' => result } if result
+          queue
+        end
+        allow(@dispatcher).to receive(:wait) do |msg_id, queue, timeout|
+          @events << "wait #{@written[msg_id.to_i - 1]}"
+          queue.pop(timeout: [timeout, 0].max)
+        end
+        allow(@dispatcher).to receive(:discard)
+      end
+
+      it "sends every command and then waits for all the acks" do
+        commands = %w(ONE TWO THREE).map { |name| build_command(name) }
+        expect(CommandTopic.send_commands(commands, timeout: 5, scope: 'DEFAULT')).to equal(commands)
+        expect(@events).to eql ['write ONE', 'write TWO', 'write THREE', 'wait ONE', 'wait TWO', 'wait THREE']
+        expect(AckDispatcher).to have_received(:instance).with('{DEFAULT__ACKCMD}TARGET__TARGET', db_shard: 0).exactly(3).times
+        expect(@dispatcher).to have_received(:discard).exactly(3).times
+      end
+
+      it "limits the commands in flight to fit the ack topic" do
+        stub_const("OpenC3::CommandTopic::MAX_IN_FLIGHT", 2)
+        commands = %w(ONE TWO THREE).map { |name| build_command(name) }
+        CommandTopic.send_commands(commands, timeout: 5, scope: 'DEFAULT')
+        expect(@events).to eql ['write ONE', 'write TWO', 'wait ONE', 'write THREE', 'wait TWO', 'wait THREE']
+      end
+
+      it "raises the first failed ack" do
+        @results['HAZ'] = "HazardousError\nDescription\nFormatted"
+        @results['BAD'] = 'Bad command'
+        commands = %w(GOOD HAZ BAD).map { |name| build_command(name) }
+        expect { CommandTopic.send_commands(commands, timeout: 5, scope: 'DEFAULT') }.to raise_error(HazardousError)
+        expect(@written).to eql %w(GOOD HAZ BAD)
+        expect(@dispatcher).to have_received(:discard).exactly(3).times
+      end
+
+      it "sends nothing after an isolated command until it is acked" do
+        @results['HAZ'] = "HazardousError\nDescription\nFormatted"
+        commands = %w(GOOD HAZ LATER).map { |name| build_command(name) }
+        expect {
+          CommandTopic.send_commands(commands, timeout: 5, scope: 'DEFAULT', isolate: [false, true, false])
+        }.to raise_error(HazardousError)
+        expect(@events).to eql ['write GOOD', 'wait GOOD', 'write HAZ', 'wait HAZ']
+      end
+
+      it "uses the timeout of each command" do
+        @results['SLOW'] = nil
+        commands = %w(SLOW FAST).map { |name| build_command(name) }
+        expect(CommandTopic.send_commands(commands, timeout: [0, 5], scope: 'DEFAULT')).to equal(commands)
+        expect(AckDispatcher).to have_received(:instance).once
+        expect {
+          CommandTopic.send_commands(commands, timeout: [0.1, 5], scope: 'DEFAULT')
+        }.to raise_error("Timeout of 0.1s waiting for cmd ack")
       end
     end
 
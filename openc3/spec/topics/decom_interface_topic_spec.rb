@@ -0,0 +1,84 @@
+# encoding: ascii-8bit
+
+# Copyright 2026 OpenC3, Inc.
+# All Rights Reserved.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See LICENSE.md for more details.
+
+require 'spec_helper'
+require 'openc3/topics/decom_interface_topic'
+
+module OpenC3
+  describe DecomInterfaceTopic do
+    before(:each) do
+      mock_redis()
+      @requests = []
+      allow(Topic).to receive(:write_topic) do |topic, request|
+        @requests << [topic, request]
+        'decom_id'
+      end
+      @dispatcher = double('AckDispatcher')
+      allow(AckDispatcher).to receive(:instance).and_return(@dispatcher)
+      allow(@dispatcher).to receive(:register).and_return(Queue.new)
+    end
+
+    # The ack the dispatcher returns or nil for none
+    def ack(msg_hash)
+      allow(@dispatcher).to receive(:wait).and_return(msg_hash && { 'id' => 'decom_id' }.merge(msg_hash))
+    end
+
+    describe "self.build_cmd" do
+      it "waits for the ack with the dispatcher of the target's ack topic" do
+        ack({ 'result' => 'SUCCESS', 'buffer' => 'data' })
+        msg_hash = DecomInterfaceTopic.build_cmd('INST', 'ABORT', {}, true, false, scope: 'DEFAULT')
+        expect(msg_hash['buffer']).to eql 'data'
+        expect(AckDispatcher).to have_received(:instance).with('{DEFAULT__ACKCMD}TARGET__INST', db_shard: 0)
+        expect(@dispatcher).to have_received(:register).with('decom_id')
+        expect(@requests[0][0]).to eql 'DEFAULT__DECOMINTERFACE__{INST}'
+        expect(JSON.parse(@requests[0][1]['build_cmd'])).to include('target_name' => 'INST', 'cmd_name' => 'ABORT')
+      end
+
+      it "raises the error in the ack" do
+        ack({ 'result' => 'Bad command' })
+        expect { DecomInterfaceTopic.build_cmd('INST', 'ABORT', {}, true, false, scope: 'DEFAULT') }.to raise_error('Bad command')
+      end
+
+      it "raises on timeout" do
+        ack(nil)
+        expect { DecomInterfaceTopic.build_cmd('INST', 'ABORT', {}, true, false, timeout: 0.1, scope: 'DEFAULT') }.to \
+          raise_error("Timeout of 0.1s waiting for cmd ack. Does target 'INST' exist?")
+      end
+    end
+
+    describe "self.inject_tlm" do
+      it "writes the request and waits for the ack" do
+        ack({ 'result' => 'SUCCESS' })
+        DecomInterfaceTopic.inject_tlm('INST', 'HEALTH_STATUS', { 'TEMP1' => 10 }, scope: 'DEFAULT')
+        expect(JSON.parse(@requests[0][1]['inject_tlm'])).to include('packet_name' => 'HEALTH_STATUS', 'item_hash' => { 'TEMP1' => 10 })
+      end
+
+      it "raises on timeout" do
+        ack(nil)
+        expect { DecomInterfaceTopic.inject_tlm('INST', 'HEALTH_STATUS', timeout: 0.1, scope: 'DEFAULT') }.to raise_error(/Timeout of 0.1s/)
+      end
+    end
+
+    describe "self.get_tlm_buffer" do
+      it "returns the buffer with its stored flag and extra" do
+        ack({ 'result' => 'SUCCESS', 'buffer' => 'data', 'stored' => 'TRUE', 'extra' => '{"foo":"bar"}' })
+        msg_hash = DecomInterfaceTopic.get_tlm_buffer('INST', 'HEALTH_STATUS', scope: 'DEFAULT')
+        expect(msg_hash['stored']).to be true
+        expect(msg_hash['extra']).to eql({ 'foo' => 'bar' })
+      end
+
+      it "raises on timeout" do
+        ack(nil)
+        expect { DecomInterfaceTopic.get_tlm_buffer('INST', 'HEALTH_STATUS', timeout: 0.1, scope: 'DEFAULT') }.to \
+          raise_error("Timeout of 0.1s waiting for ack. Does target 'INST' exist?")
+      end
+    end
+  end
+end
@@ -68,6 +68,42 @@ module OpenC3
         expect(out[0][3]).to eql "RED_HIGH"
       end
 
+      it "builds the out_of_limits index after a limits event" do
+        Store.hset("DEFAULT__current_limits", "TGT__PKT__ITEM1", "YELLOW_HIGH")
+        Store.hset("DEFAULT__current_limits", "TGT__PKT__ITEM2", "RED_LOW")
+        Store.hset("DEFAULT__current_limits", "TGT__PKT__ITEM3", "GREEN")
+        event = { type: :LIMITS_CHANGE, target_name: "TGT", packet_name: "PKT",
+            item_name: "ITEM3", old_limits_state: :GREEN, new_limits_state: :RED_HIGH,
+            time_nsec: 123456789, message: "test change" }
+        LimitsEventTopic.write(event, scope: "DEFAULT")
+
+        out = LimitsEventTopic.out_of_limits(scope: "DEFAULT")
+        expect(out.sort).to eql [%w(TGT PKT ITEM1 YELLOW_HIGH), %w(TGT PKT ITEM2 RED_LOW), %w(TGT PKT ITEM3 RED_HIGH)]
+      end
+
+      it "rebuilds the out_of_limits index if current_limits changes during the build" do
+        Store.hset("DEFAULT__current_limits", "TGT__PKT__ITEM1", "RED")
+        Store.hset("DEFAULT__current_limits", "TGT__PKT__ITEM2", "YELLOW")
+        event = { type: :LIMITS_CHANGE, target_name: "TGT", packet_name: "PKT",
+            item_name: "ITEM1", old_limits_state: :RED, new_limits_state: :GREEN,
+            time_nsec: 123456789, message: "test change" }
+        builds = 0
+        allow(Store).to receive(:watch) do |*args, &block|
+          builds += 1
+          result = Store.instance.watch(*args, &block)
+          next result if builds > 1
+
+          # ITEM1 goes back to GREEN after it was read so the transaction is aborted
+          LimitsEventTopic.write(event, scope: "DEFAULT")
+          nil
+        end
+
+        out = LimitsEventTopic.out_of_limits(scope: "DEFAULT")
+        expect(builds).to eql 2
+        expect(out).to eql [%w(TGT PKT ITEM2 YELLOW)]
+        expect(Store.hget("DEFAULT__out_of_limits", "TGT__PKT__ITEM1")).to be_nil
+      end
+
       it "writes and reads LIMITS_SETTINGS events" do
         event = { type: :LIMITS_SETTINGS, limits_set: :DEFAULT, target_name: "TGT1", packet_name: "PKT1",
             item_name: "ITEM1", red_low: -50.0, yellow_low: -40.0, yellow_high: 40.0, red_high: 50.0,